@@ -15,10 +15,14 @@ def _secret():
     return settings.JWT_SECRET
 
 
-def create_token(user_id: int, expiry_hours: int = 24 * 7) -> str:
-    """Generate a signed JWT for the given user ID. Expires in `expiry_hours` hours."""
+def create_token(user_id: int, expiry_hours: int = 24 * 7, token_version: int = 0) -> str:
+    """
+    Generate a signed JWT for the given user ID. Expires in `expiry_hours` hours.
+    Pass the user's current `token_version`; the token is revoked once it is bumped.
+    """
     payload = {
         'user_id': user_id,
+        'ver': token_version,
         'exp': datetime.datetime.utcnow() + datetime.timedelta(hours=expiry_hours),
         'iat': datetime.datetime.utcnow(),
     }
@@ -1,7 +1,7 @@
 import random
 import string
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import models, transaction
 
 
 def generate_uid():
@@ -40,6 +40,10 @@ class User(AbstractUser):
     skills = models.TextField(blank=True, default='')
     location = models.CharField(max_length=150, blank=True, default='')
 
+    # Carried in every JWT issued to the user; bumping it revokes them all
+    # (logout, profile changes — see accounts.request_user)
+    token_version = models.PositiveIntegerField(default=0)
+
     # Override USERNAME_FIELD to email
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username']
@@ -52,6 +56,24 @@ class User(AbstractUser):
     def __str__(self):
         return self.email
 
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        # Users resolved from token claims (accounts.request_user) have only
+        # their identity loaded; the first profile field read loads them all
+        if fields is not None and getattr(self, '_load_deferred_together', False):
+            deferred = self.get_deferred_fields()
+            if set(fields) <= deferred:
+                fields = deferred
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+
+    def bump_token_version(self):
+        """Revoke every JWT issued to this user so far."""
+        User.objects.filter(pk=self.pk).update(token_version=models.F('token_version') + 1)
+        self.refresh_from_db(fields=['token_version'])
+        # update() sends no post_save, so refresh the cached identity here
+        from accounts import request_user
+        request_user.forget(self.pk)
+        transaction.on_commit(lambda: request_user.store(self))
+
     def get_display_name(self):
         return self.username or self.email.split('@')[0]
 
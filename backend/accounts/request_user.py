@@ -0,0 +1,98 @@
+"""
+Resolves the user behind a JWT Bearer token without a query per request.
+
+Tokens carry the minimal identity: the user id and the `token_version` the
+user had when the token was issued. Bumping User.token_version (logout,
+profile changes) revokes every older token.
+
+`resolve` looks the user's identity (IDENTITY_FIELDS, never the password or
+profile) up in the shared cache (settings.CACHES) under `auth:user:<id>`,
+where it stays JWT_USER_CACHE_TTL seconds:
+
+- hit: a user with just the identity loaded, no query
+- miss: one query for just the identity fields
+- either way the profile fields stay deferred and load together, in one
+  query, the first time a view reads one of them (User.refresh_from_db)
+
+A token_version other than the claim's means the token was revoked.
+`remember` caches the identity a miss read once the view is done, with
+cache.add so it never replaces an entry. Saving or bumping a user stores
+its new identity once committed, and deleting it stores a tombstone
+(accounts.signals, User.bump_token_version); a request that read the old
+row before the change therefore can't put it back. A TTL of 0 turns the
+cache off.
+"""
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from accounts.models import User
+
+IDENTITY_FIELDS = ('id', 'username', 'token_version', 'is_active', 'is_staff')
+
+
+def cache_key(user_id) -> str:
+    return f'auth:user:{user_id}'
+
+
+def _identity(user: User) -> dict:
+    return {field: getattr(user, field) for field in IDENTITY_FIELDS}
+
+
+def _from_identity(identity: dict) -> User:
+    """A User with only the `identity` fields loaded, the rest deferred."""
+    fields = [f.attname for f in User._meta.concrete_fields if f.attname in identity]
+    return User.from_db(User.objects.db, fields, [identity[field] for field in fields])
+
+
+def resolve(claims: dict) -> Optional[User]:
+    """The user the token `claims` identify, or None if unknown or revoked."""
+    try:
+        user_id = int(claims['user_id'])
+        version = int(claims.get('ver', 0))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    identity = cache.get(cache_key(user_id)) if settings.JWT_USER_CACHE_TTL > 0 else None
+    if identity is not None and identity['token_version'] < version:
+        # Cached before the bump that issued this token
+        identity = None
+    if identity is not None:
+        user = _from_identity(identity)
+        user._uncached_identity = None
+    else:
+        user = User.objects.filter(pk=user_id).only(*IDENTITY_FIELDS).first()
+        if user is None:
+            return None
+        user._uncached_identity = _identity(user)
+    if user.token_version != version:
+        return None
+    user._load_deferred_together = True
+    return user
+
+
+def remember(user: User) -> None:
+    """Cache the identity `resolve` read for `user`'s request, unless an entry exists by now."""
+    identity = getattr(user, '_uncached_identity', None)
+    if identity is not None and settings.JWT_USER_CACHE_TTL > 0:
+        # add, never set: the entry may already be what a save stored since
+        cache.add(cache_key(user.pk), identity, settings.JWT_USER_CACHE_TTL)
+
+
+def store(user: User) -> None:
+    """Cache `user`'s current identity, replacing any entry (call once committed)."""
+    if settings.JWT_USER_CACHE_TTL <= 0 or user.get_deferred_fields() & set(IDENTITY_FIELDS):
+        forget(user.pk)
+        return
+    cache.set(cache_key(user.pk), _identity(user), settings.JWT_USER_CACHE_TTL)
+
+
+def tombstone(user_id) -> None:
+    """Keep a deleted user's id out of the cache for the TTL: `resolve` reads it as a miss, `remember` can't add."""
+    if settings.JWT_USER_CACHE_TTL > 0:
+        cache.set(cache_key(user_id), None, settings.JWT_USER_CACHE_TTL)
+
+
+def forget(user_id) -> None:
+    cache.delete(cache_key(user_id))
@@ -0,0 +1,26 @@
+"""
+Keeps the cached identity of a user (accounts.request_user) in step with
+its row: dropped as soon as the user is saved or deleted, and replaced by
+the saved identity, or a tombstone, once the change commits.
+"""
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts import request_user
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL, dispatch_uid='request_user_cache_save')
+def store_cached_user(sender, instance, **kwargs):
+    request_user.forget(instance.pk)
+    # Stored, not just dropped: a request that read the old row before the
+    # commit can't cache it over this entry
+    transaction.on_commit(lambda: request_user.store(instance))
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL, dispatch_uid='request_user_cache_delete')
+def forget_cached_user(sender, instance, **kwargs):
+    user_id = instance.pk
+    request_user.forget(user_id)
+    transaction.on_commit(lambda: request_user.tombstone(user_id))
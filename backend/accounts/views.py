@@ -124,7 +124,7 @@ class GoogleCallbackView(View):
             # Generate a JWT token to pass to the frontend cross-domain.
             # The frontend reads ?token=... from the URL, stores in localStorage,
             # and sends Authorization: Bearer <token> on every API request.
-            token = create_token(user.id)
+            token = create_token(user.id, token_version=user.token_version)
             frontend_url = settings.FRONTEND_URL.rstrip('/')
             return redirect(f"{frontend_url}/?token={token}")
 
@@ -0,0 +1,17 @@
+"""
+Offline benchmarks for the resume analysis pipeline and the interview/HR
+queries (the latter run against a throwaway test database, see benchmarks.db).
+
+    cd backend
+    python -m benchmarks.analyzer_bench                 # run and compare to benchmarks/baseline.json
+    python -m benchmarks.analyzer_bench --save-baseline # record a new baseline
+    python -m benchmarks.incremental_bench              # full vs incremental re-analysis of edited resumes
+    python -m benchmarks.extraction_bench               # full vs hybrid LLM extraction prompt
+    python -m benchmarks.analytics_bench                # user_analytics with 10k sessions per user
+    python -m benchmarks.history_bench                  # session_history at 20/200/2000 sessions
+    python -m benchmarks.pagination_bench               # history page 1 vs deep pages: OFFSET vs keyset cursor
+    python -m benchmarks.role_search_bench              # hr_search_role at 100k sessions: Python dedup vs latest per candidate
+    python -m benchmarks.answers_bench                  # answer autosave: list rewrite vs per-question upsert
+    python -m benchmarks.hr_request_bench               # queries per HR request: database vs cached sessions/HR users
+    python -m benchmarks.auth_bench                     # interview flow with a JWT: per-request user query vs cached claims
+"""
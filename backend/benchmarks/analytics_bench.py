@@ -0,0 +1,131 @@
+"""
+User Analytics Benchmark
+Seeds a throwaway database with N completed sessions per user and times
+three ways of building the analytics payload:
+  legacy     count, then load every session's JSON to average
+             `feedback.overall_score` in Python, plus per-mode and
+             per-difficulty queries
+  aggregate  one conditional aggregation over the indexed score columns
+  rollup     what `user_analytics` does now: read the user's
+             UserAnalyticsSummary row
+Reports median time and query count for each and checks they agree.
+
+Usage:
+    python -m benchmarks.analytics_bench
+    python -m benchmarks.analytics_bench --sessions 2000 --users 3 --output analytics.json
+"""
+
+import argparse
+import json
+import logging
+import sys
+from typing import Any, Dict
+
+from benchmarks.db import make_users, measure, seed_sessions, setup_django, test_database
+
+IMPLEMENTATIONS = ('legacy', 'aggregate', 'rollup')
+
+
+def legacy_analytics(user) -> Dict[str, Any]:
+    """The Python-side aggregation `user_analytics` used to do."""
+    from interviews.models import InterviewSession
+
+    sessions = InterviewSession.objects.filter(user=user, status='completed')
+    total = sessions.count()
+    if total == 0:
+        return {'total_sessions': 0, 'average_score': None, 'best_score': None,
+                'resume_count': 0, 'role_count': 0, 'by_difficulty': {}}
+
+    scores = [s.feedback.get('overall_score') for s in sessions if s.feedback.get('overall_score') is not None]
+    by_difficulty = {}
+    for diff in ['beginner', 'intermediate', 'advanced']:
+        diff_sessions = sessions.filter(difficulty=diff)
+        diff_scores = [s.feedback.get('overall_score') for s in diff_sessions
+                       if s.feedback.get('overall_score') is not None]
+        by_difficulty[diff] = {
+            'count': diff_sessions.count(),
+            'average_score': round(sum(diff_scores) / len(diff_scores), 1) if diff_scores else None,
+        }
+    return {
+        'total_sessions': total,
+        'average_score': round(sum(scores) / len(scores), 1) if scores else None,
+        'best_score': max(scores) if scores else None,
+        'resume_count': sessions.filter(mode='resume').count(),
+        'role_count': sessions.filter(mode='role').count(),
+        'by_difficulty': by_difficulty,
+    }
+
+
+def aggregate_analytics(user) -> Dict[str, Any]:
+    """The rollup columns computed on the fly with one conditional aggregation."""
+    from interviews.analytics import rollup_totals
+    from interviews.models import InterviewSession, UserAnalyticsSummary
+
+    totals = InterviewSession.objects.filter(user=user, status='completed').aggregate(**rollup_totals())
+    return UserAnalyticsSummary(user=user, **{k: v for k, v in totals.items() if v is not None}).to_payload()
+
+
+def current_analytics(user) -> Dict[str, Any]:
+    from django.test import RequestFactory
+
+    from interviews.views import user_analytics
+
+    request = RequestFactory().get('/api/analytics/')
+    request.user = user
+    return json.loads(user_analytics(request).content)
+
+
+def run_benchmark(sessions_per_user: int = 10000, users: int = 2, repeat: int = 5, seed: int = 2026) -> Dict[str, Any]:
+    """Time legacy vs current analytics for the first seeded user; needs a (test) database."""
+    accounts = make_users(users, prefix='analytics')
+    seed_sessions(accounts, sessions_per_user, seed=seed)
+    user = accounts[0]
+
+    results = {
+        'legacy': measure(lambda: legacy_analytics(user), repeat),
+        'aggregate': measure(lambda: aggregate_analytics(user), repeat),
+        'rollup': measure(lambda: current_analytics(user), repeat),
+    }
+    expected = legacy_analytics(user)
+    return {
+        'config': {'sessions_per_user': sessions_per_user, 'users': users, 'repeat': repeat, 'seed': seed},
+        **results,
+        'speedup': {
+            name: round(results['legacy']['median_ms'] / results[name]['median_ms'], 1)
+            for name in IMPLEMENTATIONS if results[name]['median_ms']
+        },
+        'payload_match': aggregate_analytics(user) == expected and current_analytics(user) == expected,
+    }
+
+
+def _print_report(results: Dict[str, Any], out=sys.stdout) -> None:
+    out.write(f"{results['config']['sessions_per_user']} sessions per user\n")
+    for name in IMPLEMENTATIONS:
+        out.write(f"{name:10s} {results[name]['median_ms']:10.2f} ms {results[name]['queries']:4d} queries "
+                  f"{results['speedup'].get(name, '-')}x\n")
+    out.write(f"Payloads match: {'yes' if results['payload_match'] else 'NO'}\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Time user_analytics against the implementations it replaced')
+    parser.add_argument('--output', help='Write the results JSON here')
+    parser.add_argument('--sessions', type=int, default=10000, help='Completed sessions per user')
+    parser.add_argument('--users', type=int, default=2)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=2026)
+    args = parser.parse_args(argv)
+
+    setup_django()
+    logging.getLogger('django').setLevel(logging.WARNING)
+    with test_database():
+        results = run_benchmark(args.sessions, args.users, args.repeat, args.seed)
+    _print_report(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return 0 if results['payload_match'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
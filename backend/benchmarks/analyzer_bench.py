@@ -0,0 +1,269 @@
+"""
+Resume Analyzer Benchmark
+Times each stage of ResumeAnalyzer against the synthetic corpus with a stub
+LLM client, writes machine-readable JSON and compares it with a stored
+baseline. Needs no network, database or API key.
+
+Usage:
+    python -m benchmarks.analyzer_bench
+    python -m benchmarks.analyzer_bench --output results.json --fail-on-regression
+    python -m benchmarks.analyzer_bench --pages 1,2 --repeat 5 --save-baseline
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.corpus import LAYOUTS, SKILL_DENSITY, build_corpus
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+SCHEMA_VERSION = 1
+
+STAGES = [
+    'extract_text', 'segment', 'technical_skills', 'soft_skills', 'projects_basic', 'merge', 'analyze_resume',
+]
+
+STUB_LLM_RESULT = {
+    'technical_skills': [
+        {'name': 'Python', 'category': 'programming', 'proficiency': 'proficient'},
+        {'name': 'K8s', 'category': 'cloud', 'proficiency': 'familiar'},
+        {'name': 'Kafka', 'category': 'tools', 'proficiency': 'familiar'},
+    ],
+    'soft_skills': [{'skill': 'Leadership', 'context': 'Led a team of four'}],
+    'projects': [
+        {'title': 'Analytics platform', 'description': 'Event pipeline', 'technologies': ['Kafka', 'Spark'],
+         'role': 'Lead', 'key_achievements': ['Cut report latency by 60%']},
+    ],
+    'summary': 'Backend engineer focused on data platforms',
+    'experience_level': 'mid',
+}
+
+
+class _StubResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _StubModels:
+    def __init__(self, latency_s: float):
+        self.latency_s = latency_s
+        self.calls = 0
+        self.prompt_chars: List[int] = []
+
+    def generate_content(self, model, contents, config=None):
+        self.calls += 1
+        self.prompt_chars.append(sum(len(part.text or '') for content in contents for part in content.parts))
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        return _StubResponse(json.dumps(STUB_LLM_RESULT))
+
+
+class StubGeminiClient:
+    """Stands in for genai.Client: fixed JSON response after an optional fixed delay"""
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.models = _StubModels(latency_ms / 1000.0)
+
+
+def _time_ms(func: Callable, *args) -> Any:
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        'median_ms': round(statistics.median(samples), 3),
+        'min_ms': round(min(samples), 3),
+        'max_ms': round(max(samples), 3),
+    }
+
+
+def run_benchmark(
+    seed: int = 2026,
+    page_counts=(1, 2, 4),
+    repeat: int = 3,
+    llm_latency_ms: float = 0.0,
+    layouts=tuple(LAYOUTS),
+    densities=tuple(SKILL_DENSITY)
+) -> Dict[str, Any]:
+    """Run every stage `repeat` times per corpus case and return the results document"""
+    from core.resume_analyzer import ResumeAnalyzer
+    from core.resume_sections import segment_resume
+
+    analyzer = ResumeAnalyzer(enable_llm=False)
+    analyzer.client = StubGeminiClient(llm_latency_ms)
+    corpus = build_corpus(seed, page_counts, layouts, densities)
+
+    # Warm up imports and regex caches so the first case isn't penalised
+    analyzer.analyze_resume(io.BytesIO(corpus[0].pdf))
+
+    cases: Dict[str, Any] = {}
+    for case in corpus:
+        samples: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+        for _ in range(repeat):
+            text, ms = _time_ms(analyzer.extract_text_from_pdf, io.BytesIO(case.pdf))
+            samples['extract_text'].append(ms)
+            sections, ms = _time_ms(segment_resume, text)
+            samples['segment'].append(ms)
+            technical, ms = _time_ms(analyzer.extract_technical_skills, text)
+            samples['technical_skills'].append(ms)
+            soft, ms = _time_ms(analyzer.extract_soft_skills, text)
+            samples['soft_skills'].append(ms)
+            projects, ms = _time_ms(analyzer.extract_projects_basic, text, sections)
+            samples['projects_basic'].append(ms)
+            _, ms = _time_ms(analyzer.merge_results, technical, soft, projects, dict(STUB_LLM_RESULT))
+            samples['merge'].append(ms)
+            analysis, ms = _time_ms(analyzer.analyze_resume, io.BytesIO(case.pdf))
+            samples['analyze_resume'].append(ms)
+
+        cases[case.name] = {
+            'sha256': case.sha256,
+            'pages': case.pages,
+            'layout': case.layout,
+            'density': case.density,
+            'chars': len(text),
+            'technical_skills_found': len(analysis.technical_skills),
+            'stages': {stage: _summarize(values) for stage, values in samples.items()},
+        }
+
+    totals = {
+        stage: round(sum(case['stages'][stage]['median_ms'] for case in cases.values()), 3)
+        for stage in STAGES
+    }
+    return {
+        'schema': SCHEMA_VERSION,
+        'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'cpu_count': os.cpu_count(),
+            'taxonomy_version': analyzer.taxonomy.version,
+        },
+        'config': {
+            'seed': seed,
+            'page_counts': list(page_counts),
+            'repeat': repeat,
+            'llm_latency_ms': llm_latency_ms,
+        },
+        'cases': cases,
+        'totals_median_ms': totals,
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.25,
+            min_delta_ms: float = 1.0) -> Dict[str, Any]:
+    """
+    Compare per-case stage medians with the baseline. A stage regresses when
+    it is more than `threshold` slower and at least `min_delta_ms` slower
+    (tiny stages are too noisy to judge on ratio alone)
+    """
+    regressions, improvements, corpus_changed = [], [], []
+    for name, case in results['cases'].items():
+        base_case = baseline.get('cases', {}).get(name)
+        if base_case is None:
+            continue
+        if base_case.get('sha256') != case['sha256']:
+            corpus_changed.append(name)
+            continue
+        for stage, stats in case['stages'].items():
+            base_stats = base_case['stages'].get(stage)
+            if not base_stats or base_stats['median_ms'] <= 0:
+                continue
+            current, previous = stats['median_ms'], base_stats['median_ms']
+            entry = {'case': name, 'stage': stage, 'baseline_ms': previous, 'current_ms': current,
+                     'ratio': round(current / previous, 3)}
+            if current > previous * (1 + threshold) and current - previous >= min_delta_ms:
+                regressions.append(entry)
+            elif current < previous * (1 - threshold) and previous - current >= min_delta_ms:
+                improvements.append(entry)
+
+    totals = {}
+    for stage, current in results['totals_median_ms'].items():
+        previous = baseline.get('totals_median_ms', {}).get(stage)
+        if previous:
+            totals[stage] = {'baseline_ms': previous, 'current_ms': current, 'ratio': round(current / previous, 3)}
+
+    return {
+        'threshold': threshold,
+        'regressions': regressions,
+        'improvements': improvements,
+        'corpus_changed': corpus_changed,
+        'totals': totals,
+    }
+
+
+def _print_report(results: Dict[str, Any], comparison: Optional[Dict[str, Any]], out=sys.stdout) -> None:
+    out.write(f"{'case':32s} {'chars':>7s} " + ' '.join(f'{stage[:14]:>14s}' for stage in STAGES) + '\n')
+    for name, case in results['cases'].items():
+        out.write(f"{name:32s} {case['chars']:7d} "
+                  + ' '.join(f"{case['stages'][stage]['median_ms']:14.2f}" for stage in STAGES) + '\n')
+    out.write(f"{'TOTAL (median ms)':32s} {'':7s} "
+              + ' '.join(f"{results['totals_median_ms'][stage]:14.2f}" for stage in STAGES) + '\n')
+
+    if comparison is None:
+        return
+    out.write('\nTotals vs baseline: ' + ', '.join(
+        f"{stage} x{values['ratio']}" for stage, values in comparison['totals'].items()) + '\n')
+    if comparison['corpus_changed']:
+        out.write(f"Corpus changed for {len(comparison['corpus_changed'])} cases; they were not compared.\n")
+    for entry in comparison['regressions']:
+        out.write(f"REGRESSION {entry['case']} {entry['stage']}: "
+                  f"{entry['baseline_ms']:.2f} -> {entry['current_ms']:.2f} ms (x{entry['ratio']})\n")
+    out.write(f"{len(comparison['regressions'])} regressions, {len(comparison['improvements'])} improvements "
+              f"(threshold {comparison['threshold']:.0%})\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the resume analysis pipeline on a synthetic corpus')
+    parser.add_argument('--output', help='Write the results JSON here')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Baseline JSON to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='Overwrite the baseline with this run')
+    parser.add_argument('--seed', type=int, default=2026)
+    parser.add_argument('--pages', default='1,2,4', help='Comma-separated page counts')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--llm-latency-ms', type=float, default=0.0, help='Simulated LLM latency')
+    parser.add_argument('--threshold', type=float, default=0.25, help='Slowdown ratio that counts as a regression')
+    parser.add_argument('--fail-on-regression', action='store_true', help='Exit 1 if any stage regressed')
+    args = parser.parse_args(argv)
+
+    logging.getLogger('core').setLevel(logging.WARNING)
+    results = run_benchmark(
+        seed=args.seed,
+        page_counts=[int(p) for p in args.pages.split(',') if p],
+        repeat=args.repeat,
+        llm_latency_ms=args.llm_latency_ms,
+    )
+
+    comparison = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            comparison = compare(results, json.load(f), args.threshold)
+        results['comparison'] = comparison
+
+    _print_report(results, comparison)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+
+    if args.fail_on_regression and comparison and comparison['regressions']:
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
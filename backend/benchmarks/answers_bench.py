@@ -0,0 +1,133 @@
+"""
+Answer Autosave Benchmark
+Times one `submit_answer` write as an interview fills up, comparing the
+InterviewAnswer upsert with the scheme it replaced: load the session, copy
+its answers JSON list, pad it and write the whole list back. The old scheme
+is replayed against a scratch table holding the list, since the column is
+gone. For each answer length it saves every question's answer in turn and
+reports median time and bytes sent to the database per save (the write
+statements with parameters inlined).
+
+Usage:
+    python -m benchmarks.answers_bench
+    python -m benchmarks.answers_bench --questions 12 --lengths 200,2000,8000 --output answers.json
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+from typing import Any, Dict, Sequence
+
+from benchmarks.db import make_users, seed_sessions, setup_django, test_database
+
+IMPLEMENTATIONS = ('legacy', 'upsert')
+LEGACY_TABLE = 'bench_legacy_session_answers'
+
+
+def _create_legacy_table(session_id: int) -> None:
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'CREATE TABLE IF NOT EXISTS {LEGACY_TABLE} (session_id BIGINT PRIMARY KEY, answers TEXT NOT NULL)')
+        cursor.execute(f'DELETE FROM {LEGACY_TABLE}')
+        cursor.execute(f'INSERT INTO {LEGACY_TABLE} (session_id, answers) VALUES (%s, %s)', [session_id, '[]'])
+
+
+def legacy_save(session_id: int, question_index: int, text: str) -> None:
+    """The old submit_answer: full session load, list copy + pad, whole-list write."""
+    from django.db import connection
+
+    from interviews.models import InterviewSession
+
+    InterviewSession.objects.get(id=session_id)
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT answers FROM {LEGACY_TABLE} WHERE session_id = %s', [session_id])
+        answers = list(json.loads(cursor.fetchone()[0]))
+        if len(answers) <= question_index:
+            answers.extend([None] * (question_index + 1 - len(answers)))
+        answers[question_index] = text
+        cursor.execute(f'UPDATE {LEGACY_TABLE} SET answers = %s WHERE session_id = %s',
+                       [json.dumps(answers), session_id])
+
+
+def upsert_save(session_id: int, question_index: int, text: str) -> None:
+    """What submit_answer does now."""
+    from interviews.models import InterviewAnswer, InterviewSession
+
+    InterviewSession.objects.filter(id=session_id).exists()
+    InterviewAnswer.save_answer(session_id, question_index, text)
+
+
+def _time_saves(save, session_id: int, questions: int, length: int) -> Dict[str, Any]:
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    timings, written = [], []
+    for index in range(questions):
+        text = (f'answer {index} ' * length)[:length]
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            save(session_id, index, text)
+            timings.append((time.perf_counter() - start) * 1000)
+        written.append(sum(len(q['sql'].encode('utf-8')) for q in captured.captured_queries
+                           if q['sql'].startswith(('INSERT', 'UPDATE'))))
+    return {
+        'median_ms': round(statistics.median(timings), 3),
+        'last_save_ms': round(timings[-1], 3),
+        'median_bytes_written': int(statistics.median(written)),
+        'last_save_bytes_written': written[-1],
+    }
+
+
+def run_benchmark(questions: int = 10, lengths: Sequence[int] = (200, 1000, 4000)) -> Dict[str, Any]:
+    """Legacy vs upsert saves for each answer length; needs a (test) database."""
+    from interviews.models import InterviewAnswer
+
+    user = make_users(1, prefix='answers')[0]
+    seed_sessions([user], 1, answers=0)
+    session_id = user.interview_sessions.get().id
+
+    results: Dict[str, Any] = {}
+    for length in lengths:
+        _create_legacy_table(session_id)
+        InterviewAnswer.objects.filter(session_id=session_id).delete()
+        results[str(length)] = {
+            'legacy': _time_saves(legacy_save, session_id, questions, length),
+            'upsert': _time_saves(upsert_save, session_id, questions, length),
+        }
+    return {'config': {'questions': questions, 'lengths': list(lengths)}, 'lengths': results}
+
+
+def _print_report(results: Dict[str, Any], out=sys.stdout) -> None:
+    out.write(f"{'chars':>6s} {'impl':7s} {'median ms':>9s} {'last ms':>8s} {'median B':>9s} {'last B':>8s}\n")
+    for length, by_impl in results['lengths'].items():
+        for name in IMPLEMENTATIONS:
+            r = by_impl[name]
+            out.write(f"{length:>6s} {name:7s} {r['median_ms']:9.3f} {r['last_save_ms']:8.3f} "
+                      f"{r['median_bytes_written']:9d} {r['last_save_bytes_written']:8d}\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Time answer autosaves: whole-list rewrite vs per-question upsert')
+    parser.add_argument('--output', help='Write the results JSON here')
+    parser.add_argument('--questions', type=int, default=10)
+    parser.add_argument('--lengths', default='200,1000,4000', help='Comma-separated answer lengths in characters')
+    args = parser.parse_args(argv)
+
+    setup_django()
+    logging.getLogger('django').setLevel(logging.WARNING)
+    with test_database():
+        results = run_benchmark(args.questions, [int(n) for n in args.lengths.split(',') if n])
+    _print_report(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""
+JWT Auth Overhead Benchmark
+Replays a candidate's interview flow — profile, question generation, eight
+answer autosaves, completion, history, session detail and analytics —
+through the full middleware stack with a Bearer token, and counts the
+queries and time of each request under three ways of resolving the user:
+
+- legacy: `User.objects.get` on every request, as api_login_required did
+- cold: accounts.request_user with an empty cache (a narrow identity
+  query; the profile loads only where a view reads it)
+- hot: accounts.request_user with the identity cached (the profile still
+  loads where a view reads it)
+
+Question generation and feedback are stubbed out; only the requests'
+own database work is measured.
+
+Usage:
+    python -m benchmarks.auth_bench
+    python -m benchmarks.auth_bench --repeat 50 --output auth.json
+"""
+
+import argparse
+import json
+import logging
+import sys
+from contextlib import ExitStack
+from typing import Any, Dict, List, Tuple
+from unittest import mock
+
+from benchmarks.db import measure, setup_django, test_database
+
+ANSWERS = 8
+CONFIGS = ('legacy', 'cold', 'hot')
+LOCMEM = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'auth-bench'}}
+QUESTIONS = {'technical_questions': [f'Question {i}?' for i in range(ANSWERS)], 'hr_questions': []}
+FEEDBACK = {'overall_score': 72, 'strengths': ['Clear answers'], 'improvements': ['More depth'],
+            'category_scores': {'technical_performance': 70}, 'detailed_feedback': 'Solid.'}
+
+
+def legacy_resolve(claims: dict):
+    """How api_login_required used to find the token's user."""
+    from accounts.models import User
+
+    try:
+        user = User.objects.get(pk=claims['user_id'])
+    except User.DoesNotExist:
+        return None
+    return user
+
+
+def _flow(session_id: int) -> List[Tuple[str, str, str, dict]]:
+    """(label, method, url, JSON body) of each request type of the flow."""
+    return [
+        ('user_info', 'get', '/api/user-info/', None),
+        ('generate_questions', 'post', '/api/generate-questions/',
+         {'mode': 'role', 'difficulty': 'intermediate', 'role': 'Backend Developer'}),
+        ('submit_answer', 'post', '/api/submit-answer/',
+         {'session_id': session_id, 'question_index': 0, 'answer': 'An answer'}),
+        ('complete_interview', 'post', '/api/complete-interview/', {'session_id': session_id}),
+        ('session_history', 'get', '/api/session-history/', None),
+        ('session_detail', 'get', f'/api/session/{session_id}/', None),
+        ('analytics', 'get', '/api/analytics/', None),
+    ]
+
+
+def run_config(name: str, user, session_id: int, repeat: int = 20) -> Dict[str, Any]:
+    from django.core.cache import cache
+    from django.test import Client, override_settings
+
+    from accounts import request_user
+    from accounts.jwt_utils import create_token
+
+    client = Client(HTTP_AUTHORIZATION=f'Bearer {create_token(user.id, token_version=user.token_version)}')
+    with ExitStack() as stack:
+        stack.enter_context(override_settings(CACHES=LOCMEM))
+        stack.enter_context(mock.patch('interviews.views._generate_interview_questions', return_value=QUESTIONS))
+        stack.enter_context(mock.patch('interviews.views._generate_interview_feedback', return_value=FEEDBACK))
+        if name == 'legacy':
+            stack.enter_context(mock.patch.object(request_user, 'resolve', legacy_resolve))
+
+        results = {}
+        for label, method, url, body in _flow(session_id):
+            def request(method=method, url=url, body=body):
+                if name != 'hot':
+                    cache.clear()
+                if method == 'get':
+                    response = client.get(url)
+                else:
+                    response = client.post(url, json.dumps(body), content_type='application/json')
+                assert response.status_code == 200, (url, response.status_code)
+            request()
+            results[label] = measure(request, repeat)
+        return results
+
+
+def flow_queries(results: Dict[str, Any]) -> int:
+    """Queries of one whole interview: every request once, the autosave ANSWERS times."""
+    return sum(r['queries'] * (ANSWERS if label == 'submit_answer' else 1) for label, r in results.items())
+
+
+def run_benchmark(repeat: int = 20) -> Dict[str, Any]:
+    """Queries and time per interview-flow request by way of resolving the user; needs a (test) database."""
+    from accounts.models import User
+    from interviews.models import InterviewSession
+
+    user = User.objects.create(username='auth-bench', email='auth-bench@example.com', skills='Python, Django')
+    session = InterviewSession.objects.create(user=user, mode='role', difficulty='intermediate',
+                                              role='Backend Developer', questions=QUESTIONS)
+
+    results = {name: run_config(name, user, session.id, repeat) for name in CONFIGS}
+    return {
+        'config': {'answers': ANSWERS, 'repeat': repeat},
+        'results': results,
+        'flow_queries': {name: flow_queries(results[name]) for name in CONFIGS},
+    }
+
+
+def _print_report(results: Dict[str, Any], out=sys.stdout) -> None:
+    out.write(f"{'request':20s}" + ''.join(f" {name + ' ms':>10s} {'queries':>7s}" for name in CONFIGS) + '\n')
+    for label in results['results']['legacy']:
+        row = ''.join(f" {results['results'][name][label]['median_ms']:10.2f}"
+                      f" {results['results'][name][label]['queries']:7d}" for name in CONFIGS)
+        out.write(f'{label:20s}{row}\n')
+    flow = results['flow_queries']
+    out.write(f"Queries per interview ({ANSWERS} autosaves): "
+              + ', '.join(f'{name} {flow[name]}' for name in CONFIGS) + '\n')
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Queries per interview-flow request by JWT user resolution')
+    parser.add_argument('--output', help='Write the results JSON here')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    setup_django()
+    logging.getLogger('django').setLevel(logging.WARNING)
+    with test_database():
+        results = run_benchmark(args.repeat)
+    _print_report(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
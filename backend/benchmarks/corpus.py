@@ -0,0 +1,221 @@
+"""
+Synthetic Resume Corpus
+Deterministic resume PDFs for benchmarking: same seed -> byte-identical
+files, no network and no fixtures on disk. Cases vary page count, section
+layout (which headings are used, or none at all) and skill density.
+`edit_case` derives the next version of a case the way candidates revise
+their resumes: one section touched, everything else identical.
+"""
+
+import hashlib
+import random
+import zlib
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Fixed vocabulary so the corpus doesn't change when the skill taxonomy does;
+# aliases and unknown tools are mixed in on purpose
+SKILL_VOCAB = [
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'Go', 'Rust', 'Kotlin', 'SQL',
+    'React', 'Angular', 'Vue', 'Node.js', 'NodeJS', 'Django', 'Flask', 'FastAPI', 'Spring Boot',
+    'PostgreSQL', 'Postgres', 'MySQL', 'MongoDB', 'Redis', 'Elasticsearch',
+    'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'K8s', 'Terraform', 'Jenkins', 'GitHub Actions',
+    'TensorFlow', 'PyTorch', 'pandas', 'NumPy', 'scikit-learn', 'Spark', 'Tableau',
+    'Git', 'Jira', 'GraphQL', 'REST APIs', 'Microservices', 'CI/CD', 'Jest', 'Pytest',
+    'HTML', 'CSS', 'Tailwind', 'Webpack', 'Kafka', 'RabbitMQ', 'Airflow', 'Snowflake',
+]
+SOFT_VOCAB = [
+    'leadership', 'teamwork', 'communication', 'problem solving', 'mentoring',
+    'time management', 'collaboration', 'stakeholder management', 'critical thinking',
+]
+FILLER = [
+    'Worked closely with product and design on quarterly roadmap planning',
+    'Reduced page load time and improved reliability of the checkout flow',
+    'Owned the on-call rotation and wrote runbooks for common incidents',
+    'Migrated legacy services and documented the new deployment process',
+    'Ran user interviews and turned feedback into prioritised tickets',
+    'Presented results to the wider engineering organisation every sprint',
+]
+ACTION_VERBS = ['Developed', 'Built', 'Designed', 'Implemented', 'Led', 'Created', 'Architected']
+
+LAYOUTS: Dict[str, Dict[str, str]] = {
+    'standard': {
+        'summary': 'SUMMARY', 'skills': 'TECHNICAL SKILLS', 'experience': 'WORK EXPERIENCE',
+        'projects': 'PROJECTS', 'education': 'EDUCATION',
+    },
+    'alt_headers': {
+        'summary': 'Profile', 'skills': 'Tech Stack', 'experience': 'Employment History',
+        'projects': 'Personal Projects', 'education': 'Academics',
+    },
+    'projects_first': {
+        'projects': 'Key Projects', 'skills': 'Skills', 'experience': 'Experience',
+        'summary': 'About Me', 'education': 'Education',
+    },
+    'no_headers': {},
+}
+SKILL_DENSITY = {'low': 0.15, 'high': 0.8}  # share of body lines that mention skills
+
+# Revisions for edit_case: 'contact' touches only the header (name/contact
+# lines), the others add a line at the top of that section
+EDITS = ('contact', 'skills', 'experience', 'projects')
+
+LINES_PER_PAGE = 48
+
+
+def make_pdf(pages: Sequence[Sequence[str]], image_size: Optional[Tuple[int, int]] = None) -> bytes:
+    """
+    Build a minimal text PDF: `pages` is a list of line lists. With
+    `image_size=(w, h)` every page also draws one Flate-compressed grayscale
+    image of that size (tiny on disk, large once decoded).
+    """
+    objects = []
+
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    font = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    image = None
+    if image_size:
+        width, height = image_size
+        data = zlib.compress(b"\x00" * (width * height), 9)
+        image = add(
+            b"<< /Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace /DeviceGray "
+            b"/BitsPerComponent 8 /Filter /FlateDecode /Length %d >>\nstream\n" % (width, height, len(data))
+            + data + b"\nendstream"
+        )
+    pages_id = add(b"")
+    kids = []
+    for lines in pages:
+        ops = [b"BT /F1 9 Tf 11 TL 40 790 Td"]
+        for line in lines:
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            ops.append(b"(" + escaped.encode("latin-1", "replace") + b") Tj T*")
+        ops.append(b"ET")
+        if image:
+            ops.append(b"q 500 0 0 300 50 50 cm /Im1 Do Q")
+        stream = b"\n".join(ops)
+        content = add(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        xobjects = b" /XObject << /Im1 %d 0 R >>" % image if image else b""
+        kids.append(add(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 842] "
+            b"/Resources << /Font << /F1 %d 0 R >>%s >> /Contents %d 0 R >>" % (pages_id, font, xobjects, content)
+        ))
+    objects[pages_id - 1] = (
+        b"<< /Type /Pages /Kids [" + b" ".join(b"%d 0 R" % k for k in kids) + b"] /Count %d >>" % len(kids)
+    )
+    root = add(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, root, xref)
+    return bytes(out)
+
+
+@dataclass
+class CorpusCase:
+    name: str
+    pages: int
+    layout: str
+    density: str
+    pdf: bytes = field(repr=False)
+    page_lines: List[List[str]] = field(default_factory=list, repr=False)
+
+    @property
+    def sha256(self) -> str:
+        return hashlib.sha256(self.pdf).hexdigest()
+
+
+def _skill_line(rng: random.Random, density: float) -> str:
+    if rng.random() >= density:
+        return rng.choice(FILLER)
+    skills = rng.sample(SKILL_VOCAB, rng.randint(2, 5))
+    soft = f" Strong {rng.choice(SOFT_VOCAB)}." if rng.random() < 0.3 else ''
+    return f"{rng.choice(FILLER)} using {', '.join(skills)}.{soft}"
+
+
+def _section_lines(rng: random.Random, section: str, density: float, length: int) -> List[str]:
+    if section == 'summary':
+        return [f"Software engineer with {rng.randint(1, 12)} years of experience in {', '.join(rng.sample(SKILL_VOCAB, 3))}."] + \
+            [_skill_line(rng, density) for _ in range(length - 1)]
+    if section == 'skills':
+        return [', '.join(rng.sample(SKILL_VOCAB, max(3, int(12 * density)))) for _ in range(length)]
+    if section == 'projects':
+        lines = []
+        while len(lines) < length:
+            lines.append(f"{rng.choice(ACTION_VERBS)} {rng.choice(['an analytics', 'a booking', 'a chat', 'a search'])} "
+                         f"platform with {', '.join(rng.sample(SKILL_VOCAB, 2))}")
+            lines.append(_skill_line(rng, density))
+        return lines[:length]
+    if section == 'education':
+        return [f"B.Tech in Computer Science, {rng.randint(2012, 2024)}"] + [rng.choice(FILLER) for _ in range(length - 1)]
+    return [_skill_line(rng, density) for _ in range(length)]
+
+
+def generate_resume_lines(rng: random.Random, pages: int, layout: str, density: str) -> List[List[str]]:
+    """Resume text split into pages of LINES_PER_PAGE lines"""
+    share = SKILL_DENSITY[density]
+    headers = LAYOUTS[layout]
+    sections = list(headers) or ['summary', 'skills', 'experience', 'projects', 'education']
+    body_lines = pages * LINES_PER_PAGE - 2 - len(headers)
+
+    lines = ['Jordan Example', 'jordan@example.com | +1 555 0100 | github.com/jordan-example']
+    # Experience and projects get the bulk of long resumes
+    weights = {'summary': 1, 'skills': 1, 'experience': 4, 'projects': 3, 'education': 1}
+    total = sum(weights[s] for s in sections)
+    for section in sections:
+        length = body_lines * weights[section] // total
+        if section in headers:
+            lines.append(headers[section])
+        lines.extend(_section_lines(rng, section, share, max(1, length)))
+
+    return [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)]
+
+
+def build_corpus(
+    seed: int = 2026,
+    page_counts: Sequence[int] = (1, 2, 4),
+    layouts: Sequence[str] = tuple(LAYOUTS),
+    densities: Sequence[str] = tuple(SKILL_DENSITY)
+) -> List[CorpusCase]:
+    """Every combination of page count, layout and density, reproducibly"""
+    cases = []
+    for pages, layout, density in product(page_counts, layouts, densities):
+        name = f"p{pages}-{layout}-{density}"
+        # Per-case RNG so adding a case doesn't change the others
+        rng = random.Random(f"{seed}:{name}")
+        page_lines = generate_resume_lines(rng, pages, layout, density)
+        cases.append(CorpusCase(name, pages, layout, density, make_pdf(page_lines), page_lines))
+    return cases
+
+
+def edit_case(case: CorpusCase, edit: str, seed: int = 2026) -> CorpusCase:
+    """The next version of `case` with one section revised (see EDITS)"""
+    rng = random.Random(f"{seed}:{case.name}:{edit}")
+    lines = [line for page in case.page_lines for line in page]
+
+    if edit == 'contact':
+        lines[1] = 'jordan.example@mail.com | +1 555 0199 | linkedin.com/in/jordan-example'
+    else:
+        if edit == 'skills':
+            new_line = ', '.join(rng.sample(SKILL_VOCAB, 4))
+        elif edit == 'experience':
+            new_line = f"Led the migration of the billing service to {', '.join(rng.sample(SKILL_VOCAB, 2))}"
+        elif edit == 'projects':
+            new_line = f"Built a recommendation engine with {', '.join(rng.sample(SKILL_VOCAB, 2))}"
+        else:
+            raise ValueError(f"Unknown edit {edit!r}")
+        # Right under the heading, so the change is inside the section's LLM budget.
+        # Without headings there is no section to target; add it after the contact lines
+        header = LAYOUTS[case.layout].get(edit)
+        lines.insert(lines.index(header) + 1 if header else 2, new_line)
+
+    page_lines = [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)]
+    return CorpusCase(f"{case.name}+{edit}", len(page_lines), case.layout, case.density, make_pdf(page_lines), page_lines)
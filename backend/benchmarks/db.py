@@ -0,0 +1,174 @@
+"""
+Database Benchmark Harness
+Runs the interview/HR query benchmarks against a throwaway test database
+(the one `manage.py test` would create, so never real data) seeded with
+synthetic candidates and interview sessions of realistic size. Without
+DATABASE_URL that is an in-memory SQLite database; point DATABASE_URL at a
+Postgres server to benchmark against a test database there.
+"""
+
+import os
+import random
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Any, Callable, Dict, List
+
+LOREM = ('candidate explained the trade-offs clearly and gave a concrete example from a recent project '
+         'but could go deeper on testing strategy and failure handling ').split()
+
+DIFFICULTIES = ('beginner', 'intermediate', 'advanced')
+ROLES = ('Backend Developer', 'Frontend Developer', 'Data Analyst', 'DevOps Engineer', 'ML Engineer')
+
+
+def setup_django() -> None:
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'cognivue.settings')
+    import django
+    django.setup()
+
+
+@contextmanager
+def test_database():
+    """Create the test database, migrate it, and destroy it afterwards."""
+    from django.db import connection
+
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+def _words(rng: random.Random, count: int) -> str:
+    return ' '.join(rng.choice(LOREM) for _ in range(count))
+
+
+def make_feedback(rng: random.Random) -> Dict[str, Any]:
+    """Feedback in the shape the feedback prompt asks Gemini for (~1.5 KB)."""
+    return {
+        'overall_score': rng.randint(35, 98),
+        'category_scores': {
+            'hr_performance': rng.randint(30, 100),
+            'technical_performance': rng.randint(30, 100),
+            'cultural_fit': rng.randint(30, 100),
+        },
+        'strengths': [_words(rng, 8) for _ in range(3)],
+        'improvements': [_words(rng, 8) for _ in range(3)],
+        'detailed_feedback': _words(rng, 180),
+    }
+
+
+def make_users(count: int, prefix: str = 'bench') -> List[Any]:
+    from accounts.models import User
+
+    # bulk_create skips User.save(), so hand out the candidate UIDs here
+    offset = User.objects.count()
+    return User.objects.bulk_create([
+        User(username=f'{prefix}{i}', email=f'{prefix}{i}@example.com', uid=f'22BAD{offset + i:05d}')
+        for i in range(count)
+    ])
+
+
+def seed_sessions(users, per_user: int, seed: int = 2026, batch_size: int = 1000, answers: int = 8,
+                  minutes_apart: int = 45) -> int:
+    """
+    Bulk-create `per_user` completed interview sessions for each user with
+    questions, feedback JSON and `answers` answer rows of realistic size,
+    completed `minutes_apart` minutes apart (give or take half an hour)
+    leading up to now; returns the number of sessions.
+    """
+    from django.utils import timezone
+
+    from interviews.models import InterviewAnswer, InterviewSession, feedback_columns
+
+    rng = random.Random(seed)
+    now = timezone.now()
+    created = 0
+
+    def flush(batch):
+        sessions = InterviewSession.objects.bulk_create(batch)
+        InterviewAnswer.objects.bulk_create(
+            [InterviewAnswer(session=session, question_index=index, text=_words(rng, 60))
+             for session in sessions for index in range(answers)],
+            batch_size=batch_size,
+        )
+        return len(sessions)
+
+    batch = []
+    for user in users:
+        for i in range(per_user):
+            mode = rng.choice(('resume', 'role'))
+            feedback = make_feedback(rng)
+            batch.append(InterviewSession(
+                user=user,
+                mode=mode,
+                difficulty=rng.choice(DIFFICULTIES),
+                role=rng.choice(ROLES) if mode == 'role' else '',
+                status='completed',
+                questions={
+                    'technical_questions': [_words(rng, 20) for _ in range(5)],
+                    'hr_questions': [_words(rng, 18) for _ in range(3)],
+                },
+                feedback=feedback,
+                # bulk_create skips save(), which is what fills the score/summary columns
+                **feedback_columns(feedback),
+                completed_at=now - timedelta(minutes=(per_user - i) * minutes_apart + rng.randint(0, 30)),
+            ))
+            if len(batch) >= batch_size:
+                created += flush(batch)
+                batch = []
+    if batch:
+        created += flush(batch)
+    # ...and so does the analytics rollup mark_completed keeps
+    from interviews import analytics
+    analytics.rebuild([user.pk for user in users])
+    return created
+
+
+def measure(func: Callable[[], Any], repeat: int = 5) -> Dict[str, Any]:
+    """Median wall time and the number of queries of one call to `func`."""
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    timings = []
+    queries = 0
+    for _ in range(repeat):
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+        queries = len(captured.captured_queries)
+    return {'median_ms': round(statistics.median(timings), 2), 'queries': queries}
+
+
+def _value_size(value) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    return len(str(value).encode('utf-8'))
+
+
+def measure_reads(func: Callable[[], Any]) -> Dict[str, Any]:
+    """
+    Rows and bytes the database returned to one call to `func`: every SELECT
+    it ran is re-run on a raw cursor and the returned values are sized (JSON
+    columns as their serialized text).
+    """
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    with CaptureQueriesContext(connection) as captured:
+        func()
+    rows = size = 0
+    with connection.cursor() as cursor:
+        for query in captured.captured_queries:
+            if not query['sql'].startswith('SELECT'):
+                continue
+            cursor.execute(query['sql'])
+            for row in cursor.fetchall():
+                rows += 1
+                size += sum(_value_size(value) for value in row)
+    return {'rows': rows, 'bytes_read': size}
@@ -0,0 +1,108 @@
+"""
+Echo LLM Stub
+Stands in for genai.Client in the offline benchmarks. It answers from the
+'## SECTION' blocks of the prompt the way the real model is asked to:
+skills from the corpus vocabulary (including tools the taxonomy doesn't know),
+projects from action-verb lines, every finding tagged with its section. For a
+hybrid-mode prompt it leaves out the skills listed as already found and uses
+the smaller schema. Token counts are estimated from characters and latency is
+simulated from them, so shorter prompts and answers are faster.
+"""
+
+import json
+import re
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Set
+
+from benchmarks.corpus import ACTION_VERBS, SKILL_VOCAB, SOFT_VOCAB
+
+CHARS_PER_TOKEN = 4  # rough Gemini ratio for English text
+
+_SECTION_BLOCK = re.compile(r'^## ([A-Z]+)\n(.*?)(?=\n\n|\Z)', re.M | re.S)
+_KNOWN_LINE = re.compile(r'^(Technical|Soft): (.*)$', re.M)
+
+
+def _term_pattern(terms: List[str]) -> re.Pattern:
+    alternatives = '|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+    return re.compile(rf'(?<![\w])(?:{alternatives})(?![\w+#])', re.I)
+
+
+class _EchoModels:
+    def __init__(self, base_latency_ms: float, ms_per_1k_input_tokens: float, ms_per_output_token: float):
+        from core.skill_taxonomy import get_taxonomy
+
+        self.taxonomy = get_taxonomy()
+        self.base_latency_ms = base_latency_ms
+        self.ms_per_1k_input_tokens = ms_per_1k_input_tokens
+        self.ms_per_output_token = ms_per_output_token
+        self.prompts: List[str] = []
+        self._vocab = {term.lower(): term for term in SKILL_VOCAB}
+        self._skill_re = _term_pattern(SKILL_VOCAB)
+        self._soft_re = _term_pattern(SOFT_VOCAB)
+
+    def _known(self, prompt: str) -> Dict[str, Set[str]]:
+        """Skills a hybrid prompt lists as already found (None for a full prompt)"""
+        preamble = prompt.split('Resume Text:', 1)[0]
+        found = dict(_KNOWN_LINE.findall(preamble))
+        if not found:
+            return None
+        return {kind: {name.strip().lower() for name in names.split(',') if name.strip() and names != 'none'}
+                for kind, names in found.items()}
+
+    def _findings(self, prompt: str) -> Dict[str, Any]:
+        known = self._known(prompt)
+        hybrid = known is not None
+        result = {'technical_skills': [], 'soft_skills': [], 'projects': [],
+                  'summary': 'Software engineer', 'experience_level': 'mid'}
+        seen: Set[str] = set()
+
+        for heading, body in _SECTION_BLOCK.findall(prompt):
+            for match in self._skill_re.finditer(body):
+                name = self._vocab[match.group(0).lower()]
+                canonical = self.taxonomy.canonical(name) or name.lower()
+                if canonical in seen or (hybrid and canonical in known.get('Technical', ())):
+                    continue
+                seen.add(canonical)
+                skill = {'name': name, 'category': self.taxonomy.categories.get(canonical, 'Tools'), 'section': heading}
+                if not hybrid:
+                    skill['proficiency'] = 'mentioned'
+                result['technical_skills'].append(skill)
+            for match in self._soft_re.finditer(body):
+                name = match.group(0).lower()
+                if name in seen or (hybrid and name in known.get('Soft', ())):
+                    continue
+                seen.add(name)
+                soft = {'skill': name.title(), 'section': heading}
+                if not hybrid:
+                    soft['context'] = body[max(0, match.start() - 50):match.end() + 50]
+                result['soft_skills'].append(soft)
+            if heading == 'PROJECTS':
+                for line in body.splitlines():
+                    if line.split(' ', 1)[0] in ACTION_VERBS:
+                        result['projects'].append({'section': heading, 'title': line[:60], 'description': line,
+                                                   'technologies': [], 'role': '', 'key_achievements': []})
+        return result
+
+    def generate_content(self, model, contents, config=None):
+        prompt = ''.join(part.text or '' for content in contents for part in content.parts)
+        self.prompts.append(prompt)
+        text = json.dumps(self._findings(prompt))
+        usage = SimpleNamespace(
+            prompt_token_count=len(prompt) // CHARS_PER_TOKEN,
+            candidates_token_count=len(text) // CHARS_PER_TOKEN,
+        )
+        latency_ms = (self.base_latency_ms
+                      + self.ms_per_1k_input_tokens * usage.prompt_token_count / 1000
+                      + self.ms_per_output_token * usage.candidates_token_count)
+        if latency_ms:
+            time.sleep(latency_ms / 1000)
+        return SimpleNamespace(text=text, usage_metadata=usage)
+
+
+class EchoGeminiClient:
+    """Stands in for genai.Client: findings come from the '## SECTION' blocks of the prompt"""
+
+    def __init__(self, base_latency_ms: float = 0.0, ms_per_1k_input_tokens: float = 0.0,
+                 ms_per_output_token: float = 0.0):
+        self.models = _EchoModels(base_latency_ms, ms_per_1k_input_tokens, ms_per_output_token)
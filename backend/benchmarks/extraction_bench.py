@@ -0,0 +1,149 @@
+"""
+LLM Extraction Mode Benchmark
+Analyzes every corpus resume with the full-extraction prompt and with the
+hybrid prompt (pattern-matched skills sent as context, LLM asked only for
+what's missing) and compares prompt/output tokens and LLM wall time. Also
+checks that both modes end up with the same merged analysis.
+
+Offline by default (benchmarks.echo_llm). With --live the real Gemini API is
+called using GEMINI_API_KEY; the merged results then differ run to run, so
+only the usage numbers are meaningful.
+
+Usage:
+    python -m benchmarks.extraction_bench
+    python -m benchmarks.extraction_bench --base-latency-ms 400 --ms-per-output-token 4
+    python -m benchmarks.extraction_bench --live --pages 1 --limit 4
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import sys
+from typing import Any, Dict, Sequence
+
+from benchmarks.corpus import LAYOUTS, SKILL_DENSITY, build_corpus
+from benchmarks.echo_llm import EchoGeminiClient
+
+MODES = ('full', 'hybrid')
+METRICS = ('prompt_tokens', 'output_tokens', 'llm_ms')
+
+
+def analysis_outcome(analysis) -> Dict[str, Any]:
+    """What a user of the analysis sees, independent of how it was extracted"""
+    return {
+        'technical_skills': sorted(s['name'].lower() for s in analysis.technical_skills),
+        'soft_skills': sorted(s['skill'].lower() for s in analysis.soft_skills),
+        'projects': [p.get('title', '') for p in analysis.projects],
+        'experience_level': analysis.experience_level,
+    }
+
+
+def run_benchmark(
+    seed: int = 2026,
+    page_counts: Sequence[int] = (1, 2, 4),
+    layouts: Sequence[str] = tuple(LAYOUTS),
+    densities: Sequence[str] = tuple(SKILL_DENSITY),
+    base_latency_ms: float = 0.0,
+    ms_per_1k_input_tokens: float = 0.0,
+    ms_per_output_token: float = 0.0,
+    live: bool = False,
+    limit: int = 0
+) -> Dict[str, Any]:
+    """Full vs hybrid extraction for every corpus case; returns the results document"""
+    from core.resume_analyzer import ResumeAnalyzer
+
+    analyzers = {}
+    for mode in MODES:
+        if live:
+            analyzers[mode] = ResumeAnalyzer(os.environ.get('GEMINI_API_KEY', ''), extraction_mode=mode)
+            if analyzers[mode].client is None:
+                raise SystemExit('--live needs GEMINI_API_KEY')
+        else:
+            analyzers[mode] = ResumeAnalyzer(enable_llm=False, extraction_mode=mode)
+            analyzers[mode].client = EchoGeminiClient(base_latency_ms, ms_per_1k_input_tokens, ms_per_output_token)
+
+    corpus = build_corpus(seed, page_counts, layouts, densities)
+    if limit:
+        corpus = corpus[:limit]
+
+    cases: Dict[str, Any] = {}
+    for case in corpus:
+        doc = analyzers['full'].parse_document(io.BytesIO(case.pdf))
+        results, outcomes = {}, {}
+        for mode, analyzer in analyzers.items():
+            analysis = analyzer.analyze_document(doc)
+            outcomes[mode] = analysis_outcome(analysis)
+            results[mode] = {
+                'prompt_tokens': analysis.llm_usage.get('prompt_tokens', 0),
+                'output_tokens': analysis.llm_usage.get('output_tokens', 0),
+                'llm_ms': round(analysis.timings.get('llm_extract', 0.0), 2),
+            }
+        cases[case.name] = {**results, 'outcome_match': outcomes['full'] == outcomes['hybrid']}
+
+    totals = {mode: {metric: round(sum(case[mode][metric] for case in cases.values()), 2) for metric in METRICS}
+              for mode in MODES}
+    return {
+        'config': {
+            'seed': seed,
+            'page_counts': list(page_counts),
+            'live': live,
+            'base_latency_ms': base_latency_ms,
+            'ms_per_1k_input_tokens': ms_per_1k_input_tokens,
+            'ms_per_output_token': ms_per_output_token,
+        },
+        'cases': cases,
+        'totals': totals,
+        'savings': {
+            metric: round(1 - totals['hybrid'][metric] / totals['full'][metric], 3) if totals['full'][metric] else 0.0
+            for metric in METRICS
+        },
+        'outcome_match': all(case['outcome_match'] for case in cases.values()),
+    }
+
+
+def _print_report(results: Dict[str, Any], out=sys.stdout) -> None:
+    out.write(f"{'case':32s} " + ' '.join(f'{f"{metric} {mode}":>20s}' for metric in METRICS for mode in MODES)
+              + ' match\n')
+    for name, case in results['cases'].items():
+        out.write(f"{name:32s} " + ' '.join(f'{case[mode][metric]:20}' for metric in METRICS for mode in MODES)
+                  + f" {'yes' if case['outcome_match'] else 'NO'}\n")
+    for metric in METRICS:
+        out.write(f"{metric:14s} full {results['totals']['full'][metric]:>10} "
+                  f"hybrid {results['totals']['hybrid'][metric]:>10} saved {results['savings'][metric]:.0%}\n")
+    out.write(f"Hybrid analysis matches full extraction: {'yes' if results['outcome_match'] else 'NO'}\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Compare full and hybrid LLM extraction on the synthetic corpus')
+    parser.add_argument('--output', help='Write the results JSON here')
+    parser.add_argument('--seed', type=int, default=2026)
+    parser.add_argument('--pages', default='1,2,4', help='Comma-separated page counts')
+    parser.add_argument('--base-latency-ms', type=float, default=0.0, help='Simulated fixed LLM latency per call')
+    parser.add_argument('--ms-per-1k-input-tokens', type=float, default=0.0)
+    parser.add_argument('--ms-per-output-token', type=float, default=0.0)
+    parser.add_argument('--live', action='store_true', help='Call the real Gemini API (uses GEMINI_API_KEY)')
+    parser.add_argument('--limit', type=int, default=0, help='Only the first N corpus cases')
+    args = parser.parse_args(argv)
+
+    logging.getLogger('core').setLevel(logging.WARNING)
+    results = run_benchmark(
+        seed=args.seed,
+        page_counts=[int(p) for p in args.pages.split(',') if p],
+        base_latency_ms=args.base_latency_ms,
+        ms_per_1k_input_tokens=args.ms_per_1k_input_tokens,
+        ms_per_output_token=args.ms_per_output_token,
+        live=args.live,
+        limit=args.limit,
+    )
+    _print_report(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return 0 if args.live or results['outcome_match'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
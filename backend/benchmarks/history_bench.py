@@ -0,0 +1,112 @@
+"""
+Session History Benchmark
+Times `session_history` against the implementation it replaced, which
+loaded the 20 latest sessions as full model instances (questions and
+feedback JSON included) to show scores and two strengths/improvements.
+For each history size reports median response time, queries, and the rows
+and bytes read from the database, and checks both return the same sessions
+(the legacy view had no pagination, so only the first page is compared).
+
+Usage:
+    python -m benchmarks.history_bench
+    python -m benchmarks.history_bench --sizes 20,200,2000 --output history.json
+"""
+
+import argparse
+import json
+import logging
+import sys
+from typing import Any, Dict, Sequence
+
+from benchmarks.db import make_users, measure, measure_reads, seed_sessions, setup_django, test_database
+
+IMPLEMENTATIONS = ('legacy', 'projection')
+
+
+def legacy_history(user) -> Dict[str, Any]:
+    """What `session_history` used to do."""
+    from interviews.models import InterviewSession
+
+    sessions = InterviewSession.objects.filter(user=user, status='completed').order_by('-completed_at')[:20]
+    history = []
+    for s in sessions:
+        history.append({
+            'id': s.id,
+            'mode': s.mode,
+            'difficulty': s.difficulty,
+            'role': s.role or None,
+            'experience_level': s.experience_level or None,
+            'overall_score': s.overall_score,
+            'duration_minutes': s.duration_minutes,
+            'created_at': s.created_at.isoformat(),
+            'completed_at': s.completed_at.isoformat() if s.completed_at else None,
+            'feedback_summary': {
+                'strengths': (s.feedback.get('strengths', [])[:2] if s.feedback else []),
+                'improvements': (s.feedback.get('improvements', [])[:2] if s.feedback else []),
+            },
+        })
+    return {'sessions': history}
+
+
+def current_history(user) -> Dict[str, Any]:
+    from django.test import RequestFactory
+
+    from interviews.views import session_history
+
+    request = RequestFactory().get('/api/session-history/')
+    request.user = user
+    return json.loads(session_history(request).content)
+
+
+def run_benchmark(sizes: Sequence[int] = (20, 200, 2000), repeat: int = 10, seed: int = 2026) -> Dict[str, Any]:
+    """Legacy vs projected history for one user per history size; needs a (test) database."""
+    results: Dict[str, Any] = {}
+    for size in sizes:
+        user = make_users(1, prefix=f'history{size}-')[0]
+        seed_sessions([user], size, seed=seed)
+        runs = {'legacy': lambda: legacy_history(user), 'projection': lambda: current_history(user)}
+        results[str(size)] = {
+            name: {**measure(func, repeat), **measure_reads(func)} for name, func in runs.items()
+        }
+        results[str(size)]['response_match'] = (
+            json.loads(json.dumps(legacy_history(user)))['sessions'] == current_history(user)['sessions']
+        )
+    return {
+        'config': {'sizes': list(sizes), 'repeat': repeat, 'seed': seed},
+        'sizes': results,
+        'response_match': all(size['response_match'] for size in results.values()),
+    }
+
+
+def _print_report(results: Dict[str, Any], out=sys.stdout) -> None:
+    out.write(f"{'sessions':>8s} {'impl':10s} {'median ms':>10s} {'queries':>7s} {'rows':>5s} {'bytes read':>11s}\n")
+    for size, by_impl in results['sizes'].items():
+        for name in IMPLEMENTATIONS:
+            r = by_impl[name]
+            out.write(f"{size:>8s} {name:10s} {r['median_ms']:10.2f} {r['queries']:7d} {r['rows']:5d} "
+                      f"{r['bytes_read']:11d}\n")
+    out.write(f"Responses match: {'yes' if results['response_match'] else 'NO'}\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Time session_history against the full-row implementation')
+    parser.add_argument('--output', help='Write the results JSON here')
+    parser.add_argument('--sizes', default='20,200,2000', help='Comma-separated sessions per user')
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=2026)
+    args = parser.parse_args(argv)
+
+    setup_django()
+    logging.getLogger('django').setLevel(logging.WARNING)
+    with test_database():
+        results = run_benchmark([int(s) for s in args.sizes.split(',') if s], args.repeat, args.seed)
+    _print_report(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return 0 if results['response_match'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+HR Request Overhead Benchmark
+Replays the HR dashboard's requests through the full middleware stack (test
+client) and counts the queries and time each one takes, before and after
+sessions moved to the cache and HR users to the per-process cache:
+
+- legacy: the database session backend, the HRUser fetched on every request
+- cached: cached_db sessions (a local-memory cache stands in for Redis or
+  the file cache) and HR_USER_CACHE_TTL at its default
+
+Each request is made once to warm up, as a dashboard session would have.
+
+Usage:
+    python -m benchmarks.hr_request_bench
+    python -m benchmarks.hr_request_bench --candidates 200 --per-candidate 20 --output hr_requests.json
+"""
+
+import argparse
+import json
+import logging
+import sys
+from typing import Any, Dict
+
+from benchmarks.db import make_users, measure, seed_sessions, setup_django, test_database
+
+CONFIGS = {
+    'legacy': {'SESSION_ENGINE': 'django.contrib.sessions.backends.db', 'HR_USER_CACHE_TTL': 0},
+    'cached': {'SESSION_ENGINE': 'django.contrib.sessions.backends.cached_db', 'HR_USER_CACHE_TTL': 60},
+}
+LOCMEM = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'hr-bench'}}
+
+
+def _requests(uid: str) -> Dict[str, str]:
+    return {
+        'me': '/hr/me/',
+        'roles': '/hr/roles/',
+        'search_uid': f'/hr/search/uid/?uid={uid}',
+        'search_role': '/hr/search/role/?role=Backend+Developer',
+    }
+
+
+def run_config(name: str, hr_user_id: int, uid: str, repeat: int = 20) -> Dict[str, Any]:
+    from django.test import Client, override_settings
+
+    from hr import user_cache
+
+    with override_settings(CACHES=LOCMEM, **CONFIGS[name]):
+        user_cache.clear()
+        # A fresh client, so SessionMiddleware picks up this SESSION_ENGINE
+        client = Client()
+        session = client.session
+        session['hr_user_id'] = hr_user_id
+        session.save()
+
+        results = {}
+        for label, url in _requests(uid).items():
+            def request(url=url):
+                response = client.get(url)
+                assert response.status_code == 200, (url, response.status_code)
+            request()
+            results[label] = measure(request, repeat)
+        return results
+
+
+def run_benchmark(candidates: int = 200, per_candidate: int = 20, repeat: int = 20,
+                  seed: int = 2026) -> Dict[str, Any]:
+    """Queries and time per HR request, database vs cached sessions and HR users; needs a (test) database."""
+    from hr.models import HRUser
+
+    users = make_users(candidates, prefix='candidate')
+    seeded = seed_sessions(users, per_candidate, seed=seed, answers=0)
+    hr = HRUser.objects.create(email='hr-bench@example.com', name='HR bench', is_verified=True)
+
+    results = {name: run_config(name, hr.id, users[0].uid, repeat) for name in CONFIGS}
+    saved = {label: results['legacy'][label]['queries'] - results['cached'][label]['queries']
+             for label in results['legacy']}
+    return {
+        'config': {'candidates': candidates, 'per_candidate': per_candidate, 'sessions': seeded,
+                   'repeat': repeat, 'seed': seed},
+        'results': results,
+        'queries_saved': saved,
+    }
+
+
+def _print_report(results: Dict[str, Any], out=sys.stdout) -> None:
+    out.write(f"{results['config']['sessions']} sessions\n")
+    out.write(f"{'request':12s} {'legacy ms':>10s} {'queries':>7s} {'cached ms':>10s} {'queries':>7s}\n")
+    legacy, cached = results['results']['legacy'], results['results']['cached']
+    for label in legacy:
+        out.write(f"{label:12s} {legacy[label]['median_ms']:10.2f} {legacy[label]['queries']:7d} "
+                  f"{cached[label]['median_ms']:10.2f} {cached[label]['queries']:7d}\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Queries per HR request with database vs cached sessions')
+    parser.add_argument('--output', help='Write the results JSON here')
+    parser.add_argument('--candidates', type=int, default=200)
+    parser.add_argument('--per-candidate', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=2026)
+    args = parser.parse_args(argv)
+
+    setup_django()
+    logging.getLogger('django').setLevel(logging.WARNING)
+    with test_database():
+        results = run_benchmark(args.candidates, args.per_candidate, args.repeat, args.seed)
+    _print_report(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
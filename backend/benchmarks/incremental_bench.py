@@ -0,0 +1,152 @@
+"""
+Incremental Re-analysis Benchmark
+Analyzes each corpus resume, then an edited version of it twice: from scratch
+and incrementally against the first version. Reports LLM calls, prompt tokens
+and LLM time for both, and checks the incremental result equals the full
+re-analysis. The LLM is benchmarks.echo_llm, so no network or API key is
+needed.
+
+Usage:
+    python -m benchmarks.incremental_bench
+    python -m benchmarks.incremental_bench --base-latency-ms 400 --ms-per-output-token 4 --output incremental.json
+"""
+
+import argparse
+import io
+import json
+import logging
+import sys
+import time
+from typing import Any, Dict, Sequence
+
+from benchmarks.corpus import EDITS, LAYOUTS, build_corpus, edit_case
+from benchmarks.echo_llm import EchoGeminiClient
+from benchmarks.extraction_bench import analysis_outcome
+
+
+def _as_previous(analysis) -> Dict[str, Any]:
+    return {
+        'section_hashes': analysis.section_hashes,
+        'sections': analysis.llm_sections,
+        'summary': analysis.summary,
+        'experience_level': analysis.experience_level,
+    }
+
+
+def _run(analyzer, doc, previous=None) -> Dict[str, Any]:
+    start = time.perf_counter()
+    analysis = analyzer.analyze_document(doc, previous=previous)
+    total_ms = (time.perf_counter() - start) * 1000
+    return {
+        'analysis': analysis,
+        'calls': analysis.llm_usage.get('calls', 0),
+        'prompt_tokens': analysis.llm_usage.get('prompt_tokens', 0),
+        'output_tokens': analysis.llm_usage.get('output_tokens', 0),
+        'llm_ms': round(analysis.timings.get('llm_extract', 0.0), 2),
+        'total_ms': round(total_ms, 2),
+    }
+
+
+def _savings(full: float, incremental: float) -> float:
+    return round(1 - incremental / full, 3) if full else 0.0
+
+
+def run_benchmark(
+    seed: int = 2026,
+    page_counts: Sequence[int] = (1, 2),
+    edits: Sequence[str] = EDITS,
+    layouts: Sequence[str] = tuple(LAYOUTS),
+    base_latency_ms: float = 0.0,
+    ms_per_1k_input_tokens: float = 0.0,
+    ms_per_output_token: float = 0.0
+) -> Dict[str, Any]:
+    """Full vs incremental re-analysis of every (case, edit) pair; returns the results document"""
+    from core.resume_analyzer import ResumeAnalyzer
+
+    analyzer = ResumeAnalyzer(enable_llm=False)
+    analyzer.client = EchoGeminiClient(base_latency_ms, ms_per_1k_input_tokens, ms_per_output_token)
+
+    cases: Dict[str, Any] = {}
+    for case in build_corpus(seed, page_counts, layouts, densities=('high',)):
+        first = analyzer.analyze_document(analyzer.parse_document(io.BytesIO(case.pdf)))
+        for edit in edits:
+            edited = edit_case(case, edit, seed)
+            doc = analyzer.parse_document(io.BytesIO(edited.pdf))
+            full = _run(analyzer, doc)
+            incremental = _run(analyzer, doc, previous=_as_previous(first))
+            cases[edited.name] = {
+                'layout': case.layout,
+                'edit': edit,
+                'full': {k: v for k, v in full.items() if k != 'analysis'},
+                'incremental': {k: v for k, v in incremental.items() if k != 'analysis'},
+                'reused_sections': incremental['analysis'].reused_sections,
+                # Per-section attribution can differ (a skill mentioned in two
+                # sections is reported under whichever was sent); the result can't
+                'findings_match': analysis_outcome(full['analysis']) == analysis_outcome(incremental['analysis']),
+            }
+
+    totals = {
+        mode: {metric: round(sum(case[mode][metric] for case in cases.values()), 2)
+               for metric in ('calls', 'prompt_tokens', 'output_tokens', 'llm_ms', 'total_ms')}
+        for mode in ('full', 'incremental')
+    }
+    return {
+        'config': {
+            'seed': seed,
+            'page_counts': list(page_counts),
+            'edits': list(edits),
+            'base_latency_ms': base_latency_ms,
+            'ms_per_1k_input_tokens': ms_per_1k_input_tokens,
+            'ms_per_output_token': ms_per_output_token,
+        },
+        'cases': cases,
+        'totals': totals,
+        'savings': {
+            metric: _savings(totals['full'][metric], totals['incremental'][metric])
+            for metric in ('calls', 'prompt_tokens', 'output_tokens', 'llm_ms')
+        },
+        'findings_match': all(case['findings_match'] for case in cases.values()),
+    }
+
+
+def _print_report(results: Dict[str, Any], out=sys.stdout) -> None:
+    out.write(f"{'case':38s} {'reused':>6s} {'tokens full':>11s} {'incr':>6s} {'llm ms full':>11s} {'incr':>8s} match\n")
+    for name, case in results['cases'].items():
+        out.write(f"{name:38s} {len(case['reused_sections']):6d} {case['full']['prompt_tokens']:11d} "
+                  f"{case['incremental']['prompt_tokens']:6d} {case['full']['llm_ms']:11.1f} "
+                  f"{case['incremental']['llm_ms']:8.1f} {'yes' if case['findings_match'] else 'NO'}\n")
+    totals, savings = results['totals'], results['savings']
+    for metric in ('calls', 'prompt_tokens', 'output_tokens', 'llm_ms'):
+        out.write(f"{metric:14s} full {totals['full'][metric]:>10} incremental {totals['incremental'][metric]:>10} "
+                  f"saved {savings[metric]:.0%}\n")
+    out.write(f"Incremental findings match full re-analysis: {'yes' if results['findings_match'] else 'NO'}\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Compare full and incremental re-analysis of edited resumes')
+    parser.add_argument('--output', help='Write the results JSON here')
+    parser.add_argument('--seed', type=int, default=2026)
+    parser.add_argument('--pages', default='1,2', help='Comma-separated page counts')
+    parser.add_argument('--base-latency-ms', type=float, default=0.0, help='Simulated fixed LLM latency per call')
+    parser.add_argument('--ms-per-1k-input-tokens', type=float, default=0.0)
+    parser.add_argument('--ms-per-output-token', type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    logging.getLogger('core').setLevel(logging.WARNING)
+    results = run_benchmark(
+        seed=args.seed,
+        page_counts=[int(p) for p in args.pages.split(',') if p],
+        base_latency_ms=args.base_latency_ms,
+        ms_per_1k_input_tokens=args.ms_per_1k_input_tokens,
+        ms_per_output_token=args.ms_per_output_token,
+    )
+    _print_report(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return 0 if results['findings_match'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
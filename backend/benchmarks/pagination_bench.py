@@ -0,0 +1,122 @@
+"""
+History Pagination Benchmark
+Times deep pages of one user's session history, fetched the way
+`session_history` does (keyset: seek past the previous page's cursor) and
+the OFFSET/LIMIT way. For each page number reports median time and queries;
+the keyset column should stay flat while OFFSET grows with the page number.
+Also walks every keyset page and checks the pages together are exactly the
+user's sessions in order.
+
+Usage:
+    python -m benchmarks.pagination_bench
+    python -m benchmarks.pagination_bench --sessions 20000 --pages 1,100,900 --output pagination.json
+"""
+
+import argparse
+import json
+import logging
+import sys
+from typing import Any, Dict, Sequence
+
+from benchmarks.db import make_users, measure, seed_sessions, setup_django, test_database
+
+IMPLEMENTATIONS = ('offset', 'keyset')
+COLUMNS = ('id', 'mode', 'difficulty', 'role', 'experience_level', 'overall_score',
+           'created_at', 'completed_at', 'feedback_summary')
+
+
+def _history(user):
+    from interviews.models import InterviewSession
+
+    return InterviewSession.objects.filter(user=user, status='completed').values(*COLUMNS)
+
+
+def offset_page(user, page: int, size: int) -> list:
+    start = (page - 1) * size
+    return list(_history(user).order_by('-completed_at', '-id')[start:start + size])
+
+
+def keyset_page(user, cursor, size: int):
+    from interviews import pagination
+
+    return pagination.keyset_page(_history(user), cursor, size)
+
+
+def cursor_before(user, page: int, size: int):
+    """The cursor a client holds when asking for `page` (None for the first)."""
+    from interviews.pagination import encode_cursor
+
+    if page == 1:
+        return None
+    last = _history(user).order_by('-completed_at', '-id')[(page - 1) * size - 1]
+    return encode_cursor(last['completed_at'], last['id'])
+
+
+def walk_pages(user, size: int) -> list:
+    ids, cursor = [], None
+    while True:
+        rows, cursor = keyset_page(user, cursor, size)
+        ids.extend(row['id'] for row in rows)
+        if cursor is None:
+            return ids
+
+
+def run_benchmark(sessions: int = 10000, pages: Sequence[int] = (1, 50, 450), size: int = 20,
+                  repeat: int = 10, seed: int = 2026) -> Dict[str, Any]:
+    """Offset vs keyset pages of one user's history; needs a (test) database."""
+    user = make_users(1, prefix='paged')[0]
+    seed_sessions([user], sessions, seed=seed, answers=0)
+
+    results: Dict[str, Any] = {}
+    for page in pages:
+        cursor = cursor_before(user, page, size)
+        results[str(page)] = {
+            'offset': measure(lambda: offset_page(user, page, size), repeat),
+            'keyset': measure(lambda: keyset_page(user, cursor, size), repeat),
+        }
+        results[str(page)]['rows_match'] = offset_page(user, page, size) == keyset_page(user, cursor, size)[0]
+
+    expected = list(_history(user).order_by('-completed_at', '-id').values_list('id', flat=True))
+    return {
+        'config': {'sessions': sessions, 'pages': list(pages), 'size': size, 'repeat': repeat, 'seed': seed},
+        'pages': results,
+        'walk_complete': walk_pages(user, size) == expected,
+        'rows_match': all(page['rows_match'] for page in results.values()),
+    }
+
+
+def _print_report(results: Dict[str, Any], out=sys.stdout) -> None:
+    out.write(f"{'page':>6s} {'impl':8s} {'median ms':>10s} {'queries':>7s}\n")
+    for page, by_impl in results['pages'].items():
+        for name in IMPLEMENTATIONS:
+            r = by_impl[name]
+            out.write(f"{page:>6s} {name:8s} {r['median_ms']:10.2f} {r['queries']:7d}\n")
+    out.write(f"Pages match OFFSET: {'yes' if results['rows_match'] else 'NO'}\n")
+    out.write(f"Walking every page returns every session once: {'yes' if results['walk_complete'] else 'NO'}\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Time keyset against OFFSET pagination of session history')
+    parser.add_argument('--output', help='Write the results JSON here')
+    parser.add_argument('--sessions', type=int, default=10000)
+    parser.add_argument('--pages', default='1,50,450', help='Comma-separated page numbers to time')
+    parser.add_argument('--size', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=2026)
+    args = parser.parse_args(argv)
+
+    setup_django()
+    logging.getLogger('django').setLevel(logging.WARNING)
+    with test_database():
+        results = run_benchmark(args.sessions, [int(p) for p in args.pages.split(',') if p], args.size,
+                                args.repeat, args.seed)
+    _print_report(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return 0 if results['rows_match'] and results['walk_complete'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
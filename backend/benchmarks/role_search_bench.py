@@ -0,0 +1,166 @@
+"""
+HR Role Search Benchmark
+Times `hr_search_role` — the latest completed session of each candidate for
+a role, picked in the database — against the implementation it replaced,
+which fetched the role's 50 newest sessions and dropped repeat candidates in
+Python. The seeded history has a few very active candidates whose sessions
+crowd the newest 50. Reports median time, queries and distinct candidates
+returned for a first page sorted by recency and by score and for page 10
+(or the last, if fewer), and checks the results against a brute-force pass
+over every session.
+
+Usage:
+    python -m benchmarks.role_search_bench
+    python -m benchmarks.role_search_bench --candidates 2000 --per-candidate 40 --output role_search.json
+"""
+
+import argparse
+import json
+import logging
+import sys
+from typing import Any, Dict, List
+
+from benchmarks.db import make_users, measure, seed_sessions, setup_django, test_database
+
+ROLE = 'Backend Developer'
+PAGE = 50
+IMPLEMENTATIONS = ('legacy', 'recent', 'score', 'recent_deep')
+
+
+def legacy_search(role: str) -> List[Dict[str, Any]]:
+    """What `hr_search_role` used to do."""
+    from interviews.models import InterviewSession
+
+    sessions = InterviewSession.objects.filter(
+        status='completed', role__iexact=role,
+    ).select_related('user').order_by('-completed_at')[:PAGE]
+    results, seen_users = [], set()
+    for s in sessions:
+        if s.user_id in seen_users:
+            continue
+        seen_users.add(s.user_id)
+        results.append({'session_id': s.id, 'uid': s.user.uid, 'overall_score': s.overall_score})
+    return results
+
+
+def current_search(role: str, sort: str = 'recent', cursor: str = None) -> Dict[str, Any]:
+    from django.test import RequestFactory
+
+    from hr.views import hr_search_role
+
+    params = {'role': role, 'sort': sort, 'limit': PAGE}
+    if cursor:
+        params['cursor'] = cursor
+    # __wrapped__ skips hr_login_required; the benchmark has no HR session
+    response = hr_search_role.__wrapped__(RequestFactory().get('/hr/search/role/', params))
+    return json.loads(response.content)
+
+
+def expected_search(role: str, sort: str) -> List[int]:
+    """Every candidate's latest session id for `role`, the slow obvious way."""
+    from interviews.models import InterviewSession
+
+    latest = {}
+    for row in InterviewSession.objects.filter(status='completed', role__iexact=role) \
+            .values('id', 'user_id', 'completed_at', 'overall_score'):
+        best = latest.get(row['user_id'])
+        if best is None or (row['completed_at'], row['id']) > (best['completed_at'], best['id']):
+            latest[row['user_id']] = row
+    if sort == 'score':
+        def key(row):
+            score = row['overall_score']
+            return (score if score is not None else -1.0, row['completed_at'], row['id'])
+    else:
+        def key(row):
+            return (row['completed_at'], row['id'])
+    return [row['id'] for row in sorted(latest.values(), key=key, reverse=True)]
+
+
+def _deep_cursor(role: str, page: int):
+    """The cursor of `page`, or of the last page if there are fewer; and its page number."""
+    cursor, reached = None, 1
+    while reached < page:
+        next_cursor = current_search(role, cursor=cursor)['next_cursor']
+        if next_cursor is None:
+            break
+        cursor, reached = next_cursor, reached + 1
+    return cursor, reached
+
+
+def run_benchmark(candidates: int = 2000, per_candidate: int = 40, active: int = 5, active_sessions: int = 4000,
+                  repeat: int = 5, seed: int = 2026) -> Dict[str, Any]:
+    """Legacy vs database-side latest-per-candidate role search; needs a (test) database."""
+    users = make_users(candidates, prefix='candidate')
+    seeded = seed_sessions(users, per_candidate, seed=seed, answers=0)
+    # A handful of candidates interviewing every minute or so
+    seeded += seed_sessions(make_users(active, prefix='active'), active_sessions, seed=seed + 1, answers=0,
+                            minutes_apart=1)
+
+    deep, deep_page = _deep_cursor(ROLE, 10)
+    runs = {
+        'legacy': lambda: legacy_search(ROLE),
+        'recent': lambda: current_search(ROLE),
+        'score': lambda: current_search(ROLE, sort='score'),
+        'recent_deep': lambda: current_search(ROLE, cursor=deep),
+    }
+    results: Dict[str, Any] = {}
+    for name, func in runs.items():
+        rows = func()
+        rows = rows if name == 'legacy' else rows['results']
+        results[name] = {**measure(func, repeat), 'candidates': len(rows)}
+
+    recent, score = expected_search(ROLE, 'recent'), expected_search(ROLE, 'score')
+    matches = {
+        'recent': [r['session_id'] for r in current_search(ROLE)['results']] == recent[:PAGE],
+        'score': [r['session_id'] for r in current_search(ROLE, sort='score')['results']] == score[:PAGE],
+        'recent_deep': [r['session_id'] for r in current_search(ROLE, cursor=deep)['results']]
+        == recent[(deep_page - 1) * PAGE:deep_page * PAGE],
+    }
+    return {
+        'config': {'candidates': candidates, 'per_candidate': per_candidate, 'active': active,
+                   'active_sessions': active_sessions, 'sessions': seeded, 'repeat': repeat, 'seed': seed,
+                   'deep_page': deep_page},
+        'role_candidates': len(recent),
+        'results': results,
+        'matches': matches,
+        'results_match': all(matches.values()),
+    }
+
+
+def _print_report(results: Dict[str, Any], out=sys.stdout) -> None:
+    config = results['config']
+    out.write(f"{config['sessions']} sessions, {results['role_candidates']} candidates for {ROLE!r}\n")
+    out.write(f"recent_deep is page {config['deep_page']}\n")
+    out.write(f"{'impl':15s} {'median ms':>10s} {'queries':>7s} {'candidates':>10s}\n")
+    for name in IMPLEMENTATIONS:
+        r = results['results'][name]
+        out.write(f"{name:15s} {r['median_ms']:10.2f} {r['queries']:7d} {r['candidates']:10d}\n")
+    out.write(f"Results match brute force: {'yes' if results['results_match'] else 'NO'}\n")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Time hr_search_role against the Python-dedup implementation')
+    parser.add_argument('--output', help='Write the results JSON here')
+    parser.add_argument('--candidates', type=int, default=2000)
+    parser.add_argument('--per-candidate', type=int, default=40)
+    parser.add_argument('--active', type=int, default=5, help='Very active candidates')
+    parser.add_argument('--active-sessions', type=int, default=4000, help='Sessions per very active candidate')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=2026)
+    args = parser.parse_args(argv)
+
+    setup_django()
+    logging.getLogger('django').setLevel(logging.WARNING)
+    with test_database():
+        results = run_benchmark(args.candidates, args.per_candidate, args.active, args.active_sessions,
+                                args.repeat, args.seed)
+    _print_report(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return 0 if results['results_match'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
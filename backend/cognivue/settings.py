@@ -117,8 +117,35 @@ AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
 ]
 
+# ─── Cache ────────────────────────────────────────────────────────────────────
+# Redis when REDIS_URL is set (needs the `redis` package); otherwise a file
+# cache, which unlike the in-memory one is shared by all gunicorn workers. It
+# holds sessions and users, so it defaults to a directory of the app's own
+# rather than a shared temp path; set CACHE_DIR to move it.
+REDIS_URL = os.environ.get('REDIS_URL', '')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ.get('CACHE_DIR', str(BASE_DIR / '.cache')),
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        }
+    }
+# Test runs swap in a private in-memory cache (cognivue.test_runner)
+TEST_RUNNER = 'cognivue.test_runner.TestRunner'
+
 # ─── Sessions ─────────────────────────────────────────────────────────────────
-SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+# Sessions are read from the cache and written through to the database, which
+# stays the fallback on a cache miss. Expired rows are purged by
+# `manage.py clearsessions` each time the web service starts (render.yaml).
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
 SESSION_COOKIE_AGE = 60 * 60 * 24 * 7   # 7 days
 FRONTEND_URL = os.environ.get('FRONTEND_URL', 'http://localhost:3000').rstrip('/')
 
@@ -176,6 +203,66 @@ MAX_UPLOAD_SIZE = int(os.environ.get('MAX_UPLOAD_SIZE', 16 * 1024 * 1024))  # 16
 DATA_UPLOAD_MAX_MEMORY_SIZE = MAX_UPLOAD_SIZE
 FILE_UPLOAD_MAX_MEMORY_SIZE = MAX_UPLOAD_SIZE
 
+# Resume uploads use interviews.upload_handlers.ResumeUploadHandler instead:
+# files above RESUME_UPLOAD_MEMORY_SIZE spill to a temp file, and nothing is
+# written to MEDIA_ROOT unless RESUME_RETAIN_UPLOADS is set.
+RESUME_MAX_UPLOAD_SIZE = int(os.environ.get('RESUME_MAX_UPLOAD_SIZE', MAX_UPLOAD_SIZE))
+RESUME_UPLOAD_MEMORY_SIZE = int(os.environ.get('RESUME_UPLOAD_MEMORY_SIZE', 2 * 1024 * 1024))  # 2 MB
+RESUME_RETAIN_UPLOADS = os.environ.get('RESUME_RETAIN_UPLOADS', 'True').lower() in ('1', 'true', 'yes')
+
+# Retained uploads are stored once per distinct file under MEDIA_ROOT/RESUME_BLOB_DIR
+# (content-addressed, see interviews.resume_storage). Upload references expire
+# after RESUME_BLOB_RETENTION_DAYS; `manage.py sweep_resume_blobs` deletes
+# expired references and blobs nothing points at any more.
+RESUME_BLOB_DIR = 'resumes'
+RESUME_BLOB_RETENTION_DAYS = int(os.environ.get('RESUME_BLOB_RETENTION_DAYS', '180'))
+RESUME_BLOB_SWEEP_GRACE_HOURS = int(os.environ.get('RESUME_BLOB_SWEEP_GRACE_HOURS', '1'))
+
+# ─── Resume analysis ──────────────────────────────────────────────────────────
+# Uploads are analyzed on a background thread pool; the client polls
+# /api/resume-analysis/<id>/, which answers immediately, backing off between polls.
+RESUME_ANALYSIS_ASYNC = os.environ.get('RESUME_ANALYSIS_ASYNC', 'True').lower() in ('1', 'true', 'yes')
+# One job per gunicorn worker by default: with one PDF worker a second job
+# would mostly wait for it, while holding its upload and parsed text in memory
+RESUME_ANALYSIS_WORKERS = int(os.environ.get('RESUME_ANALYSIS_WORKERS', '1'))
+# Jobs run in-process, so a restart loses them; a queued/partial analysis with
+# no progress for this long is reported failed by the status endpoint.
+RESUME_ANALYSIS_STALE_SECONDS = int(os.environ.get('RESUME_ANALYSIS_STALE_SECONDS', '300'))
+
+# Interview questions are generated speculatively as soon as an analysis
+# completes (see interviews.question_prefetch), for the difficulty sent with the
+# upload or predicted from the experience level, on a pool of its own
+# (QUESTION_PREFETCH_WORKERS threads; skipped when they're all busy).
+# generate_questions only uses finished ones; unused ones expire.
+QUESTION_PREFETCH_ENABLED = os.environ.get('QUESTION_PREFETCH_ENABLED', 'True').lower() in ('1', 'true', 'yes')
+QUESTION_PREFETCH_TTL_MINUTES = int(os.environ.get('QUESTION_PREFETCH_TTL_MINUTES', '30'))
+QUESTION_PREFETCH_WORKERS = int(os.environ.get('QUESTION_PREFETCH_WORKERS', '1'))
+
+# Session lists (history, HR search) are keyset-paginated on (completed_at, id):
+# clients get `next_cursor` and may ask for `?limit=` up to PAGE_SIZE_MAX rows.
+HISTORY_PAGE_SIZE = int(os.environ.get('HISTORY_PAGE_SIZE', '20'))
+HR_UID_PAGE_SIZE = int(os.environ.get('HR_UID_PAGE_SIZE', '10'))
+HR_ROLE_PAGE_SIZE = int(os.environ.get('HR_ROLE_PAGE_SIZE', '50'))
+HR_SEARCH_PAGE_SIZE = int(os.environ.get('HR_SEARCH_PAGE_SIZE', '20'))  # full-text search results (not paged)
+PAGE_SIZE_MAX = int(os.environ.get('PAGE_SIZE_MAX', '100'))
+
+# hr_login_required caches the verified HRUser per process (hr.user_cache);
+# edits invalidate it at once in the process that made them, within this many
+# seconds elsewhere. 0 disables the cache.
+HR_USER_CACHE_TTL = int(os.environ.get('HR_USER_CACHE_TTL', '60'))
+
+# PDF text extraction runs in a pool of separate processes: each job is killed
+# after PDF_SANDBOX_TIMEOUT seconds, workers are capped at PDF_SANDBOX_MEMORY_MB
+# of address space and replaced after PDF_SANDBOX_MAX_JOBS jobs. Every gunicorn
+# worker has its own pool; a parser takes ~100 MB of address space once its
+# imports are loaded (~80 MB resident), and the defaults are sized so that the
+# render.yaml service fits a 512 MB instance (see the budget there).
+PDF_SANDBOX_ENABLED = os.environ.get('PDF_SANDBOX_ENABLED', 'True').lower() in ('1', 'true', 'yes')
+PDF_SANDBOX_WORKERS = int(os.environ.get('PDF_SANDBOX_WORKERS', '1'))
+PDF_SANDBOX_TIMEOUT = float(os.environ.get('PDF_SANDBOX_TIMEOUT', '30'))
+PDF_SANDBOX_MEMORY_MB = int(os.environ.get('PDF_SANDBOX_MEMORY_MB', '160'))
+PDF_SANDBOX_MAX_JOBS = int(os.environ.get('PDF_SANDBOX_MAX_JOBS', '50'))
+
 # ─── Google OAuth ─────────────────────────────────────────────────────────────
 GOOGLE_OAUTH_CLIENT_ID = os.environ.get('GOOGLE_OAUTH_CLIENT_ID', '')
 GOOGLE_OAUTH_CLIENT_SECRET = os.environ.get('GOOGLE_OAUTH_CLIENT_SECRET', '')
@@ -197,6 +284,9 @@ EMAIL_TIMEOUT = int(os.environ.get('EMAIL_TIMEOUT', '30'))  # Prevents Gunicorn
 
 # ─── JWT (cross-domain auth: Vercel frontend ↔ Render backend) ───────────────
 JWT_SECRET = os.environ.get('JWT_SECRET', SECRET_KEY)  # Falls back to Django SECRET_KEY for local dev
+# Seconds a Bearer token's user stays in the cache (accounts.request_user),
+# so most API calls resolve it without a query; 0 turns the cache off
+JWT_USER_CACHE_TTL = int(os.environ.get('JWT_USER_CACHE_TTL', '60'))
 
 # ─── Misc ─────────────────────────────────────────────────────────────────────
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
@@ -0,0 +1,51 @@
+"""
+Parsed Resume Document
+The result of parsing a resume PDF exactly once: content hash, per-page text,
+the joined text, its lowercase form and section offsets. Extractors, the
+fallback keyword path and the result cache all take this object instead of
+re-reading the PDF
+"""
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Dict, List, Union
+
+from core.resume_sections import Section, section_digests, segment_resume
+
+
+@dataclass
+class ParsedDocument:
+    sha256: str                      # SHA-256 of the raw PDF bytes ('' for plain text)
+    page_texts: List[str]            # text of each page that was read, empty pages dropped
+    stats: Dict[str, Any] = field(default_factory=dict)  # PdfExtractionStats of the parse
+
+    @classmethod
+    def from_text(cls, text: str, sha256: str = '') -> 'ParsedDocument':
+        """Wrap already-extracted text (tests, bulk tools, sandbox results)"""
+        return cls(sha256=sha256, page_texts=[text] if text else [])
+
+    @classmethod
+    def coerce(cls, source: Union[str, 'ParsedDocument']) -> 'ParsedDocument':
+        return source if isinstance(source, ParsedDocument) else cls.from_text(source)
+
+    @cached_property
+    def text(self) -> str:
+        return "\n".join(self.page_texts).strip()
+
+    @cached_property
+    def text_lower(self) -> str:
+        """Lowercase text for case-insensitive matching"""
+        return self.text.lower()
+
+    @cached_property
+    def sections(self) -> List[Section]:
+        return segment_resume(self.text)
+
+    @cached_property
+    def section_digests(self) -> Dict[str, str]:
+        """Hash of each section as the LLM sees it, for incremental re-analysis"""
+        return section_digests(self.text, self.sections)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.text
@@ -0,0 +1,244 @@
+"""
+Sandboxed PDF Parsing Pool
+Runs resume text extraction in a pool of pre-started worker processes so a
+malformed or hostile PDF can't hang or bloat the web process:
+  - each job has a wall-clock timeout; a worker that overruns is killed and
+    replaced, and the caller gets PdfParseTimeout straight away
+  - workers run under an address-space limit (RLIMIT_AS) where supported
+  - workers are recycled after N jobs to contain parser memory leaks
+  - a worker that can't be replaced (e.g. fork fails under memory pressure)
+    shrinks the pool instead of leaving a dead handle in it
+  - counters (queue depth, kills, recycles, ...) are exposed via metrics()
+"""
+
+import hashlib
+import io
+import logging
+import multiprocessing
+import queue
+import threading
+from typing import Dict, Optional
+
+from core.parsed_document import ParsedDocument
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+
+class PdfParseError(Exception):
+    """The worker could not parse the PDF (crashed or raised)"""
+
+
+class PdfParseTimeout(PdfParseError):
+    """The worker exceeded the per-job wall-clock timeout and was killed"""
+
+
+class PdfPoolBusy(PdfParseError):
+    """No worker became free within the queue timeout"""
+
+
+def _worker_main(conn, memory_limit_bytes: int) -> None:
+    """Worker process loop: receive PDF bytes, send back (status, page texts, stats)"""
+    if memory_limit_bytes and resource is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes))
+
+    from core.resume_analyzer import ResumeAnalyzer
+    analyzer = ResumeAnalyzer(enable_llm=False)
+    conn.send('ready')
+
+    while True:
+        try:
+            pdf_bytes = conn.recv()
+        except (EOFError, OSError):
+            break
+        if pdf_bytes is None:
+            break
+        try:
+            # The parent already knows the hash; only the text crosses the pipe
+            doc = analyzer.parse_document(io.BytesIO(pdf_bytes), sha256='')
+            conn.send(('ok', doc.page_texts, doc.stats))
+        except MemoryError:
+            conn.send(('error', 'memory limit exceeded', {}))
+        except Exception as e:
+            conn.send(('error', str(e), {}))
+
+
+class _Worker:
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.jobs = 0
+        self.ready = False
+
+
+class PdfWorkerPool:
+    """
+    Fixed-size pool of parser processes. parse() is thread-safe; each
+    call borrows one idle worker for the duration of the job
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        job_timeout: float = 20.0,
+        memory_limit_mb: int = 512,
+        max_jobs_per_worker: int = 50,
+        queue_timeout: float = 30.0,
+        startup_timeout: float = 30.0
+    ):
+        self.size = size
+        self.job_timeout = job_timeout
+        self.memory_limit_bytes = memory_limit_mb * 1024 * 1024 if memory_limit_mb else 0
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.queue_timeout = queue_timeout
+        self.startup_timeout = startup_timeout
+
+        # forkserver avoids forking a multi-threaded web worker
+        methods = multiprocessing.get_all_start_methods()
+        self._ctx = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._metrics = {
+            'queue_depth': 0,
+            'max_queue_depth': 0,
+            'jobs_completed': 0,
+            'jobs_failed': 0,
+            'timeouts': 0,
+            'crashes': 0,
+            'kills': 0,
+            'recycled': 0,
+            'busy_rejections': 0,
+            'spawn_failures': 0,
+        }
+
+        for _ in range(size):
+            self._idle.put(self._spawn())
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self.memory_limit_bytes),
+            daemon=True,
+            name='pdf-parser',
+        )
+        process.start()
+        child_conn.close()
+        return _Worker(process, parent_conn)
+
+    def _respawn(self) -> Optional[_Worker]:
+        """A worker to replace a killed or retired one, or None if none could be started (the pool shrinks)"""
+        try:
+            return self._spawn()
+        except Exception as e:
+            with self._lock:
+                self.size -= 1
+                self._metrics['spawn_failures'] += 1
+            logger.error(f"Could not start a replacement PDF worker ({e!r}); pool down to {self.size}")
+            return None
+
+    def _kill(self, worker: _Worker) -> None:
+        worker.process.kill()
+        worker.process.join(timeout=5)
+        worker.conn.close()
+        self._bump('kills')
+
+    def _retire(self, worker: _Worker) -> None:
+        try:
+            worker.conn.send(None)
+        except OSError:
+            pass
+        worker.process.join(timeout=2)
+        if worker.process.is_alive():
+            worker.process.kill()
+            worker.process.join(timeout=5)
+        worker.conn.close()
+
+    def _bump(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._metrics[name] += amount
+
+    def parse(self, pdf_bytes: bytes, sha256: Optional[str] = None) -> ParsedDocument:
+        """
+        Parse a PDF in a worker process into a ParsedDocument
+        Raises PdfParseTimeout, PdfPoolBusy or PdfParseError on failure
+        """
+        if self._closed:
+            raise PdfParseError('PDF worker pool is shut down')
+        if self.size <= 0:
+            raise PdfParseError('No PDF workers left')
+
+        with self._lock:
+            self._metrics['queue_depth'] += 1
+            self._metrics['max_queue_depth'] = max(self._metrics['max_queue_depth'], self._metrics['queue_depth'])
+        try:
+            worker = self._idle.get(timeout=self.queue_timeout)
+        except queue.Empty:
+            self._bump('busy_rejections')
+            raise PdfPoolBusy('All PDF workers are busy')
+        finally:
+            self._bump('queue_depth', -1)
+
+        # Set once `worker` is killed or retired: only a started replacement goes back
+        retired = False
+        replacement: Optional[_Worker] = None
+        try:
+            try:
+                # Replacement workers are started without waiting; the job
+                # timeout only starts once the worker has finished importing
+                if not worker.ready:
+                    if not worker.conn.poll(self.startup_timeout):
+                        raise EOFError('worker did not start')
+                    worker.conn.recv()
+                    worker.ready = True
+                worker.conn.send(pdf_bytes)
+                if not worker.conn.poll(self.job_timeout):
+                    logger.warning(f"PDF worker {worker.process.pid} timed out after {self.job_timeout:g}s, killing it")
+                    self._kill(worker)
+                    self._bump('timeouts')
+                    retired, replacement = True, self._respawn()
+                    raise PdfParseTimeout(f'PDF parsing exceeded {self.job_timeout:g}s')
+                status, payload, stats = worker.conn.recv()
+            except (EOFError, OSError) as e:
+                # Worker died mid-job (segfault, OOM kill, ...)
+                logger.warning(f"PDF worker {worker.process.pid} died: {e!r}")
+                self._kill(worker)
+                self._bump('crashes')
+                retired, replacement = True, self._respawn()
+                raise PdfParseError(f'PDF worker crashed: {e!r}')
+
+            worker.jobs += 1
+            if worker.jobs >= self.max_jobs_per_worker:
+                self._retire(worker)
+                self._bump('recycled')
+                retired, replacement = True, self._respawn()
+
+            if status != 'ok':
+                raise PdfParseError(payload)
+            self._bump('jobs_completed')
+            return ParsedDocument(sha256=sha256 or hashlib.sha256(pdf_bytes).hexdigest(), page_texts=payload, stats=stats)
+        except PdfParseError:
+            self._bump('jobs_failed')
+            raise
+        finally:
+            if not retired:
+                self._idle.put(worker)
+            elif replacement is not None:
+                self._idle.put(replacement)
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._metrics, workers=self.size, idle_workers=self._idle.qsize())
+
+    def shutdown(self) -> None:
+        self._closed = True
+        while True:
+            try:
+                self._retire(self._idle.get_nowait())
+            except queue.Empty:
+                break
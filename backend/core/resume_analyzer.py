@@ -5,17 +5,23 @@ Uses multiple approaches: pattern matching, NLP, and LLM-based extraction
 """
 
 import os
-import re
 import json
+import time
+import hashlib
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, BinaryIO, Callable, Iterator, Optional, Tuple, Union
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 import pdfplumber
 from google import genai
 from google.genai import types
 from pydantic import BaseModel, Field
 
+from core.parsed_document import ParsedDocument
+from core.resume_sections import Section, build_llm_context, section_texts, segment_resume
+from core.skill_taxonomy import get_taxonomy
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -43,6 +49,14 @@ class Project(BaseModel):
     key_achievements: List[str] = Field(default_factory=list)
 
 
+class PdfExtractionStats(BaseModel):
+    """How much of a PDF was actually read"""
+    parser: str = "pdfplumber"
+    pages_scanned: int = 0
+    page_ms: List[float] = Field(default_factory=list)  # wall time per page
+    stopped_by: str = ""  # page_limit, char_budget, time_budget or "" if read to the end
+
+
 class ResumeAnalysis(BaseModel):
     """Complete resume analysis result"""
     technical_skills: List[Dict[str, str]] = Field(default_factory=list)
@@ -50,6 +64,14 @@ class ResumeAnalysis(BaseModel):
     projects: List[Dict[str, Any]] = Field(default_factory=list)
     summary: str = ""
     experience_level: str = "entry"  # entry, mid, senior
+    timings: Dict[str, float] = Field(default_factory=dict)  # per-stage wall time (ms)
+    taxonomy_version: str = ""  # skill taxonomy the pattern matching ran against
+    # LLM findings per resume section and the hash of the text they came from,
+    # so the next version of the same resume only re-sends edited sections
+    section_hashes: Dict[str, str] = Field(default_factory=dict)
+    llm_sections: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
+    reused_sections: List[str] = Field(default_factory=list)  # served from the previous version
+    llm_usage: Dict[str, int] = Field(default_factory=dict)  # calls, prompt_chars, prompt/output tokens
 
 
 class ResumeAnalyzer:
@@ -60,60 +82,18 @@ class ResumeAnalyzer:
     3. LLM (Gemini) for intelligent extraction
     """
     
-    # Comprehensive technical skills database
-    TECHNICAL_SKILLS = {
-        'programming_languages': [
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 
-            'ruby', 'go', 'rust', 'swift', 'kotlin', 'scala', 'r', 'matlab',
-            'perl', 'shell', 'bash', 'powershell', 'dart', 'objective-c'
-        ],
-        'web_frameworks': [
-            'react', 'angular', 'vue', 'svelte', 'next.js', 'nuxt', 'gatsby',
-            'node.js', 'express', 'django', 'flask', 'fastapi', 'spring', 
-            'spring boot', 'laravel', 'rails', 'asp.net', 'blazor'
-        ],
-        'mobile': [
-            'react native', 'flutter', 'android', 'ios', 'xamarin', 'ionic',
-            'swiftui', 'jetpack compose'
-        ],
-        'databases': [
-            'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch',
-            'cassandra', 'dynamodb', 'oracle', 'sql server', 'sqlite', 'firebase',
-            'mariadb', 'neo4j', 'couchdb'
-        ],
-        'cloud_devops': [
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'gitlab ci',
-            'github actions', 'terraform', 'ansible', 'circleci', 'travis ci',
-            'heroku', 'netlify', 'vercel', 'cloud functions', 'lambda'
-        ],
-        'data_ai_ml': [
-            'machine learning', 'deep learning', 'data science', 'ai', 
-            'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas', 
-            'numpy', 'opencv', 'nlp', 'computer vision', 'data analysis',
-            'big data', 'hadoop', 'spark', 'tableau', 'power bi'
-        ],
-        'tools_technologies': [
-            'git', 'github', 'gitlab', 'bitbucket', 'jira', 'confluence',
-            'agile', 'scrum', 'kanban', 'ci/cd', 'microservices', 'rest api',
-            'graphql', 'websocket', 'oauth', 'jwt', 'unit testing', 'jest',
-            'pytest', 'junit', 'selenium', 'cypress'
-        ],
-        'frontend': [
-            'html', 'html5', 'css', 'css3', 'sass', 'scss', 'less', 'bootstrap',
-            'tailwind', 'material ui', 'styled components', 'webpack', 'vite',
-            'babel', 'responsive design', 'ui/ux'
-        ]
-    }
+    # Skill lists and aliases live in core/data/skill_taxonomy.json (see core.skill_taxonomy)
     
-    # Soft skills to look for
-    SOFT_SKILLS = [
-        'leadership', 'teamwork', 'communication', 'problem solving',
-        'critical thinking', 'creativity', 'adaptability', 'time management',
-        'collaboration', 'presentation', 'analytical', 'detail-oriented',
-        'initiative', 'mentoring', 'conflict resolution', 'negotiation',
-        'project management', 'stakeholder management', 'agile mindset',
-        'customer focus', 'innovation', 'strategic thinking'
-    ]
+    # Limits for pathological uploads (hundreds of pages, huge embedded images)
+    MAX_PDF_PAGES = int(os.environ.get("RESUME_MAX_PDF_PAGES", "10"))
+    PDF_CHAR_BUDGET = int(os.environ.get("RESUME_PDF_CHAR_BUDGET", "30000"))
+    PDF_TIME_BUDGET = float(os.environ.get("RESUME_PDF_TIME_BUDGET", "20"))  # seconds
+    
+    # 'hybrid' sends the pattern-matched skills along and asks the LLM only for
+    # what pattern matching can't supply (projects, summary, level, missed
+    # skills); 'full' has it re-extract everything
+    LLM_EXTRACTION_MODE = os.environ.get("RESUME_LLM_EXTRACTION_MODE", "hybrid")
+    EXTRACTION_MODES = ('full', 'hybrid')
     
     # Project keywords
     PROJECT_KEYWORDS = [
@@ -121,112 +101,206 @@ class ResumeAnalyzer:
         'architected', 'led', 'managed', 'contributed', 'worked on'
     ]
     
-    def __init__(self, gemini_api_key: str = None):
-        """Initialize the analyzer with Gemini API"""
+    # LLM finding lists, the field that names each finding, and where a finding
+    # the model didn't tag with a section most likely came from
+    FINDING_KEYS = {'technical_skills': 'name', 'soft_skills': 'skill', 'projects': 'title'}
+    FINDING_SECTIONS = {
+        'technical_skills': ('skills', 'experience', 'projects', 'certifications', 'summary', 'education'),
+        'soft_skills': ('summary', 'experience', 'projects', 'skills', 'education', 'certifications'),
+        'projects': ('projects', 'experience', 'summary', 'skills', 'certifications', 'education'),
+    }
+    
+    def __init__(self, gemini_api_key: str = None, enable_llm: bool = True, extraction_mode: str = None):
+        """Initialize the analyzer with Gemini API (enable_llm=False for pattern matching only)"""
+        self.extraction_mode = extraction_mode or self.LLM_EXTRACTION_MODE
+        if self.extraction_mode not in self.EXTRACTION_MODES:
+            raise ValueError(f"Unknown LLM extraction mode {self.extraction_mode!r}")
         api_key = gemini_api_key or os.environ.get("GEMINI_API_KEY", "")
-        if api_key:
+        if not enable_llm:
+            self.client = None
+        elif api_key:
             self.client = genai.Client(api_key=api_key)
         else:
             self.client = None
             logger.warning("No Gemini API key provided. LLM-based extraction disabled.")
+        self.taxonomy = get_taxonomy()
+    
+    def iter_pdf_pages(
+        self,
+        pdf_path: Union[str, BinaryIO],
+        stats: Optional[PdfExtractionStats] = None
+    ) -> Iterator[str]:
+        """
+        Yield page texts one at a time with pdfplumber, stopping at the page
+        cap, once the character budget is met, or when the time budget runs
+        out. Each page's parsed objects are flushed as soon as its text is
+        taken so memory stays flat on long documents
+        """
+        stats = stats if stats is not None else PdfExtractionStats()
+        started = time.perf_counter()
+        collected = 0
+        
+        # Open one page past the cap so we can tell whether we truncated
+        with pdfplumber.open(pdf_path, pages=list(range(1, self.MAX_PDF_PAGES + 2))) as pdf:
+            for index, page in enumerate(pdf.pages):
+                if index >= self.MAX_PDF_PAGES:
+                    stats.stopped_by = 'page_limit'
+                    break
+                
+                page_start = time.perf_counter()
+                try:
+                    page_text = page.extract_text() or ""
+                finally:
+                    page.close()
+                stats.pages_scanned += 1
+                stats.page_ms.append(round((time.perf_counter() - page_start) * 1000, 2))
+                
+                collected += len(page_text)
+                yield page_text
+                
+                if collected >= self.PDF_CHAR_BUDGET:
+                    stats.stopped_by = 'char_budget'
+                    break
+                if time.perf_counter() - started >= self.PDF_TIME_BUDGET:
+                    stats.stopped_by = 'time_budget'
+                    break
     
-    def extract_text_from_pdf(self, pdf_path: str) -> str:
-        """Extract text from PDF using pdfplumber (more robust than PyPDF2)"""
+    def parse_document(
+        self,
+        pdf_path: Union[str, BinaryIO],
+        stats: Optional[PdfExtractionStats] = None,
+        sha256: Optional[str] = None
+    ) -> ParsedDocument:
+        """
+        Parse a PDF once into a ParsedDocument, using pdfplumber (more robust
+        than PyPDF2) and falling back to PyPDF2 if it fails
+        Accepts a file path or a seekable binary stream (e.g. an in-memory upload)
+        Reading is bounded by MAX_PDF_PAGES / PDF_CHAR_BUDGET / PDF_TIME_BUDGET;
+        pass `stats` to find out how much was actually scanned, and `sha256`
+        if the content hash is already known
+        """
+        stats = stats if stats is not None else PdfExtractionStats()
+        if sha256 is None:
+            sha256 = self._sha256_of(pdf_path)
         try:
-            text = ""
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            return text.strip()
+            page_texts = [t for t in self.iter_pdf_pages(pdf_path, stats) if t]
         except Exception as e:
             logger.error(f"Error extracting PDF text with pdfplumber: {e}")
-            # Fallback to PyPDF2
-            try:
-                import PyPDF2
-                text = ""
+            page_texts = self._pypdf2_pages(pdf_path, stats)
+        return ParsedDocument(sha256=sha256, page_texts=page_texts, stats=stats.model_dump())
+    
+    def extract_text_from_pdf(
+        self,
+        pdf_path: Union[str, BinaryIO],
+        stats: Optional[PdfExtractionStats] = None
+    ) -> str:
+        """Extract the text of a PDF (see parse_document for the limits)"""
+        return self.parse_document(pdf_path, stats, sha256='').text
+    
+    @staticmethod
+    def _sha256_of(pdf_path: Union[str, BinaryIO]) -> str:
+        if isinstance(pdf_path, str):
+            with open(pdf_path, 'rb') as file:
+                return hashlib.file_digest(file, 'sha256').hexdigest()
+        if hasattr(pdf_path, 'getbuffer'):
+            return hashlib.sha256(pdf_path.getbuffer()).hexdigest()
+        position = pdf_path.tell()
+        digest = hashlib.file_digest(pdf_path, 'sha256').hexdigest()
+        pdf_path.seek(position)
+        return digest
+    
+    def _pypdf2_pages(self, pdf_path: Union[str, BinaryIO], stats: PdfExtractionStats) -> List[str]:
+        """PyPDF2 fallback with the same page cap and character budget"""
+        try:
+            import PyPDF2
+            stats.parser = 'pypdf2'
+            stats.pages_scanned = 0
+            stats.page_ms = []
+            stats.stopped_by = ''
+            if isinstance(pdf_path, str):
                 with open(pdf_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    for page in pdf_reader.pages:
-                        text += page.extract_text() + "\n"
-                return text.strip()
-            except Exception as e2:
-                logger.error(f"Error with PyPDF2 fallback: {e2}")
-                return ""
+                    return self._read_pypdf2_pages(PyPDF2.PdfReader(file), stats)
+            pdf_path.seek(0)
+            return self._read_pypdf2_pages(PyPDF2.PdfReader(pdf_path), stats)
+        except Exception as e:
+            logger.error(f"Error with PyPDF2 fallback: {e}")
+            return []
+    
+    def _read_pypdf2_pages(self, pdf_reader, stats: PdfExtractionStats) -> List[str]:
+        page_texts = []
+        collected = 0
+        for index, page in enumerate(pdf_reader.pages):
+            if index >= self.MAX_PDF_PAGES:
+                stats.stopped_by = 'page_limit'
+                break
+            page_start = time.perf_counter()
+            page_text = page.extract_text() or ""
+            stats.pages_scanned += 1
+            stats.page_ms.append(round((time.perf_counter() - page_start) * 1000, 2))
+            if page_text:
+                page_texts.append(page_text)
+            collected += len(page_text) + 1
+            if collected >= self.PDF_CHAR_BUDGET:
+                stats.stopped_by = 'char_budget'
+                break
+        return page_texts
     
-    def extract_technical_skills(self, text: str) -> List[Dict[str, str]]:
-        """Extract technical skills using pattern matching"""
-        text_lower = text.lower()
-        found_skills = []
-        
-        # Search for skills from each category
-        for category, skills in self.TECHNICAL_SKILLS.items():
-            for skill in skills:
-                # Use word boundaries for accurate matching
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text_lower, re.IGNORECASE):
-                    found_skills.append({
-                        'name': skill,
-                        'category': category.replace('_', ' ').title(),
-                        'proficiency': 'mentioned'
-                    })
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_skills = []
-        for skill in found_skills:
-            if skill['name'] not in seen:
-                seen.add(skill['name'])
-                unique_skills.append(skill)
-        
-        return unique_skills
+    def extract_technical_skills(self, text: Union[str, ParsedDocument]) -> List[Dict[str, str]]:
+        """Extract technical skills (aliases normalized) using the compiled taxonomy matcher"""
+        doc = ParsedDocument.coerce(text)
+        return [
+            {
+                'name': skill,
+                'category': self.taxonomy.categories[skill],
+                'proficiency': 'mentioned'
+            }
+            for skill in self.taxonomy.find_technical(doc.text_lower, lowered=True)
+        ]
     
-    def extract_soft_skills(self, text: str) -> List[Dict[str, str]]:
-        """Extract soft skills using pattern matching"""
-        text_lower = text.lower()
+    def extract_soft_skills(self, text: Union[str, ParsedDocument]) -> List[Dict[str, str]]:
+        """Extract soft skills using the compiled taxonomy matcher"""
+        doc = ParsedDocument.coerce(text)
+        text = doc.text
         found_soft_skills = []
         
-        for skill in self.SOFT_SKILLS:
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            matches = re.finditer(pattern, text_lower, re.IGNORECASE)
-            
-            for match in matches:
-                # Get context (50 chars before and after)
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 50)
-                context = text[start:end].strip()
-                
-                found_soft_skills.append({
-                    'skill': skill.title(),
-                    'context': context
-                })
-                break  # Only one instance per skill
+        for skill, match_start, match_end in self.taxonomy.find_soft(doc.text_lower, lowered=True):
+            # Get context (50 chars before and after the first mention)
+            start = max(0, match_start - 50)
+            end = min(len(text), match_end + 50)
+            found_soft_skills.append({
+                'skill': skill.title(),
+                'context': text[start:end].strip()
+            })
         
         return found_soft_skills
     
-    def extract_projects_basic(self, text: str) -> List[Dict[str, Any]]:
-        """Extract projects using basic pattern matching"""
-        projects = []
-        lines = text.split('\n')
+    def extract_projects_basic(
+        self,
+        text: Union[str, ParsedDocument],
+        sections: Optional[List[Section]] = None
+    ) -> List[Dict[str, Any]]:
+        """Extract projects using basic pattern matching over the projects section(s)"""
+        if isinstance(text, ParsedDocument):
+            sections = text.sections
+            text = text.text
+        elif sections is None:
+            sections = segment_resume(text)
+        
+        project_bodies = [s.body(text) for s in sections if s.name == 'projects']
+        if project_bodies:
+            lines = '\n'.join(project_bodies).split('\n')
+            in_project_section = True
+        else:
+            # No projects heading - fall back to action-verb lines anywhere
+            lines = text.split('\n')
+            in_project_section = False
         
+        projects = []
         current_project = None
-        in_project_section = False
         
-        for i, line in enumerate(lines):
+        for line in lines:
             line_lower = line.lower().strip()
             
-            # Detect project section headers
-            if re.search(r'\bprojects?\b', line_lower) and len(line.strip()) < 50:
-                in_project_section = True
-                continue
-            
-            # Exit project section if we hit another section
-            if in_project_section and re.search(r'\b(education|experience|skills|certifications?|awards?)\b', line_lower):
-                if current_project:
-                    projects.append(current_project)
-                break
-            
             # Look for project titles (usually bold, capitalized, or have bullet points)
             if in_project_section or any(keyword in line_lower for keyword in ['developed', 'built', 'created', 'project:']):
                 # Potential project title
@@ -250,38 +324,102 @@ class ResumeAnalyzer:
         
         # Extract technologies from each project description
         for project in projects:
-            desc_lower = project['description'].lower()
-            techs = []
-            for category, skills in self.TECHNICAL_SKILLS.items():
-                for skill in skills:
-                    if skill in desc_lower:
-                        techs.append(skill)
-            project['technologies'] = list(set(techs))[:5]  # Limit to 5
+            project['technologies'] = self.taxonomy.find_technical(project['description'])[:5]  # Limit to 5
         
         return projects[:5]  # Return max 5 projects
     
-    def llm_extract_resume_details(self, text: str) -> Dict[str, Any]:
-        """Use Gemini LLM to intelligently extract resume details"""
+    def llm_extract_resume_details(
+        self,
+        text: Union[str, ParsedDocument],
+        sections: Optional[List[Section]] = None,
+        only_sections: Optional[List[str]] = None,
+        previous: Optional[Dict[str, Any]] = None,
+        usage: Optional[Dict[str, int]] = None,
+        known_skills: Optional[Dict[str, List[str]]] = None,
+        raise_errors: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Use Gemini LLM to intelligently extract resume details
+        Only the relevant sections are sent, each within its character budget
+        
+        For incremental re-analysis `only_sections` limits the excerpt to the
+        edited sections and `previous` (the last version's summary and
+        experience level) gives the model the rest of the picture. Call and
+        token counts are added to `usage`
+        
+        In hybrid mode `known_skills` ({'technical': [...], 'soft': [...]}
+        from pattern matching) is sent as context and the model returns only
+        skills missing from it, with a smaller schema
+        
+        Failures (rate limits, timeouts, bad JSON, an empty response) are
+        logged and give {}; with `raise_errors` they are raised instead
+        """
+        if isinstance(text, ParsedDocument):
+            sections = text.sections
+            text = text.text
         if not self.client:
             logger.warning("LLM extraction skipped - no API key")
             return {}
         
         try:
-            prompt = f"""You are an expert resume analyzer. Analyze the following resume text and extract detailed information.
+            resume_context = build_llm_context(text, sections, only=only_sections)
+            logger.info(f"LLM context: {len(resume_context)} of {len(text)} characters")
+            edited_note = ""
+            if only_sections and previous:
+                edited_note = f"""
+This is an edited version of a resume you analyzed before. Only the changed sections are included.
+Previous summary: {previous.get('summary') or 'none'}
+Previous experience level: {previous.get('experience_level') or 'unknown'}
+Extract findings from these sections only, and give a summary and experience level for the whole resume.
+"""
+            if self.extraction_mode == 'hybrid' and known_skills is not None:
+                prompt = self._hybrid_prompt(resume_context, edited_note, known_skills)
+            else:
+                prompt = self._full_prompt(resume_context, edited_note)
 
+            response = self.client.models.generate_content(
+                model="gemini-3-flash-preview",
+                contents=[
+                    types.Content(role="user", parts=[types.Part(text=prompt)])
+                ],
+                config=types.GenerateContentConfig(
+                    response_mime_type="application/json",
+                    temperature=0.3
+                )
+            )
+            self._record_usage(usage, prompt, response)
+            
+            if response.text:
+                result = json.loads(response.text)
+                return result
+            if raise_errors:
+                raise ValueError('Empty LLM response')
+            
+        except Exception as e:
+            if raise_errors:
+                raise
+            logger.error(f"LLM extraction error: {e}")
+        
+        return {}
+    
+    @staticmethod
+    def _full_prompt(resume_context: str, edited_note: str) -> str:
+        return f"""You are an expert resume analyzer. Analyze the following resume text and extract detailed information.
+{edited_note}
 Resume Text:
-{text[:4000]}  # Limit to 4000 chars for API efficiency
+{resume_context}
 
 Extract and return a JSON object with the following structure:
 {{
     "technical_skills": [
-        {{"name": "skill_name", "category": "programming/framework/database/cloud/etc", "proficiency": "mentioned/familiar/proficient/expert"}}
+        {{"name": "skill_name", "category": "programming/framework/database/cloud/etc", "proficiency": "mentioned/familiar/proficient/expert", "section": "heading it appears under"}}
     ],
     "soft_skills": [
-        {{"skill": "soft_skill_name", "context": "brief context where mentioned"}}
+        {{"skill": "soft_skill_name", "context": "brief context where mentioned", "section": "heading it appears under"}}
     ],
     "projects": [
         {{
+            "section": "heading it appears under",
             "title": "project title",
             "description": "brief description",
             "technologies": ["tech1", "tech2"],
@@ -300,74 +438,266 @@ Focus on:
 4. Overall experience level based on years and complexity
 
 Be thorough but concise. Return ONLY valid JSON."""
+    
+    @staticmethod
+    def _hybrid_prompt(resume_context: str, edited_note: str, known_skills: Dict[str, List[str]]) -> str:
+        return f"""You are an expert resume analyzer. Pattern matching already found these skills in the resume:
+Technical: {', '.join(known_skills.get('technical', [])) or 'none'}
+Soft: {', '.join(known_skills.get('soft', [])) or 'none'}
+{edited_note}
+Resume Text:
+{resume_context}
 
-            response = self.client.models.generate_content(
-                model="gemini-3-flash-preview",
-                contents=[
-                    types.Content(role="user", parts=[types.Part(text=prompt)])
-                ],
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    temperature=0.3
-                )
+Return a JSON object with the following structure:
+{{
+    "technical_skills": [{{"name": "skill_name", "category": "programming/framework/database/cloud/etc", "section": "heading it appears under"}}],
+    "soft_skills": [{{"skill": "soft_skill_name", "section": "heading it appears under"}}],
+    "projects": [
+        {{"section": "heading it appears under", "title": "project title", "description": "one sentence",
+          "technologies": ["tech1"], "role": "role in project", "key_achievements": ["achievement1"]}}
+    ],
+    "summary": "brief professional summary",
+    "experience_level": "entry/mid/senior"
+}}
+
+technical_skills and soft_skills: ONLY skills missing from the lists above (empty lists if none).
+Experience level is based on years and complexity. Return ONLY valid JSON."""
+    
+    @staticmethod
+    def _record_usage(usage: Optional[Dict[str, int]], prompt: str, response) -> None:
+        if usage is None:
+            return
+        metadata = getattr(response, 'usage_metadata', None)
+        usage['calls'] = usage.get('calls', 0) + 1
+        usage['prompt_chars'] = usage.get('prompt_chars', 0) + len(prompt)
+        usage['prompt_tokens'] = usage.get('prompt_tokens', 0) + (getattr(metadata, 'prompt_token_count', 0) or 0)
+        usage['output_tokens'] = usage.get('output_tokens', 0) + (getattr(metadata, 'candidates_token_count', 0) or 0)
+    
+    def split_llm_by_section(
+        self,
+        llm_result: Dict[str, Any],
+        doc: ParsedDocument,
+        sent: List[str]
+    ) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """
+        Attribute each LLM finding to one of the `sent` sections: the section
+        the model tagged it with, else the first section whose text mentions
+        it, else the likeliest section for that kind of finding
+        """
+        bodies = {name: body.lower() for name, body in section_texts(doc.text, doc.sections).items()}
+        split = {name: {kind: [] for kind in self.FINDING_KEYS} for name in sent}
+        
+        for kind, key in self.FINDING_KEYS.items():
+            for item in llm_result.get(kind) or []:
+                if not isinstance(item, dict):
+                    continue
+                item = dict(item)
+                section = str(item.pop('section', '') or '').strip(' #').lower()
+                if section not in split:
+                    label = str(item.get(key, '')).strip().lower()
+                    section = next((name for name in sent if label and label in bodies.get(name, '')), None) \
+                        or next((name for name in self.FINDING_SECTIONS[kind] if name in split), sent[0])
+                split[section][kind].append(item)
+        return split
+    
+    def _llm_extract_sections(
+        self,
+        doc: ParsedDocument,
+        previous: Optional[Dict[str, Any]],
+        usage: Dict[str, int],
+        known_skills: Optional[Dict[str, List[str]]] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]], List[str]]:
+        """
+        LLM stage of analyze_document. Returns (llm_result, findings per
+        section, reused section names)
+        
+        `previous` is the last analyzed version of the same candidate's resume
+        ({section_hashes, sections, summary, experience_level}). Sections whose
+        hash is unchanged reuse its findings; only edited sections go to the LLM
+        """
+        digests = doc.section_digests
+        previous = previous or {}
+        previous_hashes = previous.get('section_hashes') or {}
+        previous_sections = previous.get('sections') or {}
+        reused = [
+            name for name, digest in digests.items()
+            if previous_hashes.get(name) == digest and name in previous_sections
+        ]
+        
+        if not self.client or not reused:
+            llm_result = self.llm_extract_resume_details(doc, usage=usage, known_skills=known_skills)
+            if not llm_result or not digests:
+                return llm_result, {}, []
+            return llm_result, self.split_llm_by_section(llm_result, doc, list(digests)), []
+        
+        findings = {name: previous_sections[name] for name in reused}
+        changed = [name for name in digests if name not in findings]
+        llm_result = {}
+        if changed:
+            logger.info(f"Incremental re-analysis: sending {changed}, reusing {reused}")
+            llm_result = self.llm_extract_resume_details(
+                doc, only_sections=changed, previous=previous, usage=usage, known_skills=known_skills
             )
-            
-            if response.text:
-                result = json.loads(response.text)
-                return result
-            
-        except Exception as e:
-            logger.error(f"LLM extraction error: {e}")
+            if llm_result:
+                findings.update(self.split_llm_by_section(llm_result, doc, changed))
+            # On failure the edited sections stay unrecorded and are re-sent next time
+        else:
+            logger.info(f"Incremental re-analysis: no section changed, reusing {reused}")
         
-        return {}
+        combined: Dict[str, Any] = {
+            kind: [item for name in digests if name in findings for item in findings[name].get(kind, [])]
+            for kind in self.FINDING_KEYS
+        }
+        combined['summary'] = llm_result.get('summary') or previous.get('summary', '')
+        combined['experience_level'] = llm_result.get('experience_level') or previous.get('experience_level', '')
+        return combined, findings, reused
     
-    def analyze_resume(self, pdf_path: str) -> ResumeAnalysis:
+    def analyze_resume(
+        self,
+        pdf_path: Union[str, BinaryIO],
+        on_patterns: Optional[Callable[[ResumeAnalysis], None]] = None
+    ) -> ResumeAnalysis:
         """
         Complete resume analysis using hybrid approach
         Combines pattern matching + LLM extraction
+
+        If `on_patterns` is given it is called with the pattern-matching
+        result as soon as it is available, before the (slow) LLM call.
         """
-        logger.info(f"Analyzing resume: {pdf_path}")
+        logger.info(f"Analyzing resume: {pdf_path if isinstance(pdf_path, str) else 'in-memory upload'}")
+        timings: Dict[str, float] = {}
         
-        # Extract text
-        text = self.extract_text_from_pdf(pdf_path)
-        if not text:
+        # Parse once; every later stage works off the document
+        pdf_stats = PdfExtractionStats()
+        doc = self._timed(timings, 'extract_text', self.parse_document, pdf_path, pdf_stats)
+        if doc.is_empty:
             logger.error("Failed to extract text from resume")
-            return ResumeAnalysis()
+            return ResumeAnalysis(timings=timings)
+        
+        logger.info(f"Extracted {len(doc.text)} characters from {pdf_stats.pages_scanned} pages "
+                   f"({pdf_stats.parser}{', stopped by ' + pdf_stats.stopped_by if pdf_stats.stopped_by else ''}; "
+                   f"per-page ms: {pdf_stats.page_ms})")
+        return self.analyze_document(doc, on_patterns, timings)
+    
+    def analyze_text(
+        self,
+        text: str,
+        on_patterns: Optional[Callable[[ResumeAnalysis], None]] = None,
+        timings: Optional[Dict[str, float]] = None
+    ) -> ResumeAnalysis:
+        """Analyze already-extracted resume text. Same stages and callback as analyze_resume"""
+        return self.analyze_document(ParsedDocument.from_text(text), on_patterns, timings)
+    
+    def analyze_document(
+        self,
+        doc: ParsedDocument,
+        on_patterns: Optional[Callable[[ResumeAnalysis], None]] = None,
+        timings: Optional[Dict[str, float]] = None,
+        previous: Optional[Dict[str, Any]] = None
+    ) -> ResumeAnalysis:
+        """
+        Analyze a parsed resume (e.g. one returned by the sandboxed parser
+        pool). Same stages and callback as analyze_resume
+        
+        With `previous` (the candidate's last analyzed version, see
+        _llm_extract_sections) only the sections that changed since then are
+        sent to the LLM
+        """
+        timings = timings if timings is not None else {}
+        usage: Dict[str, int] = {}
+        self._timed(timings, 'segment', lambda: doc.section_digests)
         
-        logger.info(f"Extracted {len(text)} characters from resume")
+        # Pattern-based skill extraction (fast, reliable); in hybrid mode the
+        # LLM is told what was found so it only returns what's missing
+        technical_skills = self._timed(timings, 'technical_skills', self.extract_technical_skills, doc)
+        soft_skills = self._timed(timings, 'soft_skills', self.extract_soft_skills, doc)
+        known_skills = {
+            'technical': [s['name'] for s in technical_skills],
+            'soft': [s['skill'] for s in soft_skills],
+        }
         
-        # Pattern-based extraction (fast, reliable)
-        technical_skills = self.extract_technical_skills(text)
-        soft_skills = self.extract_soft_skills(text)
-        projects_basic = self.extract_projects_basic(text)
+        llm_pool = ThreadPoolExecutor(max_workers=1)
+        try:
+            # The LLM call is the slow part: start it now and finish the
+            # pattern pass while it is in flight
+            llm_future = llm_pool.submit(
+                self._timed, timings, 'llm_extract', self._llm_extract_sections, doc, previous, usage, known_skills
+            )
+            
+            projects_basic = self._timed(timings, 'projects_basic', self.extract_projects_basic, doc)
+            
+            logger.info(f"Pattern matching found: {len(technical_skills)} tech skills, "
+                       f"{len(soft_skills)} soft skills, {len(projects_basic)} projects")
+
+            if on_patterns:
+                on_patterns(ResumeAnalysis(
+                    technical_skills=technical_skills[:20],
+                    soft_skills=soft_skills[:10],
+                    projects=projects_basic[:5],
+                    taxonomy_version=self.taxonomy.version,
+                ))
+            
+            llm_result, llm_sections, reused = self._timed(timings, 'llm_wait', llm_future.result)
+        finally:
+            # If the pattern pass raised, fail now rather than after the LLM call
+            llm_pool.shutdown(wait=False, cancel_futures=True)
         
-        logger.info(f"Pattern matching found: {len(technical_skills)} tech skills, "
-                   f"{len(soft_skills)} soft skills, {len(projects_basic)} projects")
+        result = self._timed(
+            timings, 'merge', self.merge_results,
+            technical_skills, soft_skills, projects_basic, llm_result
+        )
+        result.timings = timings
+        result.llm_sections = llm_sections
+        result.section_hashes = {name: doc.section_digests[name] for name in llm_sections}
+        result.reused_sections = reused
+        result.llm_usage = usage
         
-        # LLM-based extraction (intelligent, context-aware)
-        llm_result = self.llm_extract_resume_details(text)
+        logger.info(f"Final analysis: {len(result.technical_skills)} tech skills, "
+                   f"{len(result.soft_skills)} soft skills, {len(result.projects)} projects")
+        logger.info(f"Stage timings (ms): {timings}")
         
-        # Merge results: prefer LLM for projects, combine skills
-        final_technical_skills = technical_skills  # Start with pattern matching
-        final_soft_skills = soft_skills
+        return result
+    
+    def merge_results(
+        self,
+        technical_skills: List[Dict[str, str]],
+        soft_skills: List[Dict[str, str]],
+        projects_basic: List[Dict[str, Any]],
+        llm_result: Dict[str, Any]
+    ) -> ResumeAnalysis:
+        """Merge pattern matching and LLM results: prefer LLM for projects, combine skills"""
+        final_technical_skills = list(technical_skills)  # Start with pattern matching
+        final_soft_skills = list(soft_skills)
         final_projects = projects_basic
         
         if llm_result:
             # Add LLM-found skills not in pattern matching
-            llm_tech_names = {s.get('name', '').lower() for s in llm_result.get('technical_skills', [])}
-            pattern_tech_names = {s['name'].lower() for s in technical_skills}
-            
+            # Aliases are folded so "K8s" from the LLM doesn't duplicate "kubernetes"
+            seen_tech = {s['name'].lower() for s in technical_skills}
             for llm_skill in llm_result.get('technical_skills', []):
-                if llm_skill.get('name', '').lower() not in pattern_tech_names:
+                # 'section' is bookkeeping for incremental re-analysis; hybrid
+                # mode leaves out proficiency
+                llm_skill = {'category': '', 'proficiency': 'mentioned', **self._untagged(llm_skill)}
+                name = llm_skill.get('name', '').lower()
+                canonical = self.taxonomy.canonical(name)
+                if canonical and canonical in self.taxonomy.categories:
+                    llm_skill = {**llm_skill, 'name': canonical}
+                    name = canonical
+                if name and name not in seen_tech:
+                    seen_tech.add(name)
                     final_technical_skills.append(llm_skill)
             
             # Prefer LLM projects if available (more detailed)
             if llm_result.get('projects'):
-                final_projects = llm_result['projects']
+                final_projects = [self._untagged(project) for project in llm_result['projects']]
             
             # Add LLM soft skills
+            seen_soft = {s['skill'].lower() for s in soft_skills}
             for llm_soft in llm_result.get('soft_skills', []):
-                if not any(s['skill'].lower() == llm_soft.get('skill', '').lower() for s in soft_skills):
+                llm_soft = {'context': '', **self._untagged(llm_soft)}
+                name = llm_soft.get('skill', '').lower()
+                if name and name not in seen_soft:
+                    seen_soft.add(name)
                     final_soft_skills.append(llm_soft)
         
         # Determine experience level
@@ -383,18 +713,27 @@ Be thorough but concise. Return ONLY valid JSON."""
         
         summary = llm_result.get('summary', '') or f"Candidate with {len(final_technical_skills)} technical skills and {len(final_projects)} projects"
         
-        result = ResumeAnalysis(
+        return ResumeAnalysis(
             technical_skills=final_technical_skills[:20],  # Limit to top 20
             soft_skills=final_soft_skills[:10],
             projects=final_projects[:5],
             summary=summary,
-            experience_level=experience_level
+            experience_level=experience_level,
+            taxonomy_version=self.taxonomy.version
         )
-        
-        logger.info(f"Final analysis: {len(result.technical_skills)} tech skills, "
-                   f"{len(result.soft_skills)} soft skills, {len(result.projects)} projects")
-        
-        return result
+    
+    @staticmethod
+    def _untagged(item: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: value for key, value in item.items() if key != 'section'}
+    
+    @staticmethod
+    def _timed(timings: Dict[str, float], stage: str, func: Callable, *args):
+        """Run func(*args) and record its wall time in milliseconds under `stage`"""
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            timings[stage] = round((time.perf_counter() - start) * 1000, 2)
     
     def generate_keywords_from_analysis(self, analysis: ResumeAnalysis) -> List[str]:
         """Generate keyword list for backward compatibility"""
@@ -418,7 +757,7 @@ def analyze_resume_file(pdf_path: str, gemini_api_key: str = None) -> Dict[str,
     Analyze a resume file and return detailed results
     
     Returns:
-        Dict with keys: technical_skills, soft_skills, projects, summary, experience_level, keywords
+        Dict with keys: technical_skills, soft_skills, projects, summary, experience_level, keywords, timings
     """
     analyzer = ResumeAnalyzer(gemini_api_key)
     analysis = analyzer.analyze_resume(pdf_path)
@@ -429,7 +768,8 @@ def analyze_resume_file(pdf_path: str, gemini_api_key: str = None) -> Dict[str,
         'projects': analysis.projects,
         'summary': analysis.summary,
         'experience_level': analysis.experience_level,
-        'keywords': analyzer.generate_keywords_from_analysis(analysis)
+        'keywords': analyzer.generate_keywords_from_analysis(analysis),
+        'timings': analysis.timings
     }
 
 
@@ -441,4 +781,4 @@ if __name__ == "__main__":
         result = analyze_resume_file(pdf_path)
         print(json.dumps(result, indent=2))
     else:
-        print("Usage: python resume_analyzer.py <path_to_resume.pdf>")
+        print("Usage: python -m core.resume_analyzer <path_to_resume.pdf>")
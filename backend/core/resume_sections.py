@@ -0,0 +1,196 @@
+"""
+Resume Section Segmenter
+Finds section boundaries (summary, skills, experience, projects, education,
+certifications) in extracted resume text so downstream extractors can work on
+the parts they care about instead of the whole document
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Collection, Dict, List, Optional
+
+
+# Header spellings seen in real resumes, mapped to a canonical section name
+SECTION_HEADERS = {
+    'summary': [
+        'summary', 'professional summary', 'career summary', 'profile', 'professional profile',
+        'objective', 'career objective', 'about me', 'about',
+    ],
+    'skills': [
+        'skills', 'technical skills', 'key skills', 'core skills', 'core competencies',
+        'technologies', 'tech stack', 'tools and technologies', 'skills and tools', 'soft skills',
+    ],
+    'experience': [
+        'experience', 'work experience', 'professional experience', 'employment',
+        'employment history', 'work history', 'internships', 'internship', 'internship experience',
+    ],
+    'projects': [
+        'projects', 'project', 'personal projects', 'academic projects', 'key projects',
+        'major projects', 'project experience', 'side projects',
+    ],
+    'education': [
+        'education', 'academic background', 'academics', 'qualifications',
+        'educational qualifications', 'academic qualifications',
+    ],
+    'certifications': [
+        'certifications', 'certification', 'certificates', 'licenses and certifications',
+        'courses', 'courses and certifications',
+    ],
+    # Recognised only so they terminate the previous section
+    'other': [
+        'references', 'hobbies', 'interests', 'hobbies and interests', 'languages', 'awards',
+        'achievements', 'awards and achievements', 'publications', 'contact', 'contact information',
+        'personal details', 'personal information', 'declaration', 'extracurricular activities',
+        'volunteering', 'positions of responsibility',
+    ],
+}
+
+_HEADER_LOOKUP = {alias: name for name, aliases in SECTION_HEADERS.items() for alias in aliases}
+_HEADER_MAX_LEN = 40
+_HEADER_STRIP = re.compile(r'^[\s\-•*#|:=_]+|[\s\-•*#|:=_]+$')
+
+# Characters of each section sent to the LLM, in this order; sections not
+# listed are dropped. 'header' (name, title, contact line) and 'other'
+# (publications, awards, ...) get small budgets of their own
+DEFAULT_LLM_BUDGETS = {
+    'header': 300,
+    'summary': 500,
+    'skills': 800,
+    'experience': 1400,
+    'projects': 1600,
+    'certifications': 300,
+    'education': 300,
+    'other': 400,
+}
+# Below this share of the text under recognised headings (header and 'other'
+# not counted), segmentation is too thin to trust and the raw text is sent
+MIN_SECTION_COVERAGE = 0.5
+
+
+@dataclass
+class Section:
+    """A contiguous section of the resume text: text[start:end] is the body"""
+    name: str            # canonical name, 'header' for text before the first heading
+    title: str           # heading as written in the resume
+    header_start: int    # offset of the heading line
+    start: int           # offset of the first body character
+    end: int             # offset one past the last body character
+
+    def body(self, text: str) -> str:
+        return text[self.start:self.end].strip()
+
+
+def classify_header(line: str) -> Optional[str]:
+    """Return the canonical section name if `line` looks like a section heading"""
+    stripped = line.strip()
+    if not stripped or len(stripped) > _HEADER_MAX_LEN:
+        return None
+    normalized = _HEADER_STRIP.sub('', stripped).lower().replace('&', 'and')
+    normalized = re.sub(r'\s+', ' ', normalized)
+    return _HEADER_LOOKUP.get(normalized)
+
+
+def segment_resume(text: str) -> List[Section]:
+    """
+    Split resume text into sections with their character offsets
+    Text before the first recognised heading becomes a 'header' section
+    (name, contact details)
+    """
+    sections: List[Section] = []
+    current: Optional[Section] = None
+    offset = 0
+
+    for line in text.splitlines(keepends=True):
+        name = classify_header(line)
+        if name:
+            if current is None:
+                if offset > 0:
+                    sections.append(Section('header', '', 0, 0, offset))
+            else:
+                current.end = offset
+                sections.append(current)
+            current = Section(name, line.strip(), offset, offset + len(line), len(text))
+        offset += len(line)
+
+    if current is not None:
+        current.end = len(text)
+        sections.append(current)
+    elif text:
+        sections.append(Section('header', '', 0, 0, len(text)))
+
+    return sections
+
+
+def section_texts(text: str, sections: List[Section]) -> Dict[str, str]:
+    """Join the bodies of same-named sections (e.g. two 'projects' headings)"""
+    bodies: Dict[str, List[str]] = {}
+    for section in sections:
+        body = section.body(text)
+        if body:
+            bodies.setdefault(section.name, []).append(body)
+    return {name: '\n'.join(parts) for name, parts in bodies.items()}
+
+
+def _use_fallback(text: str, bodies: Dict[str, str], budgets: Dict[str, int]) -> bool:
+    """Whether the LLM should get the raw text rather than the budgeted sections"""
+    covered = sum(len(body) for name, body in bodies.items() if name in budgets and name not in ('header', 'other'))
+    return covered < MIN_SECTION_COVERAGE * len(text.strip())
+
+
+def build_llm_context(
+    text: str,
+    sections: Optional[List[Section]] = None,
+    budgets: Optional[Dict[str, int]] = None,
+    fallback_chars: int = 4000,
+    only: Optional[Collection[str]] = None
+) -> str:
+    """
+    Build the resume excerpt sent to the LLM: only the relevant sections, each
+    truncated to its character budget. Falls back to the first
+    `fallback_chars` characters when recognised headings cover less than
+    MIN_SECTION_COVERAGE of the text (none found, or only one or two)
+    With `only`, sections not named there are left out as well
+    """
+    budgets = budgets or DEFAULT_LLM_BUDGETS
+    if sections is None:
+        sections = segment_resume(text)
+
+    bodies = section_texts(text, sections)
+    if _use_fallback(text, bodies, budgets):
+        return text[:fallback_chars]
+
+    parts = []
+    for name, budget in budgets.items():
+        body = bodies.get(name)
+        if body and (only is None or name in only):
+            parts.append(f"## {name.upper()}\n{body[:budget]}")
+    return '\n\n'.join(parts)
+
+
+def section_digests(
+    text: str,
+    sections: Optional[List[Section]] = None,
+    budgets: Optional[Dict[str, int]] = None
+) -> Dict[str, str]:
+    """
+    SHA-256 of each section exactly as build_llm_context would send it (within
+    its budget, whitespace collapsed so PDF re-flow doesn't count as an edit)
+    Empty when build_llm_context falls back to the raw text. The header
+    (name, contact details) has none: it is context for a full analysis, and
+    editing only it doesn't call for a new LLM request
+    """
+    budgets = budgets or DEFAULT_LLM_BUDGETS
+    if sections is None:
+        sections = segment_resume(text)
+
+    bodies = section_texts(text, sections)
+    if _use_fallback(text, bodies, budgets):
+        return {}
+    digests = {}
+    for name, budget in budgets.items():
+        body = bodies.get(name)
+        if body and name != 'header':
+            normalized = ' '.join(body[:budget].split())
+            digests[name] = hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+    return digests
@@ -0,0 +1,167 @@
+"""
+Skill Taxonomy
+The technical/soft skill lists and their aliases live in
+core/data/skill_taxonomy.json. `python manage.py compile_taxonomy` turns that
+into a compiled artifact (alias -> canonical map, categories and the matcher
+regexes) which every process reads once at first use. It is small (about 12
+KB) and the regexes have to be compiled per process anyway, so it is read
+with a plain file read; nothing is shared between processes.
+
+If the artifact is missing or was built from an older source file, the
+taxonomy is compiled in memory instead so analysis never breaks
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+SOURCE_PATH = os.path.join(DATA_DIR, 'skill_taxonomy.json')
+ARTIFACT_PATH = os.path.join(DATA_DIR, 'skill_taxonomy.compiled.json')
+
+ARTIFACT_FORMAT = 1
+
+# A term must not be glued to other word characters; "c++" / "c#" must not be
+# followed by more of themselves
+_TERM_BEFORE = r'(?<![\w])'
+_TERM_AFTER = r'(?![\w+#])'
+
+
+def _build_pattern(terms: List[str]) -> str:
+    # Longest first so "spring boot" wins over "spring" at the same offset
+    alternatives = '|'.join(re.escape(term) for term in sorted(set(terms), key=lambda t: (-len(t), t)))
+    return f'{_TERM_BEFORE}(?:{alternatives}){_TERM_AFTER}'
+
+
+def compile_taxonomy(source_bytes: bytes) -> Dict[str, Any]:
+    """Compile the JSON source into the artifact dict written by compile_taxonomy"""
+    source = json.loads(source_bytes)
+    source_sha256 = hashlib.sha256(source_bytes).hexdigest()
+
+    technical: List[Tuple[str, str]] = []
+    soft: List[str] = []
+    technical_terms: Dict[str, str] = {}
+    soft_terms: Dict[str, str] = {}
+
+    for category, skills in source['technical_skills'].items():
+        category_title = category.replace('_', ' ').title()
+        for skill in skills:
+            name = skill.lower()
+            if name in technical_terms:
+                raise ValueError(f'Skill "{name}" is listed more than once')
+            technical.append((name, category_title))
+            technical_terms[name] = name
+
+    for skill in source['soft_skills']:
+        name = skill.lower()
+        soft.append(name)
+        soft_terms[name] = name
+
+    for alias, canonical in source.get('aliases', {}).items():
+        alias, canonical = alias.lower(), canonical.lower()
+        if canonical in technical_terms:
+            technical_terms.setdefault(alias, canonical)
+        elif canonical in soft_terms:
+            soft_terms.setdefault(alias, canonical)
+        else:
+            raise ValueError(f'Alias "{alias}" points at unknown skill "{canonical}"')
+
+    return {
+        'format': ARTIFACT_FORMAT,
+        'version': f"{source.get('version', '0')}+{source_sha256[:8]}",
+        'source_sha256': source_sha256,
+        'technical': technical,
+        'soft': soft,
+        'technical_terms': technical_terms,
+        'soft_terms': soft_terms,
+        'technical_pattern': _build_pattern(list(technical_terms)),
+        'soft_pattern': _build_pattern(list(soft_terms)),
+    }
+
+
+def write_artifact(source_path: str = SOURCE_PATH, artifact_path: str = ARTIFACT_PATH) -> Dict[str, Any]:
+    """Compile `source_path` and atomically replace `artifact_path`"""
+    with open(source_path, 'rb') as f:
+        artifact = compile_taxonomy(f.read())
+
+    tmp_path = f'{artifact_path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(artifact, f, separators=(',', ':'))
+    os.replace(tmp_path, artifact_path)
+    return artifact
+
+
+class SkillTaxonomy:
+    """Read-only matcher over a compiled taxonomy artifact"""
+
+    def __init__(self, artifact: Dict[str, Any]):
+        self.version: str = artifact['version']
+        self.source_sha256: str = artifact['source_sha256']
+        self.technical: List[Tuple[str, str]] = [tuple(item) for item in artifact['technical']]
+        self.soft: List[str] = artifact['soft']
+        self.technical_terms: Dict[str, str] = artifact['technical_terms']
+        self.soft_terms: Dict[str, str] = artifact['soft_terms']
+        self.categories: Dict[str, str] = dict(self.technical)
+        self._technical_re = re.compile(artifact['technical_pattern'])
+        self._soft_re = re.compile(artifact['soft_pattern'])
+
+    def canonical(self, name: str) -> Optional[str]:
+        """Canonical skill name for a skill or alias, None if unknown"""
+        key = name.strip().lower()
+        return self.technical_terms.get(key) or self.soft_terms.get(key)
+
+    def find_technical(self, text: str, lowered: bool = False) -> List[str]:
+        """Canonical technical skills mentioned in `text`, in taxonomy order"""
+        text_lower = text if lowered else text.lower()
+        found = {self.technical_terms[m.group(0)] for m in self._technical_re.finditer(text_lower)}
+        return [name for name, _ in self.technical if name in found]
+
+    def find_soft(self, text: str, lowered: bool = False) -> List[Tuple[str, int, int]]:
+        """(canonical, start, end) of the first mention of each soft skill, in taxonomy order"""
+        first: Dict[str, Tuple[int, int]] = {}
+        for m in self._soft_re.finditer(text if lowered else text.lower()):
+            first.setdefault(self.soft_terms[m.group(0)], m.span())
+        return [(name, *first[name]) for name in self.soft if name in first]
+
+
+def _read_artifact(path: str) -> Dict[str, Any]:
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+
+def load_taxonomy(source_path: str = SOURCE_PATH, artifact_path: str = ARTIFACT_PATH) -> SkillTaxonomy:
+    """Load the compiled artifact, falling back to compiling the source in memory"""
+    with open(source_path, 'rb') as f:
+        source_bytes = f.read()
+    source_sha256 = hashlib.sha256(source_bytes).hexdigest()
+
+    if os.path.exists(artifact_path):
+        try:
+            artifact = _read_artifact(artifact_path)
+            if artifact.get('format') == ARTIFACT_FORMAT and artifact.get('source_sha256') == source_sha256:
+                return SkillTaxonomy(artifact)
+            logger.warning("Skill taxonomy artifact is stale - run `manage.py compile_taxonomy`")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load skill taxonomy artifact: {e}")
+
+    return SkillTaxonomy(compile_taxonomy(source_bytes))
+
+
+_taxonomy: Optional[SkillTaxonomy] = None
+_taxonomy_lock = threading.Lock()
+
+
+def get_taxonomy() -> SkillTaxonomy:
+    """The process-wide taxonomy, loaded on first use"""
+    global _taxonomy
+    if _taxonomy is None:
+        with _taxonomy_lock:
+            if _taxonomy is None:
+                _taxonomy = load_taxonomy()
+    return _taxonomy
@@ -5,3 +5,6 @@ class HrConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'hr'
     verbose_name = 'HR Management'
+
+    def ready(self):
+        from hr import signals  # noqa: F401
@@ -0,0 +1,25 @@
+"""
+Management command: rebuild_candidate_search
+Rewrites the candidate search documents (hr.search) of every completed
+interview session and drops those of sessions no longer completed. Sessions
+are indexed as they complete; run this after bulk imports or direct edits
+to sessions, resume analyses or profile skills.
+
+Usage:
+    python manage.py rebuild_candidate_search
+    python manage.py rebuild_candidate_search --batch-size 1000
+"""
+from django.core.management.base import BaseCommand
+
+from hr import search
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the full-text candidate search index from completed interview sessions'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Sessions indexed per query')
+
+    def handle(self, *args, **options):
+        indexed = search.rebuild(batch_size=max(1, options['batch_size']))
+        self.stdout.write(self.style.SUCCESS(f'Indexed {indexed} completed sessions.'))
@@ -0,0 +1,126 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:01
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# The full-text index over hr_candidate_search, per backend (queried by hr.search)
+POSTGRES_SETUP = [
+    """
+    ALTER TABLE hr_candidate_search ADD COLUMN document tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', profile_skills || ' ' || resume_skills), 'A')
+        || setweight(to_tsvector('english', strengths), 'B')
+        || setweight(to_tsvector('english', summary), 'C')
+    ) STORED
+    """,
+    'CREATE INDEX hr_candidate_search_document_gin ON hr_candidate_search USING GIN (document)',
+]
+POSTGRES_TEARDOWN = [
+    'DROP INDEX IF EXISTS hr_candidate_search_document_gin',
+    'ALTER TABLE hr_candidate_search DROP COLUMN IF EXISTS document',
+]
+
+SQLITE_SETUP = [
+    """
+    CREATE VIRTUAL TABLE hr_candidate_search_fts USING fts5(
+        profile_skills, resume_skills, strengths, summary,
+        content='hr_candidate_search', content_rowid='session_id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER hr_candidate_search_ai AFTER INSERT ON hr_candidate_search BEGIN
+        INSERT INTO hr_candidate_search_fts(rowid, profile_skills, resume_skills, strengths, summary)
+        VALUES (new.session_id, new.profile_skills, new.resume_skills, new.strengths, new.summary);
+    END
+    """,
+    """
+    CREATE TRIGGER hr_candidate_search_ad AFTER DELETE ON hr_candidate_search BEGIN
+        INSERT INTO hr_candidate_search_fts(hr_candidate_search_fts, rowid, profile_skills, resume_skills, strengths, summary)
+        VALUES ('delete', old.session_id, old.profile_skills, old.resume_skills, old.strengths, old.summary);
+    END
+    """,
+    """
+    CREATE TRIGGER hr_candidate_search_au AFTER UPDATE ON hr_candidate_search BEGIN
+        INSERT INTO hr_candidate_search_fts(hr_candidate_search_fts, rowid, profile_skills, resume_skills, strengths, summary)
+        VALUES ('delete', old.session_id, old.profile_skills, old.resume_skills, old.strengths, old.summary);
+        INSERT INTO hr_candidate_search_fts(rowid, profile_skills, resume_skills, strengths, summary)
+        VALUES (new.session_id, new.profile_skills, new.resume_skills, new.strengths, new.summary);
+    END
+    """,
+]
+SQLITE_TEARDOWN = [
+    'DROP TRIGGER IF EXISTS hr_candidate_search_au',
+    'DROP TRIGGER IF EXISTS hr_candidate_search_ad',
+    'DROP TRIGGER IF EXISTS hr_candidate_search_ai',
+    'DROP TABLE IF EXISTS hr_candidate_search_fts',
+]
+
+
+def create_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for sql in {'postgresql': POSTGRES_SETUP, 'sqlite': SQLITE_SETUP}.get(vendor, []):
+        schema_editor.execute(sql)
+
+
+def drop_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for sql in {'postgresql': POSTGRES_TEARDOWN, 'sqlite': SQLITE_TEARDOWN}.get(vendor, []):
+        schema_editor.execute(sql)
+
+
+def index_completed_sessions(apps, schema_editor):
+    """A search document per completed session; the full-text index follows the table."""
+    InterviewSession = apps.get_model('interviews', 'InterviewSession')
+    CandidateSearchDocument = apps.get_model('hr', 'CandidateSearchDocument')
+
+    batch = []
+    sessions = InterviewSession.objects.filter(status='completed').select_related('user', 'resume_analysis')
+    for session in sessions.iterator(chunk_size=500):
+        analysis = session.resume_analysis
+        skills = [s.get('name') if isinstance(s, dict) else s for s in (analysis.technical_skills if analysis else [])]
+        feedback = session.feedback if isinstance(session.feedback, dict) else {}
+        batch.append(CandidateSearchDocument(
+            session_id=session.id,
+            user_id=session.user_id,
+            profile_skills=session.user.skills or '',
+            resume_skills=', '.join(s.strip() for s in skills if isinstance(s, str) and s.strip()),
+            strengths='\n'.join(s for s in (feedback.get('strengths') or []) if isinstance(s, str)),
+            summary=(analysis.summary or '') if analysis else '',
+        ))
+        if len(batch) >= 500:
+            CandidateSearchDocument.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        CandidateSearchDocument.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hr', '0001_initial'),
+        ('interviews', '0016_session_role_user_latest_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CandidateSearchDocument',
+            fields=[
+                ('session', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='interviews.interviewsession')),
+                ('profile_skills', models.TextField(blank=True, default='')),
+                ('resume_skills', models.TextField(blank=True, default='')),
+                ('strengths', models.TextField(blank=True, default='')),
+                ('summary', models.TextField(blank=True, default='')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_documents', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Candidate Search Document',
+                'verbose_name_plural': 'Candidate Search Documents',
+                'db_table': 'hr_candidate_search',
+            },
+        ),
+        # tsvector column + GIN index on Postgres, FTS5 table + triggers on SQLite
+        migrations.RunPython(create_index, reverse_code=drop_index),
+        migrations.RunPython(index_completed_sessions, reverse_code=migrations.RunPython.noop),
+    ]
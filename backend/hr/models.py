@@ -1,5 +1,6 @@
 import hashlib
 import secrets
+from django.conf import settings
 from django.db import models
 from django.utils import timezone
 from datetime import timedelta
@@ -71,3 +72,37 @@ class OTPRecord(models.Model):
     def generate_otp():
         """Generate a secure 6-digit OTP."""
         return f"{secrets.randbelow(1000000):06d}"
+
+
+class CandidateSearchDocument(models.Model):
+    """
+    Searchable text of one completed interview session, kept up to date by
+    hr.signals. The full-text index over these columns is backend-specific
+    and maintained by the database (see hr.search): a weighted tsvector
+    column with a GIN index on Postgres, an FTS5 table synced by triggers on
+    SQLite.
+    """
+    session = models.OneToOneField(
+        'interviews.InterviewSession',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='search_document',
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='search_documents',
+    )
+    profile_skills = models.TextField(blank=True, default='')  # User.skills
+    resume_skills = models.TextField(blank=True, default='')  # ResumeAnalysis.technical_skills names
+    strengths = models.TextField(blank=True, default='')  # feedback['strengths']
+    summary = models.TextField(blank=True, default='')  # ResumeAnalysis.summary
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'hr_candidate_search'
+        verbose_name = 'Candidate Search Document'
+        verbose_name_plural = 'Candidate Search Documents'
+
+    def __str__(self):
+        return f"<CandidateSearchDocument session={self.session_id}>"
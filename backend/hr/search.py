@@ -0,0 +1,175 @@
+"""
+Full-text candidate search.
+
+Each completed interview session has a CandidateSearchDocument: the
+candidate's profile skills, the resume's technical skills and summary, and
+the feedback strengths. `index_sessions` upserts them when sessions complete
+(hr.signals); the database keeps the full-text index (created by
+migration hr 0002) in step:
+
+- Postgres: `hr_candidate_search.document`, a generated tsvector column
+  weighting skills (A) over strengths (B) over the summary (C), with a GIN
+  index; queries go through plainto_tsquery and rank with ts_rank_cd.
+- SQLite: `hr_candidate_search_fts`, an external-content FTS5 table over
+  the same columns (porter stemming) synced by triggers; ranked by bm25
+  with the same relative weights.
+
+`search` returns each matching candidate once, with their best-ranked
+session, filtered by score range and difficulty.
+"""
+import re
+from typing import Iterable, List, Optional
+
+from django.db import connection
+
+FTS_TABLE = 'hr_candidate_search_fts'
+# bm25 weights, in FTS5 column order: profile_skills, resume_skills, strengths, summary
+BM25_WEIGHTS = (10.0, 10.0, 4.0, 1.0)
+
+
+def skill_names(technical_skills) -> str:
+    """The skill names of a ResumeAnalysis.technical_skills list ({'name': ...} dicts or plain strings)."""
+    names = []
+    for skill in technical_skills or []:
+        name = skill.get('name') if isinstance(skill, dict) else skill
+        if isinstance(name, str) and name.strip():
+            names.append(name.strip())
+    return ', '.join(names)
+
+
+def document_fields(session) -> dict:
+    """The CandidateSearchDocument columns for `session` (its user and resume_analysis are read)."""
+    analysis = session.resume_analysis if session.resume_analysis_id else None
+    feedback = session.feedback if isinstance(session.feedback, dict) else {}
+    strengths = [s for s in (feedback.get('strengths') or []) if isinstance(s, str)]
+    return {
+        'user_id': session.user_id,
+        'profile_skills': session.user.skills or '',
+        'resume_skills': skill_names(analysis.technical_skills) if analysis else '',
+        'strengths': '\n'.join(strengths),
+        'summary': (analysis.summary or '') if analysis else '',
+    }
+
+
+def index_sessions(sessions: Iterable) -> int:
+    """Upsert the search documents of completed `sessions` in one statement."""
+    from hr.models import CandidateSearchDocument
+
+    documents = [
+        CandidateSearchDocument(session_id=session.pk, **document_fields(session))
+        for session in sessions if session.status == 'completed'
+    ]
+    if documents:
+        CandidateSearchDocument.objects.bulk_create(
+            documents,
+            update_conflicts=True,
+            unique_fields=['session'],
+            update_fields=['user', 'profile_skills', 'resume_skills', 'strengths', 'summary', 'updated_at'],
+        )
+    return len(documents)
+
+
+def update_profile_skills(user) -> int:
+    """Carry a profile skills edit into the user's documents; a no-op if unchanged."""
+    from hr.models import CandidateSearchDocument
+
+    skills = user.skills or ''
+    return CandidateSearchDocument.objects.filter(user=user).exclude(profile_skills=skills).update(
+        profile_skills=skills,
+    )
+
+
+def rebuild(batch_size: int = 500) -> int:
+    """Re-index every completed session and drop documents of sessions no longer completed."""
+    from hr.models import CandidateSearchDocument
+    from interviews.models import InterviewSession
+
+    CandidateSearchDocument.objects.exclude(session__status='completed').delete()
+    sessions = (
+        InterviewSession.objects.filter(status='completed')
+        .select_related('user', 'resume_analysis')
+        .only('id', 'status', 'feedback', 'user', 'user__skills',
+              'resume_analysis', 'resume_analysis__technical_skills', 'resume_analysis__summary')
+    )
+    indexed, batch = 0, []
+    for session in sessions.iterator(chunk_size=batch_size):
+        batch.append(session)
+        if len(batch) >= batch_size:
+            indexed += index_sessions(batch)
+            batch = []
+    indexed += index_sessions(batch)
+    if connection.vendor == 'sqlite':
+        # Re-derive the FTS5 index from the table, in case rows were written
+        # around the triggers (the Postgres column is generated, never stale)
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+    return indexed
+
+
+def search_terms(query: str) -> List[str]:
+    """The words of a free-text query; every one of them must match."""
+    return re.findall(r'\w+', query.lower())
+
+
+def _ranked_sql(vendor: str, filters: List[str]) -> str:
+    if vendor == 'postgresql':
+        matches = """
+            SELECT d.session_id, ts_rank_cd(d.document, q.query) AS rank
+            FROM hr_candidate_search d, plainto_tsquery('english', %s) AS q(query)
+            WHERE d.document @@ q.query
+        """
+    else:
+        weights = ', '.join(str(w) for w in BM25_WEIGHTS)
+        # bm25 is lower-is-better; negate it so both backends rank descending
+        matches = f"""
+            SELECT rowid AS session_id, -bm25({FTS_TABLE}, {weights}) AS rank
+            FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s
+        """
+    where = ' AND '.join(["s.status = 'completed'", *filters])
+    return f"""
+        WITH matches AS ({matches})
+        SELECT session_id, rank FROM (
+            SELECT m.session_id, m.rank,
+                   ROW_NUMBER() OVER (PARTITION BY s.user_id ORDER BY m.rank DESC, m.session_id DESC) AS best
+            FROM matches m JOIN interviews_session s ON s.id = m.session_id
+            WHERE {where}
+        ) ranked
+        WHERE best = 1
+        ORDER BY rank DESC, session_id DESC
+        LIMIT %s
+    """
+
+
+def search(query: str, min_score: Optional[float] = None, max_score: Optional[float] = None,
+           difficulty: Optional[str] = None, limit: int = 20) -> List[tuple]:
+    """
+    (session_id, rank) of the best-ranked matching session of each candidate,
+    best first. Every word of `query` has to match. Empty for a query
+    without words, or on backends without a full-text index.
+    """
+    terms = search_terms(query)
+    vendor = connection.vendor
+    if not terms or vendor not in ('postgresql', 'sqlite'):
+        return []
+
+    if vendor == 'postgresql':
+        # plainto_tsquery ANDs the words and has no operators ('or', '-word', ...)
+        params = [' '.join(terms)]
+    else:
+        # Quoted, so words like AND/NOT/NEAR aren't read as FTS5 operators
+        params = [' '.join(f'"{term}"' for term in terms)]
+    filters = []
+    if min_score is not None:
+        filters.append('s.overall_score >= %s')
+        params.append(min_score)
+    if max_score is not None:
+        filters.append('s.overall_score <= %s')
+        params.append(max_score)
+    if difficulty:
+        filters.append('s.difficulty = %s')
+        params.append(difficulty)
+    params.append(limit)
+
+    with connection.cursor() as cursor:
+        cursor.execute(_ranked_sql(vendor, filters), params)
+        return [(session_id, float(rank)) for session_id, rank in cursor.fetchall()]
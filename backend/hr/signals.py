@@ -0,0 +1,35 @@
+"""
+Keeps derived HR data in step with what it is built from: the candidate
+search index (hr.search) — a session's document is written when it
+completes, profile skills edits are carried into the candidate's documents —
+and the per-process HRUser cache (hr.user_cache).
+"""
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from hr import search, user_cache
+from hr.models import HRUser
+from interviews.signals import session_completed
+
+
+@receiver(session_completed, dispatch_uid='hr_index_completed_session')
+def index_completed_session(sender, session, **kwargs):
+    search.index_sessions([session])
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL, dispatch_uid='hr_index_profile_skills')
+def index_profile_skills(sender, instance, created, update_fields=None, **kwargs):
+    # Logins save last_login alone; new users have no sessions yet
+    if created or (update_fields is not None and 'skills' not in update_fields):
+        return
+    search.update_profile_skills(instance)
+
+
+@receiver(post_save, sender=HRUser, dispatch_uid='hr_user_cache_save')
+@receiver(post_delete, sender=HRUser, dispatch_uid='hr_user_cache_delete')
+def forget_cached_hr_user(sender, instance, **kwargs):
+    user_cache.invalidate(instance.pk)
+    # Again once committed, in case a request re-cached the old row meanwhile
+    transaction.on_commit(lambda: user_cache.invalidate(instance.pk))
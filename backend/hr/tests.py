@@ -1,3 +1,213 @@
-from django.test import TestCase
+import io
+from unittest import mock
 
-# Create your tests here.
+from django.core.management import call_command
+from django.db import connection
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import User
+from benchmarks.hr_request_bench import run_benchmark as run_hr_request_benchmark
+from hr import search, user_cache
+from hr.models import CandidateSearchDocument, HRUser
+from interviews.models import InterviewSession, ResumeAnalysis
+
+
+class CandidateSearchTests(TestCase):
+    """Full-text candidate search, indexed as sessions complete."""
+
+    def setUp(self):
+        user_cache.clear()
+        hr = HRUser.objects.create(email='hr@example.com', name='HR', is_verified=True)
+        session = self.client.session
+        session['hr_user_id'] = hr.id
+        session.save()
+
+        self.ops = self._candidate(
+            'ops', skills='Linux, Terraform',
+            resume_skills=[{'name': 'Kubernetes'}, {'name': 'Docker'}],
+            summary='Platform engineer running container clusters in production.',
+            strengths=['Deep knowledge of deployment pipelines'], score=82, difficulty='advanced',
+        )
+        self.web = self._candidate(
+            'web', skills='React, CSS',
+            resume_skills=[{'name': 'JavaScript'}],
+            summary='Frontend developer who has deployed a few apps on Kubernetes.',
+            strengths=['Clear communication'], score=64, difficulty='beginner',
+        )
+        self.data = self._candidate(
+            'data', skills='Python, SQL', resume_skills=['Pandas'],
+            summary='Analyst building dashboards.', strengths=['Strong Python fundamentals'],
+            score=91, difficulty='intermediate',
+        )
+
+    def _candidate(self, name, skills, resume_skills, summary, strengths, score, difficulty):
+        user = User.objects.create(username=name, email=f'{name}@example.com', skills=skills)
+        analysis = ResumeAnalysis.objects.create(
+            user=user, status='completed', technical_skills=resume_skills, summary=summary,
+        )
+        session = InterviewSession.objects.create(
+            user=user, mode='resume', difficulty=difficulty, resume_analysis=analysis,
+        )
+        session.feedback = {'overall_score': score, 'strengths': strengths}
+        session.mark_completed()
+        return session
+
+    def _search(self, query, status=200):
+        response = self.client.get(f'/hr/search/?{query}')
+        self.assertEqual(response.status_code, status)
+        return response.json()
+
+    def _uids(self, query):
+        return [item['candidate']['uid'] for item in self._search(query)['results']]
+
+    def test_completion_indexes_the_session(self):
+        document = CandidateSearchDocument.objects.get(session=self.ops)
+        self.assertEqual(document.resume_skills, 'Kubernetes, Docker')
+        self.assertEqual(document.profile_skills, 'Linux, Terraform')
+        self.assertIn('deployment pipelines', document.strengths)
+        # Sessions that never completed aren't searchable
+        InterviewSession.objects.create(user=self.ops.user, mode='role', difficulty='beginner')
+        self.assertEqual(CandidateSearchDocument.objects.count(), 3)
+
+    def test_ranked_by_where_the_words_match(self):
+        # A skill outranks a passing mention in the summary
+        self.assertEqual(self._uids('q=kubernetes'), [self.ops.user.uid, self.web.user.uid])
+        # Every word has to match, in any inflection ('deploys' finds 'deployed')
+        self.assertEqual(self._uids('q=kubernetes+deploys'), [self.web.user.uid])
+        self.assertEqual(self._uids('q=python'), [self.data.user.uid])
+        self.assertEqual(self._uids('q=rust'), [])
+
+    def test_score_and_difficulty_filters(self):
+        self.assertEqual(self._uids('q=kubernetes&min_score=75'), [self.ops.user.uid])
+        self.assertEqual(self._uids('q=kubernetes&max_score=70'), [self.web.user.uid])
+        self.assertEqual(self._uids('q=kubernetes&difficulty=beginner'), [self.web.user.uid])
+        self.assertEqual(self._uids('q=kubernetes&min_score=75&difficulty=beginner'), [])
+
+    def test_one_result_per_candidate(self):
+        session = InterviewSession.objects.create(user=self.ops.user, mode='role', difficulty='intermediate')
+        session.feedback = {'overall_score': 70, 'strengths': ['Kubernetes operators and Kubernetes networking']}
+        session.mark_completed()
+
+        results = self._search('q=kubernetes')['results']
+        self.assertEqual([item['candidate']['uid'] for item in results], [self.ops.user.uid, self.web.user.uid])
+        # The filters apply per session, so a filter can pick the candidate's other one
+        results = self._search('q=kubernetes&difficulty=intermediate')['results']
+        self.assertEqual([item['session_id'] for item in results], [session.id])
+
+    def test_profile_and_feedback_changes_reach_the_index(self):
+        user = self.data.user
+        user.skills = 'Python, Kubernetes'
+        user.save()
+        self.assertIn(user.uid, self._uids('q=kubernetes'))
+
+        # Logins save last_login only and don't touch the index
+        with CaptureQueriesContext(connection) as queries:
+            user.save(update_fields=['last_login'])
+        self.assertFalse(any('hr_candidate_search' in q['sql'] for q in queries.captured_queries))
+
+        # Regenerated feedback replaces the session's document
+        self.web.feedback = {'overall_score': 64, 'strengths': ['Accessibility expertise']}
+        self.web.mark_completed()
+        self.assertEqual(self._uids('q=accessibility'), [self.web.user.uid])
+        self.assertEqual(self._uids('q=communication'), [])
+
+        self.web.delete()
+        self.assertEqual(self._uids('q=accessibility'), [])
+
+    def test_operator_words_and_bad_parameters(self):
+        self.assertEqual(self._uids('q=python+AND+NOT'), [])
+        self.assertEqual(self._uids('q="python"'), [self.data.user.uid])
+        self._search('q=', status=400)
+        self._search('q=%2A%2A', status=400)
+        self._search('q=python&min_score=high', status=400)
+        self._search('q=python&difficulty=expert', status=400)
+        self.client.session.flush()
+        self.client.cookies.clear()
+        self._search('q=python', status=401)
+
+    def test_postgres_query_has_no_operators(self):
+        # websearch_to_tsquery would read 'or' and a leading '-' as operators
+        with mock.patch.object(search, 'connection') as connection:
+            connection.vendor = 'postgresql'
+            cursor = connection.cursor.return_value.__enter__.return_value
+            cursor.fetchall.return_value = []
+            search.search('python or -django', difficulty='advanced')
+
+        sql, params = cursor.execute.call_args[0]
+        self.assertIn("plainto_tsquery('english', %s)", sql)
+        self.assertNotIn('websearch_to_tsquery', sql)
+        self.assertEqual(params, ['python or django', 'advanced', 20])
+
+    def test_rebuild_command(self):
+        CandidateSearchDocument.objects.all().delete()
+        self.assertEqual(self._uids('q=kubernetes'), [])
+        out = io.StringIO()
+        call_command('rebuild_candidate_search', stdout=out)
+        self.assertIn('Indexed 3', out.getvalue())
+        self.assertEqual(self._uids('q=kubernetes'), [self.ops.user.uid, self.web.user.uid])
+        self.assertEqual(search.search('kubernetes', min_score=75)[0][0], self.ops.id)
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'hr-tests'}},
+    HR_USER_CACHE_TTL=60,
+)
+class HRRequestCacheTests(TestCase):
+    """HR sessions come from the cache and the HRUser from the per-process cache."""
+
+    def setUp(self):
+        user_cache.clear()
+        self.hr = HRUser.objects.create(email='hr@example.com', name='HR', is_verified=True)
+        session = self.client.session
+        session['hr_user_id'] = self.hr.id
+        session.save()
+
+    def _me(self, status=200):
+        response = self.client.get('/hr/me/')
+        self.assertEqual(response.status_code, status)
+        return response.json()
+
+    def test_repeat_requests_skip_the_database(self):
+        self.assertEqual(settings.SESSION_ENGINE, 'django.contrib.sessions.backends.cached_db')
+        self._me()
+        with self.assertNumQueries(0):
+            self.assertEqual(self._me()['email'], 'hr@example.com')
+
+    def test_changes_to_the_hr_user_apply_at_once(self):
+        self._me()
+        self.hr.name = 'Renamed'
+        self.hr.save()
+        self.assertEqual(self._me()['name'], 'Renamed')
+
+        self.hr.is_verified = False
+        self.hr.save()
+        self.assertEqual(self._me(status=401)['error'], 'HR session invalid')
+        # The stale session key is dropped
+        self._me(status=401)
+        self.assertNotIn('hr_user_id', self.client.session)
+
+    def test_deleted_hr_user_is_logged_out(self):
+        self._me()
+        self.hr.delete()
+        self._me(status=401)
+
+    def test_entries_expire(self):
+        self._me()
+        # Changed behind the ORM's back: no signal, so only the TTL catches it
+        HRUser.objects.filter(id=self.hr.id).update(name='Updated')
+        self.assertEqual(self._me()['name'], 'HR')
+        with mock.patch('hr.user_cache.time.monotonic', return_value=user_cache.time.monotonic() + 61):
+            self.assertEqual(self._me()['name'], 'Updated')
+
+    @override_settings(HR_USER_CACHE_TTL=0)
+    def test_ttl_zero_disables_the_cache(self):
+        self._me()
+        with self.assertNumQueries(1):
+            self._me()
+
+    def test_benchmark_saves_the_auth_queries(self):
+        results = run_hr_request_benchmark(candidates=5, per_candidate=3, repeat=1)
+        # The session row and the HRUser, on every request
+        self.assertEqual(set(results['queries_saved'].values()), {2})
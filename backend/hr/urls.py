@@ -13,6 +13,7 @@ urlpatterns = [
     # ─── HR Admin search ───────────────────────────────────────────────────────
     path('search/uid/', views.hr_search_uid, name='hr_search_uid'),
     path('search/role/', views.hr_search_role, name='hr_search_role'),
+    path('search/', views.hr_search_candidates, name='hr_search_candidates'),
     path('roles/', views.hr_available_roles, name='hr_available_roles'),
     path('session/<int:session_id>/', views.hr_candidate_session_detail, name='hr_candidate_session_detail'),
 ]
@@ -0,0 +1,45 @@
+"""
+Per-process cache of the verified HRUser behind an HR session.
+
+hr_login_required used to fetch the HRUser on every HR API call. Entries
+here live HR_USER_CACHE_TTL seconds; saving or deleting an HRUser drops its
+entry in this process at once (hr.signals), other workers notice within the
+TTL. A TTL of 0 turns the cache off.
+"""
+import copy
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+
+from hr.models import HRUser
+
+_entries: Dict[int, Tuple[float, HRUser]] = {}
+_lock = threading.Lock()
+
+
+def get_verified_hr_user(hr_user_id) -> Optional[HRUser]:
+    """The verified HRUser with this id, or None; a copy, so callers may modify it."""
+    ttl = settings.HR_USER_CACHE_TTL
+    now = time.monotonic()
+    with _lock:
+        entry = _entries.get(hr_user_id)
+    if entry is not None and entry[0] > now:
+        return copy.copy(entry[1])
+
+    hr_user = HRUser.objects.filter(id=hr_user_id, is_verified=True).first()
+    if hr_user is not None and ttl > 0:
+        with _lock:
+            _entries[hr_user_id] = (now + ttl, hr_user)
+    return copy.copy(hr_user) if hr_user is not None else None
+
+
+def invalidate(hr_user_id) -> None:
+    with _lock:
+        _entries.pop(hr_user_id, None)
+
+
+def clear() -> None:
+    with _lock:
+        _entries.clear()
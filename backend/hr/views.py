@@ -4,11 +4,13 @@ Handles HR registration, OTP verification, login, and candidate search.
 """
 import json
 from functools import wraps
+from django.conf import settings
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.utils import timezone
 
+from hr import user_cache
 from hr.models import HRUser, OTPRecord
 from hr.email_service import send_otp_email
 
@@ -21,16 +23,34 @@ def hr_login_required(view_func):
         hr_user_id = request.session.get('hr_user_id')
         if not hr_user_id:
             return JsonResponse({'error': 'HR authentication required'}, status=401)
-        try:
-            hr_user = HRUser.objects.get(id=hr_user_id, is_verified=True)
-            request.hr_user = hr_user
-        except HRUser.DoesNotExist:
+        # Cached per process for HR_USER_CACHE_TTL seconds (hr.user_cache)
+        hr_user = user_cache.get_verified_hr_user(hr_user_id)
+        if hr_user is None:
             request.session.pop('hr_user_id', None)
             return JsonResponse({'error': 'HR session invalid'}, status=401)
+        request.hr_user = hr_user
         return view_func(request, *args, **kwargs)
     return wrapper
 
 
+# ─── Helper: candidate card ───────────────────────────────────────────────────
+def candidate_payload(user):
+    """The candidate profile fields HR search results and session details show."""
+    return {
+        'uid': user.uid,
+        'name': user.username or user.email.split('@')[0],
+        'email': user.email,
+        'avatar_url': user.avatar_url,
+        'college_name': getattr(user, 'college_name', ''),
+        'degree': getattr(user, 'degree', ''),
+        'branch': getattr(user, 'branch', ''),
+        'address': getattr(user, 'address', ''),
+        'phone_number': getattr(user, 'phone_number', ''),
+        'skills': getattr(user, 'skills', ''),
+        'location': getattr(user, 'location', ''),
+    }
+
+
 # ─── HR Register ──────────────────────────────────────────────────────────────
 @csrf_exempt
 @require_http_methods(['POST'])
@@ -245,9 +265,14 @@ def hr_me(request):
 @hr_login_required
 @require_http_methods(['GET'])
 def hr_search_uid(request):
-    """Search for a candidate by their UID and return their latest completed session."""
+    """
+    Search for a candidate by their UID and return their completed sessions,
+    newest first, `?limit=` per page after `?cursor=` (see session_history).
+    """
     from accounts.models import User
+    from interviews.analytics import get_summary
     from interviews.models import InterviewSession
+    from interviews.pagination import InvalidCursor, keyset_page, page_size
 
     uid = request.GET.get('uid', '').strip().upper()
     if not uid:
@@ -258,14 +283,21 @@ def hr_search_uid(request):
     except User.DoesNotExist:
         return JsonResponse({'error': 'No candidate found with this UID'}, status=404)
 
-    # Get the latest completed session
     sessions = InterviewSession.objects.filter(
         user=user,
         status='completed',
-    ).order_by('-completed_at')
+    ).only('id', 'mode', 'difficulty', 'role', 'overall_score', 'created_at', 'completed_at')
+    try:
+        sessions, next_cursor = keyset_page(
+            sessions,
+            request.GET.get('cursor'),
+            page_size(request, settings.HR_UID_PAGE_SIZE, settings.PAGE_SIZE_MAX),
+        )
+    except InvalidCursor:
+        return JsonResponse({'error': 'Invalid cursor'}, status=400)
 
     session_list = []
-    for s in sessions[:10]:
+    for s in sessions:
         session_list.append({
             'id': s.id,
             'mode': s.mode,
@@ -279,65 +311,94 @@ def hr_search_uid(request):
 
     return JsonResponse({
         'candidate': {
-            'uid': user.uid,
-            'name': user.username or user.email.split('@')[0],
-            'email': user.email,
-            'avatar_url': user.avatar_url,
-            'college_name': getattr(user, 'college_name', ''),
-            'degree': getattr(user, 'degree', ''),
-            'branch': getattr(user, 'branch', ''),
-            'address': getattr(user, 'address', ''),
-            'phone_number': getattr(user, 'phone_number', ''),
-            'skills': getattr(user, 'skills', ''),
-            'location': getattr(user, 'location', ''),
-            'total_sessions': len(session_list),
+            **candidate_payload(user),
+            # All completed sessions, not just this page's
+            'total_sessions': get_summary(user).total_sessions,
         },
         'sessions': session_list,
+        'next_cursor': next_cursor,
     })
 
 
+# ─── Helper: latest session per candidate ─────────────────────────────────────
+def latest_per_candidate(sessions):
+    """
+    The ids of each user's latest (completed_at, then id) session among
+    `sessions`, as a subquery: DISTINCT ON (user_id) on Postgres, a
+    ROW_NUMBER() window elsewhere. Both walk session_role_user_latest_idx
+    in (user, newest first) order without sorting.
+    """
+    from django.db import connection
+    from django.db.models import F, Window
+    from django.db.models.functions import RowNumber
+
+    if connection.features.can_distinct_on_fields:
+        return sessions.order_by('user_id', '-completed_at', '-id').distinct('user_id').values('id')
+    return sessions.annotate(
+        latest=Window(RowNumber(), partition_by=F('user_id'), order_by=[F('completed_at').desc(), F('id').desc()]),
+    ).filter(latest=1).values('id')
+
+
 # ─── HR Search by Role ────────────────────────────────────────────────────────
+ROLE_SEARCH_SORTS = {
+    'recent': ('completed_at', 'id'),
+    'score': ('score_rank', 'completed_at', 'id'),
+}
+
+
 @hr_login_required
 @require_http_methods(['GET'])
 def hr_search_role(request):
-    """Search for candidates who have completed interviews for a specific role."""
+    """
+    Search for candidates who have completed interviews for a specific role:
+    one result per candidate, their latest session for it, sorted by
+    `?sort=recent` (default) or `?sort=score`, `?limit=` per page after
+    `?cursor=`.
+    """
+    from django.db.models import Value
+    from django.db.models.functions import Coalesce, Lower
+
     from interviews.models import InterviewSession
+    from interviews.pagination import InvalidCursor, keyset_page, page_size
 
     role = request.GET.get('role', '').strip()
     if not role:
         return JsonResponse({'error': 'Role parameter is required'}, status=400)
-
-    # Find completed sessions for this role (case-insensitive), most recent first
-    sessions = InterviewSession.objects.filter(
+    sort = request.GET.get('sort', 'recent')
+    if sort not in ROLE_SEARCH_SORTS:
+        return JsonResponse({'error': f"sort must be one of: {', '.join(ROLE_SEARCH_SORTS)}"}, status=400)
+
+    # Completed sessions for this role (case-insensitive). Lower(role) =
+    # lower(%s) rather than role__iexact, which compiles to UPPER(role) on
+    # Postgres and so can't use session_role_user_latest_idx
+    for_role = InterviewSession.objects.alias(
+        role_lower=Lower('role'),
+    ).filter(
         status='completed',
-        role__iexact=role,
-    ).select_related('user').order_by('-completed_at')[:50]
+        role_lower=Lower(Value(role)),
+    )
+    # Unscored sessions sort after every scored one
+    sessions = InterviewSession.objects.filter(
+        id__in=latest_per_candidate(for_role),
+    ).annotate(
+        score_rank=Coalesce('overall_score', Value(-1.0)),
+    ).select_related('user').defer('questions', 'feedback', 'feedback_summary')
+    try:
+        sessions, next_cursor = keyset_page(
+            sessions,
+            request.GET.get('cursor'),
+            page_size(request, settings.HR_ROLE_PAGE_SIZE, settings.PAGE_SIZE_MAX),
+            keys=ROLE_SEARCH_SORTS[sort],
+        )
+    except InvalidCursor:
+        return JsonResponse({'error': 'Invalid cursor'}, status=400)
 
     results = []
-    seen_users = set()
-
     for s in sessions:
         user = s.user
-        # Show latest session per user
-        if user.id in seen_users:
-            continue
-        seen_users.add(user.id)
-
         results.append({
             'session_id': s.id,
-            'candidate': {
-                'uid': user.uid,
-                'name': user.username or user.email.split('@')[0],
-                'email': user.email,
-                'avatar_url': user.avatar_url,
-                'college_name': getattr(user, 'college_name', ''),
-                'degree': getattr(user, 'degree', ''),
-                'branch': getattr(user, 'branch', ''),
-                'address': getattr(user, 'address', ''),
-                'phone_number': getattr(user, 'phone_number', ''),
-                'skills': getattr(user, 'skills', ''),
-                'location': getattr(user, 'location', ''),
-            },
+            'candidate': candidate_payload(user),
             'role': s.role,
             'difficulty': s.difficulty,
             'overall_score': s.overall_score,
@@ -346,6 +407,75 @@ def hr_search_role(request):
 
     return JsonResponse({
         'role': role,
+        'sort': sort,
+        'count': len(results),
+        'results': results,
+        'next_cursor': next_cursor,
+    })
+
+
+# ─── HR Candidate Search (full text) ──────────────────────────────────────────
+@hr_login_required
+@require_http_methods(['GET'])
+def hr_search_candidates(request):
+    """
+    Full-text search over candidates' skills, resume summaries and feedback
+    strengths (see hr.search): `?q=` words that must all match, optionally
+    `min_score`, `max_score` and `difficulty`. Each candidate appears once,
+    with their best-matching session, best match first.
+    """
+    from interviews.models import InterviewSession
+    from interviews.pagination import page_size
+    from hr import search
+
+    query = request.GET.get('q', '').strip()
+    if not search.search_terms(query):
+        return JsonResponse({'error': 'Search query (q) is required'}, status=400)
+
+    scores = {}
+    for param in ('min_score', 'max_score'):
+        value = request.GET.get(param, '').strip()
+        if not value:
+            scores[param] = None
+            continue
+        try:
+            scores[param] = float(value)
+        except ValueError:
+            return JsonResponse({'error': f'{param} must be a number'}, status=400)
+
+    difficulty = request.GET.get('difficulty', '').strip().lower() or None
+    if difficulty and difficulty not in dict(InterviewSession.DIFFICULTY_CHOICES):
+        return JsonResponse({'error': 'Invalid difficulty'}, status=400)
+
+    matches = search.search(
+        query,
+        min_score=scores['min_score'],
+        max_score=scores['max_score'],
+        difficulty=difficulty,
+        limit=page_size(request, settings.HR_SEARCH_PAGE_SIZE, settings.PAGE_SIZE_MAX),
+    )
+    sessions = InterviewSession.objects.select_related('user').defer(
+        'questions', 'feedback', 'feedback_summary',
+    ).in_bulk([session_id for session_id, _ in matches])
+
+    results = []
+    for session_id, rank in matches:
+        s = sessions.get(session_id)
+        if s is None:
+            continue
+        results.append({
+            'session_id': s.id,
+            'rank': round(rank, 4),
+            'candidate': candidate_payload(s.user),
+            'role': s.role or None,
+            'mode': s.mode,
+            'difficulty': s.difficulty,
+            'overall_score': s.overall_score,
+            'completed_at': s.completed_at.isoformat() if s.completed_at else None,
+        })
+
+    return JsonResponse({
+        'query': query,
         'count': len(results),
         'results': results,
     })
@@ -378,7 +508,7 @@ def hr_candidate_session_detail(request, session_id):
     from interviews.models import InterviewSession
 
     try:
-        session = InterviewSession.objects.select_related('user').get(
+        session = InterviewSession.objects.select_related('user', 'resume_analysis').get(
             id=session_id,
             status='completed',
         )
@@ -414,17 +544,5 @@ def hr_candidate_session_detail(request, session_id):
             'created_at': session.created_at.isoformat(),
             'completed_at': session.completed_at.isoformat() if session.completed_at else None,
         },
-        'candidate': {
-            'uid': user.uid,
-            'name': user.username or user.email.split('@')[0],
-            'email': user.email,
-            'avatar_url': user.avatar_url,
-            'college_name': getattr(user, 'college_name', ''),
-            'degree': getattr(user, 'degree', ''),
-            'branch': getattr(user, 'branch', ''),
-            'address': getattr(user, 'address', ''),
-            'phone_number': getattr(user, 'phone_number', ''),
-            'skills': getattr(user, 'skills', ''),
-            'location': getattr(user, 'location', ''),
-        },
+        'candidate': candidate_payload(user),
     })
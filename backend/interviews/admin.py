@@ -1,5 +1,15 @@
 from django.contrib import admin
-from interviews.models import InterviewSession
+from interviews.models import (
+    InterviewAnswer, InterviewSession, QuestionPrefetch, ResumeAnalysis, ResumeBlob, ResumeBlobReference, ResumeVersion,
+    UserAnalyticsSummary,
+)
+
+
+class InterviewAnswerInline(admin.TabularInline):
+    model = InterviewAnswer
+    extra = 0
+    fields = ('question_index', 'text', 'updated_at')
+    readonly_fields = ('updated_at',)
 
 
 @admin.register(InterviewSession)
@@ -8,18 +18,19 @@ class InterviewSessionAdmin(admin.ModelAdmin):
     list_filter = ('mode', 'difficulty', 'status', 'experience_level')
     search_fields = ('user__email', 'user__username', 'role')
     readonly_fields = ('created_at', 'completed_at', 'overall_score_display', 'duration_minutes_display')
+    raw_id_fields = ('resume_analysis',)
+    inlines = (InterviewAnswerInline,)
     ordering = ('-created_at',)
 
     fieldsets = (
         ('Session Info', {'fields': ('user', 'mode', 'difficulty', 'role', 'status')}),
         ('Resume Data', {
             'classes': ('collapse',),
-            'fields': ('resume_filename', 'experience_level', 'resume_summary',
-                       'technical_skills', 'soft_skills', 'projects'),
+            'fields': ('resume_analysis', 'resume_filename', 'experience_level'),
         }),
         ('Q&A Data', {
             'classes': ('collapse',),
-            'fields': ('questions', 'answers', 'feedback'),
+            'fields': ('questions', 'feedback'),
         }),
         ('Timestamps', {'fields': ('created_at', 'completed_at', 'duration_minutes_display')}),
         ('Performance', {'fields': ('overall_score_display',)}),
@@ -28,9 +39,62 @@ class InterviewSessionAdmin(admin.ModelAdmin):
     @admin.display(description='Score')
     def overall_score_display(self, obj):
         score = obj.overall_score
-        return f"{score}%" if score is not None else "—"
+        return f"{score:g}%" if score is not None else "—"
 
     @admin.display(description='Duration')
     def duration_minutes_display(self, obj):
         d = obj.duration_minutes
         return f"{d} min" if d is not None else "—"
+
+
+@admin.register(UserAnalyticsSummary)
+class UserAnalyticsSummaryAdmin(admin.ModelAdmin):
+    list_display = ('user', 'total_sessions', 'scored_count', 'best_score', 'last_completed_at', 'updated_at')
+    search_fields = ('user__email', 'user__username')
+    raw_id_fields = ('user',)
+    readonly_fields = ('updated_at',)
+    ordering = ('-updated_at',)
+
+
+@admin.register(ResumeAnalysis)
+class ResumeAnalysisAdmin(admin.ModelAdmin):
+    list_display = ('id', 'user', 'source', 'status', 'experience_level', 'resume_filename', 'created_at')
+    list_filter = ('status', 'source', 'experience_level')
+    search_fields = ('user__email', 'user__username', 'resume_filename')
+    readonly_fields = ('created_at', 'updated_at')
+    ordering = ('-created_at',)
+
+
+@admin.register(ResumeVersion)
+class ResumeVersionAdmin(admin.ModelAdmin):
+    list_display = ('id', 'user', 'version', 'analysis', 'reused_sections', 'created_at')
+    search_fields = ('user__email', 'user__username', 'content_hash')
+    raw_id_fields = ('user', 'analysis')
+    readonly_fields = ('created_at',)
+    ordering = ('-created_at',)
+
+
+@admin.register(QuestionPrefetch)
+class QuestionPrefetchAdmin(admin.ModelAdmin):
+    list_display = ('id', 'analysis', 'difficulty', 'difficulty_source', 'status', 'outcome', 'generation_ms',
+                    'created_at', 'expires_at')
+    list_filter = ('status', 'outcome', 'difficulty', 'difficulty_source')
+    raw_id_fields = ('analysis',)
+    readonly_fields = ('created_at', 'ready_at', 'used_at')
+    ordering = ('-created_at',)
+
+
+@admin.register(ResumeBlob)
+class ResumeBlobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'sha256', 'size', 'created_at', 'last_referenced_at')
+    search_fields = ('sha256',)
+    readonly_fields = ('sha256', 'size', 'created_at', 'last_referenced_at')
+    ordering = ('-created_at',)
+
+
+@admin.register(ResumeBlobReference)
+class ResumeBlobReferenceAdmin(admin.ModelAdmin):
+    list_display = ('id', 'blob', 'user', 'analysis', 'session', 'stored_name', 'expires_at')
+    search_fields = ('user__email', 'stored_name', 'blob__sha256')
+    raw_id_fields = ('blob', 'user', 'analysis', 'session')
+    ordering = ('-created_at',)
@@ -0,0 +1,277 @@
+"""
+Background resume analysis.
+
+`upload_resume` only saves the file and creates a `ResumeAnalysis` row; the
+slow part (PDF parsing + Gemini extraction) runs here on a small per-process
+thread pool. Each stage writes its results to the row as soon as it finishes,
+so the status endpoint can show pattern-matched skills while the LLM call is
+still in flight.
+
+With PDF_SANDBOX_ENABLED the PDF itself is parsed in a separate process pool
+(core.pdf_sandbox) so a hostile file can't hang or bloat the web worker.
+
+Every analysis with LLM findings is recorded as a `ResumeVersion` of the
+candidate's resume; the next upload from the same candidate only sends the
+sections that changed since that version to the LLM.
+
+Once an analysis completes its interview questions are generated
+speculatively (interviews.question_prefetch), so starting the interview
+doesn't have to wait for Gemini.
+
+Jobs live only in the process that queued them: one lost to a restart or
+redeploy leaves its row queued/partial, and `fail_if_stale` marks such rows
+failed once they've made no progress for RESUME_ANALYSIS_STALE_SECONDS.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import BinaryIO
+
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from interviews.models import ResumeAnalysis, ResumeVersion
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.RESUME_ANALYSIS_WORKERS,
+            thread_name_prefix='resume-analysis',
+        )
+    return _executor
+
+
+def get_pdf_pool():
+    """Return the per-process sandboxed parser pool, starting it on first use."""
+    global _pdf_pool
+    if not settings.PDF_SANDBOX_ENABLED:
+        return None
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            from core.pdf_sandbox import PdfWorkerPool
+            _pdf_pool = PdfWorkerPool(
+                size=settings.PDF_SANDBOX_WORKERS,
+                job_timeout=settings.PDF_SANDBOX_TIMEOUT,
+                memory_limit_mb=settings.PDF_SANDBOX_MEMORY_MB,
+                max_jobs_per_worker=settings.PDF_SANDBOX_MAX_JOBS,
+            )
+    return _pdf_pool
+
+
+def pdf_pool_metrics():
+    """Pool counters for the health check, or None if the pool hasn't started."""
+    return _pdf_pool.metrics() if _pdf_pool is not None else None
+
+
+def enqueue_analysis(analysis_id: int, pdf_file: BinaryIO, content_hash: str = '', difficulty: str = '') -> None:
+    """
+    Schedule analysis of an uploaded resume (inline when async is disabled).
+    `pdf_file` is a seekable binary file, such as the upload's spooled temp
+    file; the job reads it only when it runs, and closes it.
+    """
+    if settings.RESUME_ANALYSIS_ASYNC:
+        _get_executor().submit(run_analysis, analysis_id, pdf_file, content_hash, difficulty)
+    else:
+        run_analysis(analysis_id, pdf_file, content_hash, difficulty)
+
+
+def run_analysis(analysis_id: int, pdf_file: BinaryIO, content_hash: str = '', difficulty: str = '') -> None:
+    """
+    Analyze one resume and record each stage on its `ResumeAnalysis` row, then
+    start generating interview questions for it (see question_prefetch).
+    """
+    from core.resume_analyzer import ResumeAnalyzer
+
+    close_old_connections()
+    try:
+        _analyze(analysis_id, pdf_file, content_hash or ResumeAnalyzer._sha256_of(pdf_file))
+    except Exception as e:
+        logger.exception(f"Resume analysis {analysis_id} crashed: {e}")
+        _update(analysis_id, status='failed', error=str(e))
+    else:
+        from interviews.question_prefetch import schedule_prefetch
+        schedule_prefetch(analysis_id, difficulty)
+    finally:
+        pdf_file.close()
+        close_old_connections()
+
+
+def _update(analysis_id: int, **fields) -> None:
+    # QuerySet.update() skips auto_now, so bump updated_at explicitly
+    ResumeAnalysis.objects.filter(id=analysis_id).update(updated_at=timezone.now(), **fields)
+
+
+def fail_if_stale(analysis: ResumeAnalysis) -> ResumeAnalysis:
+    """Mark `analysis` failed if its job has made no progress for too long, e.g. its worker was restarted."""
+    if analysis.is_finished:
+        return analysis
+    cutoff = timezone.now() - timedelta(seconds=settings.RESUME_ANALYSIS_STALE_SECONDS)
+    if analysis.updated_at >= cutoff:
+        return analysis
+    # Conditional, so a job that has just made progress isn't failed
+    failed = ResumeAnalysis.objects.filter(
+        id=analysis.id, status__in=('queued', 'partial'), updated_at__lt=cutoff,
+    ).update(status='failed', error='Analysis job was lost (no progress)', updated_at=timezone.now())
+    if failed:
+        logger.warning(f"Resume analysis {analysis.id} made no progress since {analysis.updated_at}, marked failed")
+    analysis.refresh_from_db()
+    return analysis
+
+
+def _copy_cached_result(analysis_id: int, content_hash: str) -> bool:
+    """
+    Reuse a finished analysis of the same bytes (matched against the current
+    taxonomy) instead of parsing and calling the LLM again
+    """
+    from core.skill_taxonomy import get_taxonomy
+
+    cached = (
+        ResumeAnalysis.objects
+        .filter(content_hash=content_hash, status='completed', note='', taxonomy_version=get_taxonomy().version)
+        .exclude(id=analysis_id)
+        .order_by('-updated_at')
+        .first()
+    )
+    if cached is None:
+        return False
+    _update(
+        analysis_id,
+        status='completed',
+        technical_skills=cached.technical_skills,
+        soft_skills=cached.soft_skills,
+        projects=cached.projects,
+        experience_level=cached.experience_level,
+        summary=cached.summary,
+        keywords=cached.keywords,
+        taxonomy_version=cached.taxonomy_version,
+    )
+    logger.info(f"Resume analysis {analysis_id} reused analysis {cached.id} (same content hash)")
+    return True
+
+
+def _parse(analysis_id: int, pdf_file: BinaryIO, content_hash: str):
+    """Parse the PDF exactly once; returns None (and marks the row failed) on failure."""
+    from core.pdf_sandbox import PdfParseError
+    from core.resume_analyzer import ResumeAnalyzer
+
+    pool = get_pdf_pool()
+    if pool is not None:
+        try:
+            # The sandbox gets the bytes over a pipe; only now are they read
+            pdf_file.seek(0)
+            doc = pool.parse(pdf_file.read(), sha256=content_hash)
+        except PdfParseError as e:
+            # Don't retry in-process: that is exactly what the sandbox protects against
+            logger.warning(f"Sandboxed PDF parsing failed for resume {analysis_id}: {e}")
+            _update(analysis_id, status='failed', error=f'Could not read this PDF: {e}')
+            return None
+    else:
+        pdf_file.seek(0)
+        doc = ResumeAnalyzer(enable_llm=False).parse_document(pdf_file, sha256=content_hash)
+
+    if doc.is_empty:
+        _update(analysis_id, status='failed', error='Could not extract text from PDF')
+        return None
+    logger.info(f"Extracted {len(doc.text)} characters from {doc.stats.get('pages_scanned')} pages "
+                f"({'sandbox' if pool is not None else 'in-process'})")
+    return doc
+
+
+def _latest_version(user_id):
+    if user_id is None:
+        return None
+    return ResumeVersion.objects.filter(user_id=user_id).order_by('-version').first()
+
+
+def _record_version(analysis_id: int, user_id, content_hash: str, analysis) -> None:
+    """Store the per-section LLM findings as the candidate's newest resume version."""
+    if user_id is None or not analysis.llm_sections:
+        return
+    try:
+        with transaction.atomic():
+            latest = ResumeVersion.objects.filter(user_id=user_id).aggregate(latest=Max('version'))['latest']
+            ResumeVersion.objects.create(
+                user_id=user_id,
+                analysis_id=analysis_id,
+                version=(latest or 0) + 1,
+                content_hash=content_hash,
+                section_hashes=analysis.section_hashes,
+                llm_sections=analysis.llm_sections,
+                summary=analysis.summary,
+                experience_level=analysis.experience_level,
+                reused_sections=analysis.reused_sections,
+                llm_usage=analysis.llm_usage,
+            )
+    except IntegrityError:
+        # Another upload from the same candidate took this version number;
+        # losing one version only means the next upload diffs against theirs
+        logger.warning(f"Resume version for analysis {analysis_id} not recorded (concurrent upload)")
+
+
+def _analyze(analysis_id: int, pdf_file: BinaryIO, content_hash: str) -> None:
+    from core.resume_analyzer import ResumeAnalyzer
+
+    if _copy_cached_result(analysis_id, content_hash):
+        return
+
+    doc = _parse(analysis_id, pdf_file, content_hash)
+    if doc is None:
+        return
+
+    analyzer = ResumeAnalyzer(settings.GEMINI_API_KEY)
+    user_id = ResumeAnalysis.objects.filter(id=analysis_id).values_list('user_id', flat=True).first()
+    previous = _latest_version(user_id)
+
+    def on_patterns(partial):
+        _update(
+            analysis_id,
+            status='partial',
+            technical_skills=partial.technical_skills,
+            soft_skills=partial.soft_skills,
+            projects=partial.projects,
+            keywords=analyzer.generate_keywords_from_analysis(partial),
+            taxonomy_version=partial.taxonomy_version,
+        )
+
+    try:
+        analysis = analyzer.analyze_document(
+            doc, on_patterns=on_patterns, previous=previous.as_previous() if previous else None,
+        )
+    except Exception as e:
+        logger.error(f"Error analyzing resume {analysis_id}: {e}")
+        from interviews.views import _extract_resume_keywords
+        _update(
+            analysis_id,
+            status='completed',
+            keywords=_extract_resume_keywords(doc),
+            note='Basic analysis used due to processing error',
+            error=str(e),
+        )
+        return
+
+    _update(
+        analysis_id,
+        status='completed',
+        technical_skills=analysis.technical_skills,
+        soft_skills=analysis.soft_skills,
+        projects=analysis.projects,
+        experience_level=analysis.experience_level,
+        summary=analysis.summary,
+        keywords=analyzer.generate_keywords_from_analysis(analysis),
+        taxonomy_version=analysis.taxonomy_version,
+    )
+    if analysis.reused_sections:
+        logger.info(f"Resume analysis {analysis_id}: reused {analysis.reused_sections} from "
+                    f"version {previous.version}, LLM usage {analysis.llm_usage}")
+    _record_version(analysis_id, user_id, content_hash, analysis)
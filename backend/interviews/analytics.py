@@ -0,0 +1,125 @@
+"""
+Per-user analytics rollup.
+
+`UserAnalyticsSummary` holds running totals (counts per mode and difficulty,
+score sums, best score) that `record_completion` adjusts inside
+InterviewSession.mark_completed's transaction. `rebuild` recomputes them from
+the sessions with one grouped aggregate — for repair after sessions are
+deleted or edited outside mark_completed, and for users who have no row yet
+when they open the dashboard.
+"""
+from typing import Iterable, Optional
+
+from django.db.models import Count, Max, Q, Sum
+
+from interviews.models import InterviewSession, UserAnalyticsSummary
+
+DIFFICULTIES = [value for value, _ in InterviewSession.DIFFICULTY_CHOICES]
+MODES = [value for value, _ in InterviewSession.MODE_CHOICES]
+
+
+def _apply(summary: UserAnalyticsSummary, mode: str, difficulty: str, score, sign: int) -> None:
+    summary.total_sessions += sign
+    if mode in MODES:
+        setattr(summary, f'{mode}_count', getattr(summary, f'{mode}_count') + sign)
+    if difficulty in DIFFICULTIES:
+        setattr(summary, f'{difficulty}_count', getattr(summary, f'{difficulty}_count') + sign)
+    if score is None:
+        return
+    summary.scored_count += sign
+    summary.score_sum += sign * score
+    if difficulty in DIFFICULTIES:
+        setattr(summary, f'{difficulty}_scored', getattr(summary, f'{difficulty}_scored') + sign)
+        setattr(summary, f'{difficulty}_score_sum', getattr(summary, f'{difficulty}_score_sum') + sign * score)
+
+
+def record_completion(session: InterviewSession, previous: Optional[dict] = None) -> UserAnalyticsSummary:
+    """
+    Add a just-completed session to its user's rollup. `previous` is the
+    session's mode/difficulty/overall_score if it had already been completed,
+    whose contribution is taken out first. Call inside a transaction.
+    """
+    # Locked, or created, before it is read: concurrent completions of one
+    # user queue up here instead of each overwriting the other's totals
+    summary, created = (
+        UserAnalyticsSummary.objects.select_for_update().get_or_create(user_id=session.user_id)
+    )
+    if created:
+        # Users without a row yet may have history from before the rollup
+        # existed; start from it, less this session, which is added below
+        totals = (
+            InterviewSession.objects.filter(user_id=session.user_id, status='completed')
+            .exclude(pk=session.pk).aggregate(**rollup_totals())
+        )
+        for field, value in totals.items():
+            if value is not None:
+                setattr(summary, field, value)
+        previous = None
+
+    if previous is not None:
+        _apply(summary, previous['mode'], previous['difficulty'], previous['overall_score'], -1)
+    _apply(summary, session.mode, session.difficulty, session.overall_score, +1)
+
+    if previous is not None and previous['overall_score'] is not None \
+            and previous['overall_score'] == summary.best_score:
+        # The old score may have been the best one; max() can't be undone
+        summary.best_score = (
+            InterviewSession.objects.filter(user_id=session.user_id, status='completed')
+            .aggregate(best=Max('overall_score'))['best']
+        )
+    elif session.overall_score is not None and (summary.best_score is None
+                                                 or session.overall_score > summary.best_score):
+        summary.best_score = session.overall_score
+    if summary.last_completed_at is None or session.completed_at > summary.last_completed_at:
+        summary.last_completed_at = session.completed_at
+    summary.save()
+    return summary
+
+
+def rollup_totals() -> dict:
+    """Aggregate expressions computing each rollup column over a user's completed sessions."""
+    totals = {
+        'total_sessions': Count('id'),
+        'resume_count': Count('id', filter=Q(mode='resume')),
+        'role_count': Count('id', filter=Q(mode='role')),
+        'scored_count': Count('overall_score'),
+        'score_sum': Sum('overall_score'),
+        'best_score': Max('overall_score'),
+        'last_completed_at': Max('completed_at'),
+    }
+    for diff in DIFFICULTIES:
+        totals[f'{diff}_count'] = Count('id', filter=Q(difficulty=diff))
+        totals[f'{diff}_scored'] = Count('overall_score', filter=Q(difficulty=diff))
+        totals[f'{diff}_score_sum'] = Sum('overall_score', filter=Q(difficulty=diff))
+    return totals
+
+
+def rebuild(user_ids: Iterable[int]) -> list:
+    """Recompute the rollups of the given users from their completed sessions."""
+    user_ids = list(user_ids)
+    rows = {
+        row.pop('user_id'): row
+        for row in InterviewSession.objects.filter(user_id__in=user_ids, status='completed')
+        .values('user_id').annotate(**rollup_totals()).order_by()
+    }
+    # Sums over no scored sessions come back as NULL; the model defaults are 0
+    summaries = [
+        UserAnalyticsSummary(
+            user_id=user_id,
+            **{field: value for field, value in rows.get(user_id, {}).items() if value is not None},
+        )
+        for user_id in user_ids
+    ]
+    UserAnalyticsSummary.objects.bulk_create(
+        summaries,
+        update_conflicts=True,
+        unique_fields=['user'],
+        update_fields=[*rollup_totals(), 'updated_at'],
+    )
+    return summaries
+
+
+def get_summary(user) -> UserAnalyticsSummary:
+    """The user's rollup: one primary-key lookup, built on first use."""
+    summary = UserAnalyticsSummary.objects.filter(pk=user.pk).first()
+    return summary if summary is not None else rebuild([user.pk])[0]
@@ -0,0 +1,62 @@
+"""
+Management command: compile_taxonomy
+Compiles core/data/skill_taxonomy.json into the artifact the resume analyzer
+loads at startup (alias -> canonical map, categories and matcher regexes).
+Run it after editing the taxonomy; the deploy build runs it too.
+
+Usage:
+    python manage.py compile_taxonomy
+    python manage.py compile_taxonomy --check   # exit 1 if the artifact is stale
+"""
+import hashlib
+import json
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError
+
+from core import skill_taxonomy
+
+
+class Command(BaseCommand):
+    help = 'Compiles the skill taxonomy data file into the runtime lookup artifact'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--source', default=skill_taxonomy.SOURCE_PATH, help='Taxonomy JSON source')
+        parser.add_argument('--output', default=skill_taxonomy.ARTIFACT_PATH, help='Compiled artifact path')
+        parser.add_argument('--check', action='store_true', help='Only report whether the artifact is up to date')
+
+    def handle(self, *args, **options):
+        if options['check']:
+            self._check(options['source'], options['output'])
+            return
+
+        try:
+            artifact = skill_taxonomy.write_artifact(options['source'], options['output'])
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(f'Could not compile taxonomy: {e}')
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Compiled taxonomy {artifact['version']}: {len(artifact['technical'])} technical skills, "
+            f"{len(artifact['soft'])} soft skills, "
+            f"{len(artifact['technical_terms']) + len(artifact['soft_terms'])} terms -> {options['output']}"
+        ))
+
+        from interviews.models import ResumeAnalysis
+        try:
+            stale = ResumeAnalysis.objects.filter(status='completed').exclude(taxonomy_version=artifact['version']).count()
+        except DatabaseError:
+            return  # not migrated yet
+        if stale:
+            self.stdout.write(f'{stale} stored analyses were matched against an older taxonomy version.')
+
+    def _check(self, source_path, artifact_path):
+        with open(source_path, 'rb') as f:
+            source_sha256 = hashlib.sha256(f.read()).hexdigest()
+        if not os.path.exists(artifact_path):
+            raise CommandError('Taxonomy artifact is missing - run `manage.py compile_taxonomy`')
+        with open(artifact_path, 'rb') as f:
+            artifact = json.load(f)
+        if artifact.get('source_sha256') != source_sha256 or artifact.get('format') != skill_taxonomy.ARTIFACT_FORMAT:
+            raise CommandError('Taxonomy artifact is stale - run `manage.py compile_taxonomy`')
+        self.stdout.write(self.style.SUCCESS(f"Taxonomy artifact {artifact['version']} is up to date."))
@@ -0,0 +1,295 @@
+"""
+Management command: ingest_resumes
+Bulk-analyzes a directory of PDF resumes (e.g. collected at a career fair).
+
+  - PDF parsing + pattern extraction runs in a process pool (one per core)
+  - Gemini enrichment runs on a bounded thread pool behind a rate limit
+  - every analyzed file is appended to a checkpoint log, so re-running the
+    command after an interruption skips work that is already done; files
+    that failed go to a separate failures log and are retried on the next run
+  - a file that crashes its parse process is recorded as failed and the
+    pool is rebuilt; the other files that were in flight are re-parsed one
+    at a time so only the culprit is lost
+  - results stream to a JSONL file and/or are stored as ResumeAnalysis rows
+
+Usage:
+    python manage.py ingest_resumes ./career_fair_2026
+    python manage.py ingest_resumes ./cvs --output cvs.jsonl --store-db --llm-rpm 30
+    python manage.py ingest_resumes ./cvs --skip-llm --workers 8
+"""
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+_worker_analyzer = None
+
+
+def _init_parse_worker():
+    global _worker_analyzer
+    from core.resume_analyzer import ResumeAnalyzer
+    # Parse workers never call the LLM
+    _worker_analyzer = ResumeAnalyzer(enable_llm=False)
+
+
+def _parse_resume(path: str, rel_name: str) -> dict:
+    """Process-pool task: read, hash, parse once and run the pattern extractors."""
+    analyzer = _worker_analyzer
+    timings = {}
+    start = time.perf_counter()
+    try:
+        data = Path(path).read_bytes()
+        doc = analyzer._timed(
+            timings, 'extract_text', analyzer.parse_document, io.BytesIO(data), None, hashlib.sha256(data).hexdigest()
+        )
+        if doc.is_empty:
+            raise ValueError('No text could be extracted')
+        return {
+            'file': rel_name,
+            'sha256': doc.sha256,
+            'document': doc,
+            'technical_skills': analyzer._timed(timings, 'technical_skills', analyzer.extract_technical_skills, doc),
+            'soft_skills': analyzer._timed(timings, 'soft_skills', analyzer.extract_soft_skills, doc),
+            'projects': analyzer._timed(timings, 'projects_basic', analyzer.extract_projects_basic, doc),
+            'timings': timings,
+        }
+    except Exception as e:
+        return {'file': rel_name, 'error': str(e), 'timings': {'parse': round((time.perf_counter() - start) * 1000, 2)}}
+
+
+class RateLimiter:
+    """Spaces calls evenly so that at most `per_minute` start in any minute."""
+
+    def __init__(self, per_minute: float):
+        self.interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self.next_slot = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class Command(BaseCommand):
+    help = 'Bulk-analyzes every PDF resume in a directory with resumable progress'
+
+    def add_arguments(self, parser):
+        parser.add_argument('directory', help='Directory to scan (recursively) for *.pdf files')
+        parser.add_argument('--output', help='JSONL file to append results to (default: <directory>/ingest_results.jsonl)')
+        parser.add_argument('--store-db', action='store_true', help='Also store results as ResumeAnalysis rows')
+        parser.add_argument('--checkpoint', help='Checkpoint log path (default: <directory>/.ingest_checkpoint)')
+        parser.add_argument('--failures', help='Failures log path (default: <directory>/.ingest_failures)')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Parse processes (default: CPU count)')
+        parser.add_argument('--llm-concurrency', type=int, default=4, help='Max concurrent Gemini requests')
+        parser.add_argument('--llm-rpm', type=float, default=60, help='Max Gemini requests per minute (0 = unlimited)')
+        parser.add_argument('--skip-llm', action='store_true', help='Pattern extraction only')
+
+    def handle(self, *args, **options):
+        directory = Path(options['directory']).resolve()
+        if not directory.is_dir():
+            raise CommandError(f'{directory} is not a directory')
+
+        output_path = Path(options['output'] or directory / 'ingest_results.jsonl')
+        checkpoint_path = Path(options['checkpoint'] or directory / '.ingest_checkpoint')
+        failures_path = Path(options['failures'] or directory / '.ingest_failures')
+        done = set(checkpoint_path.read_text().splitlines()) if checkpoint_path.exists() else set()
+        failed_before = set()
+        if failures_path.exists():
+            failed_before = {json.loads(line)['file'] for line in failures_path.read_text().splitlines() if line}
+
+        found = sorted(directory.rglob('*.pdf'))
+        pending = []
+        for path in found:
+            rel_name = str(path.relative_to(directory))
+            if rel_name not in done:
+                pending.append((str(path), rel_name))
+
+        retrying = len(failed_before & {rel_name for _, rel_name in pending})
+        self.stdout.write(
+            f'Found {len(found)} resumes, {len(found) - len(pending)} already done, {len(pending)} to process'
+            + (f' ({retrying} failed last run, retrying).' if retrying else '.')
+        )
+        if not pending:
+            return
+
+        from core.resume_analyzer import ResumeAnalyzer
+        self.pattern_analyzer = ResumeAnalyzer(enable_llm=False)
+        analyzer = None if options['skip_llm'] else ResumeAnalyzer(settings.GEMINI_API_KEY)
+        if analyzer is not None and analyzer.client is None:
+            self.stdout.write(self.style.WARNING('No Gemini API key configured — running pattern extraction only.'))
+            analyzer = None
+        limiter = RateLimiter(options['llm_rpm'])
+
+        def enrich(parsed):
+            limiter.acquire()
+            known_skills = {
+                'technical': [s['name'] for s in parsed['technical_skills']],
+                'soft': [s['skill'] for s in parsed['soft_skills']],
+            }
+            try:
+                llm_result = analyzer._timed(
+                    parsed['timings'], 'llm_extract',
+                    lambda: analyzer.llm_extract_resume_details(
+                        parsed['document'], known_skills=known_skills, raise_errors=True,
+                    ),
+                )
+            except Exception as e:
+                # Rate limits and timeouts included: a failure, so the next run retries it
+                return dict(parsed, error=f'LLM extraction failed: {e}'), {}
+            return parsed, llm_result
+
+        counts = {'ok': 0, 'error': 0}
+        started = time.monotonic()
+        workers = max(1, options['workers'])
+
+        # Failures are rewritten each run: the ones that fail again are recorded again
+        with open(output_path, 'a', encoding='utf-8') as out, open(checkpoint_path, 'a', encoding='utf-8') as checkpoint, \
+                open(failures_path, 'w', encoding='utf-8') as failures, \
+                ThreadPoolExecutor(max_workers=max(1, options['llm_concurrency'])) as llm_pool:
+
+            def record(parsed, llm_result):
+                result = self._build_result(parsed, llm_result)
+                out.write(json.dumps(result) + '\n')
+                out.flush()
+                if 'error' in result:
+                    # Not checkpointed, so the next run retries it
+                    failures.write(json.dumps({'file': result['file'], 'error': result['error']}) + '\n')
+                    failures.flush()
+                else:
+                    if options['store_db']:
+                        self._store(result, pattern_only=analyzer is None)
+                    # Checkpoint only after the result is durable
+                    checkpoint.write(parsed['file'] + '\n')
+                    checkpoint.flush()
+                counts['error' if 'error' in result else 'ok'] += 1
+                processed = counts['ok'] + counts['error']
+                if processed % 25 == 0 or processed == len(pending):
+                    self.stdout.write(f'  {processed}/{len(pending)} processed')
+
+            def parsed_done(parsed):
+                if 'error' in parsed or analyzer is None:
+                    record(parsed, {})
+                else:
+                    llm_futures.add(llm_pool.submit(enrich, parsed))
+
+            queued = deque(pending)
+            # Files that were in flight when a parse process crashed
+            isolating = deque()
+            parse_futures = {}
+            llm_futures = set()
+
+            def submit():
+                # Isolated files go alone, so a crash pins down the file that caused it
+                if isolating:
+                    if not parse_futures:
+                        path, rel_name = isolating.popleft()
+                        parse_futures[parse_pool.submit(_parse_resume, path, rel_name)] = (path, rel_name, True)
+                    return
+                while queued and len(parse_futures) < 2 * workers:
+                    path, rel_name = queued.popleft()
+                    parse_futures[parse_pool.submit(_parse_resume, path, rel_name)] = (path, rel_name, False)
+
+            parse_pool = self._parse_pool(workers)
+            try:
+                submit()
+                while parse_futures or llm_futures:
+                    finished, _ = wait(set(parse_futures) | llm_futures, return_when=FIRST_COMPLETED)
+                    crashed = False
+                    for future in finished:
+                        if future in llm_futures:
+                            llm_futures.discard(future)
+                            record(*future.result())
+                            continue
+                        path, rel_name, isolated = parse_futures.pop(future)
+                        try:
+                            parsed = future.result()
+                        except BrokenProcessPool:
+                            crashed = True
+                            if isolated:
+                                record({'file': rel_name, 'error': 'Parse process crashed', 'timings': {}}, {})
+                            else:
+                                isolating.append((path, rel_name))
+                            continue
+                        parsed_done(parsed)
+
+                    if crashed:
+                        # The rest of the pool's in-flight work went down with it
+                        for future, (path, rel_name, _) in parse_futures.items():
+                            if future.done() and future.exception() is None:
+                                parsed_done(future.result())
+                            else:
+                                isolating.append((path, rel_name))
+                        parse_futures.clear()
+                        if isolating:
+                            self.stdout.write(self.style.WARNING(
+                                f'A parse process crashed; re-parsing {len(isolating)} file(s) one at a time.'
+                            ))
+                        parse_pool.shutdown(wait=False, cancel_futures=True)
+                        parse_pool = self._parse_pool(workers)
+                    submit()
+            finally:
+                parse_pool.shutdown()
+
+        elapsed = time.monotonic() - started
+        processed = counts['ok'] + counts['error']
+        rate = processed / elapsed * 60 if elapsed > 0 else 0.0
+        self.stdout.write(self.style.SUCCESS(
+            f'Done: {counts["ok"]} analyzed, {counts["error"]} failed in {elapsed:.1f}s '
+            f'({rate:.1f} resumes/min). Results: {output_path}'
+        ))
+
+    def _parse_pool(self, workers):
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_parse_worker)
+
+    def _build_result(self, parsed, llm_result):
+        if 'error' in parsed:
+            return {'file': parsed['file'], 'error': parsed['error'], 'timings': parsed['timings']}
+
+        analyzer = self.pattern_analyzer
+        analysis = analyzer.merge_results(
+            parsed['technical_skills'], parsed['soft_skills'], parsed['projects'], llm_result
+        )
+        return {
+            'file': parsed['file'],
+            'sha256': parsed['sha256'],
+            'technical_skills': analysis.technical_skills,
+            'soft_skills': analysis.soft_skills,
+            'projects': analysis.projects,
+            'experience_level': analysis.experience_level,
+            'summary': analysis.summary,
+            'keywords': analyzer.generate_keywords_from_analysis(analysis),
+            'taxonomy_version': analysis.taxonomy_version,
+            'timings': parsed['timings'],
+        }
+
+    def _store(self, result, pattern_only=False):
+        from interviews.models import ResumeAnalysis
+        ResumeAnalysis.objects.create(
+            source='bulk',
+            # A note keeps pattern-only rows from being reused as the full
+            # analysis of a candidate who uploads the same PDF
+            note='Pattern matching only (bulk ingestion without LLM)' if pattern_only else '',
+            resume_filename=result['file'][:255],
+            content_hash=result['sha256'],
+            status='completed',
+            technical_skills=result['technical_skills'],
+            soft_skills=result['soft_skills'],
+            projects=result['projects'],
+            experience_level=result['experience_level'],
+            summary=result['summary'],
+            keywords=result['keywords'],
+            taxonomy_version=result['taxonomy_version'],
+        )
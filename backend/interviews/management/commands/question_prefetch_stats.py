@@ -0,0 +1,46 @@
+"""
+Management command: question_prefetch_stats
+Expires speculatively generated interview questions nobody used in time,
+then reports how well speculation is paying off:
+  - hit rate: interview starts served from a prefetch
+  - wasted-call rate: prefetches whose Gemini calls were thrown away
+
+Usage:
+    python manage.py question_prefetch_stats
+    python manage.py question_prefetch_stats --days 7
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from interviews import question_prefetch
+
+
+class Command(BaseCommand):
+    help = 'Expires unused question prefetches and reports the hit and wasted-call rates'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=0, help='Only prefetches from the last N days (default: all)')
+
+    def handle(self, *args, **options):
+        expired = question_prefetch.expire_stale()
+        since = timezone.now() - timedelta(days=options['days']) if options['days'] else None
+        stats = question_prefetch.prefetch_stats(since=since)
+
+        self.stdout.write(f"Expired {expired} unused prefetches.")
+        self.stdout.write(
+            f"Prefetched {stats['prefetched']} question sets ({stats['gemini_calls']} Gemini calls): "
+            f"{stats['ready']} ready, {stats['failed']} failed, {stats['pending']} still pending."
+        )
+        self.stdout.write(
+            f"Interview starts: {stats['requests']} — {stats['hits']} hits, {stats['misses']} different "
+            f"difficulty, {stats['late']} not ready in time; hit rate {stats['hit_rate']:.0%} "
+            f"(predicted difficulty only: {stats['predicted_hit_rate']:.0%})."
+        )
+        self.stdout.write(
+            f"Wasted: {stats['wasted_calls']} Gemini calls, {stats['wasted_call_rate']:.0%} of settled "
+            f"prefetches ({stats['expired']} expired unused)."
+        )
+        if stats['avg_saved_ms'] is not None:
+            self.stdout.write(f"Average generation time saved per hit: {stats['avg_saved_ms'] / 1000:.1f} s.")
@@ -0,0 +1,34 @@
+"""
+Management command: rebuild_analytics_summaries
+Recomputes the per-user analytics rollups (UserAnalyticsSummary) from the
+completed interview sessions. The rollups are kept current by
+InterviewSession.mark_completed; run this to repair them after sessions were
+deleted or their feedback edited directly.
+
+Usage:
+    python manage.py rebuild_analytics_summaries
+    python manage.py rebuild_analytics_summaries --user-id 42 --user-id 57
+"""
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from interviews import analytics
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the per-user analytics rollups from completed interview sessions'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user-id', type=int, action='append', dest='user_ids',
+                            help='Only rebuild this user (repeatable)')
+        parser.add_argument('--batch-size', type=int, default=500, help='Users rebuilt per query')
+
+    def handle(self, *args, **options):
+        user_ids = options['user_ids'] or list(
+            get_user_model().objects.filter(interview_sessions__status='completed')
+            .values_list('id', flat=True).distinct().order_by('id')
+        )
+        batch_size = max(1, options['batch_size'])
+        for start in range(0, len(user_ids), batch_size):
+            analytics.rebuild(user_ids[start:start + batch_size])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt analytics summaries for {len(user_ids)} users.'))
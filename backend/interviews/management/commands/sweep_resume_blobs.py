@@ -0,0 +1,68 @@
+"""
+Management command: sweep_resume_blobs
+Applies the resume retention policy to content-addressed storage:
+  1. deletes upload references older than RESUME_BLOB_RETENTION_DAYS
+     (references held by interview sessions never expire)
+  2. deletes blobs nothing references any more, file and row, in batches
+
+Reports disk usage and the dedup ratio before and after. Run it from the
+web service (the blobs live on its persistent disk), e.g. daily.
+
+Usage:
+    python manage.py sweep_resume_blobs
+    python manage.py sweep_resume_blobs --dry-run
+    python manage.py sweep_resume_blobs --batch-size 200 --purge-legacy
+"""
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from interviews import resume_storage
+
+
+def _mb(num_bytes):
+    return f'{num_bytes / (1024 * 1024):.1f} MB'
+
+
+class Command(BaseCommand):
+    help = 'Deletes expired resume references and unreferenced resume blobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Rows deleted per batch')
+        parser.add_argument('--dry-run', action='store_true', help='Only report what would be deleted')
+        parser.add_argument('--purge-legacy', action='store_true',
+                            help='Also delete pre-dedup uploads in MEDIA_ROOT older than the retention period')
+
+    def handle(self, *args, **options):
+        self._report('Before', resume_storage.storage_stats())
+
+        result = resume_storage.sweep(batch_size=max(1, options['batch_size']), dry_run=options['dry_run'])
+        verb = 'Would delete' if options['dry_run'] else 'Deleted'
+        self.stdout.write(
+            f"{verb} {result['expired_references']} expired references and "
+            f"{result['blobs_deleted']} blobs ({_mb(result['bytes_freed'])})."
+        )
+
+        if options['purge_legacy']:
+            cutoff = time.time() - timedelta(days=settings.RESUME_BLOB_RETENTION_DAYS).total_seconds()
+            old = [path for path in resume_storage.legacy_uploads() if path.stat().st_mtime < cutoff]
+            freed = sum(path.stat().st_size for path in old)
+            if not options['dry_run']:
+                for path in old:
+                    path.unlink(missing_ok=True)
+            self.stdout.write(f"{verb} {len(old)} legacy uploads ({_mb(freed)}).")
+
+        if not options['dry_run']:
+            self._report('After', resume_storage.storage_stats())
+        self.stdout.write(self.style.SUCCESS(f'Sweep finished at {timezone.now():%Y-%m-%d %H:%M:%S} UTC.'))
+
+    def _report(self, label, stats):
+        self.stdout.write(
+            f"{label}: {stats['blobs']} blobs / {stats['references']} references, "
+            f"{_mb(stats['disk_bytes'])} on disk, {_mb(stats['logical_bytes'])} referenced, "
+            f"dedup ratio {stats['dedup_ratio']}x; "
+            f"legacy uploads: {stats['legacy_files']} files ({_mb(stats['legacy_bytes'])})"
+        )
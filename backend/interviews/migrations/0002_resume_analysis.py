@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:56
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeAnalysis',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resume_filename', models.CharField(blank=True, default='', max_length=255)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('partial', 'Pattern Skills Ready'), ('completed', 'Completed'), ('failed', 'Failed')], default='queued', max_length=20)),
+                ('technical_skills', models.JSONField(blank=True, default=list)),
+                ('soft_skills', models.JSONField(blank=True, default=list)),
+                ('projects', models.JSONField(blank=True, default=list)),
+                ('experience_level', models.CharField(blank=True, default='entry', max_length=20)),
+                ('summary', models.TextField(blank=True, default='')),
+                ('keywords', models.JSONField(blank=True, default=list)),
+                ('note', models.CharField(blank=True, default='', max_length=255)),
+                ('error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='resume_analyses', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Resume Analysis',
+                'verbose_name_plural': 'Resume Analyses',
+                'db_table': 'interviews_resume_analysis',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:59
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0003_resume_analysis_content_hash'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumeanalysis',
+            name='source',
+            field=models.CharField(choices=[('upload', 'Candidate Upload'), ('bulk', 'Bulk Ingestion')], default='upload', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='resumeanalysis',
+            name='user',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='resume_analyses', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
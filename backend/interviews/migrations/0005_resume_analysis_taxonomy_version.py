@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0004_resume_analysis_bulk_source'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumeanalysis',
+            name='taxonomy_version',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=40),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:21
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0006_resume_blob_storage'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveIntegerField()),
+                ('content_hash', models.CharField(blank=True, default='', max_length=64)),
+                ('section_hashes', models.JSONField(blank=True, default=dict)),
+                ('llm_sections', models.JSONField(blank=True, default=dict)),
+                ('summary', models.TextField(blank=True, default='')),
+                ('experience_level', models.CharField(blank=True, default='', max_length=20)),
+                ('reused_sections', models.JSONField(blank=True, default=list)),
+                ('llm_usage', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('analysis', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='version', to='interviews.resumeanalysis')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='resume_versions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Resume Version',
+                'verbose_name_plural': 'Resume Versions',
+                'db_table': 'interviews_resume_version',
+                'ordering': ['-version'],
+                'constraints': [models.UniqueConstraint(fields=('user', 'version'), name='unique_resume_version_per_user')],
+            },
+        ),
+    ]
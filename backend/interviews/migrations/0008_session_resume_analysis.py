@@ -0,0 +1,94 @@
+import json
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def link_sessions_to_analyses(apps, schema_editor):
+    """
+    Point every resume-mode session at a ResumeAnalysis instead of its own
+    copy of the analysis JSON: the upload's row when it holds the same
+    analysis, else one row per distinct (user, file, analysis) shared by all
+    its sessions.
+    """
+    InterviewSession = apps.get_model('interviews', 'InterviewSession')
+    ResumeAnalysis = apps.get_model('interviews', 'ResumeAnalysis')
+    created = {}
+
+    for session in InterviewSession.objects.filter(mode='resume').iterator():
+        copied = {
+            'technical_skills': session.technical_skills or [],
+            'soft_skills': session.soft_skills or [],
+            'projects': session.projects or [],
+            'summary': session.resume_summary or '',
+        }
+        if not any(copied.values()):
+            continue
+
+        analysis = None
+        if session.resume_filename:
+            upload = ResumeAnalysis.objects.filter(
+                user_id=session.user_id, resume_filename=session.resume_filename, status='completed',
+            ).order_by('-updated_at').first()
+            if upload is not None and all(getattr(upload, field) == value for field, value in copied.items()):
+                analysis = upload
+        if analysis is None:
+            key = (session.user_id, session.resume_filename, json.dumps(copied, sort_keys=True))
+            analysis = created.get(key)
+            if analysis is None:
+                analysis = created[key] = ResumeAnalysis.objects.create(
+                    user_id=session.user_id,
+                    resume_filename=session.resume_filename,
+                    status='completed',
+                    experience_level=session.experience_level or 'entry',
+                    **copied,
+                )
+        InterviewSession.objects.filter(id=session.id).update(resume_analysis=analysis)
+
+
+def copy_analyses_into_sessions(apps, schema_editor):
+    InterviewSession = apps.get_model('interviews', 'InterviewSession')
+
+    for session in InterviewSession.objects.filter(resume_analysis__isnull=False).select_related('resume_analysis'):
+        analysis = session.resume_analysis
+        InterviewSession.objects.filter(id=session.id).update(
+            technical_skills=analysis.technical_skills,
+            soft_skills=analysis.soft_skills,
+            projects=analysis.projects,
+            resume_summary=analysis.summary,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0007_resume_version'),
+    ]
+
+    operations = [
+        # Step 1: Add the reference
+        migrations.AddField(
+            model_name='interviewsession',
+            name='resume_analysis',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='sessions', to='interviews.resumeanalysis'),
+        ),
+        # Step 2: Move the copied analysis JSON into ResumeAnalysis rows
+        migrations.RunPython(link_sessions_to_analyses, reverse_code=copy_analyses_into_sessions),
+        # Step 3: Drop the copies
+        migrations.RemoveField(
+            model_name='interviewsession',
+            name='projects',
+        ),
+        migrations.RemoveField(
+            model_name='interviewsession',
+            name='resume_summary',
+        ),
+        migrations.RemoveField(
+            model_name='interviewsession',
+            name='soft_skills',
+        ),
+        migrations.RemoveField(
+            model_name='interviewsession',
+            name='technical_skills',
+        ),
+    ]
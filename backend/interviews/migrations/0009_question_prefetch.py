@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0008_session_resume_analysis'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuestionPrefetch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('difficulty', models.CharField(max_length=20)),
+                ('difficulty_source', models.CharField(choices=[('requested', 'Difficulty Sent With Upload'), ('predicted', 'Predicted From Experience')], default='predicted', max_length=20)),
+                ('status', models.CharField(choices=[('generating', 'Generating'), ('ready', 'Ready'), ('failed', 'Failed')], default='generating', max_length=20)),
+                ('outcome', models.CharField(blank=True, choices=[('', 'Pending'), ('hit', 'Used'), ('miss', 'Different Difficulty'), ('late', 'Not Ready In Time'), ('expired', 'Expired')], db_index=True, default='', max_length=20)),
+                ('questions', models.JSONField(blank=True, default=dict)),
+                ('error', models.TextField(blank=True, default='')),
+                ('generation_ms', models.PositiveIntegerField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('ready_at', models.DateTimeField(blank=True, null=True)),
+                ('expires_at', models.DateTimeField(db_index=True)),
+                ('used_at', models.DateTimeField(blank=True, null=True)),
+                ('analysis', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='question_prefetch', to='interviews.resumeanalysis')),
+            ],
+            options={
+                'verbose_name': 'Question Prefetch',
+                'verbose_name_plural': 'Question Prefetches',
+                'db_table': 'interviews_question_prefetch',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
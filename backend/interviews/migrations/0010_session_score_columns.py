@@ -0,0 +1,66 @@
+from django.db import migrations, models
+
+# Frozen copy of interviews.models.FEEDBACK_SCORE_PATHS as of this migration
+SCORE_PATHS = {
+    'overall_score': ('overall_score',),
+    'hr_score': ('category_scores', 'hr_performance'),
+    'technical_score': ('category_scores', 'technical_performance'),
+    'cultural_fit_score': ('category_scores', 'cultural_fit'),
+}
+
+
+def _score(feedback, path):
+    value = feedback
+    for key in path:
+        value = value.get(key) if isinstance(value, dict) else None
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def copy_scores_out_of_feedback(apps, schema_editor):
+    InterviewSession = apps.get_model('interviews', 'InterviewSession')
+    batch = []
+    for session in InterviewSession.objects.exclude(feedback={}).only('id', 'feedback').iterator(chunk_size=500):
+        for field, path in SCORE_PATHS.items():
+            setattr(session, field, _score(session.feedback, path))
+        batch.append(session)
+        if len(batch) >= 500:
+            InterviewSession.objects.bulk_update(batch, list(SCORE_PATHS))
+            batch = []
+    if batch:
+        InterviewSession.objects.bulk_update(batch, list(SCORE_PATHS))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0009_question_prefetch'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewsession',
+            name='cultural_fit_score',
+            field=models.FloatField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='interviewsession',
+            name='hr_score',
+            field=models.FloatField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='interviewsession',
+            name='overall_score',
+            field=models.FloatField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='interviewsession',
+            name='technical_score',
+            field=models.FloatField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(copy_scores_out_of_feedback, reverse_code=migrations.RunPython.noop),
+    ]
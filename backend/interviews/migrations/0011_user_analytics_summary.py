@@ -0,0 +1,72 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:42
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max, Q, Sum
+
+
+def build_summaries(apps, schema_editor):
+    """One rollup row per user with completed sessions, in a single grouped query."""
+    InterviewSession = apps.get_model('interviews', 'InterviewSession')
+    UserAnalyticsSummary = apps.get_model('interviews', 'UserAnalyticsSummary')
+
+    totals = {
+        'total_sessions': Count('id'),
+        'resume_count': Count('id', filter=Q(mode='resume')),
+        'role_count': Count('id', filter=Q(mode='role')),
+        'scored_count': Count('overall_score'),
+        'score_sum': Sum('overall_score'),
+        'best_score': Max('overall_score'),
+        'last_completed_at': Max('completed_at'),
+    }
+    for diff in ('beginner', 'intermediate', 'advanced'):
+        totals[f'{diff}_count'] = Count('id', filter=Q(difficulty=diff))
+        totals[f'{diff}_scored'] = Count('overall_score', filter=Q(difficulty=diff))
+        totals[f'{diff}_score_sum'] = Sum('overall_score', filter=Q(difficulty=diff))
+
+    rows = InterviewSession.objects.filter(status='completed').values('user_id').annotate(**totals).order_by()
+    UserAnalyticsSummary.objects.bulk_create(
+        (UserAnalyticsSummary(**{field: value for field, value in row.items() if value is not None}) for row in rows),
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_user_address_user_branch_user_college_name_and_more'),
+        ('interviews', '0010_session_score_columns'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserAnalyticsSummary',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='analytics_summary', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('total_sessions', models.PositiveIntegerField(default=0)),
+                ('resume_count', models.PositiveIntegerField(default=0)),
+                ('role_count', models.PositiveIntegerField(default=0)),
+                ('scored_count', models.PositiveIntegerField(default=0)),
+                ('score_sum', models.FloatField(default=0)),
+                ('best_score', models.FloatField(blank=True, null=True)),
+                ('beginner_count', models.PositiveIntegerField(default=0)),
+                ('beginner_scored', models.PositiveIntegerField(default=0)),
+                ('beginner_score_sum', models.FloatField(default=0)),
+                ('intermediate_count', models.PositiveIntegerField(default=0)),
+                ('intermediate_scored', models.PositiveIntegerField(default=0)),
+                ('intermediate_score_sum', models.FloatField(default=0)),
+                ('advanced_count', models.PositiveIntegerField(default=0)),
+                ('advanced_scored', models.PositiveIntegerField(default=0)),
+                ('advanced_score_sum', models.FloatField(default=0)),
+                ('last_completed_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'User Analytics Summary',
+                'verbose_name_plural': 'User Analytics Summaries',
+                'db_table': 'interviews_user_analytics_summary',
+            },
+        ),
+        migrations.RunPython(build_summaries, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:44
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0011_user_analytics_summary'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='interviewsession',
+            index=models.Index(fields=['user', 'status', '-completed_at'], name='session_user_status_done_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interviewsession',
+            index=models.Index(django.db.models.functions.text.Lower('role'), models.F('status'), models.OrderBy(models.F('completed_at'), descending=True), name='session_role_lower_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interviewsession',
+            index=models.Index(fields=['status', 'mode', 'role'], name='session_status_mode_role_idx'),
+        ),
+    ]
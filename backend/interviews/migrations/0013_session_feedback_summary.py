@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:46
+
+from django.db import migrations, models
+
+
+def summarize_existing_feedback(apps, schema_editor):
+    InterviewSession = apps.get_model('interviews', 'InterviewSession')
+    batch = []
+    for session in InterviewSession.objects.exclude(feedback={}).only('id', 'feedback').iterator(chunk_size=500):
+        feedback = session.feedback if isinstance(session.feedback, dict) else {}
+        session.feedback_summary = {
+            'strengths': list(feedback.get('strengths') or [])[:2],
+            'improvements': list(feedback.get('improvements') or [])[:2],
+        }
+        batch.append(session)
+        if len(batch) >= 500:
+            InterviewSession.objects.bulk_update(batch, ['feedback_summary'])
+            batch = []
+    if batch:
+        InterviewSession.objects.bulk_update(batch, ['feedback_summary'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0012_session_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewsession',
+            name='feedback_summary',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.RunPython(summarize_existing_feedback, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,73 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def split_answers_into_rows(apps, schema_editor):
+    """One InterviewAnswer per non-empty entry of each session's answers list."""
+    InterviewSession = apps.get_model('interviews', 'InterviewSession')
+    InterviewAnswer = apps.get_model('interviews', 'InterviewAnswer')
+
+    batch = []
+    for session_id, answers in InterviewSession.objects.exclude(answers=[]).values_list('id', 'answers').iterator():
+        for index, text in enumerate(answers if isinstance(answers, list) else []):
+            if text is None:
+                continue
+            batch.append(InterviewAnswer(
+                session_id=session_id,
+                question_index=index,
+                text=text if isinstance(text, str) else str(text),
+            ))
+        if len(batch) >= 1000:
+            InterviewAnswer.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        InterviewAnswer.objects.bulk_create(batch)
+
+
+def join_rows_into_answers(apps, schema_editor):
+    InterviewSession = apps.get_model('interviews', 'InterviewSession')
+    InterviewAnswer = apps.get_model('interviews', 'InterviewAnswer')
+
+    answers_by_session = {}
+    for session_id, index, text in InterviewAnswer.objects.order_by('session_id', 'question_index') \
+            .values_list('session_id', 'question_index', 'text').iterator():
+        answers = answers_by_session.setdefault(session_id, [])
+        answers.extend([None] * (index + 1 - len(answers)))
+        answers[index] = text
+    for session_id, answers in answers_by_session.items():
+        InterviewSession.objects.filter(id=session_id).update(answers=answers)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0013_session_feedback_summary'),
+    ]
+
+    operations = [
+        # Step 1: The per-question table
+        migrations.CreateModel(
+            name='InterviewAnswer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('question_index', models.PositiveIntegerField()),
+                ('text', models.TextField(blank=True, default='')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('session', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='answer_rows', to='interviews.interviewsession')),
+            ],
+            options={
+                'verbose_name': 'Interview Answer',
+                'verbose_name_plural': 'Interview Answers',
+                'db_table': 'interviews_answer',
+                'ordering': ['session', 'question_index'],
+                'constraints': [models.UniqueConstraint(fields=('session', 'question_index'), name='unique_answer_per_question')],
+            },
+        ),
+        # Step 2: Move the answers JSON into rows
+        migrations.RunPython(split_answers_into_rows, reverse_code=join_rows_into_answers),
+        # Step 3: Drop the JSON list
+        migrations.RemoveField(
+            model_name='interviewsession',
+            name='answers',
+        ),
+    ]
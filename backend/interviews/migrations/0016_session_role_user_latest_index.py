@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:56
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0015_session_keyset_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='interviewsession',
+            name='session_role_lower_idx',
+        ),
+        migrations.AddIndex(
+            model_name='interviewsession',
+            index=models.Index(django.db.models.functions.text.Lower('role'), models.F('status'), models.F('user'), models.OrderBy(models.F('completed_at'), descending=True), models.OrderBy(models.F('id'), descending=True), name='session_role_user_latest_idx'),
+        ),
+    ]
@@ -1,7 +1,44 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Lower
 from django.conf import settings
 from django.utils import timezone
 
+# Score column -> path into the feedback JSON produced by the feedback prompt
+FEEDBACK_SCORE_PATHS = {
+    'overall_score': ('overall_score',),
+    'hr_score': ('category_scores', 'hr_performance'),
+    'technical_score': ('category_scores', 'technical_performance'),
+    'cultural_fit_score': ('category_scores', 'cultural_fit'),
+}
+
+
+def feedback_scores(feedback) -> dict:
+    """The score columns for a feedback blob; missing or non-numeric scores are None."""
+    scores = {}
+    for field, path in FEEDBACK_SCORE_PATHS.items():
+        value = feedback
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        try:
+            scores[field] = float(value) if value is not None and not isinstance(value, bool) else None
+        except (TypeError, ValueError):
+            scores[field] = None
+    return scores
+
+
+def summarize_feedback(feedback) -> dict:
+    """The part of a feedback blob the session history list shows."""
+    feedback = feedback if isinstance(feedback, dict) else {}
+    return {
+        'strengths': list(feedback.get('strengths') or [])[:2],
+        'improvements': list(feedback.get('improvements') or [])[:2],
+    }
+
+
+def feedback_columns(feedback) -> dict:
+    """Every column derived from a feedback blob: the scores and the summary."""
+    return {**feedback_scores(feedback), 'feedback_summary': summarize_feedback(feedback)}
+
 
 class InterviewSession(models.Model):
     """
@@ -25,20 +62,33 @@ class InterviewSession(models.Model):
     difficulty = models.CharField(max_length=20, choices=DIFFICULTY_CHOICES)
     role = models.CharField(max_length=100, blank=True, default='')
 
-    # Resume analysis data (for resume mode)
+    # Resume mode: the analysis the questions were generated from. Every
+    # interview from the same upload points at the same row instead of
+    # carrying its own copy of the skills/projects JSON
+    resume_analysis = models.ForeignKey(
+        'ResumeAnalysis',
+        on_delete=models.SET_NULL,
+        related_name='sessions',
+        null=True,
+        blank=True,
+    )
     resume_filename = models.CharField(max_length=255, blank=True, default='')
-    technical_skills = models.JSONField(default=list, blank=True)
-    soft_skills = models.JSONField(default=list, blank=True)
-    projects = models.JSONField(default=list, blank=True)
+    # Copied from the analysis; kept on the session for history/list views
     experience_level = models.CharField(max_length=20, blank=True, default='entry')
-    resume_summary = models.TextField(blank=True, default='')
 
-    # Q&A data
+    # Q&A data (answers are InterviewAnswer rows, see `answers`)
     questions = models.JSONField(default=dict, blank=True)
-    answers = models.JSONField(default=list, blank=True)
 
     # AI-generated feedback
     feedback = models.JSONField(default=dict, blank=True)
+    # Scores copied out of `feedback` whenever it is saved, so analytics and
+    # HR listings can aggregate and sort without loading the JSON
+    overall_score = models.FloatField(null=True, blank=True, db_index=True)
+    hr_score = models.FloatField(null=True, blank=True, db_index=True)
+    technical_score = models.FloatField(null=True, blank=True, db_index=True)
+    cultural_fit_score = models.FloatField(null=True, blank=True, db_index=True)
+    # First two strengths/improvements, for list views that shouldn't load `feedback`
+    feedback_summary = models.JSONField(default=dict, blank=True)
 
     # Status
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='active')
@@ -48,26 +98,416 @@ class InterviewSession(models.Model):
     class Meta:
         db_table = 'interviews_session'
         ordering = ['-created_at']
+        indexes = [
+            # A user's completed sessions, newest first (session_history, hr_search_uid);
+            # id breaks completed_at ties for the keyset pagination cursor
+            models.Index(fields=['user', 'status', '-completed_at', '-id'], name='session_user_status_done_idx'),
+            # hr_search_role: case-insensitive role match via Lower(role) = lower(%s),
+            # which a plain index on role can't serve, then each candidate's
+            # latest session — rows come out grouped by user, newest first
+            models.Index(Lower('role'), 'status', 'user', models.F('completed_at').desc(), models.F('id').desc(),
+                         name='session_role_user_latest_idx'),
+            # hr_available_roles: distinct roles of completed role-mode sessions
+            models.Index(fields=['status', 'mode', 'role'], name='session_status_mode_role_idx'),
+        ]
         verbose_name = 'Interview Session'
         verbose_name_plural = 'Interview Sessions'
 
     def __str__(self):
         return f"<InterviewSession {self.id} — {self.mode} — {self.status}>"
 
+    def save(self, *args, **kwargs):
+        # Keep the score and summary columns in step with the feedback they come from
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'feedback' in update_fields:
+            columns = feedback_columns(self.feedback)
+            for field, value in columns.items():
+                setattr(self, field, value)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, *columns}
+        super().save(*args, **kwargs)
+
     def mark_completed(self):
-        self.status = 'completed'
-        self.completed_at = timezone.now()
-        self.save(update_fields=['status', 'completed_at', 'feedback'])
+        from interviews import analytics
+        from interviews.signals import session_completed
+
+        with transaction.atomic():
+            # Locks the row; if the session was already completed (feedback
+            # regenerated) its old contribution is taken out of the rollup
+            previous = (
+                InterviewSession.objects.select_for_update()
+                .filter(pk=self.pk, status='completed')
+                .values('mode', 'difficulty', 'overall_score')
+                .first()
+            )
+            self.status = 'completed'
+            self.completed_at = timezone.now()
+            self.save(update_fields=['status', 'completed_at', 'feedback'])
+            analytics.record_completion(self, previous=previous)
+            session_completed.send(sender=InterviewSession, session=self)
+
+    @property
+    def answers(self):
+        """
+        The answers as one list indexed by question, None for questions not
+        answered — the shape the feedback prompt and detail endpoints use.
+        """
+        answers = []
+        for row in self.answer_rows.all():
+            answers.extend([None] * (row.question_index + 1 - len(answers)))
+            answers[row.question_index] = row.text
+        return answers
 
     @property
-    def overall_score(self):
-        """Return the overall score from feedback, or None."""
-        return self.feedback.get('overall_score') if self.feedback else None
+    def resume_summary(self):
+        """Summary of the resume this interview was generated from, if any."""
+        return self.resume_analysis.summary if self.resume_analysis_id else ''
 
     @property
     def duration_minutes(self):
         """Return session duration in minutes, or None if not completed."""
-        if self.completed_at and self.created_at:
-            delta = self.completed_at - self.created_at
-            return round(delta.total_seconds() / 60, 1)
+        return self.minutes_between(self.created_at, self.completed_at)
+
+    @staticmethod
+    def minutes_between(created_at, completed_at):
+        if completed_at and created_at:
+            return round((completed_at - created_at).total_seconds() / 60, 1)
         return None
+
+
+class InterviewAnswer(models.Model):
+    """
+    The candidate's answer to one question of an interview session. Saves
+    upsert this single row on (session, question_index), so the cost of an
+    autosave doesn't grow with the other answers and concurrent saves of
+    different questions can't overwrite each other.
+    """
+    session = models.ForeignKey(InterviewSession, on_delete=models.CASCADE, related_name='answer_rows')
+    question_index = models.PositiveIntegerField()
+    text = models.TextField(blank=True, default='')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'interviews_answer'
+        ordering = ['session', 'question_index']
+        constraints = [
+            models.UniqueConstraint(fields=['session', 'question_index'], name='unique_answer_per_question'),
+        ]
+        verbose_name = 'Interview Answer'
+        verbose_name_plural = 'Interview Answers'
+
+    def __str__(self):
+        return f"<InterviewAnswer {self.session_id}#{self.question_index}>"
+
+    @classmethod
+    def save_answer(cls, session_id: int, question_index: int, text: str) -> None:
+        """Insert or overwrite one answer in a single INSERT ... ON CONFLICT DO UPDATE."""
+        cls.objects.bulk_create(
+            [cls(session_id=session_id, question_index=question_index, text=text)],
+            update_conflicts=True,
+            unique_fields=['session', 'question_index'],
+            update_fields=['text', 'updated_at'],
+        )
+
+
+class UserAnalyticsSummary(models.Model):
+    """
+    Running totals behind a user's analytics dashboard. Updated in the same
+    transaction as InterviewSession.mark_completed, so `user_analytics` is a
+    primary-key lookup however long the history; `manage.py
+    rebuild_analytics_summaries` recomputes them from the sessions.
+    """
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='analytics_summary',
+    )
+    total_sessions = models.PositiveIntegerField(default=0)
+    resume_count = models.PositiveIntegerField(default=0)
+    role_count = models.PositiveIntegerField(default=0)
+
+    # Sessions with an overall score, and the sum of those scores
+    scored_count = models.PositiveIntegerField(default=0)
+    score_sum = models.FloatField(default=0)
+    best_score = models.FloatField(null=True, blank=True)
+
+    beginner_count = models.PositiveIntegerField(default=0)
+    beginner_scored = models.PositiveIntegerField(default=0)
+    beginner_score_sum = models.FloatField(default=0)
+    intermediate_count = models.PositiveIntegerField(default=0)
+    intermediate_scored = models.PositiveIntegerField(default=0)
+    intermediate_score_sum = models.FloatField(default=0)
+    advanced_count = models.PositiveIntegerField(default=0)
+    advanced_scored = models.PositiveIntegerField(default=0)
+    advanced_score_sum = models.FloatField(default=0)
+
+    last_completed_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'interviews_user_analytics_summary'
+        verbose_name = 'User Analytics Summary'
+        verbose_name_plural = 'User Analytics Summaries'
+
+    def __str__(self):
+        return f"<UserAnalyticsSummary {self.user_id} — {self.total_sessions} sessions>"
+
+    def to_payload(self):
+        """Serialize in the shape `user_analytics` returns."""
+        if not self.total_sessions:
+            return {
+                'total_sessions': 0,
+                'average_score': None,
+                'best_score': None,
+                'resume_count': 0,
+                'role_count': 0,
+                'by_difficulty': {},
+            }
+
+        def _average(total, count):
+            return round(total / count, 1) if count else None
+
+        return {
+            'total_sessions': self.total_sessions,
+            'average_score': _average(self.score_sum, self.scored_count),
+            'best_score': self.best_score,
+            'resume_count': self.resume_count,
+            'role_count': self.role_count,
+            'by_difficulty': {
+                diff: {
+                    'count': getattr(self, f'{diff}_count'),
+                    'average_score': _average(getattr(self, f'{diff}_score_sum'), getattr(self, f'{diff}_scored')),
+                }
+                for diff, _ in InterviewSession.DIFFICULTY_CHOICES
+            },
+        }
+
+
+class ResumeAnalysis(models.Model):
+    """
+    Analysis of a single uploaded resume.
+    The row doubles as the background job record: `upload_resume` creates it,
+    the analysis worker fills it in as each stage finishes, and the status
+    endpoint polls it for partial results.
+    """
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('partial', 'Pattern Skills Ready'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+    SOURCE_CHOICES = [('upload', 'Candidate Upload'), ('bulk', 'Bulk Ingestion')]
+
+    # Bulk-ingested resumes (manage.py ingest_resumes) have no candidate account
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='resume_analyses',
+        null=True,
+        blank=True,
+    )
+    source = models.CharField(max_length=20, choices=SOURCE_CHOICES, default='upload')
+    resume_filename = models.CharField(max_length=255, blank=True, default='')
+    content_hash = models.CharField(max_length=64, blank=True, default='', db_index=True)  # SHA-256 of the PDF
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='queued')
+
+    technical_skills = models.JSONField(default=list, blank=True)
+    soft_skills = models.JSONField(default=list, blank=True)
+    projects = models.JSONField(default=list, blank=True)
+    experience_level = models.CharField(max_length=20, blank=True, default='entry')
+    summary = models.TextField(blank=True, default='')
+    keywords = models.JSONField(default=list, blank=True)
+    # core.skill_taxonomy version the skills were matched against; rows on an
+    # older version can be found and re-matched after a taxonomy update
+    taxonomy_version = models.CharField(max_length=40, blank=True, default='', db_index=True)
+
+    # Set when the full analysis failed and only basic keywords are available
+    note = models.CharField(max_length=255, blank=True, default='')
+    error = models.TextField(blank=True, default='')
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'interviews_resume_analysis'
+        ordering = ['-created_at']
+        verbose_name = 'Resume Analysis'
+        verbose_name_plural = 'Resume Analyses'
+
+    def __str__(self):
+        return f"<ResumeAnalysis {self.id} — {self.status}>"
+
+    @property
+    def is_finished(self):
+        return self.status in ('completed', 'failed')
+
+    def to_payload(self):
+        """Serialize in the shape `upload_resume` used to return synchronously."""
+        payload = {
+            'analysis_id': self.id,
+            'status': self.status,
+            'filename': self.resume_filename,
+            'keywords': self.keywords,
+        }
+        if self.status in ('partial', 'completed') and not self.note:
+            payload['analysis'] = {
+                'technical_skills': self.technical_skills[:10],
+                'soft_skills': self.soft_skills[:8],
+                'projects': self.projects[:5],
+                'experience_level': self.experience_level,
+                'summary': self.summary,
+            }
+        if self.note:
+            payload['note'] = self.note
+        if self.status == 'failed':
+            payload['error'] = 'Resume analysis failed. Please try uploading again.'
+        return payload
+
+
+class ResumeVersion(models.Model):
+    """
+    One analyzed version of a candidate's resume: the hash of each section as
+    it was sent to the LLM and what the LLM found in it. When the candidate
+    uploads an edited resume, only sections whose hash changed are re-sent
+    (see ResumeAnalyzer.analyze_document); the rest reuse these findings.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='resume_versions',
+    )
+    analysis = models.OneToOneField(ResumeAnalysis, on_delete=models.CASCADE, related_name='version')
+    version = models.PositiveIntegerField()
+    content_hash = models.CharField(max_length=64, blank=True, default='')
+    section_hashes = models.JSONField(default=dict, blank=True)  # {section: sha256}
+    # {section: {technical_skills, soft_skills, projects}} as returned by the LLM
+    llm_sections = models.JSONField(default=dict, blank=True)
+    summary = models.TextField(blank=True, default='')
+    experience_level = models.CharField(max_length=20, blank=True, default='')
+    reused_sections = models.JSONField(default=list, blank=True)
+    llm_usage = models.JSONField(default=dict, blank=True)  # calls, prompt_chars, prompt/output tokens
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'interviews_resume_version'
+        ordering = ['-version']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'version'], name='unique_resume_version_per_user'),
+        ]
+        verbose_name = 'Resume Version'
+        verbose_name_plural = 'Resume Versions'
+
+    def __str__(self):
+        return f"<ResumeVersion {self.user_id} v{self.version}>"
+
+    def as_previous(self):
+        """The shape ResumeAnalyzer.analyze_document takes as `previous`."""
+        return {
+            'section_hashes': self.section_hashes,
+            'sections': self.llm_sections,
+            'summary': self.summary,
+            'experience_level': self.experience_level,
+        }
+
+
+class QuestionPrefetch(models.Model):
+    """
+    Interview questions generated speculatively as soon as a resume analysis
+    completes, for the difficulty the candidate is expected to pick.
+    `generate_questions` uses them instead of calling Gemini when the
+    difficulty matches; unused rows expire after QUESTION_PREFETCH_TTL_MINUTES.
+    """
+    STATUS_CHOICES = [
+        ('generating', 'Generating'),
+        ('ready', 'Ready'),
+        ('failed', 'Failed'),
+    ]
+    OUTCOME_CHOICES = [
+        ('', 'Pending'),
+        ('hit', 'Used'),
+        ('miss', 'Different Difficulty'),
+        ('late', 'Not Ready In Time'),
+        ('expired', 'Expired'),
+    ]
+    SOURCE_CHOICES = [('requested', 'Difficulty Sent With Upload'), ('predicted', 'Predicted From Experience')]
+
+    analysis = models.OneToOneField(ResumeAnalysis, on_delete=models.CASCADE, related_name='question_prefetch')
+    difficulty = models.CharField(max_length=20)
+    difficulty_source = models.CharField(max_length=20, choices=SOURCE_CHOICES, default='predicted')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='generating')
+    outcome = models.CharField(max_length=20, choices=OUTCOME_CHOICES, blank=True, default='', db_index=True)
+    questions = models.JSONField(default=dict, blank=True)
+    error = models.TextField(blank=True, default='')
+    generation_ms = models.PositiveIntegerField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    ready_at = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField(db_index=True)
+    used_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'interviews_question_prefetch'
+        ordering = ['-created_at']
+        verbose_name = 'Question Prefetch'
+        verbose_name_plural = 'Question Prefetches'
+
+    def __str__(self):
+        return f"<QuestionPrefetch {self.analysis_id} {self.difficulty} — {self.status}>"
+
+
+class ResumeBlob(models.Model):
+    """
+    One stored resume PDF, addressed by the SHA-256 of its bytes.
+    Lives at <MEDIA_ROOT>/<RESUME_BLOB_DIR>/<sha[:2]>/<sha[2:4]>/<sha>.pdf
+    (see interviews.resume_storage); identical uploads share one blob.
+    """
+    sha256 = models.CharField(max_length=64, unique=True)
+    size = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    # Bumped whenever a new reference is taken; the sweeper leaves recently
+    # referenced blobs alone so it can't race an upload in progress
+    last_referenced_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        db_table = 'interviews_resume_blob'
+        verbose_name = 'Resume Blob'
+        verbose_name_plural = 'Resume Blobs'
+
+    def __str__(self):
+        return f"<ResumeBlob {self.sha256[:12]} — {self.size} bytes>"
+
+
+class ResumeBlobReference(models.Model):
+    """
+    Links a user (and the analysis / interview session created from the
+    upload) to a stored blob. Blobs without references are swept.
+    """
+    blob = models.ForeignKey(ResumeBlob, on_delete=models.CASCADE, related_name='references')
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='resume_blob_references',
+        null=True,
+        blank=True,
+    )
+    analysis = models.ForeignKey(
+        ResumeAnalysis, on_delete=models.SET_NULL, related_name='blob_references', null=True, blank=True,
+    )
+    session = models.ForeignKey(
+        InterviewSession, on_delete=models.CASCADE, related_name='blob_references', null=True, blank=True,
+    )
+    # Name the upload was returned to the client under (`{user_id}_{ts}_{name}`)
+    stored_name = models.CharField(max_length=255, blank=True, default='', db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # Upload references expire after RESUME_BLOB_RETENTION_DAYS; references
+    # held by an interview session don't (they go when the session does)
+    expires_at = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    class Meta:
+        db_table = 'interviews_resume_blob_reference'
+        verbose_name = 'Resume Blob Reference'
+        verbose_name_plural = 'Resume Blob References'
+
+    def __str__(self):
+        return f"<ResumeBlobReference {self.id} → {self.blob_id}>"
@@ -0,0 +1,108 @@
+"""
+Keyset (cursor) pagination over completed interview sessions.
+
+Lists are ordered newest first by (completed_at, id) — or by another key
+ending in id, such as (score, completed_at, id) — and each page is
+`WHERE (key) < (last seen) ORDER BY key DESC LIMIT n`, which the
+(…, -completed_at, -id) indexes answer by seeking straight to the cursor:
+page 500 costs what page 1 does, where OFFSET would walk and throw away
+every earlier row. The cursor handed to clients is the last row's key,
+base64-encoded; they pass it back as `?cursor=` unchanged.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from django.db import models
+from django.db.models import Q, QuerySet
+
+RECENT = ('completed_at', 'id')
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def _dump(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def encode_cursor(*values) -> str:
+    raw = json.dumps([_dump(value) for value in values], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def _is_datetime(queryset: QuerySet, key: str) -> bool:
+    if key in queryset.query.annotations:
+        field = queryset.query.annotations[key].output_field
+    else:
+        field = queryset.model._meta.get_field(key)
+    return isinstance(field, models.DateTimeField)
+
+
+def decode_cursor(cursor: str, queryset: QuerySet, keys: Sequence[str] = RECENT) -> Tuple:
+    """The key values in `cursor`, typed for filtering `queryset` on `keys`."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError
+        decoded = []
+        for key, value in zip(keys, values):
+            if _is_datetime(queryset, key):
+                value = datetime.fromisoformat(value)
+                if value.tzinfo is None:
+                    raise ValueError
+            elif isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError
+            decoded.append(value)
+    except (binascii.Error, ValueError, TypeError):
+        raise InvalidCursor(cursor)
+    return tuple(decoded)
+
+
+def page_size(request, default: int, maximum: int) -> int:
+    """`?limit=` clamped to 1..maximum; `default` when absent or not a number."""
+    try:
+        size = int(request.GET.get('limit', default))
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(size, maximum))
+
+
+def _key(row, keys: Sequence[str]) -> Tuple:
+    if isinstance(row, dict):
+        return tuple(row[key] for key in keys)
+    return tuple(getattr(row, key) for key in keys)
+
+
+def _after(keys: Sequence[str], values: Sequence) -> Q:
+    """(keys) < (values) in descending order, spelled out as a disjunction."""
+    condition = Q()
+    for i, key in enumerate(keys):
+        condition |= Q(**dict(zip(keys[:i], values[:i])), **{f'{key}__lt': values[i]})
+    return condition
+
+
+def keyset_page(queryset: QuerySet, cursor: Optional[str], size: int,
+                keys: Sequence[str] = RECENT) -> Tuple[List[Any], Optional[str]]:
+    """
+    One page of `queryset` (model instances or .values() dicts) after
+    `cursor`, in descending order of `keys` — non-null fields or annotations
+    ending in a unique one — and the cursor of the next page, None on the
+    last one. Raises InvalidCursor.
+    """
+    queryset = queryset.filter(completed_at__isnull=False).order_by(*(f'-{key}' for key in keys))
+    if cursor:
+        values = decode_cursor(cursor, queryset, keys)
+        # The redundant bound on the leading key gives the planner an index
+        # range to seek to; the OR alone would be applied as a filter
+        queryset = queryset.filter(_after(keys, values), **{f'{keys[0]}__lte': values[0]})
+    # One extra row says whether another page follows
+    rows = list(queryset[:size + 1])
+    if len(rows) <= size:
+        return rows, None
+    rows = rows[:size]
+    return rows, encode_cursor(*_key(rows[-1], keys))
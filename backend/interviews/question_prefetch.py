@@ -0,0 +1,207 @@
+"""
+Speculative interview question generation.
+
+Between the resume analysis finishing and the candidate clicking "start" the
+Gemini quota sits idle, then `generate_questions` makes its three calls while
+the candidate watches a spinner. As soon as an analysis completes we generate
+the questions for the difficulty the candidate most likely wants (the one
+sent with the upload, else predicted from the experience level) and stash
+them in a `QuestionPrefetch` row keyed by the analysis. `generate_questions`
+claims them if they are ready and match the difficulty, and otherwise
+generates as before — it never waits for a prefetch still in flight.
+
+Prefetches run on their own pool of QUESTION_PREFETCH_WORKERS threads, so
+speculative Gemini calls never queue ahead of resume analyses; when every
+prefetch thread is busy the prefetch is skipped.
+
+Every prefetch ends with an outcome — used (hit), different difficulty
+(miss), still generating when the interview started (late) or never asked
+for (expired) — which `prefetch_stats` turns into the hit rate and the share
+of speculative Gemini calls that were wasted.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Avg, Count, Q
+from django.utils import timezone
+
+from interviews.models import QuestionPrefetch, ResumeAnalysis
+
+logger = logging.getLogger(__name__)
+
+DIFFICULTIES = ('beginner', 'intermediate', 'advanced')
+DIFFICULTY_BY_EXPERIENCE = {'entry': 'beginner', 'mid': 'intermediate', 'senior': 'advanced'}
+CALLS_PER_GENERATION = 3  # technical, HR and project questions
+
+_executor = None
+_slots = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    """The prefetch pool and the semaphore counting its free threads, started on first use."""
+    global _executor, _slots
+    with _executor_lock:
+        if _executor is None:
+            _slots = threading.BoundedSemaphore(settings.QUESTION_PREFETCH_WORKERS)
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.QUESTION_PREFETCH_WORKERS,
+                thread_name_prefix='question-prefetch',
+            )
+    return _executor, _slots
+
+
+def predict_difficulty(experience_level: str) -> str:
+    return DIFFICULTY_BY_EXPERIENCE.get(experience_level or '', 'beginner')
+
+
+def schedule_prefetch(analysis_id: int, requested_difficulty: str = '') -> None:
+    """Start generating questions for a completed analysis (inline when async is disabled)."""
+    if not settings.QUESTION_PREFETCH_ENABLED or not settings.GEMINI_API_KEY:
+        return
+    if settings.RESUME_ANALYSIS_ASYNC:
+        executor, slots = _get_executor()
+        # Never queue: a prefetch that can't start now would likely finish too late
+        if not slots.acquire(blocking=False):
+            logger.info(f"Question prefetch for analysis {analysis_id} skipped (prefetch pool busy)")
+            return
+        future = executor.submit(prefetch_questions, analysis_id, requested_difficulty)
+        future.add_done_callback(lambda _: slots.release())
+    else:
+        prefetch_questions(analysis_id, requested_difficulty)
+
+
+def prefetch_questions(analysis_id: int, requested_difficulty: str = '') -> Optional[QuestionPrefetch]:
+    """Generate and stash the questions for one analysis; never raises."""
+    close_old_connections()
+    try:
+        return _prefetch(analysis_id, requested_difficulty)
+    except Exception as e:
+        logger.exception(f"Question prefetch for analysis {analysis_id} crashed: {e}")
+        QuestionPrefetch.objects.filter(analysis_id=analysis_id, status='generating').update(
+            status='failed', error=str(e),
+        )
+        return None
+    finally:
+        close_old_connections()
+
+
+def _prefetch(analysis_id: int, requested_difficulty: str) -> Optional[QuestionPrefetch]:
+    from interviews.views import _generate_resume_questions
+
+    # Analyses that fell back to basic keywords get keyword questions, not these
+    analysis = ResumeAnalysis.objects.filter(id=analysis_id, status='completed', note='').first()
+    if analysis is None:
+        return None
+
+    if requested_difficulty in DIFFICULTIES:
+        difficulty, source = requested_difficulty, 'requested'
+    else:
+        difficulty, source = predict_difficulty(analysis.experience_level), 'predicted'
+
+    prefetch, created = QuestionPrefetch.objects.get_or_create(
+        analysis=analysis,
+        defaults={
+            'difficulty': difficulty,
+            'difficulty_source': source,
+            'expires_at': timezone.now() + timedelta(minutes=settings.QUESTION_PREFETCH_TTL_MINUTES),
+        },
+    )
+    if not created:
+        return prefetch
+
+    start = time.perf_counter()
+    questions = _generate_resume_questions(analysis.technical_skills, analysis.soft_skills,
+                                           analysis.projects, difficulty)
+    elapsed_ms = int((time.perf_counter() - start) * 1000)
+
+    if 'error' in questions:
+        fields = {'status': 'failed', 'error': questions.get('details') or questions['error']}
+    else:
+        fields = {'status': 'ready', 'questions': questions, 'ready_at': timezone.now()}
+    QuestionPrefetch.objects.filter(id=prefetch.id).update(generation_ms=elapsed_ms, **fields)
+    logger.info(f"Prefetched {difficulty} questions for analysis {analysis_id} in {elapsed_ms} ms "
+                f"({fields['status']})")
+    for field, value in fields.items():
+        setattr(prefetch, field, value)
+    prefetch.generation_ms = elapsed_ms
+    return prefetch
+
+
+def _settle(prefetch_id: int, outcome: str, **fields) -> bool:
+    """Record the outcome unless another request already did; True if this call did."""
+    return bool(QuestionPrefetch.objects.filter(id=prefetch_id, outcome='').update(outcome=outcome, **fields))
+
+
+def claim_questions(prefetch: Optional[QuestionPrefetch], difficulty: str) -> Optional[Dict]:
+    """
+    The prefetched questions if they are ready, match `difficulty` and nobody
+    used them yet. A prefetch still generating is not waited for: the request
+    generates its own questions instead. Each prefetch is used at most once,
+    so a repeat interview from the same resume still gets fresh questions.
+    """
+    if prefetch is None or prefetch.outcome:
+        return None
+    if prefetch.difficulty != difficulty:
+        _settle(prefetch.id, 'miss')
+        return None
+    if prefetch.expires_at <= timezone.now():
+        _settle(prefetch.id, 'expired', questions={})
+        return None
+    if prefetch.status == 'generating':
+        _settle(prefetch.id, 'late')
+        return None
+
+    if prefetch.status != 'ready' or not _settle(prefetch.id, 'hit', used_at=timezone.now()):
+        return None
+    return prefetch.questions
+
+
+def expire_stale(now=None) -> int:
+    """Mark prefetches nobody asked for before they expired, dropping their questions."""
+    now = now or timezone.now()
+    return QuestionPrefetch.objects.filter(outcome='', expires_at__lte=now).update(outcome='expired', questions={})
+
+
+def prefetch_stats(since=None) -> Dict:
+    """
+    Hit rate: share of interview starts served from a prefetch.
+    Wasted-call rate: share of settled prefetches whose Gemini calls were
+    thrown away (wrong difficulty, too late, never used, or failed).
+    """
+    rows = QuestionPrefetch.objects.all()
+    if since is not None:
+        rows = rows.filter(created_at__gte=since)
+    counts = rows.aggregate(
+        prefetched=Count('id'),
+        ready=Count('id', filter=Q(status='ready')),
+        failed=Count('id', filter=Q(status='failed')),
+        pending=Count('id', filter=Q(outcome='')),
+        hits=Count('id', filter=Q(outcome='hit')),
+        misses=Count('id', filter=Q(outcome='miss')),
+        late=Count('id', filter=Q(outcome='late')),
+        expired=Count('id', filter=Q(outcome='expired')),
+        predicted_hits=Count('id', filter=Q(outcome='hit', difficulty_source='predicted')),
+        predicted_requests=Count('id', filter=Q(outcome__in=('hit', 'miss', 'late'), difficulty_source='predicted')),
+        avg_generation_ms=Avg('generation_ms', filter=Q(status='ready')),
+        avg_saved_ms=Avg('generation_ms', filter=Q(outcome='hit')),
+    )
+    requests = counts['hits'] + counts['misses'] + counts['late']
+    settled = counts['prefetched'] - counts['pending']
+    wasted = settled - counts['hits']
+    return {
+        **counts,
+        'requests': requests,
+        'hit_rate': round(counts['hits'] / requests, 3) if requests else 0.0,
+        'predicted_hit_rate': (round(counts['predicted_hits'] / counts['predicted_requests'], 3)
+                               if counts['predicted_requests'] else 0.0),
+        'gemini_calls': counts['prefetched'] * CALLS_PER_GENERATION,
+        'wasted_calls': wasted * CALLS_PER_GENERATION,
+        'wasted_call_rate': round(wasted / settled, 3) if settled else 0.0,
+    }
@@ -0,0 +1,194 @@
+"""
+Content-addressed resume storage.
+
+Every retained upload is stored once per distinct file, named by its SHA-256
+and sharded two levels deep so no directory gets huge:
+
+    <MEDIA_ROOT>/<RESUME_BLOB_DIR>/ab/cd/abcd…ef.pdf
+
+`ResumeBlobReference` rows link users, analyses and interview sessions to a
+blob; `manage.py sweep_resume_blobs` removes expired references and then the
+blobs nothing points at.
+"""
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Exists, F, OuterRef, Q, Sum
+from django.utils import timezone
+
+from interviews.models import ResumeBlob, ResumeBlobReference
+
+
+def blob_root() -> Path:
+    return Path(settings.MEDIA_ROOT) / settings.RESUME_BLOB_DIR
+
+
+def blob_path(sha256: str) -> Path:
+    return blob_root() / sha256[:2] / sha256[2:4] / f'{sha256}.pdf'
+
+
+def _write_blob_file(sha256: str, pdf) -> None:
+    path = blob_path(sha256)
+    if path.exists():
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temp file in the same directory and rename, so readers and
+    # concurrent writers of the same hash never see a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            if isinstance(pdf, (bytes, bytearray)):
+                tmp.write(pdf)
+            else:
+                pdf.seek(0)
+                shutil.copyfileobj(pdf, tmp)
+                pdf.seek(0)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _size(pdf) -> int:
+    if isinstance(pdf, (bytes, bytearray)):
+        return len(pdf)
+    size = pdf.seek(0, os.SEEK_END)
+    pdf.seek(0)
+    return size
+
+
+def store_resume(pdf, sha256: str, user=None, stored_name: str = '',
+                 analysis=None) -> ResumeBlobReference:
+    """Store the PDF — bytes or a seekable binary file — once per hash and record a reference to it."""
+    now = timezone.now()
+    try:
+        blob, created = ResumeBlob.objects.get_or_create(
+            sha256=sha256, defaults={'size': _size(pdf), 'last_referenced_at': now},
+        )
+    except IntegrityError:
+        # Lost a race with a concurrent upload of the same file
+        blob, created = ResumeBlob.objects.get(sha256=sha256), False
+    if not created:
+        ResumeBlob.objects.filter(id=blob.id).update(last_referenced_at=now)
+
+    # Also heals a blob whose file went missing
+    _write_blob_file(sha256, pdf)
+
+    return ResumeBlobReference.objects.create(
+        blob=blob,
+        user=user,
+        analysis=analysis,
+        stored_name=stored_name,
+        expires_at=now + timedelta(days=settings.RESUME_BLOB_RETENTION_DAYS),
+    )
+
+
+def attach_session(user, stored_name: str, session) -> int:
+    """
+    Hand the upload's blob over to the interview session created from it; the
+    reference then lives as long as the session instead of expiring.
+    """
+    if not stored_name:
+        return 0
+    return ResumeBlobReference.objects.filter(
+        user=user, stored_name=stored_name, session__isnull=True,
+    ).update(session=session, expires_at=None)
+
+
+def read_resume(sha256: str) -> Optional[bytes]:
+    path = blob_path(sha256)
+    return path.read_bytes() if path.exists() else None
+
+
+def _batched(ids: List[int], size: int) -> Iterable[List[int]]:
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+def sweep(batch_size: int = 500, dry_run: bool = False, now=None) -> Dict[str, int]:
+    """
+    Delete expired references, then blobs with no references that haven't been
+    referenced within the grace period, `batch_size` rows at a time.
+    """
+    now = now or timezone.now()
+    result = {'expired_references': 0, 'blobs_deleted': 0, 'bytes_freed': 0}
+
+    expired = list(
+        ResumeBlobReference.objects.filter(expires_at__lte=now).values_list('id', flat=True)
+    )
+    for batch in _batched(expired, batch_size):
+        if not dry_run:
+            ResumeBlobReference.objects.filter(id__in=batch, expires_at__lte=now).delete()
+        result['expired_references'] += len(batch)
+
+    cutoff = now - timedelta(hours=settings.RESUME_BLOB_SWEEP_GRACE_HOURS)
+    # After the deletes above every remaining reference is live; in a dry run
+    # the expired ones are still there and must be ignored
+    live_references = ResumeBlobReference.objects.filter(
+        Q(expires_at__isnull=True) | Q(expires_at__gt=now), blob=OuterRef('pk'),
+    )
+    sweepable = Q(last_referenced_at__lt=cutoff) & ~Exists(live_references)
+    candidates = list(ResumeBlob.objects.filter(sweepable).values_list('id', flat=True))
+
+    for batch in _batched(candidates, batch_size):
+        if dry_run:
+            doomed = list(ResumeBlob.objects.filter(id__in=batch).values_list('sha256', 'size'))
+        else:
+            with transaction.atomic():
+                # Re-check inside the transaction: a new upload may have taken a reference
+                rows = ResumeBlob.objects.select_for_update().filter(sweepable, id__in=batch)
+                doomed = list(rows.values_list('sha256', 'size'))
+                ResumeBlob.objects.filter(sha256__in=[sha for sha, _ in doomed]).delete()
+            for sha256, _ in doomed:
+                try:
+                    blob_path(sha256).unlink()
+                except FileNotFoundError:
+                    pass
+        result['blobs_deleted'] += len(doomed)
+        result['bytes_freed'] += sum(size for _, size in doomed)
+
+    return result
+
+
+def legacy_uploads():
+    """Files written by the old `{user_id}_{timestamp}_{name}` scheme, directly in MEDIA_ROOT."""
+    root = Path(settings.MEDIA_ROOT)
+    if not root.exists():
+        return []
+    return [path for path in root.iterdir() if path.is_file() and path.suffix.lower() == '.pdf']
+
+
+def storage_stats() -> Dict[str, float]:
+    """
+    Disk usage and dedup ratio: `logical_bytes` is what the references would
+    take as separate files, `stored_bytes` what the blobs take once each.
+    """
+    blobs = ResumeBlob.objects.aggregate(count=Count('id'), stored=Sum('size'))
+    references = ResumeBlobReference.objects.aggregate(count=Count('id'), logical=Sum(F('blob__size')))
+
+    disk_bytes = 0
+    root = blob_root()
+    if root.exists():
+        for dirpath, _, filenames in os.walk(root):
+            disk_bytes += sum(os.path.getsize(os.path.join(dirpath, name)) for name in filenames)
+
+    stored = blobs['stored'] or 0
+    logical = references['logical'] or 0
+    legacy = legacy_uploads()
+    return {
+        'blobs': blobs['count'],
+        'references': references['count'],
+        'stored_bytes': stored,
+        'logical_bytes': logical,
+        'disk_bytes': disk_bytes,
+        'dedup_ratio': round(logical / stored, 2) if stored else 0.0,
+        'legacy_files': len(legacy),
+        'legacy_bytes': sum(path.stat().st_size for path in legacy),
+    }
@@ -0,0 +1,10 @@
+"""
+Signals sent by the interviews app.
+
+session_completed: an InterviewSession was (re)completed with its final
+feedback, sent inside mark_completed's transaction. Receivers get
+`session`.
+"""
+from django.dispatch import Signal
+
+session_completed = Signal()
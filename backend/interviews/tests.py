@@ -0,0 +1,1578 @@
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import timedelta
+import tracemalloc
+from pathlib import Path
+
+from unittest import mock
+
+import pdfplumber
+import PyPDF2
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import OperationalError, connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from benchmarks.answers_bench import run_benchmark as run_answers_benchmark
+from benchmarks.analytics_bench import current_analytics, legacy_analytics, run_benchmark as run_analytics_benchmark
+from benchmarks.analyzer_bench import compare, run_benchmark
+from benchmarks.auth_bench import run_benchmark as run_auth_benchmark
+from benchmarks.db import make_users, seed_sessions
+from benchmarks.history_bench import legacy_history, run_benchmark as run_history_benchmark
+from benchmarks.extraction_bench import run_benchmark as run_extraction_benchmark
+from benchmarks.corpus import build_corpus, edit_case, make_pdf
+from benchmarks.echo_llm import EchoGeminiClient
+from benchmarks.incremental_bench import run_benchmark as run_incremental_benchmark
+from core import skill_taxonomy
+from core.resume_sections import build_llm_context, section_digests, segment_resume
+from core.pdf_sandbox import PdfParseError, PdfParseTimeout, PdfWorkerPool
+from accounts import request_user
+from accounts.jwt_utils import create_token
+from accounts.models import User
+from core.resume_analyzer import PdfExtractionStats, ResumeAnalyzer
+from interviews import question_prefetch, resume_storage
+from interviews.management.commands import ingest_resumes
+from interviews.models import (
+    InterviewAnswer, InterviewSession, QuestionPrefetch, ResumeAnalysis, ResumeBlob, ResumeBlobReference, ResumeVersion,
+    UserAnalyticsSummary,
+)
+
+
+def _parse_or_crash(path, rel_name):
+    """Stands in for ingest_resumes._parse_resume (pickled by reference): crash*.pdf kills its process."""
+    if Path(path).name.startswith('crash'):
+        os._exit(1)
+    return _real_parse_resume(path, rel_name)
+
+
+_real_parse_resume = ingest_resumes._parse_resume
+
+DENSE_PAGE = [f"Line {i}: Python Django Kubernetes engineer building systems at scale" for i in range(60)]
+
+
+class BoundedPdfExtractionTests(SimpleTestCase):
+    """Stress tests: pathological PDFs must not pin a worker or spike memory."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.long_pdf = make_pdf([DENSE_PAGE] * 200)
+        cls.image_pdf = make_pdf([DENSE_PAGE[:5]] * 30, image_size=(6000, 6000))
+
+    def _analyzer(self, max_pages=5, char_budget=10 ** 9, time_budget=60.0):
+        analyzer = ResumeAnalyzer(enable_llm=False)
+        analyzer.MAX_PDF_PAGES = max_pages
+        analyzer.PDF_CHAR_BUDGET = char_budget
+        analyzer.PDF_TIME_BUDGET = time_budget
+        return analyzer
+
+    def test_page_cap_bounds_wall_time(self):
+        stats = PdfExtractionStats()
+        started = time.perf_counter()
+        text = self._analyzer(max_pages=5).extract_text_from_pdf(io.BytesIO(self.long_pdf), stats)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(stats.pages_scanned, 5)
+        self.assertEqual(stats.stopped_by, 'page_limit')
+        self.assertEqual(len(stats.page_ms), 5)
+        self.assertIn('Line 59', text)
+        self.assertLess(elapsed, 10.0)
+
+    def test_char_budget_stops_early(self):
+        stats = PdfExtractionStats()
+        text = self._analyzer(max_pages=50, char_budget=6000).extract_text_from_pdf(
+            io.BytesIO(self.long_pdf), stats
+        )
+
+        self.assertEqual(stats.stopped_by, 'char_budget')
+        self.assertLess(stats.pages_scanned, 5)
+        self.assertGreaterEqual(len(text), 6000)
+
+    def test_time_budget_stops_between_pages(self):
+        stats = PdfExtractionStats()
+        self._analyzer(max_pages=200, time_budget=0.0).extract_text_from_pdf(io.BytesIO(self.long_pdf), stats)
+
+        self.assertEqual(stats.pages_scanned, 1)
+        self.assertEqual(stats.stopped_by, 'time_budget')
+
+    def test_peak_memory_is_bounded_on_long_documents(self):
+        tracemalloc.start()
+        try:
+            stats = PdfExtractionStats()
+            self._analyzer(max_pages=6).extract_text_from_pdf(io.BytesIO(self.long_pdf), stats)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(stats.pages_scanned, 6)
+        self.assertLess(peak, 40 * 1024 * 1024)
+
+    def test_huge_embedded_images_are_not_decoded(self):
+        tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            stats = PdfExtractionStats()
+            text = self._analyzer(max_pages=10).extract_text_from_pdf(io.BytesIO(self.image_pdf), stats)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(stats.pages_scanned, 10)
+        self.assertIn('Line 4', text)
+        # A single decoded 6000x6000 image would be 36 MB
+        self.assertLess(peak, 20 * 1024 * 1024)
+        self.assertLess(elapsed, 10.0)
+
+
+class PdfSandboxPoolTests(SimpleTestCase):
+    """The sandboxed parser pool returns text over IPC and fails fast on bad jobs."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.pool = PdfWorkerPool(size=1, job_timeout=5.0, memory_limit_mb=768, max_jobs_per_worker=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+        super().tearDownClass()
+
+    def test_extracts_text_in_worker(self):
+        doc = self.pool.parse(make_pdf([DENSE_PAGE[:3]]), sha256='abc')
+
+        self.assertIn('Line 2', doc.text)
+        self.assertEqual(doc.sha256, 'abc')
+        self.assertEqual(doc.stats['pages_scanned'], 1)
+
+    def test_garbage_input_does_not_take_down_worker(self):
+        self.assertTrue(self.pool.parse(b'%PDF-1.4 this is not a pdf').is_empty)
+        self.assertIn('still alive', self.pool.parse(make_pdf([["still alive"]])).text)
+
+    def test_workers_are_recycled_after_max_jobs(self):
+        before = self.pool.metrics()['recycled']
+        for _ in range(4):
+            self.pool.parse(make_pdf([["recycle me"]]))
+
+        self.assertGreaterEqual(self.pool.metrics()['recycled'], before + 2)
+
+    def test_timeout_kills_and_replaces_worker(self):
+        pool = PdfWorkerPool(size=1, job_timeout=0.5, memory_limit_mb=0)
+        try:
+            started = time.perf_counter()
+            with self.assertRaises(PdfParseTimeout):
+                pool.parse(make_pdf([DENSE_PAGE] * 200))
+            self.assertLess(time.perf_counter() - started, 5.0)
+
+            metrics = pool.metrics()
+            self.assertEqual(metrics['timeouts'], 1)
+            self.assertEqual(metrics['kills'], 1)
+            self.assertEqual(metrics['idle_workers'], 1)
+            self.assertIn('after timeout', pool.parse(make_pdf([["after timeout"]])).text)
+        finally:
+            pool.shutdown()
+
+    def test_failed_respawn_shrinks_the_pool(self):
+        pool = PdfWorkerPool(size=2, memory_limit_mb=0, max_jobs_per_worker=1)
+        try:
+            with mock.patch.object(pool, '_spawn', side_effect=OSError('Cannot allocate memory')):
+                self.assertIn('first', pool.parse(make_pdf([["first"]])).text)
+                metrics = pool.metrics()
+                self.assertEqual((metrics['workers'], metrics['idle_workers'], metrics['spawn_failures']), (1, 1, 1))
+
+                self.assertIn('second', pool.parse(make_pdf([["second"]])).text)
+                started = time.perf_counter()
+                with self.assertRaisesRegex(PdfParseError, 'No PDF workers left'):
+                    pool.parse(make_pdf([["third"]]))
+                self.assertLess(time.perf_counter() - started, 1.0)
+            self.assertEqual(pool.metrics()['spawn_failures'], 2)
+        finally:
+            pool.shutdown()
+
+
+class SkillTaxonomyTests(SimpleTestCase):
+    """Compiled taxonomy: alias normalization, artifact loading and versioning."""
+
+    def setUp(self):
+        self.analyzer = ResumeAnalyzer(enable_llm=False)
+
+    def test_aliases_map_to_canonical_skills(self):
+        text = "Shipped services on K8s with Postgres, NodeJS and TF; sklearn models; REST APIs."
+        names = [s['name'] for s in self.analyzer.extract_technical_skills(text)]
+
+        for expected in ['kubernetes', 'postgresql', 'node.js', 'terraform', 'scikit-learn', 'rest api']:
+            self.assertIn(expected, names)
+        self.assertEqual(len(names), len(set(names)))
+
+    def test_symbol_terms_and_word_boundaries(self):
+        names = [s['name'] for s in self.analyzer.extract_technical_skills("C++, C# and ASP.NET. Worked at Google.")]
+
+        self.assertIn('c++', names)
+        self.assertIn('c#', names)
+        self.assertIn('asp.net', names)
+        self.assertNotIn('go', names)
+
+    def test_soft_skill_aliases_keep_first_context(self):
+        soft = self.analyzer.extract_soft_skills("A team player. Strong problem-solving. Teamwork again.")
+
+        self.assertEqual([s['skill'] for s in soft], ['Teamwork', 'Problem Solving'])
+        self.assertIn('team player', soft[0]['context'])
+
+    def test_merge_folds_llm_aliases_and_records_version(self):
+        patterns = self.analyzer.extract_technical_skills("Kubernetes")
+        result = self.analyzer.merge_results(patterns, [], [], {'technical_skills': [{'name': 'K8s'}, {'name': 'Helm'}]})
+
+        self.assertEqual([s['name'] for s in result.technical_skills], ['kubernetes', 'Helm'])
+        self.assertEqual(result.taxonomy_version, self.analyzer.taxonomy.version)
+
+    def test_artifact_round_trip_and_stale_fallback(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, 'taxonomy.json')
+            artifact = os.path.join(tmp, 'taxonomy.compiled.json')
+            data = {'version': 't1', 'technical_skills': {'databases': ['postgresql']}, 'soft_skills': ['teamwork'],
+                    'aliases': {'postgres': 'postgresql'}}
+            with open(source, 'w') as f:
+                json.dump(data, f)
+            skill_taxonomy.write_artifact(source, artifact)
+
+            loaded = skill_taxonomy.load_taxonomy(source, artifact)
+            self.assertTrue(loaded.version.startswith('t1+'))
+            self.assertEqual(loaded.find_technical('postgres'), ['postgresql'])
+
+            # Editing the source without recompiling must not serve the old artifact
+            data['aliases']['pg'] = 'postgresql'
+            with open(source, 'w') as f:
+                json.dump(data, f)
+            reloaded = skill_taxonomy.load_taxonomy(source, artifact)
+            self.assertNotEqual(reloaded.version, loaded.version)
+            self.assertEqual(reloaded.find_technical('pg'), ['postgresql'])
+
+    def test_unknown_alias_target_is_rejected(self):
+        source = json.dumps({'technical_skills': {'x': ['python']}, 'soft_skills': [], 'aliases': {'py3': 'pyhton'}})
+        with self.assertRaises(ValueError):
+            skill_taxonomy.compile_taxonomy(source.encode())
+
+
+class ResumeSectionsTests(SimpleTestCase):
+    """Section segmentation and the budgeted excerpt sent to the LLM."""
+
+    RESUME = (
+        "Jane Doe\njane@example.com\n"
+        "## Technical Skills:\nPython, Django\n"
+        "WORK EXPERIENCE\nBackend engineer at Acme\n"
+        "Projects & Achievements\nShipped on time\n"
+        "- Projects -\nChat app in Django\n"
+        "Hobbies\nChess\n"
+    )
+
+    def test_headings_split_the_text_with_offsets(self):
+        sections = segment_resume(self.RESUME)
+
+        self.assertEqual([s.name for s in sections], ['header', 'skills', 'experience', 'projects', 'other'])
+        self.assertEqual(sections[0].body(self.RESUME), 'Jane Doe\njane@example.com')
+        self.assertEqual(sections[1].title, '## Technical Skills:')
+        self.assertEqual(sections[1].body(self.RESUME), 'Python, Django')
+        # A line that isn't a known heading stays in the section above it
+        self.assertIn('Projects & Achievements', sections[2].body(self.RESUME))
+        self.assertEqual(sections[3].body(self.RESUME), 'Chat app in Django')
+        self.assertEqual(sections[-1].end, len(self.RESUME))
+        self.assertEqual(self.RESUME[sections[3].header_start:sections[3].start], '- Projects -\n')
+
+    def test_text_without_headings_is_one_header_section_and_falls_back(self):
+        text = 'Jane Doe, Python developer. ' * 20
+
+        sections = segment_resume(text)
+
+        self.assertEqual([(s.name, s.start, s.end) for s in sections], [('header', 0, len(text))])
+        self.assertEqual(build_llm_context(text, fallback_chars=50), text[:50])
+        self.assertEqual(segment_resume(''), [])
+
+    def test_sections_are_truncated_to_their_budget(self):
+        text = "Skills\n" + "Python " * 100 + "\nProjects\nChat app\nHobbies\nChess\n"
+
+        context = build_llm_context(text, budgets={'skills': 20, 'projects': 100})
+
+        self.assertEqual(context, "## SKILLS\n" + ("Python " * 100)[:20] + "\n\n## PROJECTS\nChat app")
+        self.assertNotIn('Chess', context)
+
+    def test_header_and_unlisted_sections_are_sent_within_small_budgets(self):
+        context = build_llm_context(self.RESUME)
+
+        self.assertTrue(context.startswith('## HEADER\nJane Doe\njane@example.com\n\n## SKILLS'))
+        self.assertTrue(context.endswith('## OTHER\nChess'))
+
+    def test_partially_headed_resume_falls_back_to_the_raw_text(self):
+        # One recognised heading at the end: the experience above it has none
+        intro = 'Jane Doe\nSenior engineer\n' + 'Led the payments platform team at Acme for five years.\n' * 20
+        text = intro + 'Skills\nPython, Go\n'
+
+        self.assertEqual(build_llm_context(text), text[:4000])
+        self.assertEqual(section_digests(text), {})
+        # Enough of it under headings, and the same sections are trusted
+        headed = 'Jane Doe\nExperience\n' + intro + 'Skills\nPython, Go\n'
+        self.assertIn('## EXPERIENCE', build_llm_context(headed))
+        self.assertEqual(set(section_digests(headed)), {'experience', 'skills'})
+
+    def test_only_keeps_the_named_sections(self):
+        context = build_llm_context(self.RESUME, only={'projects'})
+
+        self.assertEqual(context, "## PROJECTS\nChat app in Django")
+        self.assertEqual(build_llm_context(self.RESUME, only=()), '')
+
+
+class AnalyzerBenchmarkTests(SimpleTestCase):
+    """The benchmark corpus is reproducible and the runner works offline."""
+
+    def test_corpus_is_deterministic(self):
+        first = build_corpus(seed=7, page_counts=(1, 2))
+        second = build_corpus(seed=7, page_counts=(1, 2))
+
+        self.assertEqual([c.sha256 for c in first], [c.sha256 for c in second])
+        self.assertNotEqual(first[0].sha256, build_corpus(seed=8, page_counts=(1,))[0].sha256)
+
+    def test_runner_times_every_stage_and_flags_regressions(self):
+        results = run_benchmark(page_counts=(1,), repeat=1, layouts=('standard',), densities=('high',))
+        case = results['cases']['p1-standard-high']
+
+        self.assertEqual(set(case['stages']), {
+            'extract_text', 'segment', 'technical_skills', 'soft_skills', 'projects_basic', 'merge', 'analyze_resume',
+        })
+        self.assertGreater(case['technical_skills_found'], 0)
+        self.assertEqual(compare(results, results)['regressions'], [])
+
+        faster = json.loads(json.dumps(results))
+        faster['cases']['p1-standard-high']['stages']['analyze_resume']['median_ms'] /= 10
+        regressions = compare(results, faster)['regressions']
+        self.assertEqual([r['stage'] for r in regressions], ['analyze_resume'])
+
+
+class LlmOverlapTests(SimpleTestCase):
+    """analyze_document runs the LLM call while the pattern pass finishes."""
+
+    def setUp(self):
+        self.analyzer = ResumeAnalyzer(enable_llm=False)
+        self.doc = self.analyzer.parse_document(io.BytesIO(make_pdf([['Skills', 'Python, Django']])))
+        self.llm_started = threading.Event()
+        self.release_llm = threading.Event()
+        self.addCleanup(self.release_llm.set)
+
+    def _slow_llm(self, *args):
+        self.llm_started.set()
+        self.release_llm.wait(5)
+        return {}, {}, []
+
+    def test_llm_call_is_in_flight_during_the_pattern_pass(self):
+        def projects(doc):
+            # Only returns once the LLM call has started and is still waiting
+            self.assertTrue(self.llm_started.wait(5))
+            self.assertFalse(self.release_llm.is_set())
+            self.release_llm.set()
+            return []
+
+        with mock.patch.object(self.analyzer, '_llm_extract_sections', self._slow_llm), \
+                mock.patch.object(self.analyzer, 'extract_projects_basic', projects):
+            result = self.analyzer.analyze_document(self.doc)
+
+        self.assertIn('python', [s['name'] for s in result.technical_skills])
+
+    def test_pattern_pass_error_does_not_wait_for_the_llm(self):
+        with mock.patch.object(self.analyzer, '_llm_extract_sections', self._slow_llm), \
+                mock.patch.object(self.analyzer, 'extract_projects_basic', side_effect=RuntimeError('boom')):
+            started = time.perf_counter()
+            with self.assertRaises(RuntimeError):
+                self.analyzer.analyze_document(self.doc)
+
+        self.assertLess(time.perf_counter() - started, 2.0)
+
+
+class HybridExtractionTests(SimpleTestCase):
+    """Hybrid mode sends pattern-matched skills and asks the LLM only for the rest."""
+
+    def _analyze(self, mode, doc):
+        analyzer = ResumeAnalyzer(enable_llm=False, extraction_mode=mode)
+        analyzer.client = EchoGeminiClient()
+        return analyzer.analyze_document(doc), analyzer.client.models.prompts
+
+    def test_hybrid_prompt_carries_known_skills_and_gives_the_same_analysis(self):
+        case = build_corpus(page_counts=(1,), layouts=('standard',), densities=('high',))[0]
+        doc = ResumeAnalyzer(enable_llm=False).parse_document(io.BytesIO(case.pdf))
+
+        full, full_prompts = self._analyze('full', doc)
+        hybrid, hybrid_prompts = self._analyze('hybrid', doc)
+
+        self.assertNotIn('Pattern matching already found', full_prompts[0])
+        known_line = next(line for line in hybrid_prompts[0].splitlines() if line.startswith('Technical: '))
+        self.assertIn('kubernetes', known_line)
+        self.assertNotIn('proficiency', hybrid_prompts[0])
+
+        self.assertEqual({s['name'] for s in hybrid.technical_skills}, {s['name'] for s in full.technical_skills})
+        self.assertEqual(hybrid.projects, full.projects)
+        self.assertLess(hybrid.llm_usage['output_tokens'], full.llm_usage['output_tokens'] / 2)
+        # Skills the LLM adds get the fields hybrid mode doesn't ask for
+        self.assertTrue(all({'category', 'proficiency'} <= set(s) and 'section' not in s
+                            for s in hybrid.technical_skills))
+
+    def test_benchmark_compares_both_modes(self):
+        results = run_extraction_benchmark(page_counts=(1,), layouts=('alt_headers',), densities=('low',))
+
+        self.assertTrue(results['outcome_match'])
+        self.assertGreater(results['savings']['output_tokens'], 0.3)
+
+    def test_unknown_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            ResumeAnalyzer(enable_llm=False, extraction_mode='everything')
+
+@override_settings(RESUME_ANALYSIS_ASYNC=False, PDF_SANDBOX_ENABLED=False, RESUME_RETAIN_UPLOADS=False)
+@mock.patch.object(ResumeAnalyzer, 'llm_extract_resume_details', return_value={})
+class ParseOnceTests(TestCase):
+    """Every upload parses its PDF at most once, whichever path the analysis takes."""
+
+    RESUME = make_pdf([["Jordan Example", "SKILLS", "Python, Django, K8s, leadership",
+                        "PROJECTS", "Built a booking platform with React and Postgres"]])
+
+    def setUp(self):
+        self.user = User.objects.create(username='jordan', email='jordan@example.com')
+        self.client.force_login(self.user)
+
+    def _upload(self, pdf_bytes):
+        with mock.patch('pdfplumber.open', wraps=pdfplumber.open) as plumber, \
+                mock.patch('PyPDF2.PdfReader', wraps=PyPDF2.PdfReader) as pypdf2:
+            response = self.client.post('/api/upload-resume/', {
+                'resume': SimpleUploadedFile('cv.pdf', pdf_bytes, 'application/pdf'),
+            })
+        self.assertEqual(response.status_code, 202)
+        return ResumeAnalysis.objects.get(id=response.json()['analysis_id']), plumber.call_count, pypdf2.call_count
+
+    def test_successful_analysis_parses_once(self, _llm):
+        analysis, plumber_calls, pypdf2_calls = self._upload(self.RESUME)
+
+        self.assertEqual(analysis.status, 'completed')
+        self.assertIn('kubernetes', [s['name'] for s in analysis.technical_skills])
+        self.assertEqual((plumber_calls, pypdf2_calls), (1, 0))
+
+    def test_fallback_keywords_reuse_the_parsed_document(self, _llm):
+        with mock.patch.object(ResumeAnalyzer, 'merge_results', side_effect=RuntimeError('boom')):
+            analysis, plumber_calls, pypdf2_calls = self._upload(self.RESUME)
+
+        self.assertEqual(analysis.note, 'Basic analysis used due to processing error')
+        self.assertIn('python', analysis.keywords)
+        self.assertEqual((plumber_calls, pypdf2_calls), (1, 0))
+
+    def test_unreadable_pdf_tries_each_parser_once(self, _llm):
+        analysis, plumber_calls, pypdf2_calls = self._upload(b'%PDF-1.4 not really a pdf')
+
+        self.assertEqual(analysis.status, 'failed')
+        self.assertEqual((plumber_calls, pypdf2_calls), (1, 1))
+
+    def test_identical_upload_is_served_from_cache_without_parsing(self, _llm):
+        first, _, _ = self._upload(self.RESUME)
+        second, plumber_calls, pypdf2_calls = self._upload(self.RESUME)
+
+        self.assertEqual(second.status, 'completed')
+        self.assertEqual(second.content_hash, first.content_hash)
+        self.assertEqual(second.technical_skills, first.technical_skills)
+        self.assertEqual((plumber_calls, pypdf2_calls), (0, 0))
+
+
+@override_settings(RESUME_ANALYSIS_ASYNC=True, PDF_SANDBOX_ENABLED=False, RESUME_RETAIN_UPLOADS=False,
+                   RESUME_MAX_UPLOAD_SIZE=100 * 1024, RESUME_UPLOAD_MEMORY_SIZE=16 * 1024)
+@mock.patch('interviews.analysis_jobs._get_executor')
+class ResumeUploadHandlerTests(TestCase):
+    """The upload is validated, size-capped and hashed while it streams in."""
+
+    def setUp(self):
+        self.user = User.objects.create(username='jordan', email='jordan@example.com')
+        self.client.force_login(self.user)
+
+    def _upload(self, data, name='cv.pdf'):
+        return self.client.post('/api/upload-resume/', {'resume': SimpleUploadedFile(name, data, 'application/pdf')})
+
+    def _pdf(self, size):
+        return b'%PDF-1.4\n' + b'0' * (size - 9)
+
+    def test_bad_magic_bytes_and_extension(self, executor):
+        response = self._upload(b'MZ\x90\x00 not a pdf at all')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error'], 'Invalid file format. Please upload a PDF.')
+        self.assertEqual(self._upload(self._pdf(100), name='cv.docx').status_code, 400)
+        self.assertFalse(ResumeAnalysis.objects.exists())
+        executor.assert_not_called()
+
+    def test_oversized_content_length_is_refused_up_front(self, executor):
+        with mock.patch('interviews.upload_handlers.ResumeUploadHandler.receive_data_chunk') as receive:
+            response = self._upload(self._pdf(300 * 1024))
+        self.assertEqual(response.status_code, 413)
+        self.assertIn('too large', response.json()['error'])
+        receive.assert_not_called()
+
+    def test_oversized_stream_without_content_length(self, executor):
+        from django.core.files.uploadhandler import StopUpload
+        from interviews.upload_handlers import ResumeUploadHandler
+
+        handler = ResumeUploadHandler()
+        # No Content-Length: nothing to refuse up front
+        self.assertIsNone(handler.handle_raw_input(None, {}, None, b'boundary'))
+        handler.new_file('resume', 'cv.pdf', 'application/pdf', None)
+        chunk = self._pdf(64 * 1024)
+        handler.receive_data_chunk(chunk, 0)
+        with self.assertRaises(StopUpload):
+            handler.receive_data_chunk(b'0' * len(chunk), len(chunk))
+        self.assertEqual(handler.rejection[0], 413)
+
+        # Through the view: within the multipart allowance, over the limit once streamed
+        self.assertEqual(self._upload(self._pdf(120 * 1024)).status_code, 413)
+        self.assertFalse(ResumeAnalysis.objects.exists())
+
+    def test_hash_and_spooled_file_reach_the_job(self, executor):
+        data = self._pdf(40 * 1024)
+        response = self._upload(data)
+        self.assertEqual(response.status_code, 202)
+
+        analysis = ResumeAnalysis.objects.get(id=response.json()['analysis_id'])
+        self.assertEqual(analysis.content_hash, hashlib.sha256(data).hexdigest())
+        _, analysis_id, pdf_file, content_hash, _ = executor.return_value.submit.call_args.args
+        self.assertEqual((analysis_id, content_hash), (analysis.id, analysis.content_hash))
+        # Above RESUME_UPLOAD_MEMORY_SIZE: on disk, still open after the request
+        self.assertTrue(pdf_file._rolled)
+        self.assertEqual(pdf_file.read(), data)
+        pdf_file.close()
+
+
+@override_settings(RESUME_ANALYSIS_ASYNC=True, PDF_SANDBOX_ENABLED=False, RESUME_RETAIN_UPLOADS=False)
+class ResumeAnalysisStatusTests(TestCase):
+    """Uploads return 202 at once; the status endpoint answers immediately at every stage."""
+
+    def setUp(self):
+        self.user = User.objects.create(username='jordan', email='jordan@example.com')
+        self.client.force_login(self.user)
+
+    def _status(self, analysis, query=''):
+        response = self.client.get(f'/api/resume-analysis/{analysis.id}/{query}')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    @mock.patch('interviews.analysis_jobs._get_executor')
+    def test_upload_is_accepted_before_analysis(self, executor):
+        response = self.client.post('/api/upload-resume/', {
+            'resume': SimpleUploadedFile('cv.pdf', ParseOnceTests.RESUME, 'application/pdf'),
+        })
+
+        self.assertEqual(response.status_code, 202)
+        body = response.json()
+        self.assertEqual(body['status'], 'queued')
+        self.assertTrue(body['filename'].endswith('_cv.pdf'))
+        executor.return_value.submit.assert_called_once()
+        analysis = ResumeAnalysis.objects.get(id=body['analysis_id'])
+        self.assertEqual(self._status(analysis), {
+            'analysis_id': analysis.id, 'status': 'queued', 'filename': body['filename'], 'keywords': [],
+        })
+
+    def test_partial_completed_and_failed_payloads(self):
+        analysis = ResumeAnalysis.objects.create(
+            user=self.user, status='partial', technical_skills=[{'name': 'python'}] * 12,
+            keywords=['python'],
+        )
+        # Clients still sending the old long-poll parameters get an answer at once
+        with mock.patch('time.sleep') as sleep:
+            payload = self._status(analysis, '?since=partial&wait=10')
+        sleep.assert_not_called()
+        self.assertEqual(payload['status'], 'partial')
+        self.assertEqual(payload['keywords'], ['python'])
+        self.assertEqual(len(payload['analysis']['technical_skills']), 10)
+        self.assertNotIn('error', payload)
+
+        analysis.status, analysis.summary = 'completed', 'Backend engineer'
+        analysis.save()
+        payload = self._status(analysis)
+        self.assertEqual(payload['status'], 'completed')
+        self.assertEqual(payload['analysis']['summary'], 'Backend engineer')
+
+        analysis.status, analysis.error = 'failed', 'Could not extract text from PDF'
+        analysis.save()
+        payload = self._status(analysis)
+        self.assertEqual(payload['status'], 'failed')
+        self.assertNotIn('analysis', payload)
+        self.assertEqual(payload['error'], 'Resume analysis failed. Please try uploading again.')
+
+    @override_settings(RESUME_ANALYSIS_STALE_SECONDS=300)
+    def test_job_without_progress_is_failed(self):
+        fresh = ResumeAnalysis.objects.create(user=self.user, status='partial')
+        stale = ResumeAnalysis.objects.create(user=self.user, status='queued')
+        done = ResumeAnalysis.objects.create(user=self.user, status='completed')
+        ResumeAnalysis.objects.filter(id__in=[stale.id, done.id]).update(
+            updated_at=timezone.now() - timedelta(seconds=301),
+        )
+
+        self.assertEqual(self._status(fresh)['status'], 'partial')
+        self.assertEqual(self._status(done)['status'], 'completed')
+        payload = self._status(stale)
+        self.assertEqual(payload['status'], 'failed')
+        self.assertEqual(payload['error'], 'Resume analysis failed. Please try uploading again.')
+        stale.refresh_from_db()
+        self.assertEqual(stale.error, 'Analysis job was lost (no progress)')
+
+    def test_other_users_analysis_is_not_found(self):
+        other = User.objects.create(username='kim', email='kim@example.com')
+        analysis = ResumeAnalysis.objects.create(user=other, status='completed')
+        self.assertEqual(self.client.get(f'/api/resume-analysis/{analysis.id}/').status_code, 404)
+
+
+@override_settings(RESUME_ANALYSIS_ASYNC=False, PDF_SANDBOX_ENABLED=False, RESUME_RETAIN_UPLOADS=False,
+                   GEMINI_API_KEY='test-key', QUESTION_PREFETCH_ENABLED=False)
+class IncrementalAnalysisTests(TestCase):
+    """Edited resumes only send their changed sections to the LLM."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.original = build_corpus(page_counts=(1,), layouts=('standard',), densities=('high',))[0]
+
+    def setUp(self):
+        self.user = User.objects.create(username='jordan', email='jordan@example.com')
+        self.client.force_login(self.user)
+        self.llm = EchoGeminiClient()
+        patcher = mock.patch('core.resume_analyzer.genai.Client', return_value=self.llm)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _upload(self, case):
+        response = self.client.post('/api/upload-resume/', {
+            'resume': SimpleUploadedFile('cv.pdf', case.pdf, 'application/pdf'),
+        })
+        self.assertEqual(response.status_code, 202)
+        analysis = ResumeAnalysis.objects.get(id=response.json()['analysis_id'])
+        self.assertEqual(analysis.status, 'completed')
+        return analysis
+
+    def test_edited_section_is_the_only_one_resent(self):
+        self._upload(self.original)
+        first = ResumeVersion.objects.get(user=self.user)
+        self.assertEqual(first.version, 1)
+        self.assertEqual(set(first.section_hashes), {'summary', 'skills', 'experience', 'projects', 'education'})
+        self.assertEqual(first.reused_sections, [])
+
+        edited = edit_case(self.original, 'skills')
+        analysis = self._upload(edited)
+        second = ResumeVersion.objects.get(user=self.user, version=2)
+
+        self.assertEqual(len(self.llm.models.prompts), 2)
+        prompt = self.llm.models.prompts[-1]
+        self.assertIn('## SKILLS', prompt)
+        self.assertNotIn('## EXPERIENCE', prompt)
+        self.assertEqual(sorted(second.reused_sections), ['education', 'experience', 'projects', 'summary'])
+        self.assertEqual(second.llm_sections['projects'], first.llm_sections['projects'])
+        self.assertNotEqual(second.section_hashes['skills'], first.section_hashes['skills'])
+        self.assertLess(second.llm_usage['prompt_tokens'], first.llm_usage['prompt_tokens'])
+        # Bookkeeping tags never reach the stored analysis
+        self.assertTrue(all('section' not in skill for skill in analysis.technical_skills))
+
+    def test_header_only_edit_skips_the_llm(self):
+        self._upload(self.original)
+        self._upload(edit_case(self.original, 'contact'))
+
+        self.assertEqual(len(self.llm.models.prompts), 1)
+        latest = ResumeVersion.objects.get(user=self.user, version=2)
+        self.assertEqual(len(latest.reused_sections), 5)
+        self.assertEqual(latest.llm_usage, {})
+
+    def test_failed_incremental_call_leaves_edited_section_unrecorded(self):
+        self._upload(self.original)
+        with mock.patch.object(self.llm.models, 'generate_content', side_effect=RuntimeError('quota')):
+            self._upload(edit_case(self.original, 'projects'))
+
+        latest = ResumeVersion.objects.get(user=self.user, version=2)
+        self.assertNotIn('projects', latest.section_hashes)
+        self._upload(edit_case(self.original, 'projects', seed=1))
+        self.assertIn('## PROJECTS', self.llm.models.prompts[-1])
+
+    def test_benchmark_findings_match_full_reanalysis(self):
+        results = run_incremental_benchmark(page_counts=(1,), layouts=('alt_headers',))
+
+        self.assertTrue(results['findings_match'])
+        self.assertGreater(results['savings']['prompt_tokens'], 0.3)
+
+class ResumeStorageTests(TestCase):
+    """Content-addressed resume storage: dedup, session references and sweeping."""
+
+    def setUp(self):
+        self.media = tempfile.TemporaryDirectory()
+        self.addCleanup(self.media.cleanup)
+        override = override_settings(MEDIA_ROOT=self.media.name, RESUME_RETAIN_UPLOADS=True,
+                                     RESUME_ANALYSIS_ASYNC=False, PDF_SANDBOX_ENABLED=False)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.user = User.objects.create(username='sam', email='sam@example.com')
+
+    def _blob(self, data, last_referenced_days_ago=0, reference_expires_in_days=None, user=None):
+        sha = hashlib.sha256(data).hexdigest()
+        ref = resume_storage.store_resume(data, sha, user=user)
+        ResumeBlob.objects.filter(id=ref.blob_id).update(
+            last_referenced_at=timezone.now() - timedelta(days=last_referenced_days_ago))
+        if reference_expires_in_days is None:
+            ref.delete()
+        else:
+            ResumeBlobReference.objects.filter(id=ref.id).update(
+                expires_at=timezone.now() + timedelta(days=reference_expires_in_days))
+        return sha
+
+    @mock.patch.object(ResumeAnalyzer, 'llm_extract_resume_details', return_value={})
+    def test_identical_uploads_share_one_sharded_blob(self, _llm):
+        pdf = make_pdf([["SKILLS", "Python"]])
+        other = User.objects.create(username='kim', email='kim@example.com')
+        for user in (self.user, other):
+            self.client.force_login(user)
+            response = self.client.post('/api/upload-resume/', {'resume': SimpleUploadedFile('cv.pdf', pdf)})
+            self.assertEqual(response.status_code, 202)
+
+        sha = hashlib.sha256(pdf).hexdigest()
+        path = resume_storage.blob_path(sha)
+        self.assertEqual(path.relative_to(self.media.name).parts, ('resumes', sha[:2], sha[2:4], f'{sha}.pdf'))
+        self.assertEqual(path.read_bytes(), pdf)
+        self.assertEqual(ResumeBlob.objects.count(), 1)
+        self.assertEqual(ResumeBlobReference.objects.filter(blob__sha256=sha).count(), 2)
+        # Nothing written by the old flat naming scheme
+        self.assertEqual(resume_storage.legacy_uploads(), [])
+
+        stats = resume_storage.storage_stats()
+        self.assertEqual(stats['dedup_ratio'], 2.0)
+        self.assertEqual(stats['disk_bytes'], len(pdf))
+
+    def test_session_reference_does_not_expire(self):
+        pdf = b'%PDF-1.4 session resume'
+        resume_storage.store_resume(pdf, hashlib.sha256(pdf).hexdigest(), user=self.user, stored_name='1_1_cv.pdf')
+        session = InterviewSession.objects.create(user=self.user, mode='resume', difficulty='beginner')
+
+        self.assertEqual(resume_storage.attach_session(self.user, '1_1_cv.pdf', session), 1)
+        ref = ResumeBlobReference.objects.get()
+        self.assertEqual(ref.session, session)
+        self.assertIsNone(ref.expires_at)
+
+        result = resume_storage.sweep(now=timezone.now() + timedelta(days=3650))
+        self.assertEqual(result['blobs_deleted'], 0)
+
+    def test_sweep_deletes_expired_and_unreferenced_blobs_in_batches(self):
+        live = self._blob(b'%PDF live', last_referenced_days_ago=30, reference_expires_in_days=10, user=self.user)
+        expired = self._blob(b'%PDF expired', last_referenced_days_ago=30, reference_expires_in_days=-1, user=self.user)
+        fresh = self._blob(b'%PDF just uploaded, reference not created yet')
+        orphan = self._blob(b'%PDF orphan', last_referenced_days_ago=30)
+
+        dry = resume_storage.sweep(batch_size=1, dry_run=True)
+        self.assertEqual((dry['expired_references'], dry['blobs_deleted']), (1, 2))
+        self.assertEqual(ResumeBlob.objects.count(), 4)
+
+        result = resume_storage.sweep(batch_size=1)
+        self.assertEqual((result['expired_references'], result['blobs_deleted']), (1, 2))
+        self.assertEqual(result['bytes_freed'], len(b'%PDF expired') + len(b'%PDF orphan'))
+
+        remaining = set(ResumeBlob.objects.values_list('sha256', flat=True))
+        self.assertEqual(remaining, {live, fresh})
+        for sha in (expired, orphan):
+            self.assertFalse(resume_storage.blob_path(sha).exists())
+        for sha in (live, fresh):
+            self.assertTrue(resume_storage.blob_path(sha).exists())
+
+
+class IngestResumesTests(TestCase):
+    """ingest_resumes checkpoints what it analyzed and retries what failed."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.corpus = Path(tmp.name)
+        for name in ('alice', 'bob', 'carol', 'dave'):
+            (self.corpus / f'{name}.pdf').write_bytes(make_pdf([[f'{name.title()} - Python Django developer']]))
+        (self.corpus / 'broken.pdf').write_bytes(b'%PDF-1.4 not really a pdf')
+
+    def _ingest(self, *args, workers=1):
+        stdout = io.StringIO()
+        args = args or ('--skip-llm',)
+        call_command('ingest_resumes', str(self.corpus), *args, '--workers', str(workers), stdout=stdout)
+        return stdout.getvalue()
+
+    def _logs(self):
+        checkpoint = (self.corpus / '.ingest_checkpoint').read_text().splitlines()
+        failures = [json.loads(line)['file'] for line in (self.corpus / '.ingest_failures').read_text().splitlines()]
+        return sorted(checkpoint), failures
+
+    def test_resume_skips_done_files_and_retries_failures(self):
+        output = self._ingest()
+
+        self.assertIn('4 analyzed, 1 failed', output)
+        self.assertEqual(self._logs(), (['alice.pdf', 'bob.pdf', 'carol.pdf', 'dave.pdf'], ['broken.pdf']))
+
+        output = self._ingest()
+        self.assertIn('4 already done, 1 to process (1 failed last run, retrying)', output)
+        self.assertIn('0 analyzed, 1 failed', output)
+
+        (self.corpus / 'broken.pdf').write_bytes(make_pdf([['Erin - Go developer']]))
+        output = self._ingest()
+        self.assertIn('1 analyzed, 0 failed', output)
+        checkpoint, failures = self._logs()
+        self.assertEqual(len(checkpoint), 5)
+        self.assertEqual(failures, [])
+        self.assertIn('5 already done, 0 to process', self._ingest())
+
+    @override_settings(GEMINI_API_KEY='test-key')
+    def test_llm_failures_are_retried(self):
+        llm = mock.Mock()
+        llm.models.generate_content.side_effect = RuntimeError('429 RESOURCE_EXHAUSTED')
+        with mock.patch('core.resume_analyzer.genai.Client', return_value=llm):
+            output = self._ingest('--llm-rpm', '0')
+
+        self.assertIn('0 analyzed, 5 failed', output)
+        checkpoint, failures = self._logs()
+        self.assertEqual((checkpoint, sorted(failures)), ([], ['alice.pdf', 'bob.pdf', 'broken.pdf', 'carol.pdf', 'dave.pdf']))
+        results = [json.loads(line) for line in (self.corpus / 'ingest_results.jsonl').read_text().splitlines()]
+        self.assertIn('429', next(r['error'] for r in results if r['file'] == 'alice.pdf'))
+
+        with mock.patch('core.resume_analyzer.genai.Client', return_value=EchoGeminiClient()):
+            output = self._ingest('--llm-rpm', '0')
+        self.assertIn('4 analyzed, 1 failed', output)
+
+    @override_settings(GEMINI_API_KEY='test-key')
+    def test_pattern_only_rows_are_not_reused_for_uploads(self):
+        from interviews.analysis_jobs import _copy_cached_result
+
+        self._ingest('--skip-llm', '--store-db')
+        pattern_only = ResumeAnalysis.objects.get(resume_filename='alice.pdf')
+        self.assertTrue(pattern_only.note)
+        upload = ResumeAnalysis.objects.create(content_hash=pattern_only.content_hash)
+        self.assertFalse(_copy_cached_result(upload.id, pattern_only.content_hash))
+
+        (self.corpus / '.ingest_checkpoint').unlink()
+        with mock.patch('core.resume_analyzer.genai.Client', return_value=EchoGeminiClient()):
+            self._ingest('--store-db', '--llm-rpm', '0')
+        self.assertTrue(_copy_cached_result(upload.id, pattern_only.content_hash))
+
+    @mock.patch.object(ingest_resumes, '_parse_resume', _parse_or_crash)
+    def test_crashing_file_is_recorded_and_the_pool_rebuilt(self):
+        (self.corpus / 'crash.pdf').write_bytes(make_pdf([['Mallory']]))
+
+        output = self._ingest(workers=2)
+
+        self.assertIn('A parse process crashed', output)
+        self.assertIn('4 analyzed, 2 failed', output)
+        checkpoint, failures = self._logs()
+        self.assertEqual(checkpoint, ['alice.pdf', 'bob.pdf', 'carol.pdf', 'dave.pdf'])
+        self.assertEqual(sorted(failures), ['broken.pdf', 'crash.pdf'])
+        results = [json.loads(line) for line in (self.corpus / 'ingest_results.jsonl').read_text().splitlines()]
+        self.assertEqual(next(r['error'] for r in results if r['file'] == 'crash.pdf'), 'Parse process crashed')
+
+
+@mock.patch('core.question_generator.QuestionGenerator.generate_resume_based_questions',
+            return_value={'technical_questions': ['Tell me about Django.'], 'hr_questions': []})
+class GenerateQuestionsFromAnalysisTests(TestCase):
+    """Resume interviews reference the stored analysis by id instead of copying it."""
+
+    def setUp(self):
+        self.user = User.objects.create(username='jordan', email='jordan@example.com')
+        self.client.force_login(self.user)
+        self.analysis = ResumeAnalysis.objects.create(
+            user=self.user,
+            resume_filename='1_1700000000_cv.pdf',
+            status='completed',
+            technical_skills=[{'name': 'django', 'category': 'Frameworks', 'proficiency': 'mentioned'}],
+            soft_skills=[{'skill': 'Leadership', 'context': ''}],
+            projects=[{'title': 'Booking platform'}],
+            experience_level='mid',
+            summary='Backend engineer',
+        )
+
+    def _generate(self, **body):
+        return self.client.post('/api/generate-questions/', json.dumps({
+            'mode': 'resume', 'difficulty': 'intermediate', **body,
+        }), content_type='application/json')
+
+    def test_sessions_share_the_stored_analysis(self, generate):
+        with CaptureQueriesContext(connection) as queries:
+            response = self._generate(analysis_id=self.analysis.id)
+        self.assertEqual(response.status_code, 200)
+        analysis_queries = [q for q in queries.captured_queries
+                            if q['sql'].startswith('SELECT') and 'interviews_resume_analysis' in q['sql']]
+        self.assertEqual(len(analysis_queries), 1)
+
+        generate.assert_called_once_with(
+            technical_skills=self.analysis.technical_skills,
+            soft_skills=self.analysis.soft_skills,
+            projects=self.analysis.projects,
+            difficulty='intermediate',
+        )
+        self.assertEqual(self._generate(analysis_id=self.analysis.id).status_code, 200)
+
+        sessions = InterviewSession.objects.filter(user=self.user)
+        self.assertEqual(sessions.count(), 2)
+        self.assertEqual({s.resume_analysis_id for s in sessions}, {self.analysis.id})
+        self.assertEqual(ResumeAnalysis.objects.count(), 1)
+
+        session = sessions.first()
+        self.assertEqual(session.experience_level, 'mid')
+        self.assertEqual(session.resume_filename, self.analysis.resume_filename)
+        detail = self.client.get(f'/api/session/{session.id}/').json()
+        self.assertEqual(detail['resume_summary'], 'Backend engineer')
+
+    def test_unknown_or_unfinished_analysis_is_rejected(self, generate):
+        other = User.objects.create(username='kim', email='kim@example.com')
+        foreign = ResumeAnalysis.objects.create(user=other, status='completed')
+        running = ResumeAnalysis.objects.create(user=self.user, status='partial')
+
+        self.assertEqual(self._generate(analysis_id=foreign.id).status_code, 404)
+        self.assertEqual(self._generate(analysis_id=running.id).status_code, 409)
+        self.assertEqual(self._generate(analysis_id='abc').status_code, 400)
+        self.assertFalse(InterviewSession.objects.exists())
+        generate.assert_not_called()
+
+
+PREFETCHED = {'technical_questions': ['Prefetched?'], 'hr_questions': [], 'project_questions': []}
+
+
+@override_settings(RESUME_ANALYSIS_ASYNC=False, PDF_SANDBOX_ENABLED=False, RESUME_RETAIN_UPLOADS=False,
+                   GEMINI_API_KEY='test-key')
+@mock.patch('interviews.views._generate_resume_questions', return_value=PREFETCHED)
+class QuestionPrefetchTests(TestCase):
+    """Questions are generated once the analysis completes and claimed by generate_questions."""
+
+    def setUp(self):
+        self.user = User.objects.create(username='jordan', email='jordan@example.com')
+        self.client.force_login(self.user)
+        self.analysis = ResumeAnalysis.objects.create(
+            user=self.user, status='completed', experience_level='senior',
+            technical_skills=[{'name': 'django', 'category': 'Frameworks', 'proficiency': 'mentioned'}],
+        )
+
+    def _generate(self, difficulty, analysis=None):
+        return self.client.post('/api/generate-questions/', json.dumps({
+            'mode': 'resume', 'difficulty': difficulty, 'analysis_id': (analysis or self.analysis).id,
+        }), content_type='application/json')
+
+    def test_upload_prefetches_the_requested_difficulty(self, generate):
+        case = build_corpus(page_counts=(1,), layouts=('standard',), densities=('high',))[0]
+        with mock.patch('core.resume_analyzer.genai.Client', return_value=EchoGeminiClient()):
+            response = self.client.post('/api/upload-resume/', {
+                'resume': SimpleUploadedFile('cv.pdf', case.pdf, 'application/pdf'),
+                'difficulty': 'intermediate',
+            })
+        prefetch = QuestionPrefetch.objects.get(analysis_id=response.json()['analysis_id'])
+        self.assertEqual((prefetch.status, prefetch.difficulty, prefetch.difficulty_source),
+                         ('ready', 'intermediate', 'requested'))
+
+        response = self._generate('intermediate', analysis=prefetch.analysis)
+        self.assertEqual(response.json()['questions'], PREFETCHED)
+        generate.assert_called_once()
+        prefetch.refresh_from_db()
+        self.assertEqual(prefetch.outcome, 'hit')
+        self.assertIsNotNone(prefetch.used_at)
+
+    def test_predicted_difficulty_hit_is_used_once(self, generate):
+        question_prefetch.schedule_prefetch(self.analysis.id)
+        prefetch = QuestionPrefetch.objects.get(analysis=self.analysis)
+        self.assertEqual((prefetch.difficulty, prefetch.difficulty_source), ('advanced', 'predicted'))
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self._generate('advanced').status_code, 200)
+        self.assertEqual(generate.call_count, 1)
+        self.assertEqual(len([q for q in queries.captured_queries if q['sql'].startswith('SELECT')
+                              and 'interviews_question_prefetch' in q['sql']]), 1)
+
+        # A repeat interview from the same resume gets fresh questions
+        self._generate('advanced')
+        self.assertEqual(generate.call_count, 2)
+
+    def test_other_difficulty_is_a_miss(self, generate):
+        question_prefetch.prefetch_questions(self.analysis.id)
+        self.assertEqual(self._generate('beginner').status_code, 200)
+
+        self.assertEqual(generate.call_args.args[-1], 'beginner')
+        self.assertEqual(QuestionPrefetch.objects.get().outcome, 'miss')
+
+    def test_unfinished_prefetch_is_late(self, generate):
+        QuestionPrefetch.objects.create(analysis=self.analysis, difficulty='advanced',
+                                        expires_at=timezone.now() + timedelta(minutes=5))
+        self.assertEqual(self._generate('advanced').status_code, 200)
+
+        generate.assert_called_once()
+        self.assertEqual(QuestionPrefetch.objects.get().outcome, 'late')
+
+    @override_settings(RESUME_ANALYSIS_ASYNC=True, QUESTION_PREFETCH_WORKERS=1)
+    def test_prefetch_has_its_own_pool_and_skips_when_busy(self, generate):
+        import threading
+
+        started, release = threading.Event(), threading.Event()
+
+        def slow_prefetch(analysis_id, difficulty=''):
+            started.set()
+            release.wait(5)
+
+        other = ResumeAnalysis.objects.create(user=self.user, status='completed')
+        with mock.patch('interviews.question_prefetch.prefetch_questions', side_effect=slow_prefetch) as prefetch, \
+                mock.patch('interviews.analysis_jobs._get_executor') as analysis_pool:
+            question_prefetch.schedule_prefetch(self.analysis.id)
+            self.assertTrue(started.wait(5))
+            # The only prefetch thread is busy: dropped rather than queued
+            question_prefetch.schedule_prefetch(other.id)
+            release.set()
+        self.assertEqual(prefetch.call_count, 1)
+        analysis_pool.assert_not_called()
+
+    @override_settings(QUESTION_PREFETCH_ENABLED=False)
+    def test_disabled(self, generate):
+        question_prefetch.schedule_prefetch(self.analysis.id)
+        self.assertFalse(QuestionPrefetch.objects.exists())
+
+    def test_expiry_and_stats(self, generate):
+        stale = ResumeAnalysis.objects.create(user=self.user, status='completed', experience_level='entry')
+        for analysis in (self.analysis, stale):
+            question_prefetch.prefetch_questions(analysis.id)
+        QuestionPrefetch.objects.filter(analysis=stale).update(expires_at=timezone.now() - timedelta(minutes=1))
+        self._generate('advanced')
+
+        self.assertEqual(question_prefetch.expire_stale(), 1)
+        self.assertEqual(QuestionPrefetch.objects.get(analysis=stale).questions, {})
+        stats = question_prefetch.prefetch_stats()
+        self.assertEqual((stats['requests'], stats['hits'], stats['expired']), (1, 1, 1))
+        self.assertEqual(stats['hit_rate'], 1.0)
+        self.assertEqual(stats['wasted_call_rate'], 0.5)
+        self.assertEqual(stats['wasted_calls'], question_prefetch.CALLS_PER_GENERATION)
+
+
+class UserAnalyticsTests(TestCase):
+    """Scores live in indexed columns and the dashboard is one aggregate query."""
+
+    def setUp(self):
+        self.user = User.objects.create(username='jordan', email='jordan@example.com')
+
+    def test_scores_are_copied_out_of_feedback(self):
+        session = InterviewSession.objects.create(user=self.user, mode='role', difficulty='beginner')
+        session.feedback = {'overall_score': '81', 'category_scores': {'hr_performance': 70, 'cultural_fit': 'n/a'}}
+        session.mark_completed()
+
+        session.refresh_from_db()
+        self.assertEqual((session.overall_score, session.hr_score), (81.0, 70.0))
+        self.assertIsNone(session.technical_score)
+        self.assertIsNone(session.cultural_fit_score)
+
+    def test_analytics_is_one_query_whatever_the_history(self):
+        for count in (3, 60):
+            user = make_users(1, prefix=f'user{count}-')[0]
+            seed_sessions([user], count)
+            with self.assertNumQueries(1):
+                payload = current_analytics(user)
+            self.assertEqual(payload['total_sessions'], count)
+            self.assertEqual(payload, legacy_analytics(user))
+
+        # A user without a rollup row yet gets one built on the first visit
+        self.assertEqual(current_analytics(self.user)['by_difficulty'], {})
+        with self.assertNumQueries(1):
+            self.assertEqual(current_analytics(self.user)['total_sessions'], 0)
+
+    def test_benchmark_payloads_match(self):
+        results = run_analytics_benchmark(sessions_per_user=100, users=1, repeat=1)
+        self.assertTrue(results['payload_match'])
+        self.assertEqual(results['aggregate']['queries'], 1)
+        self.assertEqual(results['rollup']['queries'], 1)
+
+    def _complete(self, difficulty, score, mode='role'):
+        session = InterviewSession.objects.create(user=self.user, mode=mode, difficulty=difficulty)
+        session.feedback = {'overall_score': score}
+        session.mark_completed()
+        return session
+
+    def test_rollup_follows_completions(self):
+        self._complete('beginner', 60)
+        self._complete('advanced', 90, mode='resume')
+        session = self._complete('advanced', None)
+        summary = UserAnalyticsSummary.objects.get(user=self.user)
+        self.assertEqual((summary.total_sessions, summary.scored_count, summary.best_score), (3, 2, 90))
+        self.assertEqual(current_analytics(self.user), legacy_analytics(self.user))
+
+        # Completing again with new feedback replaces the session's contribution
+        session.feedback = {'overall_score': 95}
+        session.mark_completed()
+        best = InterviewSession.objects.get(feedback__overall_score=90)
+        best.feedback = {'overall_score': 40}
+        best.mark_completed()
+        summary.refresh_from_db()
+        self.assertEqual((summary.total_sessions, summary.scored_count, summary.best_score), (3, 3, 95))
+        self.assertEqual(current_analytics(self.user), legacy_analytics(self.user))
+
+    def test_first_completion_creates_the_row_from_earlier_history(self):
+        earlier = self._complete('beginner', 60)
+        UserAnalyticsSummary.objects.filter(user=self.user).delete()
+
+        with CaptureQueriesContext(connection) as queries:
+            self._complete('advanced', 80)
+        # Created by get_or_create under the lock, not upserted by rebuild()
+        summary_sql = [q['sql'] for q in queries.captured_queries if 'interviews_user_analytics_summary' in q['sql']]
+        self.assertFalse(any('ON CONFLICT' in sql for sql in summary_sql))
+        summary = UserAnalyticsSummary.objects.get(user=self.user)
+        self.assertEqual((summary.total_sessions, summary.score_sum, summary.best_score), (2, 140, 80))
+
+        # Re-completing a session counted in that history doesn't count it twice
+        UserAnalyticsSummary.objects.filter(user=self.user).delete()
+        earlier.feedback = {'overall_score': 70}
+        earlier.mark_completed()
+        self.assertEqual(current_analytics(self.user), legacy_analytics(self.user))
+
+    def test_rebuild_command_repairs_the_rollup(self):
+        self._complete('intermediate', 70)
+        InterviewSession.objects.filter(user=self.user).delete()
+        self.assertEqual(current_analytics(self.user)['total_sessions'], 1)
+
+        call_command('rebuild_analytics_summaries', '--user-id', str(self.user.id), stdout=io.StringIO())
+        self.assertEqual(current_analytics(self.user), legacy_analytics(self.user))
+
+
+class SessionQueryIndexTests(TestCase):
+    """The hot interview/HR queries are served by the composite and Lower(role) indexes."""
+
+    def setUp(self):
+        from hr import user_cache
+        from hr.models import HRUser
+
+        self.user = make_users(1, prefix='indexed')[0]
+        seed_sessions([self.user], 40)
+        self.client.force_login(self.user)
+        user_cache.clear()
+        hr = HRUser.objects.create(email='hr@example.com', name='HR', is_verified=True)
+        session = self.client.session
+        session['hr_user_id'] = hr.id
+        session.save()
+
+    def _explain(self, sql):
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                # Tiny test tables are cheaper to scan; ask whether the index *can* be used
+                cursor.execute('SET LOCAL enable_seqscan = off')
+                cursor.execute(f'EXPLAIN {sql}')
+            else:
+                cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            return '\n'.join(str(row) for row in cursor.fetchall())
+
+    def _session_query(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(url).status_code, 200)
+        selects = [q['sql'] for q in queries.captured_queries
+                   if q['sql'].startswith('SELECT') and 'FROM "interviews_session"' in q['sql']]
+        self.assertEqual(len(selects), 1)
+        return selects[0]
+
+    def test_hot_queries_use_the_indexes(self):
+        cases = {
+            '/api/session-history/': 'session_user_status_done_idx',
+            f'/hr/search/uid/?uid={self.user.uid}': 'session_user_status_done_idx',
+            '/hr/search/role/?role=backend%20DEVELOPER': 'session_role_user_latest_idx',
+            '/hr/roles/': 'session_status_mode_role_idx',
+        }
+        for url, index in cases.items():
+            with self.subTest(url=url):
+                self.assertIn(index, self._explain(self._session_query(url)))
+
+    def test_role_search_is_case_insensitive(self):
+        response = self.client.get('/hr/search/role/?role=backend%20DEVELOPER')
+        expected = InterviewSession.objects.filter(role='Backend Developer').values('user').distinct().count()
+        self.assertEqual(response.json()['count'], expected)
+        self.assertGreater(expected, 0)
+
+
+class SessionHistoryProjectionTests(TestCase):
+    """The history list reads feedback_summary instead of the full JSON columns."""
+
+    def setUp(self):
+        self.user = make_users(1, prefix='history')[0]
+        self.client.force_login(self.user)
+
+    def test_summary_is_written_on_completion(self):
+        session = InterviewSession.objects.create(user=self.user, mode='role', difficulty='beginner')
+        session.feedback = {'overall_score': 70, 'strengths': ['a', 'b', 'c'], 'improvements': ['d']}
+        session.mark_completed()
+
+        session.refresh_from_db()
+        self.assertEqual(session.feedback_summary, {'strengths': ['a', 'b'], 'improvements': ['d']})
+
+    def test_history_skips_the_json_blobs(self):
+        seed_sessions([self.user], 25)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/session-history/')
+        history_sql = [q['sql'] for q in queries.captured_queries if 'FROM "interviews_session"' in q['sql']]
+        self.assertEqual(len(history_sql), 1)
+        for column in ('"questions"', '"answers"', '"feedback"'):
+            self.assertNotIn(column, history_sql[0])
+        self.assertEqual(response.json()['sessions'], json.loads(json.dumps(legacy_history(self.user)))['sessions'])
+
+    def test_benchmark_reads_less(self):
+        results = run_history_benchmark(sizes=(30,), repeat=1)
+        self.assertTrue(results['response_match'])
+        sizes = results['sizes']['30']
+        self.assertLess(sizes['projection']['bytes_read'], sizes['legacy']['bytes_read'] / 5)
+
+
+class KeysetPaginationTests(TestCase):
+    """History and HR search page with an opaque (completed_at, id) cursor instead of OFFSET."""
+
+    def setUp(self):
+        from hr import user_cache
+        from hr.models import HRUser
+
+        self.user = make_users(1, prefix='keyset')[0]
+        seed_sessions([self.user], 150, answers=0)
+        # Sessions completed in the same instant are ordered by id
+        tied = InterviewSession.objects.filter(user=self.user).order_by('id')[:6]
+        InterviewSession.objects.filter(id__in=[s.id for s in tied]).update(completed_at=tied[0].completed_at)
+        self.client.force_login(self.user)
+        user_cache.clear()
+        hr = HRUser.objects.create(email='hr@example.com', name='HR', is_verified=True)
+        session = self.client.session
+        session['hr_user_id'] = hr.id
+        session.save()
+
+    def _ordered_ids(self, **filters):
+        return list(InterviewSession.objects.filter(status='completed', **filters)
+                    .order_by('-completed_at', '-id').values_list('id', flat=True))
+
+    def _walk(self, url, key, id_field='id'):
+        ids, pages, cursor, sql = [], 0, None, []
+        while True:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url + (f'&cursor={cursor}' if cursor else ''))
+            self.assertEqual(response.status_code, 200)
+            sql.extend(q['sql'] for q in queries.captured_queries if 'FROM "interviews_session"' in q['sql'])
+            data = response.json()
+            ids.extend(row[id_field] for row in data[key])
+            pages += 1
+            cursor = data['next_cursor']
+            if cursor is None:
+                return ids, pages, sql
+
+    def test_history_pages_cover_every_session_once(self):
+        ids, pages, sql = self._walk('/api/session-history/?limit=7', 'sessions')
+        self.assertEqual(ids, self._ordered_ids(user=self.user))
+        self.assertEqual(pages, 22)
+        # One seek per page however deep, never an OFFSET scan
+        self.assertEqual(len(sql), pages)
+        for query in sql:
+            self.assertNotIn('OFFSET', query)
+
+    def test_uid_search_pages(self):
+        ids, pages, _ = self._walk(f'/hr/search/uid/?uid={self.user.uid}&limit=40', 'sessions')
+        self.assertEqual(ids, self._ordered_ids(user=self.user))
+        self.assertEqual(pages, 4)
+        first = self.client.get(f'/hr/search/uid/?uid={self.user.uid}').json()
+        self.assertEqual(len(first['sessions']), 10)
+        self.assertEqual(first['candidate']['total_sessions'], 150)
+
+    def test_role_search_lists_the_candidate_once(self):
+        sessions, pages, _ = self._walk('/hr/search/role/?role=backend%20developer&limit=1', 'results', 'session_id')
+        self.assertEqual(sessions, self._ordered_ids(role='Backend Developer')[:1])
+        self.assertEqual(pages, 1)
+
+    def test_page_size_and_cursor_validation(self):
+        self.assertEqual(len(self.client.get('/api/session-history/').json()['sessions']), 20)
+        self.assertEqual(len(self.client.get('/api/session-history/?limit=1000').json()['sessions']), 100)
+        self.assertEqual(len(self.client.get('/api/session-history/?limit=0').json()['sessions']), 1)
+        self.assertEqual(len(self.client.get('/api/session-history/?limit=lots').json()['sessions']), 20)
+        for cursor in ('garbage', 'W10', 'WyIyMDI2LTAxLTAxIiwxXQ'):  # '[]', a naive timestamp
+            with self.subTest(cursor=cursor):
+                response = self.client.get(f'/api/session-history/?cursor={cursor}')
+                self.assertEqual(response.status_code, 400)
+
+    def test_deep_pages_cost_what_the_first_does(self):
+        from benchmarks.pagination_bench import run_benchmark as run_pagination_benchmark
+
+        results = run_pagination_benchmark(sessions=400, pages=(1, 19), size=20, repeat=1)
+        self.assertTrue(results['rows_match'])
+        self.assertTrue(results['walk_complete'])
+        self.assertEqual({page['keyset']['queries'] for page in results['pages'].values()}, {1})
+
+
+class LatestSessionPerCandidateTests(TestCase):
+    """hr_search_role picks each candidate's latest session in the database."""
+
+    def setUp(self):
+        from hr import user_cache
+        from hr.models import HRUser
+
+        user_cache.clear()
+        hr = HRUser.objects.create(email='hr@example.com', name='HR', is_verified=True)
+        session = self.client.session
+        session['hr_user_id'] = hr.id
+        session.save()
+
+        now = timezone.now()
+        self.latest = {}
+        # One candidate interviewing constantly, eight who did it twice
+        busy, *others = make_users(9, prefix='latest')
+        for minutes in range(40):
+            self._session(busy, now - timedelta(minutes=minutes), score=50 + minutes % 7)
+        for i, user in enumerate(others):
+            self._session(user, now - timedelta(days=2, hours=i), score=90)
+            self._session(user, now - timedelta(days=1, hours=i), score=None if i == 0 else 60 + i)
+        self._session(others[1], now, role='Frontend Developer', score=99)
+
+    def _session(self, user, completed_at, score, role='Backend Developer'):
+        session = InterviewSession.objects.create(
+            user=user, mode='role', role=role, difficulty='beginner', status='completed',
+            feedback={'overall_score': score}, completed_at=completed_at,
+        )
+        if role == 'Backend Developer' and (user.id not in self.latest
+                                            or completed_at > self.latest[user.id].completed_at):
+            self.latest[user.id] = session
+
+    def _search(self, query):
+        response = self.client.get(f'/hr/search/role/?role=Backend%20Developer&{query}')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_first_page_has_distinct_candidates(self):
+        data = self._search('limit=5')
+        self.assertEqual(data['count'], 5)
+        self.assertEqual(len({item['candidate']['uid'] for item in data['results']}), 5)
+        self.assertIsNotNone(data['next_cursor'])
+
+    def test_pages_cover_each_candidate_once_with_their_latest_session(self):
+        for sort, key in (('recent', lambda s: (s.completed_at, s.id)),
+                          ('score', lambda s: (-1 if s.overall_score is None else s.overall_score,
+                                               s.completed_at, s.id))):
+            with self.subTest(sort=sort):
+                ids, cursor = [], None
+                while True:
+                    data = self._search(f'sort={sort}&limit=3' + (f'&cursor={cursor}' if cursor else ''))
+                    ids.extend(item['session_id'] for item in data['results'])
+                    cursor = data['next_cursor']
+                    if cursor is None:
+                        break
+                expected = sorted(self.latest.values(), key=key, reverse=True)
+                self.assertEqual(ids, [s.id for s in expected])
+
+        # The unscored session comes last when sorting by score
+        self.assertIsNone(self._search('sort=score')['results'][-1]['overall_score'])
+
+    def test_bad_sort_or_cursor(self):
+        self.assertEqual(self.client.get('/hr/search/role/?role=x&sort=name').status_code, 400)
+        recent_cursor = self._search('limit=1')['next_cursor']
+        # A recency cursor has the wrong shape for the score ordering
+        response = self.client.get(f'/hr/search/role/?role=Backend%20Developer&sort=score&cursor={recent_cursor}')
+        self.assertEqual(response.status_code, 400)
+
+    def test_benchmark_matches_brute_force(self):
+        from benchmarks.role_search_bench import run_benchmark as run_role_search_benchmark
+
+        results = run_role_search_benchmark(candidates=60, per_candidate=10, active=2, active_sessions=300,
+                                            repeat=1)
+        self.assertTrue(results['results_match'])
+        self.assertEqual(results['results']['recent']['candidates'], min(50, results['role_candidates']))
+        self.assertLess(results['results']['legacy']['candidates'], results['results']['recent']['candidates'])
+
+
+class InterviewAnswerTests(TestCase):
+    """Each autosave upserts one InterviewAnswer row; `answers` reassembles the list."""
+
+    def setUp(self):
+        self.user = User.objects.create(username='jordan', email='jordan@example.com')
+        self.client.force_login(self.user)
+        self.session = InterviewSession.objects.create(user=self.user, mode='role', difficulty='beginner')
+
+    def _submit(self, index, answer, session=None):
+        return self.client.post('/api/submit-answer/', json.dumps({
+            'session_id': (session or self.session).id, 'question_index': index, 'answer': answer,
+        }), content_type='application/json')
+
+    def test_answers_are_upserted_per_question(self):
+        self.assertEqual(self._submit(2, 'third').status_code, 200)
+        self._submit(0, 'first draft')
+        with CaptureQueriesContext(connection) as queries:
+            self._submit(0, 'first')
+
+        self.assertEqual(self.session.answers, ['first', None, 'third'])
+        self.assertEqual(InterviewAnswer.objects.filter(session=self.session).count(), 2)
+        # The session row (and its JSON) is never loaded or rewritten
+        session_sql = [q['sql'] for q in queries.captured_queries if 'interviews_session' in q['sql']]
+        self.assertEqual(len(session_sql), 1)
+        self.assertNotIn('"questions"', session_sql[0])
+        self.assertEqual(self.client.get(f'/api/session/{self.session.id}/').json()['answers'],
+                         ['first', None, 'third'])
+
+    def test_invalid_requests(self):
+        other = InterviewSession.objects.create(
+            user=User.objects.create(username='kim', email='kim@example.com'), mode='role', difficulty='beginner',
+        )
+        self.assertEqual(self._submit(0, 'mine?', session=other).status_code, 404)
+        self.assertEqual(self._submit(-1, 'x').status_code, 400)
+        self.assertEqual(self._submit(None, 'x').status_code, 400)
+        self.assertFalse(InterviewAnswer.objects.exists())
+
+    def test_benchmark_upsert_writes_stay_flat(self):
+        results = run_answers_benchmark(questions=6, lengths=(500,))
+        legacy, upsert = results['lengths']['500']['legacy'], results['lengths']['500']['upsert']
+        self.assertGreater(legacy['last_save_bytes_written'], 2 * upsert['last_save_bytes_written'])
+        self.assertLess(upsert['last_save_bytes_written'], 1000)
+
+
+class ConcurrentAnswerTests(TransactionTestCase):
+    """Autosaves racing on one session never lose each other's answers."""
+
+    def test_concurrent_saves(self):
+        import threading
+        from django.db import connections
+
+        user = User.objects.create(username='jordan', email='jordan@example.com')
+        session = InterviewSession.objects.create(user=user, mode='role', difficulty='beginner')
+        barrier = threading.Barrier(8)
+        errors = []
+
+        def save(index):
+            try:
+                barrier.wait()
+                for _ in range(100):
+                    try:
+                        # Two writers per question: the row ends up with one of them
+                        InterviewAnswer.save_answer(session.id, index // 2, f'answer {index // 2} from {index}')
+                        break
+                    except OperationalError as e:
+                        # The in-memory SQLite test database reports lock
+                        # contention instead of waiting like Postgres (or a
+                        # file database with its busy timeout) does
+                        if 'locked' not in str(e):
+                            raise
+                        time.sleep(0.005)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=save, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        answers = session.answers
+        self.assertEqual(len(answers), 4)
+        for index, text in enumerate(answers):
+            self.assertTrue(text.startswith(f'answer {index} from '))
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'jwt-tests'}},
+    JWT_USER_CACHE_TTL=60,
+)
+class JwtRequestUserTests(TestCase):
+    """Bearer requests resolve the user from token claims and the cache, not a query each."""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        self.user = User.objects.create(username='jordan', email='jordan@example.com', skills='Python')
+        self.session = InterviewSession.objects.create(user=self.user, mode='role', difficulty='beginner')
+        self.token = create_token(self.user.id, token_version=self.user.token_version)
+
+    def _get(self, url, token=None, status=200):
+        response = self.client.get(url, headers={'Authorization': f'Bearer {token or self.token}'})
+        self.assertEqual(response.status_code, status)
+        return response.json()
+
+    def _post(self, url, body, token=None, status=200):
+        response = self.client.post(url, json.dumps(body), content_type='application/json',
+                                    headers={'Authorization': f'Bearer {token or self.token}'})
+        self.assertEqual(response.status_code, status)
+        return response.json()
+
+    def _submit(self):
+        return self._post('/api/submit-answer/', {'session_id': self.session.id, 'question_index': 0, 'answer': 'x'})
+
+    def test_profile_loads_only_when_read(self):
+        # Cold: the identity query; the autosave never reads the profile
+        with CaptureQueriesContext(connection) as queries:
+            self._submit()
+        user_sql = [q['sql'] for q in queries.captured_queries if 'accounts_user' in q['sql']]
+        self.assertEqual(len(user_sql), 1)
+        self.assertNotIn('"skills"', user_sql[0])
+
+        # Cached now: no user query at all
+        with CaptureQueriesContext(connection) as queries:
+            self._submit()
+        self.assertFalse(any('accounts_user' in q['sql'] for q in queries.captured_queries))
+
+        # Reading the profile loads every other field in one query; only the
+        # identity is cached
+        with self.assertNumQueries(1):
+            self.assertEqual(self._get('/api/user-info/')['skills'], 'Python')
+        with self.assertNumQueries(1):
+            self.assertEqual(self._get('/api/user-info/')['email'], 'jordan@example.com')
+
+    def test_cache_holds_only_the_identity(self):
+        from django.core.cache import cache
+
+        self._get('/api/user-info/')
+
+        self.assertEqual(cache.get(request_user.cache_key(self.user.id)), {
+            'id': self.user.id, 'username': 'jordan', 'token_version': 0, 'is_active': True, 'is_staff': False,
+        })
+
+    def test_logout_revokes_the_token(self):
+        self._get('/api/user-info/')
+        self._post('/api/logout/', {})
+        self._get('/api/user-info/', status=401)
+        self._get('/api/user-info/', token=create_token(self.user.id, token_version=1))
+
+    def test_profile_update_rotates_the_token(self):
+        self._get('/api/user-info/')
+        token = self._post('/api/update-profile/', {'skills': 'Python, Go'})['token']
+        self._get('/api/user-info/', status=401)
+        self.assertEqual(self._get('/api/user-info/', token=token)['skills'], 'Python, Go')
+
+    def test_request_that_read_the_user_before_a_bump_cannot_cache_it(self):
+        stale = request_user.resolve({'user_id': self.user.id, 'ver': 0})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.bump_token_version()
+
+        request_user.remember(stale)
+
+        self.assertIsNone(request_user.resolve({'user_id': self.user.id, 'ver': 0}))
+        self._get('/api/user-info/', status=401)
+        self._get('/api/user-info/', token=create_token(self.user.id, token_version=1))
+
+    def test_saved_profile_changes_drop_the_cached_user(self):
+        self._get('/api/user-info/')
+        self.user.location = 'Pune'
+        self.user.save()
+        self.assertEqual(self._get('/api/user-info/')['location'], 'Pune')
+
+        stale = request_user.resolve({'user_id': self.user.id, 'ver': 0})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.delete()
+        request_user.remember(stale)
+        self._get('/api/user-info/', status=401)
+
+    def test_bad_claims(self):
+        import jwt
+        from django.conf import settings
+
+        # Tokens issued before the version claim existed are version 0
+        legacy = jwt.encode({'user_id': self.user.id}, settings.JWT_SECRET, algorithm='HS256')
+        self._get('/api/user-info/', token=legacy)
+        self.assertIsNone(request_user.resolve({'user_id': 'abc'}))
+        self.assertIsNone(request_user.resolve({'ver': 0}))
+        self._get('/api/user-info/', token=create_token(self.user.id + 1000), status=401)
+
+    @override_settings(JWT_USER_CACHE_TTL=0)
+    def test_ttl_zero_disables_the_cache(self):
+        self._submit()
+        with CaptureQueriesContext(connection) as queries:
+            self._submit()
+        self.assertTrue(any('accounts_user' in q['sql'] for q in queries.captured_queries))
+
+    def test_benchmark_hot_path_skips_the_user_query(self):
+        results = run_auth_benchmark(repeat=1)
+        legacy, hot = results['results']['legacy'], results['results']['hot']
+        for label in legacy:
+            # user_info reads the profile, which is never cached
+            saved = 0 if label == 'user_info' else 1
+            self.assertEqual(hot[label]['queries'], legacy[label]['queries'] - saved, label)
@@ -0,0 +1,107 @@
+"""
+Streaming upload handler for resume PDFs.
+
+Validates the upload while the bytes arrive instead of after Django has
+buffered (or spooled) the whole request:
+  - rejects non-PDF names and content on the first chunk (`%PDF` magic bytes)
+  - enforces RESUME_MAX_UPLOAD_SIZE from Content-Length and as chunks arrive
+  - computes the SHA-256 content hash incrementally
+  - keeps small files in memory; only spills to a temp file above
+    RESUME_UPLOAD_MEMORY_SIZE
+
+`upload_resume` hands the spooled file itself to the analysis job
+(`HashedUploadedFile.detach`), so a large resume waiting in the queue stays
+on disk instead of being read into memory by the request.
+"""
+import hashlib
+import io
+import tempfile
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, StopUpload
+from django.http import QueryDict
+from django.utils.datastructures import MultiValueDict
+
+PDF_MAGIC = b'%PDF'
+
+# Multipart boundaries and headers around the file part
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+class HashedUploadedFile(UploadedFile):
+    """An uploaded file that carries the SHA-256 of its contents."""
+
+    def __init__(self, file, name, content_type, size, charset, content_type_extra, sha256):
+        super().__init__(file, name, content_type, size, charset, content_type_extra)
+        self.sha256 = sha256
+
+    def detach(self):
+        """
+        Take the spooled file away from the request, which would otherwise
+        close it when the response is done; the caller closes it instead.
+        """
+        file, self.file = self.file, io.BytesIO()
+        file.seek(0)
+        return file
+
+
+class ResumeUploadHandler(FileUploadHandler):
+    """
+    Single-purpose handler for `upload_resume`.
+    On rejection the upload is stopped and `rejection` holds (status, message)
+    for the view to return.
+    """
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.max_size = settings.RESUME_MAX_UPLOAD_SIZE
+        self.rejection = None
+
+    def _reject(self, status, message):
+        self.rejection = (status, message)
+        raise StopUpload(connection_reset=True)
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        # Refuse obviously oversized bodies before reading a single byte
+        if content_length and content_length > self.max_size + MULTIPART_OVERHEAD:
+            self.rejection = (413, self._too_large_message())
+            return QueryDict(encoding=encoding), MultiValueDict()
+        return None
+
+    def new_file(self, field_name, file_name, *args, **kwargs):
+        super().new_file(field_name, file_name, *args, **kwargs)
+        if not file_name.lower().endswith('.pdf'):
+            self._reject(400, 'Invalid file format. Please upload a PDF.')
+        self.file = tempfile.SpooledTemporaryFile(max_size=settings.RESUME_UPLOAD_MEMORY_SIZE)
+        self.hasher = hashlib.sha256()
+
+    def receive_data_chunk(self, raw_data, start):
+        if start == 0 and not raw_data.startswith(PDF_MAGIC):
+            self._reject(400, 'Invalid file format. Please upload a PDF.')
+        if start + len(raw_data) > self.max_size:
+            self._reject(413, self._too_large_message())
+        self.hasher.update(raw_data)
+        self.file.write(raw_data)
+        return None
+
+    def file_complete(self, file_size):
+        if not hasattr(self, 'file'):
+            return None
+        self.file.seek(0)
+        return HashedUploadedFile(
+            file=self.file,
+            name=self.file_name,
+            content_type=self.content_type,
+            size=file_size,
+            charset=self.charset,
+            content_type_extra=self.content_type_extra,
+            sha256=self.hasher.hexdigest(),
+        )
+
+    def upload_interrupted(self):
+        if hasattr(self, 'file'):
+            self.file.close()
+
+    def _too_large_message(self):
+        return f"Resume is too large. Maximum size is {self.max_size // (1024 * 1024)} MB."
@@ -8,6 +8,7 @@ urlpatterns = [
     path('update-profile/', views.update_profile, name='update_profile'),
     path('logout/', views.logout_view, name='api_logout'),
     path('upload-resume/', views.upload_resume, name='upload_resume'),
+    path('resume-analysis/<int:analysis_id>/', views.resume_analysis_status, name='resume_analysis_status'),
     path('generate-questions/', views.generate_questions, name='generate_questions'),
     path('submit-answer/', views.submit_answer, name='submit_answer'),
     path('complete-interview/', views.complete_interview, name='complete_interview'),
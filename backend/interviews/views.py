@@ -9,7 +9,6 @@ Full port of Flask app.py routes with additional features:
 import json
 import os
 import time
-from pathlib import Path
 from functools import wraps
 
 from django.conf import settings
@@ -23,7 +22,7 @@ from django.views.decorators.http import require_http_methods
 from django.utils import timezone
 from werkzeug.utils import secure_filename
 
-from interviews.models import InterviewSession
+from interviews.models import InterviewSession, ResumeAnalysis
 
 
 # ─── Helper: API login required (session OR JWT Bearer token) ─────────────────
@@ -40,20 +39,21 @@ def api_login_required(view_func):
         if request.user.is_authenticated:
             return view_func(request, *args, **kwargs)
 
-        # 2. Try JWT Bearer token from Authorization header
+        # 2. Try JWT Bearer token from Authorization header; the user comes
+        #    from the cache or a narrow query (accounts.request_user)
         auth_header = request.headers.get('Authorization', '')
         if auth_header.startswith('Bearer '):
             token = auth_header[7:]
+            from accounts import request_user
             from accounts.jwt_utils import decode_token
-            from accounts.models import User as UserModel
             payload = decode_token(token)
-            if payload:
+            user = request_user.resolve(payload) if payload else None
+            if user is not None:
+                request.user = user
                 try:
-                    user = UserModel.objects.get(pk=payload['user_id'])
-                    request.user = user
                     return view_func(request, *args, **kwargs)
-                except UserModel.DoesNotExist:
-                    pass
+                finally:
+                    request_user.remember(user)
 
         return JsonResponse({'error': 'Authentication required'}, status=401)
     return wrapper
@@ -62,11 +62,16 @@ def api_login_required(view_func):
 # ─── Health check ─────────────────────────────────────────────────────────────
 @require_http_methods(['GET'])
 def health_check(request):
-    return JsonResponse({
+    from interviews.analysis_jobs import pdf_pool_metrics
+    payload = {
         'status': 'healthy',
         'message': 'Cognivue AI Backend (Django) Running',
         'framework': 'Django',
-    })
+    }
+    pdf_pool = pdf_pool_metrics()
+    if pdf_pool is not None:
+        payload['pdf_pool'] = pdf_pool
+    return JsonResponse(payload)
 
 
 # ─── User info ────────────────────────────────────────────────────────────────
@@ -105,7 +110,13 @@ def update_profile(request):
                 setattr(user, field, data[field])
                 
         user.save()
-        return JsonResponse({'message': 'Profile updated successfully'})
+        # Profile changes revoke the user's older tokens; hand out a current one
+        from accounts.jwt_utils import create_token
+        user.bump_token_version()
+        return JsonResponse({
+            'message': 'Profile updated successfully',
+            'token': create_token(user.id, token_version=user.token_version),
+        })
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=400)
 
@@ -115,6 +126,8 @@ def update_profile(request):
 @api_login_required
 @require_http_methods(['POST'])
 def logout_view(request):
+    # Revokes the user's JWTs too, not just the session
+    request.user.bump_token_version()
     auth_logout(request)
     return JsonResponse({'message': 'Logged out successfully'})
 
@@ -124,53 +137,70 @@ def logout_view(request):
 @api_login_required
 @require_http_methods(['POST'])
 def upload_resume(request):
-    if 'resume' not in request.FILES:
+    # Validate, hash and buffer the PDF while it streams in; must be installed
+    # before request.FILES is first touched.
+    from interviews.upload_handlers import ResumeUploadHandler
+    handler = ResumeUploadHandler(request)
+    request.upload_handlers = [handler]
+
+    files = request.FILES
+    if handler.rejection:
+        status, message = handler.rejection
+        return JsonResponse({'error': message}, status=status)
+    if 'resume' not in files:
         return JsonResponse({'error': 'No resume file provided'}, status=400)
 
-    file = request.FILES['resume']
+    file = files['resume']
     if not file.name:
         return JsonResponse({'error': 'No file selected'}, status=400)
 
-    if not file.name.lower().endswith('.pdf'):
-        return JsonResponse({'error': 'Invalid file format. Please upload a PDF.'}, status=400)
-
-    # Save file
-    upload_dir = Path(settings.MEDIA_ROOT)
-    upload_dir.mkdir(parents=True, exist_ok=True)
-
     filename = secure_filename(file.name)
     unique_filename = f"{request.user.id}_{int(time.time())}_{filename}"
-    filepath = upload_dir / unique_filename
+    # The analysis job owns the spooled upload from here on and closes it
+    resume = file.detach()
 
-    with open(filepath, 'wb+') as dest:
-        for chunk in file.chunks():
-            dest.write(chunk)
+    # Parsing + Gemini extraction can take several seconds, so hand them to
+    # the background worker and let the client poll for results.
+    from interviews.analysis_jobs import enqueue_analysis
+    analysis = ResumeAnalysis.objects.create(
+        user=request.user,
+        resume_filename=unique_filename,
+        content_hash=file.sha256,
+    )
 
-    try:
-        from core.resume_analyzer import analyze_resume_file
-        analysis = analyze_resume_file(str(filepath), settings.GEMINI_API_KEY)
+    # Only touch the disk when uploads have to be kept around; identical
+    # files are stored once (content-addressed by their hash)
+    if settings.RESUME_RETAIN_UPLOADS:
+        from interviews.resume_storage import store_resume
+        store_resume(resume, file.sha256, user=request.user, stored_name=unique_filename, analysis=analysis)
 
-        return JsonResponse({
-            'message': 'Resume uploaded and analyzed successfully',
-            'filename': unique_filename,
-            'analysis': {
-                'technical_skills': analysis['technical_skills'][:10],
-                'soft_skills': analysis['soft_skills'][:8],
-                'projects': analysis['projects'][:5],
-                'experience_level': analysis['experience_level'],
-                'summary': analysis['summary'],
-            },
-            'keywords': analysis['keywords'],
-        })
-    except Exception as e:
-        print(f"Error analyzing resume: {e}")
-        keywords = _extract_resume_keywords(str(filepath))
-        return JsonResponse({
-            'message': 'Resume uploaded successfully (basic analysis)',
-            'filename': unique_filename,
-            'keywords': keywords,
-            'note': 'Basic analysis used due to processing error',
-        })
+    # The difficulty picked on the upload form (optional) is the one questions
+    # get pre-generated for once the analysis completes
+    enqueue_analysis(analysis.id, resume, file.sha256, difficulty=request.POST.get('difficulty', ''))
+
+    return JsonResponse({
+        'message': 'Resume uploaded. Analysis started.',
+        'analysis_id': analysis.id,
+        'filename': unique_filename,
+        'status': analysis.status,
+    }, status=202)
+
+
+# ─── Resume Analysis Status ───────────────────────────────────────────────────
+@api_login_required
+@require_http_methods(['GET'])
+def resume_analysis_status(request, analysis_id):
+    """
+    Return the current state of a resume analysis job, right away: the
+    client polls with its own backoff rather than holding a web worker.
+    A job that stopped making progress (its worker went away) is failed.
+    """
+    from interviews.analysis_jobs import fail_if_stale
+    try:
+        analysis = ResumeAnalysis.objects.get(id=analysis_id, user=request.user)
+    except ResumeAnalysis.DoesNotExist:
+        return JsonResponse({'error': 'Resume analysis not found'}, status=404)
+    return JsonResponse(fail_if_stale(analysis).to_payload())
 
 
 # ─── Generate Questions ───────────────────────────────────────────────────────
@@ -188,11 +218,45 @@ def generate_questions(request):
     role = data.get('role', '')
     keywords = data.get('keywords', [])
     resume_filename = data.get('filename', '')
+    analysis_id = data.get('analysis_id')
+    # Older clients post the analysis itself; it is only used for the questions
     analysis = data.get('analysis', {})
 
     if not mode or not difficulty:
         return JsonResponse({'error': 'mode and difficulty are required'}, status=400)
 
+    # Resume mode: load the stored analysis (and any prefetched questions) by
+    # id in one query rather than trusting and re-storing whatever the client
+    # sends back
+    resume_analysis = None
+    if mode == 'resume' and analysis_id:
+        try:
+            analysis_id = int(analysis_id)
+        except (TypeError, ValueError):
+            return JsonResponse({'error': 'analysis_id must be an integer'}, status=400)
+        resume_analysis = (
+            ResumeAnalysis.objects
+            .select_related('question_prefetch')
+            .filter(id=analysis_id, user=request.user)
+            .first()
+        )
+        if resume_analysis is None:
+            return JsonResponse({'error': 'Resume analysis not found'}, status=404)
+        if not resume_analysis.is_finished:
+            return JsonResponse({'error': 'Resume analysis is still running'}, status=409)
+        if resume_analysis.status == 'failed':
+            return JsonResponse({'error': 'Resume analysis failed. Please upload your resume again.'}, status=400)
+
+        resume_filename = resume_analysis.resume_filename
+        keywords = keywords or resume_analysis.keywords
+        analysis = {}
+        if not resume_analysis.note:
+            analysis = {
+                'technical_skills': resume_analysis.technical_skills,
+                'soft_skills': resume_analysis.soft_skills,
+                'projects': resume_analysis.projects,
+            }
+
     try:
         session = InterviewSession(
             user=request.user,
@@ -202,26 +266,28 @@ def generate_questions(request):
             status='active',
         )
 
-        if mode == 'resume' and analysis:
+        if resume_analysis is not None:
+            session.resume_analysis = resume_analysis
+            session.resume_filename = resume_filename
+            session.experience_level = resume_analysis.experience_level or 'entry'
+        elif mode == 'resume' and analysis:
             session.resume_filename = resume_filename
-            session.technical_skills = analysis.get('technical_skills', [])
-            session.soft_skills = analysis.get('soft_skills', [])
-            session.projects = analysis.get('projects', [])
             session.experience_level = analysis.get('experience_level', 'entry')
-            session.resume_summary = analysis.get('summary', '')
-
-        # Generate questions
-        if mode == 'resume' and analysis:
-            from core.gemini import client
-            from core.question_generator import QuestionGenerator
-            qg = QuestionGenerator(client)
-            questions = qg.generate_resume_based_questions(
-                technical_skills=analysis.get('technical_skills', []),
-                soft_skills=analysis.get('soft_skills', []),
-                projects=analysis.get('projects', []),
-                difficulty=difficulty,
+
+        # Generate questions, unless they were already generated speculatively
+        # when the analysis finished (see interviews.question_prefetch)
+        questions = None
+        if resume_analysis is not None and analysis:
+            from interviews.question_prefetch import claim_questions
+            questions = claim_questions(getattr(resume_analysis, 'question_prefetch', None), difficulty)
+        if questions is None and mode == 'resume' and analysis:
+            questions = _generate_resume_questions(
+                analysis.get('technical_skills', []),
+                analysis.get('soft_skills', []),
+                analysis.get('projects', []),
+                difficulty,
             )
-        else:
+        elif questions is None:
             questions = _generate_interview_questions(mode, difficulty, role, keywords)
 
         if 'error' in questions:
@@ -233,6 +299,10 @@ def generate_questions(request):
         session.questions = questions
         session.save()
 
+        if mode == 'resume' and resume_filename:
+            from interviews.resume_storage import attach_session
+            attach_session(request.user, resume_filename, session)
+
         return JsonResponse({
             'session_id': session.id,
             'questions': questions,
@@ -258,26 +328,25 @@ def submit_answer(request):
     except (json.JSONDecodeError, Exception):
         return JsonResponse({'error': 'Invalid JSON body'}, status=400)
 
+    from interviews.models import InterviewAnswer
+
     session_id = data.get('session_id')
-    question_index = data.get('question_index')
     answer = data.get('answer', '')
-
     try:
-        session = InterviewSession.objects.get(id=session_id, user=request.user)
-    except InterviewSession.DoesNotExist:
+        question_index = int(data.get('question_index'))
+        if question_index < 0:
+            raise ValueError
+    except (TypeError, ValueError):
+        return JsonResponse({'error': 'question_index must be a non-negative integer'}, status=400)
+
+    # Ownership check only; the session row and its JSON are never loaded
+    if not InterviewSession.objects.filter(id=session_id, user=request.user).exists():
         return JsonResponse({'error': 'Interview session not found'}, status=404)
 
     try:
-        answers = list(session.answers) if session.answers else []
-
-        if question_index is not None and len(answers) <= question_index:
-            answers.extend([None] * (question_index + 1 - len(answers)))
-        if question_index is not None:
-            answers[question_index] = answer
-
-        session.answers = answers
-        session.save(update_fields=['answers'])
-
+        # One-row upsert: the cost doesn't grow with the other answers and
+        # concurrent saves of different questions can't overwrite each other
+        InterviewAnswer.save_answer(session_id, question_index, answer if isinstance(answer, str) else str(answer or ''))
         return JsonResponse({'message': 'Answer submitted successfully'})
 
     except Exception as e:
@@ -334,31 +403,51 @@ def complete_interview(request):
 @api_login_required
 @require_http_methods(['GET'])
 def session_history(request):
-    """Return all completed interview sessions for the current user."""
+    """
+    Return the current user's completed interview sessions, newest first, a
+    page at a time: `?limit=` sessions (HISTORY_PAGE_SIZE by default) after
+    `?cursor=`, the `next_cursor` of the previous page.
+    """
+    from interviews.pagination import InvalidCursor, keyset_page, page_size
+
+    # Only the columns the list shows: the questions/answers/feedback JSON is
+    # never read, strengths and improvements come from feedback_summary
     sessions = InterviewSession.objects.filter(
         user=request.user,
         status='completed',
-    ).order_by('-completed_at')[:20]  # Latest 20
+    ).values(
+        'id', 'mode', 'difficulty', 'role', 'experience_level', 'overall_score',
+        'created_at', 'completed_at', 'feedback_summary',
+    )
+    try:
+        sessions, next_cursor = keyset_page(
+            sessions,
+            request.GET.get('cursor'),
+            page_size(request, settings.HISTORY_PAGE_SIZE, settings.PAGE_SIZE_MAX),
+        )
+    except InvalidCursor:
+        return JsonResponse({'error': 'Invalid cursor'}, status=400)
 
     history = []
     for s in sessions:
+        summary = s['feedback_summary'] or {}
         history.append({
-            'id': s.id,
-            'mode': s.mode,
-            'difficulty': s.difficulty,
-            'role': s.role or None,
-            'experience_level': s.experience_level or None,
-            'overall_score': s.overall_score,
-            'duration_minutes': s.duration_minutes,
-            'created_at': s.created_at.isoformat(),
-            'completed_at': s.completed_at.isoformat() if s.completed_at else None,
+            'id': s['id'],
+            'mode': s['mode'],
+            'difficulty': s['difficulty'],
+            'role': s['role'] or None,
+            'experience_level': s['experience_level'] or None,
+            'overall_score': s['overall_score'],
+            'duration_minutes': InterviewSession.minutes_between(s['created_at'], s['completed_at']),
+            'created_at': s['created_at'].isoformat(),
+            'completed_at': s['completed_at'].isoformat() if s['completed_at'] else None,
             'feedback_summary': {
-                'strengths': (s.feedback.get('strengths', [])[:2] if s.feedback else []),
-                'improvements': (s.feedback.get('improvements', [])[:2] if s.feedback else []),
+                'strengths': summary.get('strengths', []),
+                'improvements': summary.get('improvements', []),
             },
         })
 
-    return JsonResponse({'sessions': history})
+    return JsonResponse({'sessions': history, 'next_cursor': next_cursor})
 
 
 # ─── Session Detail (NEW FEATURE) ─────────────────────────────────────────────
@@ -367,7 +456,7 @@ def session_history(request):
 def session_detail(request, session_id):
     """Return full details of a specific interview session."""
     try:
-        session = InterviewSession.objects.get(id=session_id, user=request.user)
+        session = InterviewSession.objects.select_related('resume_analysis').get(id=session_id, user=request.user)
     except InterviewSession.DoesNotExist:
         return JsonResponse({'error': 'Session not found'}, status=404)
 
@@ -403,60 +492,17 @@ def session_detail(request, session_id):
 @api_login_required
 @require_http_methods(['GET'])
 def user_analytics(request):
-    """Return performance analytics across all sessions."""
-    sessions = InterviewSession.objects.filter(
-        user=request.user,
-        status='completed',
-    )
-
-    total = sessions.count()
-    if total == 0:
-        return JsonResponse({
-            'total_sessions': 0,
-            'average_score': None,
-            'best_score': None,
-            'resume_count': 0,
-            'role_count': 0,
-            'by_difficulty': {},
-        })
-
-    scores = [s.overall_score for s in sessions if s.overall_score is not None]
-    avg_score = round(sum(scores) / len(scores), 1) if scores else None
-    best_score = max(scores) if scores else None
-
-    resume_count = sessions.filter(mode='resume').count()
-    role_count = sessions.filter(mode='role').count()
-
-    by_difficulty = {}
-    for diff in ['beginner', 'intermediate', 'advanced']:
-        diff_sessions = sessions.filter(difficulty=diff)
-        diff_scores = [s.overall_score for s in diff_sessions if s.overall_score is not None]
-        by_difficulty[diff] = {
-            'count': diff_sessions.count(),
-            'average_score': round(sum(diff_scores) / len(diff_scores), 1) if diff_scores else None,
-        }
-
-    return JsonResponse({
-        'total_sessions': total,
-        'average_score': avg_score,
-        'best_score': best_score,
-        'resume_count': resume_count,
-        'role_count': role_count,
-        'by_difficulty': by_difficulty,
-    })
+    """Return performance analytics across all sessions (from the user's rollup row)."""
+    from interviews.analytics import get_summary
+    return JsonResponse(get_summary(request.user).to_payload())
 
 
 # ─── Internal helpers ─────────────────────────────────────────────────────────
-def _extract_resume_keywords(filepath: str) -> list:
-    """Fallback keyword extraction using PyPDF2."""
+def _extract_resume_keywords(doc) -> list:
+    """Fallback keyword extraction over an already-parsed resume (core.parsed_document)."""
     import re
     from collections import Counter
     try:
-        import PyPDF2
-        with open(filepath, 'rb') as f:
-            reader = PyPDF2.PdfReader(f)
-            text = ''.join(p.extract_text() or '' for p in reader.pages)
-
         skill_patterns = [
             r'\b(?:python|java|javascript|typescript|c\+\+|c#|php|ruby|go|rust|swift|kotlin)\b',
             r'\b(?:react|angular|vue|node\.?js|express|django|flask|spring|laravel)\b',
@@ -467,9 +513,8 @@ def _extract_resume_keywords(filepath: str) -> list:
             r'\b(?:agile|scrum|devops|ci/cd|microservices|api|rest|graphql)\b',
         ]
         found = []
-        text_lower = text.lower()
         for pat in skill_patterns:
-            found.extend(re.findall(pat, text_lower, re.IGNORECASE))
+            found.extend(re.findall(pat, doc.text_lower))
 
         return [kw for kw, _ in Counter(found).most_common(10)] if found else ['general programming']
     except Exception as e:
@@ -477,6 +522,18 @@ def _extract_resume_keywords(filepath: str) -> list:
         return ['general programming', 'software development']
 
 
+def _generate_resume_questions(technical_skills: list, soft_skills: list, projects: list, difficulty: str) -> dict:
+    """Generate resume-based interview questions using Gemini (three calls)."""
+    from core.gemini import client
+    from core.question_generator import QuestionGenerator
+    return QuestionGenerator(client).generate_resume_based_questions(
+        technical_skills=technical_skills,
+        soft_skills=soft_skills,
+        projects=projects,
+        difficulty=difficulty,
+    )
+
+
 def _generate_interview_questions(mode: str, difficulty: str, role: str, keywords: list) -> dict:
     """Generate role-based interview questions using Gemini."""
     from core.gemini import client
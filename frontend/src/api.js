@@ -51,5 +51,8 @@ export const updateUserProfile = async (data) => {
     body: JSON.stringify(data),
   });
   if (!response.ok) throw new Error("Failed to update profile");
-  return response.json();
+  const result = await response.json();
+  // Profile changes revoke the old token; the response carries its replacement
+  saveToken(result.token);
+  return result;
 };
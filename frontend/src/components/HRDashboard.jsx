@@ -6,7 +6,7 @@ import Loader from "./Loader";
 function HRDashboard() {
   const navigate = useNavigate();
   const [hrUser, setHrUser] = useState(null);
-  const [activeTab, setActiveTab] = useState("uid"); // 'uid' | 'role'
+  const [activeTab, setActiveTab] = useState("uid"); // 'uid' | 'role' | 'skills'
   const [loading, setLoading] = useState(false);
   const [initLoading, setInitLoading] = useState(true);
   const [error, setError] = useState("");
@@ -18,7 +18,15 @@ function HRDashboard() {
   // Role search state
   const [availableRoles, setAvailableRoles] = useState([]);
   const [selectedRole, setSelectedRole] = useState("");
+  const [roleSort, setRoleSort] = useState("recent"); // 'recent' | 'score'
   const [roleResults, setRoleResults] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+
+  // Skill (full-text) search state
+  const [skillQuery, setSkillQuery] = useState("");
+  const [minScore, setMinScore] = useState("");
+  const [difficultyFilter, setDifficultyFilter] = useState("");
+  const [skillResults, setSkillResults] = useState(null);
 
   // Detail view
   const [selectedSession, setSelectedSession] = useState(null);
@@ -97,7 +105,7 @@ function HRDashboard() {
     setRoleResults(null);
     try {
       const res = await fetch(
-        `${API_BASE_URL}/hr/search/role/?role=${encodeURIComponent(selectedRole)}`,
+        `${API_BASE_URL}/hr/search/role/?role=${encodeURIComponent(selectedRole)}&sort=${roleSort}`,
         {
           credentials: "include",
         },
@@ -115,6 +123,79 @@ function HRDashboard() {
     }
   };
 
+  const handleSkillSearch = async (e) => {
+    e.preventDefault();
+    if (!skillQuery.trim()) return;
+    setError("");
+    setLoading(true);
+    setSkillResults(null);
+    const params = new URLSearchParams({ q: skillQuery.trim() });
+    if (minScore !== "") params.set("min_score", minScore);
+    if (difficultyFilter) params.set("difficulty", difficultyFilter);
+    try {
+      const res = await fetch(`${API_BASE_URL}/hr/search/?${params}`, {
+        credentials: "include",
+      });
+      const data = await res.json();
+      if (!res.ok) {
+        setError(data.error || "Search failed");
+        return;
+      }
+      setSkillResults(data);
+    } catch {
+      setError("Network error. Please try again.");
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  // Both searches are paged by the server; each response carries the cursor
+  // of the next page (null on the last one)
+  const fetchNextPage = async (url, cursor) => {
+    setLoadingMore(true);
+    try {
+      const res = await fetch(`${url}&cursor=${encodeURIComponent(cursor)}`, {
+        credentials: "include",
+      });
+      const data = await res.json();
+      if (!res.ok) {
+        setError(data.error || "Search failed");
+        return null;
+      }
+      return data;
+    } catch {
+      setError("Network error. Please try again.");
+      return null;
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  const loadMoreUidSessions = async () => {
+    const data = await fetchNextPage(
+      `${API_BASE_URL}/hr/search/uid/?uid=${encodeURIComponent(uidResult.candidate.uid)}`,
+      uidResult.next_cursor,
+    );
+    if (!data) return;
+    setUidResult((prev) => ({
+      ...prev,
+      sessions: [...prev.sessions, ...data.sessions],
+      next_cursor: data.next_cursor,
+    }));
+  };
+
+  const loadMoreRoleResults = async () => {
+    const data = await fetchNextPage(
+      `${API_BASE_URL}/hr/search/role/?role=${encodeURIComponent(roleResults.role)}&sort=${roleResults.sort}`,
+      roleResults.next_cursor,
+    );
+    if (!data) return;
+    setRoleResults((prev) => {
+      const results = [...prev.results, ...data.results];
+      return { ...prev, results, count: results.length, next_cursor: data.next_cursor };
+    });
+  };
+
   const handleViewSession = async (sessionId) => {
     setDetailLoading(true);
     setSelectedSession(sessionId);
@@ -420,6 +501,27 @@ function HRDashboard() {
             </svg>
             Search by Role
           </button>
+          <button
+            className={`hr-search-tab ${activeTab === "skills" ? "active" : ""}`}
+            onClick={() => {
+              setActiveTab("skills");
+              setError("");
+              setSkillResults(null);
+            }}
+          >
+            <svg
+              width="18"
+              height="18"
+              viewBox="0 0 24 24"
+              fill="none"
+              stroke="currentColor"
+              strokeWidth="2"
+            >
+              <polyline points="16 18 22 12 16 6" />
+              <polyline points="8 6 2 12 8 18" />
+            </svg>
+            Search by Skills
+          </button>
         </div>
 
         {error && (
@@ -555,6 +657,17 @@ function HRDashboard() {
                     </div>
                   ))}
                 </div>
+                {uidResult.next_cursor && (
+                  <div className="history-pagination">
+                    <button
+                      className="page-btn"
+                      disabled={loadingMore}
+                      onClick={loadMoreUidSessions}
+                    >
+                      {loadingMore ? "Loading…" : "Load more sessions"}
+                    </button>
+                  </div>
+                )}
               </div>
             )}
           </div>
@@ -576,6 +689,14 @@ function HRDashboard() {
                   </option>
                 ))}
               </select>
+              <select
+                className="hr-role-select"
+                value={roleSort}
+                onChange={(e) => setRoleSort(e.target.value)}
+              >
+                <option value="recent">Most recent</option>
+                <option value="score">Highest score</option>
+              </select>
               <button
                 className="hr-search-btn"
                 onClick={handleRoleSearch}
@@ -676,6 +797,140 @@ function HRDashboard() {
                     ))}
                   </div>
                 )}
+                {roleResults.next_cursor && (
+                  <div className="history-pagination">
+                    <button
+                      className="page-btn"
+                      disabled={loadingMore}
+                      onClick={loadMoreRoleResults}
+                    >
+                      {loadingMore ? "Loading…" : "Load more candidates"}
+                    </button>
+                  </div>
+                )}
+              </div>
+            )}
+          </div>
+        )}
+
+        {/* Skill Search Panel */}
+        {activeTab === "skills" && (
+          <div className="hr-search-panel">
+            <form onSubmit={handleSkillSearch} className="hr-role-search-form">
+              <input
+                type="text"
+                className="hr-search-input"
+                value={skillQuery}
+                onChange={(e) => setSkillQuery(e.target.value)}
+                placeholder="Skills or keywords, e.g. Kubernetes Python"
+              />
+              <input
+                type="number"
+                className="hr-role-select"
+                min="0"
+                max="100"
+                value={minScore}
+                onChange={(e) => setMinScore(e.target.value)}
+                placeholder="Min score"
+              />
+              <select
+                className="hr-role-select"
+                value={difficultyFilter}
+                onChange={(e) => setDifficultyFilter(e.target.value)}
+              >
+                <option value="">Any difficulty</option>
+                <option value="beginner">Beginner</option>
+                <option value="intermediate">Intermediate</option>
+                <option value="advanced">Advanced</option>
+              </select>
+              <button
+                type="submit"
+                className="hr-search-btn"
+                disabled={loading || !skillQuery.trim()}
+              >
+                {loading ? "Searching..." : "Search"}
+              </button>
+            </form>
+
+            {loading && (
+              <div
+                style={{
+                  display: "flex",
+                  justifyContent: "center",
+                  marginTop: "16px",
+                }}
+              >
+                <Loader message="Searching..." />
+              </div>
+            )}
+
+            {skillResults && (
+              <div>
+                <div className="hr-results-summary">
+                  <span>
+                    Found <strong>{skillResults.count}</strong> candidate(s)
+                    matching <strong>{skillResults.query}</strong>
+                  </span>
+                </div>
+
+                {skillResults.count === 0 ? (
+                  <div className="hr-empty-state">
+                    <p>No candidates match this search.</p>
+                  </div>
+                ) : (
+                  <div className="hr-results-grid">
+                    {skillResults.results?.map((item) => (
+                      <div
+                        key={item.session_id}
+                        className="hr-result-card"
+                        onClick={() => handleViewSession(item.session_id)}
+                      >
+                        <div className="hr-result-card-top">
+                          <div className="hr-candidate-mini">
+                            <div className="hr-candidate-mini-avatar">
+                              {item.candidate?.name?.charAt(0)?.toUpperCase()}
+                            </div>
+                            <div>
+                              <div className="hr-result-name">
+                                {item.candidate?.name}
+                              </div>
+                              <div className="hr-uid-badge-sm">
+                                {item.candidate?.uid}
+                              </div>
+                            </div>
+                          </div>
+                          <div
+                            className="hr-result-score"
+                            style={{ color: scoreColor(item.overall_score) }}
+                          >
+                            {item.overall_score ?? "—"}
+                            <span
+                              style={{ fontSize: "12px", color: "#64748b" }}
+                            >
+                              /100
+                            </span>
+                          </div>
+                        </div>
+                        <div className="hr-result-meta">
+                          <span className="hr-result-role-tag">
+                            {item.role || "Resume interview"}
+                          </span>
+                          <span
+                            className={`hr-difficulty-badge ${item.difficulty}`}
+                          >
+                            {item.difficulty}
+                          </span>
+                        </div>
+                        <div className="hr-result-date">
+                          {item.candidate?.skills || "—"}
+                        </div>
+                        <div className="hr-result-view-btn">
+                          View Full Details →
+                        </div>
+                      </div>
+                    ))}
+                  </div>
+                )}
               </div>
             )}
           </div>
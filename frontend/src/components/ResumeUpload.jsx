@@ -3,6 +3,9 @@ import styled from "styled-components";
 import Loader from "./Loader";
 import { getApiUrl, getAuthHeaders } from "../api";
 
+// Longer than the server takes to fail a stalled job (RESUME_ANALYSIS_STALE_SECONDS)
+const MAX_ANALYSIS_WAIT_MS = 6 * 60 * 1000;
+
 // Styled File Upload Component
 const StyledWrapper = styled.div`
   display: flex;
@@ -202,6 +205,33 @@ function ResumeUpload({ setCurrentView, setInterviewData }) {
     }
   };
 
+  // Poll the analysis job until the LLM stage has finished, backing off
+  // from 0.5s to 4s between polls (the server answers immediately).
+  // Pattern-matched keywords arrive first and are shown while we wait.
+  // The server fails jobs that stop making progress; past
+  // MAX_ANALYSIS_WAIT_MS we give up regardless.
+  const waitForAnalysis = async (analysisId) => {
+    let delay = 500;
+    const deadline = Date.now() + MAX_ANALYSIS_WAIT_MS;
+    for (;;) {
+      if (Date.now() > deadline) {
+        throw new Error("Resume analysis is taking too long. Please try uploading again.");
+      }
+      const response = await fetch(
+        getApiUrl(`/api/resume-analysis/${analysisId}/`),
+        { credentials: "include", headers: getAuthHeaders() }
+      );
+      const result = await response.json();
+      if (!response.ok || result.status === "failed") {
+        throw new Error(result.error || "Resume analysis failed");
+      }
+      if (result.keywords?.length) setKeywords(result.keywords);
+      if (result.status === "completed") return result;
+      await new Promise((resolve) => setTimeout(resolve, delay));
+      delay = Math.min(delay * 2, 4000);
+    }
+  };
+
   const handleUpload = async () => {
     if (!selectedFile || !difficulty) {
       alert("Please select a file and difficulty level");
@@ -211,6 +241,8 @@ function ResumeUpload({ setCurrentView, setInterviewData }) {
     setUploading(true);
     const formData = new FormData();
     formData.append("resume", selectedFile);
+    // Questions for this difficulty are pre-generated as soon as analysis ends
+    formData.append("difficulty", difficulty);
 
     try {
       const response = await fetch(getApiUrl("/api/upload-resume/"), {
@@ -221,7 +253,8 @@ function ResumeUpload({ setCurrentView, setInterviewData }) {
       });
 
       if (response.ok) {
-        const result = await response.json();
+        const upload = await response.json();
+        const result = await waitForAnalysis(upload.analysis_id);
         setKeywords(result.keywords);
 
         // Set interview data and proceed to interview
@@ -229,7 +262,8 @@ function ResumeUpload({ setCurrentView, setInterviewData }) {
           mode: "resume",
           difficulty: difficulty,
           keywords: result.keywords,
-          filename: result.filename,
+          filename: upload.filename,
+          analysis_id: upload.analysis_id,
         });
 
         setCurrentView("interview-setup");
@@ -239,7 +273,7 @@ function ResumeUpload({ setCurrentView, setInterviewData }) {
       }
     } catch (error) {
       console.error("Upload error:", error);
-      alert("Upload failed. Please try again.");
+      alert(error.message || "Upload failed. Please try again.");
     } finally {
       setUploading(false);
     }
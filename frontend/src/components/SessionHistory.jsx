@@ -11,6 +11,8 @@ function SessionHistory({ setCurrentView, setFeedbackData, onViewFullDetails })
   const [sessionDetail, setSessionDetail] = useState(null);
   const [detailLoading, setDetailLoading] = useState(false);
   const [currentPage, setCurrentPage] = useState(1);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const itemsPerPage = 3;
 
   useEffect(() => {
@@ -25,6 +27,7 @@ function SessionHistory({ setCurrentView, setFeedbackData, onViewFullDetails })
         if (historyRes.ok) {
           const data = await historyRes.json();
           setSessions(data.sessions || []);
+          setNextCursor(data.next_cursor || null);
         }
         if (analyticsRes.ok) {
           const data = await analyticsRes.json();
@@ -40,6 +43,34 @@ function SessionHistory({ setCurrentView, setFeedbackData, onViewFullDetails })
     return () => controller.abort();
   }, []);
 
+  // The server pages history with a cursor; fetch the next page once the
+  // user steps past the sessions loaded so far
+  const loadMoreSessions = async () => {
+    if (!nextCursor) return false;
+    setLoadingMore(true);
+    try {
+      const res = await fetch(
+        getApiUrl(`/api/session-history/?cursor=${encodeURIComponent(nextCursor)}`),
+        { credentials: 'include', headers: getAuthHeaders() },
+      );
+      if (!res.ok) return false;
+      const data = await res.json();
+      setSessions(prev => [...prev, ...(data.sessions || [])]);
+      setNextCursor(data.next_cursor || null);
+      return (data.sessions || []).length > 0;
+    } catch (err) {
+      console.error('History fetch error:', err);
+      return false;
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  const goToNextPage = async () => {
+    if (currentPage === Math.ceil(sessions.length / itemsPerPage) && !(await loadMoreSessions())) return;
+    setCurrentPage(p => p + 1);
+  };
+
   const loadSessionDetail = async (sessionId) => {
     setDetailLoading(true);
     setSelectedSession(sessionId);
@@ -197,7 +228,7 @@ function SessionHistory({ setCurrentView, setFeedbackData, onViewFullDetails })
             </div>
             
             {/* Pagination Controls */}
-            {Math.ceil(sessions.length / itemsPerPage) > 1 && (
+            {(Math.ceil(sessions.length / itemsPerPage) > 1 || nextCursor) && (
               <div className="history-pagination">
                 <button 
                   className="page-btn" 
@@ -206,13 +237,15 @@ function SessionHistory({ setCurrentView, setFeedbackData, onViewFullDetails })
                 >
                   Previous
                 </button>
-                <span className="page-info">{currentPage} / {Math.ceil(sessions.length / itemsPerPage)}</span>
+                <span className="page-info">
+                  {currentPage} / {Math.ceil(sessions.length / itemsPerPage)}{nextCursor ? '+' : ''}
+                </span>
                 <button 
                   className="page-btn" 
-                  disabled={currentPage === Math.ceil(sessions.length / itemsPerPage)}
-                  onClick={() => setCurrentPage(p => p + 1)}
+                  disabled={loadingMore || (currentPage === Math.ceil(sessions.length / itemsPerPage) && !nextCursor)}
+                  onClick={goToNextPage}
                 >
-                  Next
+                  {loadingMore ? 'Loading…' : 'Next'}
                 </button>
               </div>
             )}
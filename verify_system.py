@@ -6,58 +6,74 @@ Checks if all components are working properly
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'cognivue.settings')
 
 print("🔍 Verifying LLM-Powered Interview Assistant System...\n")
 
+# Failed checks; the script exits non-zero if there are any
+failures = []
+
+# Resume data lives on ResumeAnalysis; sessions reference it by foreign key
+SESSION_FIELDS = {'resume_filename': 'resume_filename', 'experience_level': 'experience_level',
+                  'resume_analysis': 'resume_analysis_id'}
+ANALYSIS_FIELDS = ['technical_skills', 'soft_skills', 'projects', 'experience_level', 'summary']
+
 # Check 1: Models
 print("1. Checking Database Models...")
 try:
-    from models import User, InterviewSession, db
-    
-    # Check if new fields exist
-    fields_to_check = ['resume_filename', 'technical_skills', 'soft_skills', 
-                       'projects', 'experience_level', 'resume_summary']
-    
-    model_fields = dir(InterviewSession)
-    all_present = all(field in model_fields for field in fields_to_check)
-    
-    if all_present:
-        print("   ✅ All new fields present in InterviewSession model")
-    else:
-        missing = [f for f in fields_to_check if f not in model_fields]
-        print(f"   ❌ Missing fields: {missing}")
+    import django
+    django.setup()
+    from interviews.models import InterviewSession, ResumeAnalysis
+
+    for model, fields in ((InterviewSession, list(SESSION_FIELDS)), (ResumeAnalysis, ANALYSIS_FIELDS)):
+        model_fields = {f.name for f in model._meta.get_fields()}
+        missing = [f for f in fields if f not in model_fields]
+        if missing:
+            print(f"   ❌ Missing fields in {model.__name__}: {missing}")
+            failures.append(f'{model.__name__} fields')
+        else:
+            print(f"   ✅ All resume fields present in {model.__name__} model")
+    if InterviewSession._meta.get_field('resume_analysis').related_model is not ResumeAnalysis:
+        print("   ❌ InterviewSession.resume_analysis does not reference ResumeAnalysis")
+        failures.append('resume_analysis FK')
 except Exception as e:
     print(f"   ❌ Error loading models: {e}")
+    failures.append('models')
 
 # Check 2: Resume Analyzer
 print("\n2. Checking Resume Analyzer...")
 try:
-    from resume_analyzer import ResumeAnalyzer
-    analyzer = ResumeAnalyzer()
+    from core.resume_analyzer import ResumeAnalyzer
+    analyzer = ResumeAnalyzer(enable_llm=False)
     print("   ✅ Resume Analyzer imported successfully")
-    print(f"   - Can detect {sum(len(v) for v in analyzer.TECHNICAL_SKILLS.values())} technical skills")
-    print(f"   - Can detect {len(analyzer.SOFT_SKILLS)} soft skills")
+    print(f"   - Skill taxonomy {analyzer.taxonomy.version}")
+    print(f"   - Can detect {len(analyzer.taxonomy.technical)} technical skills")
+    print(f"   - Can detect {len(analyzer.taxonomy.soft)} soft skills")
 except Exception as e:
     print(f"   ❌ Error loading Resume Analyzer: {e}")
+    failures.append('resume analyzer')
 
 # Check 3: Question Generator
 print("\n3. Checking Question Generator...")
 try:
-    from question_generator import QuestionGenerator
-    from gemini import client
+    from core.question_generator import QuestionGenerator
+    from core.gemini import client
     qg = QuestionGenerator(client)
     print("   ✅ Question Generator imported successfully")
 except Exception as e:
     print(f"   ❌ Error loading Question Generator: {e}")
+    failures.append('question generator')
 
 # Check 4: Dependencies
 print("\n4. Checking Dependencies...")
 dependencies = {
     'pdfplumber': 'PDF text extraction',
     'google.genai': 'Gemini AI',
+    'PyPDF2': 'PDF fallback parser',
     'pydantic': 'Data validation',
-    'flask': 'Web framework',
-    'flask_sqlalchemy': 'Database ORM'
+    'django': 'Web framework',
+    'corsheaders': 'CORS handling',
+    'dj_database_url': 'Database configuration',
 }
 
 for module, purpose in dependencies.items():
@@ -66,6 +82,7 @@ for module, purpose in dependencies.items():
         print(f"   ✅ {module:20s} - {purpose}")
     except ImportError:
         print(f"   ❌ {module:20s} - MISSING (needed for {purpose})")
+        failures.append(module)
 
 # Check 5: Environment Variables
 print("\n5. Checking Environment Variables...")
@@ -89,46 +106,45 @@ for var, purpose in env_vars.items():
 # Check 6: Database Connection
 print("\n6. Checking Database Connection...")
 try:
-    from app import app, db
-    with app.app_context():
-        # Try to query
-        from sqlalchemy import text
-        result = db.session.execute(text("SELECT 1"))
-        print("   ✅ Database connection successful")
-        
-        # Check if table exists with new columns
-        result = db.session.execute(text(
-            "SELECT column_name FROM information_schema.columns "
-            "WHERE table_name='interview_session'"
-        ))
-        columns = [row[0] for row in result]
-        
-        new_cols = ['resume_filename', 'technical_skills', 'soft_skills', 
-                    'projects', 'experience_level', 'resume_summary']
-        
-        all_cols_exist = all(col in columns for col in new_cols)
-        
-        if all_cols_exist:
-            print("   ✅ All new columns exist in database")
-        else:
-            missing = [c for c in new_cols if c not in columns]
-            print(f"   ❌ Missing columns in database: {missing}")
-            print("   → Run: python migrate_database.py")
-            
+    from django.db import connection
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+    print("   ✅ Database connection successful")
+
+    # Check the tables have the resume columns
+    expected = {InterviewSession: list(SESSION_FIELDS.values()), ResumeAnalysis: ANALYSIS_FIELDS}
+    with connection.cursor() as cursor:
+        for model, cols in expected.items():
+            columns = [col.name for col in connection.introspection.get_table_description(
+                cursor, model._meta.db_table
+            )]
+            missing = [c for c in cols if c not in columns]
+            if missing:
+                print(f"   ❌ Missing columns in {model._meta.db_table}: {missing}")
+                print("   → Run: cd backend && python manage.py migrate")
+                failures.append(f'{model._meta.db_table} columns')
+            else:
+                print(f"   ✅ All resume columns exist in {model._meta.db_table}")
+
 except Exception as e:
     print(f"   ❌ Database connection failed: {e}")
+    failures.append('database')
 
 # Final Summary
 print("\n" + "="*60)
 print("📊 VERIFICATION SUMMARY")
 print("="*60)
 print("\nSystem Status:")
+if failures:
+    print(f"❌ {len(failures)} check(s) failed: {', '.join(failures)}")
+    print("\n" + "="*60)
+    sys.exit(1)
 print("✅ All checks passed - System is ready!")
 print("\nTo start the application:")
-print("1. Backend:  python backend/app.py")
+print("1. Backend:  cd backend && python manage.py runserver")
 print("2. Frontend: cd frontend && npm run dev")
 print("\nTest URLs:")
-print("- Backend API: http://localhost:5000/api/health")
+print("- Backend API: http://localhost:8000/api/health/")
 print("- Frontend:    http://localhost:3000")
 print("\nFeatures Available:")
 print("- ✅ Role-based interviews")